@@ -4,11 +4,14 @@ OpenAGI Workflow Engine Integration
 Automates complex workflows using meta-agents
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+from collections import deque
 from enum import Enum
 import asyncio
+import heapq
 import json
+import math
 
 
 class TriggerType(Enum):
@@ -43,19 +46,82 @@ class WorkflowTrigger:
 
 @dataclass
 class WorkflowAction:
-    """Workflow action configuration"""
+    """Workflow action configuration
+
+    ``depends_on`` lists the ids of actions that must finish first. Left as
+    None, the action depends on the one declared before it (sequential, as
+    workflows always ran); ``[]`` makes it independent so it can run
+    concurrently with its siblings. ``id`` defaults to ``action_<index>``.
+    """
     type: ActionType
     parameters: Dict[str, Any]
     meta_agent: Optional[str] = None
+    id: Optional[str] = None
+    depends_on: Optional[List[str]] = None
+
+
+@dataclass(frozen=True)
+class WorkflowPlan:
+    """Compiled, validated execution plan for a workflow's actions"""
+    action_ids: Tuple[str, ...]
+    parents: Tuple[Tuple[int, ...], ...]
+    children: Tuple[Tuple[int, ...], ...]
+    roots: Tuple[int, ...]
+
+    @classmethod
+    def compile(cls, actions: List[WorkflowAction]) -> "WorkflowPlan":
+        """Resolve dependencies to action indices and reject cycles"""
+        action_ids = tuple(action.id or f"action_{i}" for i, action in enumerate(actions))
+        index = {}
+        for i, action_id in enumerate(action_ids):
+            if action_id in index:
+                raise ValueError(f"Duplicate action id {action_id}")
+            index[action_id] = i
+
+        parents = []
+        children = [[] for _ in actions]
+        for i, action in enumerate(actions):
+            if action.depends_on is None:
+                deps = (i - 1,) if i else ()
+            else:
+                unknown = [d for d in action.depends_on if d not in index]
+                if unknown:
+                    raise ValueError(f"Action {action_ids[i]} depends on unknown actions {unknown}")
+                deps = tuple(dict.fromkeys(index[d] for d in action.depends_on))
+            parents.append(deps)
+            for parent in deps:
+                children[parent].append(i)
+
+        waiting = [len(deps) for deps in parents]
+        ready = deque(i for i, count in enumerate(waiting) if not count)
+        visited = 0
+        while ready:
+            i = ready.popleft()
+            visited += 1
+            for child in children[i]:
+                waiting[child] -= 1
+                if not waiting[child]:
+                    ready.append(child)
+        if visited != len(actions):
+            raise ValueError("Workflow actions contain a dependency cycle")
+
+        return cls(
+            action_ids=action_ids,
+            parents=tuple(parents),
+            children=tuple(tuple(c) for c in children),
+            roots=tuple(i for i, deps in enumerate(parents) if not deps),
+        )
 
 
 class OpenAGIWorkflowEngine:
     """Advanced workflow automation engine"""
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 16):
         self.workflows = {}
         self.meta_agents = self._initialize_meta_agents()
         self.execution_history = []
+        self.max_concurrency = max_concurrency
+        self._plans: Dict[str, WorkflowPlan] = {}
 
     def _initialize_meta_agents(self) -> Dict[str, Any]:
         """Initialize OpenAGI meta-agents"""
@@ -81,11 +147,53 @@ class OpenAGIWorkflowEngine:
             "enabled": True,
             "created_at": asyncio.get_event_loop().time()
         }
+        # Compile up front so invalid dependencies fail at creation time
+        self._plans[workflow_id] = WorkflowPlan.compile(actions)
+
+        return workflow_id
+
+    async def create_workflow_from_template(self, template_id: str, name: str,
+                                            description: Optional[str] = None,
+                                            trigger: Optional[WorkflowTrigger] = None) -> str:
+        """Create a workflow reusing another workflow's actions and compiled plan"""
+        if template_id not in self.workflows:
+            raise ValueError(f"Workflow {template_id} not found")
+        template = self.workflows[template_id]
+        workflow_id = f"wf_{len(self.workflows) + 1}"
+
+        self.workflows[workflow_id] = {
+            "name": name,
+            "description": template["description"] if description is None else description,
+            "trigger": template["trigger"] if trigger is None else trigger,
+            "actions": template["actions"],
+            "enabled": True,
+            "created_at": asyncio.get_event_loop().time()
+        }
+        self._plans[workflow_id] = self.get_plan(template_id)
 
         return workflow_id
 
+    def get_plan(self, workflow_id: str) -> WorkflowPlan:
+        """Return the cached plan for a workflow, compiling it on first use"""
+        plan = self._plans.get(workflow_id)
+        if plan is None or len(plan.action_ids) != len(self.workflows[workflow_id]["actions"]):
+            plan = self._plans[workflow_id] = WorkflowPlan.compile(self.workflows[workflow_id]["actions"])
+        return plan
+
+    def invalidate_plan(self, workflow_id: str) -> None:
+        """Drop a cached plan after a workflow's actions were edited in place"""
+        self._plans.pop(workflow_id, None)
+
     async def execute_workflow(self, workflow_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute workflow with given context"""
+        """Execute workflow with given context
+
+        Actions run as soon as their dependencies have finished, up to
+        ``max_concurrency`` at a time. Each action sees the context plus
+        ``previous_action_result`` (its last dependency's result) and
+        ``dependency_results`` keyed by action id. Results are returned in
+        declaration order. With ``stop_on_error`` (the default) a failure
+        cancels running actions and starts no new ones.
+        """
         if workflow_id not in self.workflows:
             raise ValueError(f"Workflow {workflow_id} not found")
 
@@ -93,20 +201,63 @@ class OpenAGIWorkflowEngine:
         if not workflow["enabled"]:
             return {"status": "skipped", "reason": "workflow disabled"}
 
-        results = []
-
-        for action in workflow["actions"]:
-            try:
-                result = await self._execute_action(action, context)
-                results.append(result)
-
-                # Update context with action results
-                context["previous_action_result"] = result
-
-            except Exception as e:
-                results.append({"error": str(e)})
-                if workflow.get("stop_on_error", True):
-                    break
+        actions = workflow["actions"]
+        plan = self.get_plan(workflow_id)
+        stop_on_error = workflow.get("stop_on_error", True)
+        outcomes: Dict[int, Dict[str, Any]] = {}
+
+        waiting = [len(deps) for deps in plan.parents]
+        ready = deque(plan.roots)
+        running: Dict[asyncio.Task, int] = {}
+        aborted = False
+
+        def action_context(i: int) -> Dict[str, Any]:
+            deps = plan.parents[i]
+            if not deps:
+                return context
+            view = dict(context)
+            view["previous_action_result"] = outcomes[deps[-1]]
+            view["dependency_results"] = {plan.action_ids[d]: outcomes[d] for d in deps}
+            return view
+
+        def finish(i: int, result: Dict[str, Any]) -> None:
+            outcomes[i] = result
+            for child in plan.children[i]:
+                waiting[child] -= 1
+                if not waiting[child]:
+                    ready.append(child)
+
+        try:
+            while (ready or running) and not aborted:
+                while ready and len(running) < self.max_concurrency:
+                    i = ready.popleft()
+                    task = asyncio.ensure_future(self._execute_action(actions[i], action_context(i)))
+                    running[task] = i
+                if not running:
+                    continue
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    i = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        finish(i, task.result())
+                        continue
+                    outcomes[i] = {"error": str(error)}
+                    if stop_on_error:
+                        aborted = True
+                    else:
+                        finish(i, outcomes[i])
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        results = [outcomes[i] for i in sorted(outcomes)]
+        if results:
+            # Update context with action results
+            context["previous_action_result"] = results[-1]
 
         execution_record = {
             "workflow_id": workflow_id,
@@ -223,20 +374,55 @@ class TeamBalancerAgent:
     """Meta-agent for team workload balancing"""
 
     async def balance_workload(self, team: List[Dict], tasks: List[Dict]) -> Dict:
-        """Balance tasks across team"""
-        # Simulate workload balancing
-        # In production, would use optimization algorithms
+        """Balance tasks across team
+
+        Greedy least-loaded assignment: tasks are taken by priority, then
+        estimated hours (largest first), and each goes to the member with
+        the most spare capacity, ties broken by current load and team order.
+        Members without a ``capacity`` have unlimited headroom; their
+        ``workload`` (hours already booked) is the starting load. A task
+        that fits nobody's remaining capacity is left unassigned. With no
+        estimates or capacities this is plain round-robin.
+        """
+        loads = [float(member.get("workload", 0)) for member in team]
+        heap = []
+        for i, member in enumerate(team):
+            capacity = member.get("capacity")
+            headroom = math.inf if capacity is None else float(capacity) - loads[i]
+            heap.append((-headroom, loads[i], i))
+        heapq.heapify(heap)
+
+        ordered = sorted(tasks, key=lambda t: (-t.get("priority", 0), -t.get("estimated_hours", 1)))
         assignments = {}
-        for i, task in enumerate(tasks):
-            member = team[i % len(team)] if team else None
-            if member:
-                assignments[task["id"]] = member["id"]
+        unassigned = []
+        for task in ordered:
+            hours = float(task.get("estimated_hours", 1))
+            if not heap or -heap[0][0] < hours:
+                unassigned.append(task["id"])
+                continue
+            neg_headroom, load, i = heap[0]
+            loads[i] = load + hours
+            heapq.heapreplace(heap, (neg_headroom + hours, loads[i], i))
+            assignments[task["id"]] = team[i]["id"]
 
         return {
             "assignments": assignments,
-            "balance_score": 0.92
+            "unassigned": unassigned,
+            "member_hours": {member["id"]: loads[i] for i, member in enumerate(team)},
+            "balance_score": self._balance_score(loads)
         }
 
+    @staticmethod
+    def _balance_score(loads: List[float]) -> float:
+        """1.0 for perfectly even loads, falling with their relative spread"""
+        if not loads:
+            return 1.0
+        mean = sum(loads) / len(loads)
+        if not mean:
+            return 1.0
+        variance = sum((load - mean) ** 2 for load in loads) / len(loads)
+        return round(max(0.0, 1.0 - math.sqrt(variance) / mean), 4)
+
 
 class QualityAnalyzerAgent:
     """Meta-agent for quality analysis"""
@@ -0,0 +1,49 @@
+"""add stripe event inbox
+
+Revision ID: 3e8b51c0d7a2
+Revises: 7c2e9d4a1f63
+Create Date: 2026-10-18 11:40:05.527391
+
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+from alembic import op
+import sqlalchemy as sa
+import blank_business_builder.database
+
+
+# revision identifiers, used by Alembic.
+revision = '3e8b51c0d7a2'
+down_revision = '7c2e9d4a1f63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'stripe_event_inbox',
+        sa.Column('event_id', sa.String(length=255), nullable=False),
+        sa.Column('event_type', sa.String(length=100), nullable=False),
+        sa.Column('object_id', sa.String(length=255), nullable=True),
+        sa.Column('stripe_created', sa.DateTime(), nullable=False),
+        sa.Column('payload', blank_business_builder.database.JSONType(astext_type=sa.Text()), nullable=False),
+        sa.Column('received_at', sa.DateTime(), nullable=True),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+        sa.Column('outcome', sa.String(length=50), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('event_id'),
+    )
+    op.create_index(op.f('ix_stripe_event_inbox_event_type'), 'stripe_event_inbox', ['event_type'], unique=False)
+    op.create_index(op.f('ix_stripe_event_inbox_object_id'), 'stripe_event_inbox', ['object_id'], unique=False)
+    op.create_index(
+        'ix_stripe_event_inbox_pending', 'stripe_event_inbox', ['processed_at', 'stripe_created'], unique=False
+    )
+    op.add_column('subscriptions', sa.Column('last_event_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('subscriptions', 'last_event_at')
+    op.drop_index('ix_stripe_event_inbox_pending', table_name='stripe_event_inbox')
+    op.drop_index(op.f('ix_stripe_event_inbox_object_id'), table_name='stripe_event_inbox')
+    op.drop_index(op.f('ix_stripe_event_inbox_event_type'), table_name='stripe_event_inbox')
+    op.drop_table('stripe_event_inbox')
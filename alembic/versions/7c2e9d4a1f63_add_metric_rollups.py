@@ -0,0 +1,92 @@
+"""add metric rollups and metrics_history ingestion time
+
+Revision ID: 7c2e9d4a1f63
+Revises: 1b1187eb0477
+Create Date: 2026-10-18 09:12:40.118204
+
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+from alembic import op
+import sqlalchemy as sa
+import blank_business_builder.database
+
+
+# revision identifiers, used by Alembic.
+revision = '7c2e9d4a1f63'
+down_revision = '1b1187eb0477'
+branch_labels = None
+depends_on = None
+
+SUMMARY_COLUMNS = [
+    ('revenue', sa.Numeric(precision=18, scale=2)),
+    ('customers', sa.BigInteger()),
+    ('leads', sa.BigInteger()),
+    ('conversion_rate', sa.Numeric(precision=18, scale=2)),
+    ('tasks_completed', sa.BigInteger()),
+    ('tasks_pending', sa.BigInteger()),
+    ('tasks_failed', sa.BigInteger()),
+]
+
+
+def _summary_columns():
+    columns = [
+        sa.Column('samples', sa.Integer(), nullable=False),
+        sa.Column('first_timestamp', sa.DateTime(), nullable=True),
+        sa.Column('last_timestamp', sa.DateTime(), nullable=True),
+    ]
+    for name, type_ in SUMMARY_COLUMNS:
+        columns.append(sa.Column(f'{name}_sum', type_, nullable=True))
+        columns.append(sa.Column(f'{name}_last', type_, nullable=True))
+    columns.append(sa.Column('updated_at', sa.DateTime(), nullable=True))
+    return columns
+
+
+def upgrade() -> None:
+    op.add_column(
+        'metrics_history',
+        sa.Column('ingested_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    )
+    # Existing rows count as ingested when they were measured
+    op.execute('UPDATE metrics_history SET ingested_at = timestamp WHERE timestamp IS NOT NULL')
+    op.create_index(op.f('ix_metrics_history_ingested_at'), 'metrics_history', ['ingested_at'], unique=False)
+    op.create_index(
+        'ix_metrics_history_business_timestamp', 'metrics_history', ['business_id', 'timestamp'], unique=False
+    )
+
+    op.create_table(
+        'business_metric_rollups',
+        sa.Column('business_id', blank_business_builder.database.UUIDType(), nullable=False),
+        sa.Column('granularity', sa.String(length=10), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        *_summary_columns(),
+        sa.ForeignKeyConstraint(['business_id'], ['businesses.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('business_id', 'granularity', 'bucket_start'),
+    )
+    op.create_index(
+        'ix_business_metric_rollups_bucket', 'business_metric_rollups', ['granularity', 'bucket_start'], unique=False
+    )
+    op.create_table(
+        'global_metric_rollups',
+        sa.Column('granularity', sa.String(length=10), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('businesses', sa.Integer(), nullable=False),
+        *_summary_columns(),
+        sa.PrimaryKeyConstraint('granularity', 'bucket_start'),
+    )
+    op.create_table(
+        'rollup_watermarks',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('watermark', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('rollup_watermarks')
+    op.drop_table('global_metric_rollups')
+    op.drop_index('ix_business_metric_rollups_bucket', table_name='business_metric_rollups')
+    op.drop_table('business_metric_rollups')
+    op.drop_index('ix_metrics_history_business_timestamp', table_name='metrics_history')
+    op.drop_index(op.f('ix_metrics_history_ingested_at'), table_name='metrics_history')
+    op.drop_column('metrics_history', 'ingested_at')
@@ -0,0 +1,396 @@
+"""
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+Shared Python analysis service for the audit and optimisation tasks.
+
+Each file is read and parsed once, and a single traversal of its AST feeds
+every analyzer (code metrics, security, performance, code quality). Per-file
+results are cached in memory for the run and, optionally, on disk keyed by
+(path, mtime, size, content hash), so repeat runs only re-analyze changed
+files. Changed files fan out across a process pool.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Bump when any per-file analysis changes so persisted results are recomputed
+ANALYZER_VERSION = 1
+
+# Below this many changed files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 32
+
+DECISION_NODES = (ast.If, ast.While, ast.For, ast.And, ast.Or, ast.ExceptHandler)
+LOOP_NODES = (ast.For, ast.While)
+
+
+def iter_python_files(project_root: Path) -> Iterator[Path]:
+    """Python files under ``project_root``, skipping virtual environments."""
+    for py_file in project_root.rglob('*.py'):
+        if '.venv' in str(py_file) or 'venv' in str(py_file):
+            continue
+        yield py_file
+
+
+def find_line_number(content: str, pattern: str) -> int:
+    """Find line number of pattern in content."""
+    for i, line in enumerate(content.splitlines(), 1):
+        if pattern in line:
+            return i
+    return 0
+
+
+def scan_security(content: str, relative_path: str) -> list[dict[str, Any]]:
+    """Scan Python source for common security anti-patterns."""
+    issues = []
+
+    def add(severity: str, issue: str, pattern: str) -> None:
+        issues.append({
+            'severity': severity,
+            'file': relative_path,
+            'issue': issue,
+            'line': find_line_number(content, pattern)
+        })
+
+    # Check for dangerous functions
+    if 'eval(' in content:
+        add('high', 'Use of eval() detected - potential code injection', 'eval(')
+    if 'exec(' in content:
+        add('high', 'Use of exec() detected - potential code injection', 'exec(')
+    if 'pickle.loads' in content and 'untrusted' in content.lower():
+        add('high', 'Unsafe pickle.loads() usage - potential code execution', 'pickle.loads')
+    if 'shell=True' in content:
+        add('medium', 'subprocess with shell=True - potential command injection', 'shell=True')
+    if re.search(r'password\s*=\s*["\'][^"\']+["\']', content, re.IGNORECASE):
+        add('critical', 'Hard-coded password detected', 'password')
+    if re.search(r'api[_-]?key\s*=\s*["\'][^"\']+["\']', content, re.IGNORECASE):
+        add('critical', 'Hard-coded API key detected', 'api')
+    return issues
+
+
+class _FileVisitor:
+    """
+    One depth-first pass over a module collecting every analyzer's findings.
+
+    Subtree counts (function complexity, nested loops, class methods) are
+    accumulated on stacks of open frames, so nothing walks a subtree twice.
+    The traversal is iterative, so deeply nested expressions cannot hit the
+    recursion limit.
+    """
+
+    def __init__(self, relative_path: str):
+        self.path = relative_path
+        self.metrics = {
+            'functions': 0,
+            'classes': 0,
+            'complexity': 0,
+            'max_function_complexity': 0,
+            'imports': 0,
+            'docstrings': 0,
+        }
+        self.performance_issues: list[dict[str, Any]] = []
+        self.opportunities: list[dict[str, Any]] = []
+        self.suggestions: list[dict[str, Any]] = []
+        self._complexity: list[int] = []   # One frame per open FunctionDef
+        self._loops: list[int] = []        # One frame per open For/While
+        self._methods: list[int] = []      # One frame per open ClassDef
+
+    def run(self, tree: ast.AST) -> None:
+        parents: list[ast.AST] = []
+        stack: list[tuple[ast.AST, bool]] = [(tree, False)]
+        while stack:
+            node, leaving = stack.pop()
+            if leaving:
+                parents.pop()
+                self._leave(node)
+                continue
+            self._enter(node, parents[-1] if parents else None)
+            parents.append(node)
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(list(ast.iter_child_nodes(node))))
+
+    def _enter(self, node: ast.AST, parent: ast.AST | None) -> None:
+        if isinstance(node, DECISION_NODES):
+            for i in range(len(self._complexity)):
+                self._complexity[i] += 1
+        if isinstance(node, LOOP_NODES):
+            for i in range(len(self._loops)):
+                self._loops[i] += 1
+            self._loops.append(1)
+
+        if isinstance(node, ast.FunctionDef):
+            self.metrics['functions'] += 1
+            if ast.get_docstring(node):
+                self.metrics['docstrings'] += 1
+            for i in range(len(self._methods)):
+                self._methods[i] += 1
+            self._complexity.append(1)
+            self._check_function(node)
+        elif isinstance(node, ast.ClassDef):
+            self.metrics['classes'] += 1
+            if ast.get_docstring(node):
+                self.metrics['docstrings'] += 1
+            self._methods.append(0)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            self.metrics['imports'] += 1
+
+        # Detect list comprehension that could be generator
+        if isinstance(node, ast.ListComp) and isinstance(parent, (ast.For, ast.Call)):
+            self.opportunities.append({
+                'file': self.path,
+                'opportunity': 'List comprehension could be generator expression',
+                'benefit': 'Reduced memory usage',
+                'line': node.lineno
+            })
+
+        # Detect repeated string concatenation
+        if isinstance(node, ast.AugAssign) and isinstance(node.op, ast.Add) and isinstance(node.target, ast.Name):
+            self.opportunities.append({
+                'file': self.path,
+                'opportunity': 'String concatenation in loop detected',
+                'recommendation': 'Use join() or list accumulation',
+                'benefit': 'O(n) instead of O(n^2)',
+                'line': node.lineno
+            })
+
+        # Iterating over .keys() unnecessarily
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr == 'keys' and isinstance(node.func.value, ast.Name)):
+            self.opportunities.append({
+                'file': self.path,
+                'opportunity': 'Unnecessary .keys() call',
+                'recommendation': 'Iterate directly over dict',
+                'benefit': 'Cleaner code, slight performance gain',
+                'line': node.lineno
+            })
+
+    def _leave(self, node: ast.AST) -> None:
+        if isinstance(node, LOOP_NODES):
+            # Detect nested loops (O(n^2) or worse)
+            nested_loops = self._loops.pop()
+            if nested_loops > 2:
+                self.performance_issues.append({
+                    'severity': 'medium',
+                    'file': self.path,
+                    'issue': f'Deeply nested loops detected ({nested_loops} levels)',
+                    'recommendation': 'Consider algorithmic optimization or vectorization',
+                    'line': node.lineno
+                })
+
+        if isinstance(node, ast.FunctionDef):
+            complexity = self._complexity.pop()
+            self.metrics['complexity'] += complexity
+            self.metrics['max_function_complexity'] = max(self.metrics['max_function_complexity'], complexity)
+        elif isinstance(node, ast.ClassDef):
+            methods = self._methods.pop()
+            if methods > 20:
+                self.suggestions.append({
+                    'category': 'design',
+                    'file': self.path,
+                    'class': node.name,
+                    'issue': f'Class has {methods} methods',
+                    'recommendation': 'Consider splitting into multiple classes',
+                    'priority': 'high'
+                })
+
+    def _check_function(self, node: ast.FunctionDef) -> None:
+        func_lines = node.end_lineno - node.lineno if hasattr(node, 'end_lineno') else 0
+        if func_lines > 50:
+            self.suggestions.append({
+                'category': 'maintainability',
+                'file': self.path,
+                'function': node.name,
+                'issue': f'Function is {func_lines} lines long',
+                'recommendation': 'Consider breaking into smaller functions',
+                'priority': 'medium'
+            })
+
+        param_count = len(node.args.args) + len(node.args.kwonlyargs)
+        if param_count > 5:
+            self.suggestions.append({
+                'category': 'maintainability',
+                'file': self.path,
+                'function': node.name,
+                'issue': f'Function has {param_count} parameters',
+                'recommendation': 'Consider using dataclass or config object',
+                'priority': 'low'
+            })
+
+        if not ast.get_docstring(node) and not node.name.startswith('_'):
+            self.suggestions.append({
+                'category': 'documentation',
+                'file': self.path,
+                'function': node.name,
+                'issue': 'Missing docstring',
+                'recommendation': 'Add docstring describing purpose and parameters',
+                'priority': 'low'
+            })
+
+
+def analyze_source(source: str, relative_path: str) -> dict[str, Any]:
+    """
+    Every analyzer's findings for one Python file.
+
+    Security checks are text based and run even when the file does not parse;
+    the AST-based sections are None in that case, with the error recorded.
+    """
+    result: dict[str, Any] = {'security': scan_security(source, relative_path)}
+    try:
+        tree = ast.parse(source, filename=relative_path)
+    except (SyntaxError, ValueError) as e:
+        result.update(error=str(e), metrics=None, performance_issues=None,
+                      opportunities=None, suggestions=None)
+        return result
+
+    visitor = _FileVisitor(relative_path)
+    visitor.run(tree)
+    lines = source.splitlines()
+    result['metrics'] = {
+        'lines_of_code': len(lines),
+        'blank_lines': sum(1 for line in lines if not line.strip()),
+        'comment_lines': sum(1 for line in lines if line.strip().startswith('#')),
+        **visitor.metrics,
+    }
+    by_line = itemgetter('line')
+    result['performance_issues'] = sorted(visitor.performance_issues, key=by_line)
+    result['opportunities'] = sorted(visitor.opportunities, key=by_line)
+    result['suggestions'] = visitor.suggestions
+    return result
+
+
+def _analyze_file(path: str, relative_path: str) -> tuple[str, str, dict[str, Any]]:
+    """Read, hash and analyze one file (process pool entry point)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    try:
+        source = data.decode('utf-8')
+    except UnicodeDecodeError as e:
+        return relative_path, digest, {'security': [], 'error': str(e), 'metrics': None,
+                                       'performance_issues': None, 'opportunities': None, 'suggestions': None}
+    return relative_path, digest, analyze_source(source, relative_path)
+
+
+class ProjectAnalysis:
+    """
+    Per-file analysis results for a project, computed at most once per change.
+
+    Pass one instance to every analyzer in a run so the tree is parsed once;
+    with ``cache_path`` the results also persist between runs.
+    """
+
+    def __init__(self, project_root: Path, cache_path: Path | None = None, max_workers: int | None = None):
+        self.project_root = Path(project_root)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self._files: dict[str, dict[str, Any]] | None = None
+        self.stats = {'analyzed': 0, 'reused': 0}
+
+    def python_files(self) -> dict[str, dict[str, Any]]:
+        """Relative path -> analysis result, in discovery order"""
+        if self._files is None:
+            self._files = self._collect()
+        return self._files
+
+    def refresh(self) -> dict[str, dict[str, Any]]:
+        """Re-check the tree for changes and return the updated results"""
+        self._files = None
+        return self.python_files()
+
+    def _load_cache(self) -> dict[str, dict[str, Any]]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable analysis cache {self.cache_path}: {e}")
+            return {}
+        if cached.get('version') != ANALYZER_VERSION:
+            return {}
+        return cached.get('files', {})
+
+    def _save_cache(self, entries: dict[str, dict[str, Any]]) -> None:
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': ANALYZER_VERSION, 'files': entries}, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def _collect(self) -> dict[str, dict[str, Any]]:
+        self.stats = {'analyzed': 0, 'reused': 0}
+        cached = self._load_cache()
+        entries: dict[str, dict[str, Any]] = {}
+        pending: list[tuple[str, str, tuple[int, int]]] = []
+
+        for py_file in iter_python_files(self.project_root):
+            relative_path = str(py_file.relative_to(self.project_root))
+            try:
+                st = py_file.stat()
+            except OSError as e:
+                logger.warning(f"Error reading {py_file}: {e}")
+                continue
+            signature = (st.st_mtime_ns, st.st_size)
+            entry = cached.get(relative_path)
+            if entry is not None and (entry['mtime_ns'], entry['size']) == signature:
+                entries[relative_path] = entry
+            else:
+                entries[relative_path] = None  # Keeps discovery order
+                pending.append((str(py_file), relative_path, signature))
+
+        for relative_path, digest, result, signature in self._analyze(pending):
+            previous = cached.get(relative_path)
+            if previous is not None and previous['sha256'] == digest:
+                # Touched but unchanged: keep the result, remember the new stat
+                result = previous['result']
+            else:
+                self.stats['analyzed'] += 1
+            entries[relative_path] = {'mtime_ns': signature[0], 'size': signature[1],
+                                      'sha256': digest, 'result': result}
+
+        entries = {path: entry for path, entry in entries.items() if entry is not None}
+        self.stats['reused'] = len(entries) - self.stats['analyzed']
+        if pending or len(entries) != len(cached):
+            self._save_cache(entries)
+        return {path: entry['result'] for path, entry in entries.items()}
+
+    def _analyze(self, pending: list[tuple[str, str, tuple[int, int]]]):
+        signatures = {relative_path: signature for _, relative_path, signature in pending}
+        jobs = [(path, relative_path) for path, relative_path, _ in pending]
+
+        if self.max_workers > 1 and len(jobs) >= PARALLEL_THRESHOLD:
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    results = list(pool.map(_analyze_file, *zip(*jobs), chunksize=16))
+            except (OSError, RuntimeError) as e:
+                # e.g. no process support in a sandbox; fall back to this process
+                logger.warning(f"Process pool unavailable, analyzing serially: {e}")
+                results = None
+            if results is not None:
+                for relative_path, digest, result in results:
+                    yield relative_path, digest, result, signatures[relative_path]
+                return
+
+        for path, relative_path in jobs:
+            try:
+                relative_path, digest, result = _analyze_file(path, relative_path)
+            except OSError as e:
+                logger.warning(f"Error analyzing {path}: {e}")
+                continue
+            yield relative_path, digest, result, signatures[relative_path]
+
+
+__all__ = ["ProjectAnalysis", "analyze_source", "scan_security", "find_line_number", "iter_python_files"]
@@ -7,6 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from .analysis import ProjectAnalysis
 from .tasks.audit import SoftwareAuditTask
 from .tasks.optimisation import OptimisationTask
 from .tasks.escalate import EscalationTask
@@ -42,6 +43,13 @@ class ChiefEnhancementsMetaAgent:
         ctx = EnhancementContext(product=product)
         ctx.log(f"Starting enhancement loop for {product}")
 
+        # One parse of the project serves every task; results persist between runs
+        if 'analysis' not in options:
+            options['analysis'] = ProjectAnalysis(
+                Path(options.get('project_root', '.')),
+                cache_path=self.knowledge_dir / "analysis_cache.json",
+            )
+
         for task in self.pipeline:
             ctx.log(f"Executing {task.name}")
             task.execute(ctx, options=options)
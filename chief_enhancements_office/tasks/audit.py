@@ -6,7 +6,6 @@ Software audit task with comprehensive code analysis capabilities.
 
 from __future__ import annotations
 
-import ast
 import logging
 import json
 import re
@@ -17,6 +16,7 @@ from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__name__)
 
+from ..analysis import ProjectAnalysis, analyze_source, find_line_number
 from .base import EnhancementTask
 
 if TYPE_CHECKING:
@@ -26,60 +26,21 @@ if TYPE_CHECKING:
 class CodeMetricsAnalyzer:
     """Analyzes code complexity and quality metrics."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, analysis: ProjectAnalysis | None = None):
         self.project_root = project_root
+        self.analysis = analysis or ProjectAnalysis(project_root)
 
     def analyze_python_file(self, filepath: Path) -> dict[str, Any]:
         """Analyze a single Python file for metrics."""
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 source = f.read()
-
-            tree = ast.parse(source, filename=str(filepath))
-
-            metrics = {
-                'lines_of_code': len(source.splitlines()),
-                'blank_lines': sum(1 for line in source.splitlines() if not line.strip()),
-                'comment_lines': sum(1 for line in source.splitlines() if line.strip().startswith('#')),
-                'functions': 0,
-                'classes': 0,
-                'complexity': 0,
-                'max_function_complexity': 0,
-                'imports': 0,
-                'docstrings': 0,
-            }
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    metrics['functions'] += 1
-                    complexity = self._calculate_complexity(node)
-                    metrics['complexity'] += complexity
-                    metrics['max_function_complexity'] = max(
-                        metrics['max_function_complexity'], complexity
-                    )
-                    if ast.get_docstring(node):
-                        metrics['docstrings'] += 1
-                elif isinstance(node, ast.ClassDef):
-                    metrics['classes'] += 1
-                    if ast.get_docstring(node):
-                        metrics['docstrings'] += 1
-                elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                    metrics['imports'] += 1
-
-            return metrics
-
         except Exception as e:
             return {'error': str(e)}
-
-    def _calculate_complexity(self, node: ast.AST) -> int:
-        """Calculate cyclomatic complexity of a function."""
-        complexity = 1
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.And, ast.Or)):
-                complexity += 1
-            elif isinstance(child, ast.ExceptHandler):
-                complexity += 1
-        return complexity
+        result = analyze_source(source, str(filepath))
+        if result['metrics'] is None:
+            return {'error': result['error']}
+        return result['metrics']
 
     def analyze_javascript_file(self, filepath: Path) -> dict[str, Any]:
         """Analyze a JavaScript/TypeScript file for basic metrics."""
@@ -112,14 +73,12 @@ class CodeMetricsAnalyzer:
             'rust': {'files': [], 'totals': defaultdict(int)},
         }
 
-        # Python files
-        for py_file in self.project_root.rglob('*.py'):
-            if '.venv' in str(py_file) or 'venv' in str(py_file):
-                continue
-            metrics = self.analyze_python_file(py_file)
-            if 'error' not in metrics:
+        # Python files (parsed once, shared with the other analyzers)
+        for relative_path, analysis in self.analysis.python_files().items():
+            metrics = analysis['metrics']
+            if metrics is not None:
                 results['python']['files'].append({
-                    'path': str(py_file.relative_to(self.project_root)),
+                    'path': relative_path,
                     'metrics': metrics
                 })
                 for key, value in metrics.items():
@@ -171,94 +130,31 @@ class CodeMetricsAnalyzer:
 class SecurityScanner:
     """Scans code for security vulnerabilities."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, analysis: ProjectAnalysis | None = None):
         self.project_root = project_root
+        self.analysis = analysis or ProjectAnalysis(project_root)
 
     def scan_python_security(self) -> dict[str, Any]:
         """Scan Python code for security issues."""
-        issues = []
+        issues = [
+            issue
+            for analysis in self.analysis.python_files().values()
+            for issue in analysis['security']
+        ]
 
-        # Check for common security anti-patterns
-        for py_file in self.project_root.rglob('*.py'):
-            if '.venv' in str(py_file) or 'venv' in str(py_file):
-                continue
-
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                relative_path = str(py_file.relative_to(self.project_root))
-
-                # Check for dangerous functions
-                if 'eval(' in content:
-                    issues.append({
-                        'severity': 'high',
-                        'file': relative_path,
-                        'issue': 'Use of eval() detected - potential code injection',
-                        'line': self._find_line_number(content, 'eval(')
-                    })
-
-                if 'exec(' in content:
-                    issues.append({
-                        'severity': 'high',
-                        'file': relative_path,
-                        'issue': 'Use of exec() detected - potential code injection',
-                        'line': self._find_line_number(content, 'exec(')
-                    })
-
-                if 'pickle.loads' in content and 'untrusted' in content.lower():
-                    issues.append({
-                        'severity': 'high',
-                        'file': relative_path,
-                        'issue': 'Unsafe pickle.loads() usage - potential code execution',
-                        'line': self._find_line_number(content, 'pickle.loads')
-                    })
-
-                if 'shell=True' in content:
-                    issues.append({
-                        'severity': 'medium',
-                        'file': relative_path,
-                        'issue': 'subprocess with shell=True - potential command injection',
-                        'line': self._find_line_number(content, 'shell=True')
-                    })
-
-                if re.search(r'password\s*=\s*["\'][^"\']+["\']', content, re.IGNORECASE):
-                    issues.append({
-                        'severity': 'critical',
-                        'file': relative_path,
-                        'issue': 'Hard-coded password detected',
-                        'line': self._find_line_number(content, 'password')
-                    })
-
-                if re.search(r'api[_-]?key\s*=\s*["\'][^"\']+["\']', content, re.IGNORECASE):
-                    issues.append({
-                        'severity': 'critical',
-                        'file': relative_path,
-                        'issue': 'Hard-coded API key detected',
-                        'line': self._find_line_number(content, 'api')
-                    })
-
-            except Exception as e:
-                logger.warning(f"Error scanning security for {py_file}: {e}")
+        by_severity = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
+        for issue in issues:
+            by_severity[issue['severity']] += 1
 
         return {
             'total_issues': len(issues),
-            'by_severity': {
-                'critical': len([i for i in issues if i['severity'] == 'critical']),
-                'high': len([i for i in issues if i['severity'] == 'high']),
-                'medium': len([i for i in issues if i['severity'] == 'medium']),
-                'low': len([i for i in issues if i['severity'] == 'low']),
-            },
+            'by_severity': by_severity,
             'issues': issues
         }
 
     def _find_line_number(self, content: str, pattern: str) -> int:
         """Find line number of pattern in content."""
-        lines = content.splitlines()
-        for i, line in enumerate(lines, 1):
-            if pattern in line:
-                return i
-        return 0
+        return find_line_number(content, pattern)
 
 
 class DependencyAuditor:
@@ -454,16 +350,17 @@ class SoftwareAuditTask(EnhancementTask):
             ctx.log(f"Project root {project_root} does not exist")
             ctx.telemetry['audit_error'] = f'Project root not found: {project_root}'
             return
+        analysis = options.get('analysis') or ProjectAnalysis(project_root)
 
         # Code metrics analysis
         ctx.log("Analyzing code metrics")
-        metrics_analyzer = CodeMetricsAnalyzer(project_root)
+        metrics_analyzer = CodeMetricsAnalyzer(project_root, analysis)
         code_metrics = metrics_analyzer.analyze_project()
         ctx.telemetry['code_metrics'] = code_metrics
 
         # Security scanning
         ctx.log("Scanning for security vulnerabilities")
-        security_scanner = SecurityScanner(project_root)
+        security_scanner = SecurityScanner(project_root, analysis)
         security_results = security_scanner.scan_python_security()
         ctx.telemetry['security_scan'] = security_results
 
@@ -6,7 +6,6 @@ Optimisation task with performance profiling and actionable recommendations.
 
 from __future__ import annotations
 
-import ast
 import logging
 import json
 from pathlib import Path
@@ -14,99 +13,31 @@ from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__name__)
 
+from ..analysis import ProjectAnalysis
 from .base import EnhancementTask
 
 if TYPE_CHECKING:
     from ..meta_agent import EnhancementContext
 
 
-class ParentAddingVisitor(ast.NodeVisitor):
-    """Adds a parent attribute to all nodes in the AST."""
-    def generic_visit(self, node: ast.AST) -> None:
-        for child in ast.iter_child_nodes(node):
-            child.parent = node  # type: ignore
-            self.visit(child)
-
 class PerformanceAnalyzer:
     """Analyzes code for performance issues and optimization opportunities."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, analysis: ProjectAnalysis | None = None):
         self.project_root = project_root
+        self.analysis = analysis or ProjectAnalysis(project_root)
 
     def analyze_python_performance(self) -> dict[str, Any]:
         """Analyze Python code for performance anti-patterns."""
         issues = []
         opportunities = []
 
-        for py_file in self.project_root.rglob('*.py'):
-            if '.venv' in str(py_file) or 'venv' in str(py_file):
-                continue
-
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    source = f.read()
-
-                tree = ast.parse(source, filename=str(py_file))
-                relative_path = str(py_file.relative_to(self.project_root))
-
-                # Inject parent references into the AST in O(N) time
-                ParentAddingVisitor().visit(tree)
-
-                # Check for common performance issues
-                for node in ast.walk(tree):
-                    # Detect nested loops (O(n^2) or worse)
-                    if isinstance(node, (ast.For, ast.While)):
-                        nested_loops = sum(
-                            1 for child in ast.walk(node)
-                            if isinstance(child, (ast.For, ast.While))
-                        )
-                        if nested_loops > 2:
-                            issues.append({
-                                'severity': 'medium',
-                                'file': relative_path,
-                                'issue': f'Deeply nested loops detected ({nested_loops} levels)',
-                                'recommendation': 'Consider algorithmic optimization or vectorization',
-                                'line': node.lineno
-                            })
-
-                    # Detect list comprehension that could be generator
-                    if isinstance(node, ast.ListComp):
-                        # ⚡ Bolt Optimization: Use injected parent reference instead of O(N^2) walk
-                        parent = getattr(node, 'parent', None)
-                        if parent and isinstance(parent, (ast.For, ast.Call)):
-                            opportunities.append({
-                                'file': relative_path,
-                                'opportunity': 'List comprehension could be generator expression',
-                                'benefit': 'Reduced memory usage',
-                                'line': node.lineno
-                            })
-
-                    # Detect repeated string concatenation
-                    if isinstance(node, ast.AugAssign) and isinstance(node.op, ast.Add):
-                        if isinstance(node.target, ast.Name):
-                            opportunities.append({
-                                'file': relative_path,
-                                'opportunity': 'String concatenation in loop detected',
-                                'recommendation': 'Use join() or list accumulation',
-                                'benefit': 'O(n) instead of O(n^2)',
-                                'line': node.lineno
-                            })
-
-                    # Detect inefficient dict/list operations
-                    if isinstance(node, ast.Call):
-                        if isinstance(node.func, ast.Attribute):
-                            if node.func.attr == 'keys' and isinstance(node.func.value, ast.Name):
-                                # Iterating over .keys() unnecessarily
-                                opportunities.append({
-                                    'file': relative_path,
-                                    'opportunity': 'Unnecessary .keys() call',
-                                    'recommendation': 'Iterate directly over dict',
-                                    'benefit': 'Cleaner code, slight performance gain',
-                                    'line': node.lineno
-                                })
-
-            except Exception as e:
-                logger.warning(f"Error analyzing performance for {py_file}: {e}")
+        # Nested loops, list comprehensions that could be generators, string
+        # concatenation and .keys() calls are found in the shared AST pass
+        for analysis in self.analysis.python_files().values():
+            if analysis['performance_issues'] is not None:
+                issues.extend(analysis['performance_issues'])
+                opportunities.extend(analysis['opportunities'])
 
         return {
             'performance_issues': issues,
@@ -119,89 +50,31 @@ class PerformanceAnalyzer:
 class CodeQualityAnalyzer:
     """Analyzes code quality and suggests improvements."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, analysis: ProjectAnalysis | None = None):
         self.project_root = project_root
+        self.analysis = analysis or ProjectAnalysis(project_root)
 
     def analyze_code_quality(self) -> dict[str, Any]:
         """Analyze code for quality issues."""
-        suggestions = []
-
-        for py_file in self.project_root.rglob('*.py'):
-            if '.venv' in str(py_file) or 'venv' in str(py_file):
-                continue
-
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    source = f.read()
-
-                tree = ast.parse(source, filename=str(py_file))
-                relative_path = str(py_file.relative_to(self.project_root))
-
-                # Check for long functions
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        func_lines = node.end_lineno - node.lineno if hasattr(node, 'end_lineno') else 0
-                        if func_lines > 50:
-                            suggestions.append({
-                                'category': 'maintainability',
-                                'file': relative_path,
-                                'function': node.name,
-                                'issue': f'Function is {func_lines} lines long',
-                                'recommendation': 'Consider breaking into smaller functions',
-                                'priority': 'medium'
-                            })
-
-                        # Check for too many parameters
-                        param_count = len(node.args.args) + len(node.args.kwonlyargs)
-                        if param_count > 5:
-                            suggestions.append({
-                                'category': 'maintainability',
-                                'file': relative_path,
-                                'function': node.name,
-                                'issue': f'Function has {param_count} parameters',
-                                'recommendation': 'Consider using dataclass or config object',
-                                'priority': 'low'
-                            })
-
-                        # Check for missing docstring
-                        if not ast.get_docstring(node) and not node.name.startswith('_'):
-                            suggestions.append({
-                                'category': 'documentation',
-                                'file': relative_path,
-                                'function': node.name,
-                                'issue': 'Missing docstring',
-                                'recommendation': 'Add docstring describing purpose and parameters',
-                                'priority': 'low'
-                            })
-
-                    # Check for large classes
-                    if isinstance(node, ast.ClassDef):
-                        methods = [n for n in ast.walk(node) if isinstance(n, ast.FunctionDef)]
-                        if len(methods) > 20:
-                            suggestions.append({
-                                'category': 'design',
-                                'file': relative_path,
-                                'class': node.name,
-                                'issue': f'Class has {len(methods)} methods',
-                                'recommendation': 'Consider splitting into multiple classes',
-                                'priority': 'high'
-                            })
+        # Long functions, parameter counts, missing docstrings and large
+        # classes are found in the shared AST pass
+        suggestions = [
+            suggestion
+            for analysis in self.analysis.python_files().values()
+            if analysis['suggestions'] is not None
+            for suggestion in analysis['suggestions']
+        ]
 
-            except Exception as e:
-                logger.warning(f"Error analyzing code quality for {py_file}: {e}")
+        by_category = {'maintainability': 0, 'documentation': 0, 'design': 0}
+        by_priority = {'high': 0, 'medium': 0, 'low': 0}
+        for suggestion in suggestions:
+            by_category[suggestion['category']] += 1
+            by_priority[suggestion['priority']] += 1
 
         return {
             'suggestions': suggestions,
-            'by_category': {
-                'maintainability': len([s for s in suggestions if s['category'] == 'maintainability']),
-                'documentation': len([s for s in suggestions if s['category'] == 'documentation']),
-                'design': len([s for s in suggestions if s['category'] == 'design']),
-            },
-            'by_priority': {
-                'high': len([s for s in suggestions if s['priority'] == 'high']),
-                'medium': len([s for s in suggestions if s['priority'] == 'medium']),
-                'low': len([s for s in suggestions if s['priority'] == 'low']),
-            },
+            'by_category': by_category,
+            'by_priority': by_priority,
             'total_suggestions': len(suggestions)
         }
 
@@ -307,10 +180,11 @@ class OptimisationTask(EnhancementTask):
         if not project_root.exists():
             ctx.log(f"Project root {project_root} does not exist")
             return
+        analysis = options.get('analysis') or ProjectAnalysis(project_root)
 
         # Performance analysis
         ctx.log("Analyzing performance patterns")
-        perf_analyzer = PerformanceAnalyzer(project_root)
+        perf_analyzer = PerformanceAnalyzer(project_root, analysis)
         perf_results = perf_analyzer.analyze_python_performance()
         ctx.telemetry['performance_analysis'] = perf_results
 
@@ -322,7 +196,7 @@ class OptimisationTask(EnhancementTask):
 
         # Code quality analysis
         ctx.log("Analyzing code quality")
-        quality_analyzer = CodeQualityAnalyzer(project_root)
+        quality_analyzer = CodeQualityAnalyzer(project_root, analysis)
         quality_results = quality_analyzer.analyze_code_quality()
         ctx.telemetry['code_quality'] = quality_results
 
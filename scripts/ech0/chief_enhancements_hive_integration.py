@@ -184,7 +184,7 @@ class ChiefEnhancementsHiveAgent:
         hive_status = self.hive.get_hive_status()
 
         # Count optimizations shared
-        optimization_learnings = len(self.hive.shared_knowledge.get('optimization_learnings', []))
+        optimization_learnings = self.hive.knowledge_store.count('optimization_learnings')
 
         return {
             'agent_id': self.agent_id,
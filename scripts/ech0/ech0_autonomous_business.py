@@ -237,6 +237,10 @@ class ECH0AutonomousCore:
             
             with open(log_path, 'w') as f:
                 json.dump(logs, f, indent=2)
+
+            # Append-only copy the dashboard tails instead of re-reading the array
+            with open(os.path.splitext(log_path)[0] + ".jsonl", 'a') as f:
+                f.write(json.dumps(entry) + "\n")
         except Exception as e:
             print(f"[ERROR] Failed to save shared log: {e}")
 
@@ -385,13 +385,8 @@ class EnhancedParliamentValidator:
         print(f"   📊 Local Density: {node.density} inventions")
         print(f"   🎯 Novelty Score: {node.calculate_local_novelty():.0%}")
 
-        # Check for prior art through lattice
-        similar_nodes = []
-        for other_id, other_node in self.semantic_lattice.nodes.items():
-            if other_id != node_id and other_node.density > 0:
-                distance = self.semantic_lattice.calculate_semantic_distance(node_id, other_id)
-                if distance < 0.3:  # Close semantic distance
-                    similar_nodes.append((other_id, distance))
+        # Check for prior art through lattice (one traversal from the new node)
+        similar_nodes = self.semantic_lattice.find_similar_nodes(node_id, threshold=0.3)
 
         if similar_nodes:
             print(f"   ⚠️  Found {len(similar_nodes)} similar inventions")
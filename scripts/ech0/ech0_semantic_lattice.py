@@ -67,8 +67,14 @@ class ECH0SemanticLattice:
     - Level 2: Domains (e.g., "Virtual Reality", "Neurotechnology")
     - Level 3: Fields (e.g., "Human-Computer Interaction")
     - Level 4: Meta-categories (e.g., "Enhancement Technology")
+
+    Explored combinations are kept in an unordered-pair index and hop counts
+    from a node come from one cached breadth-first search, so placing and
+    validating an invention stays near-linear in lattice size.
     """
 
+    MAX_DISTANCE = 10  # Approximate maximum levels in lattice
+
     def __init__(self):
         self.nodes: Dict[str, SemanticLatticeNode] = {}
         self.graph = nx.DiGraph()
@@ -77,6 +83,11 @@ class ECH0SemanticLattice:
         self.gap_opportunities = []
         self.emergence_clusters = []
 
+        # frozenset({concept_a, concept_b}) for every combination in the lattice
+        self.explored_combinations: Set[frozenset] = set()
+        # Single-source hop counts, dropped whenever an edge is added
+        self._distance_cache: Dict[str, Dict[str, int]] = {}
+
         # Initialize root concepts
         self._initialize_lattice()
 
@@ -140,6 +151,16 @@ class ECH0SemanticLattice:
             self.nodes[child_id].parents.add(parent_id)
             self.nodes[parent_id].children.add(child_id)
             self.graph.add_edge(child_id, parent_id)
+            self._distance_cache.clear()
+
+    def _register_combination(self, categories: List[str]):
+        """Record the combination a combo or bridge node covers in the pair index"""
+        if len(categories) >= 2:
+            self.explored_combinations.add(frozenset(categories[:2]))
+
+    def is_combination_explored(self, concept_a: str, concept_b: str) -> bool:
+        """O(1) check whether two concepts are already combined somewhere in the lattice"""
+        return frozenset((concept_a, concept_b)) in self.explored_combinations
 
     def add_invention(self, invention: Dict) -> str:
         """Add an invention to the lattice and find its optimal position"""
@@ -184,6 +205,7 @@ class ECH0SemanticLattice:
 
             self.nodes[node_id] = node
             self.graph.add_node(node_id, data=node)
+            self._register_combination(categories)
 
             # Connect to parent domains
             for category in categories:
@@ -227,6 +249,7 @@ class ECH0SemanticLattice:
 
             self.nodes[bridge_id] = bridge_node
             self.graph.add_node(bridge_id, data=bridge_node)
+            self._register_combination(categories)
 
             # Connect bridge to source node
             self._connect_nodes(node_id, bridge_id)
@@ -275,15 +298,7 @@ class ECH0SemanticLattice:
                 sibling = self.nodes[sibling_id]
 
                 # Check if combination exists
-                combo_key = f"{node.name}_{sibling.name}"
-                reverse_combo = f"{sibling.name}_{node.name}"
-
-                combo_exists = any(
-                    combo_key in n or reverse_combo in n
-                    for n in self.nodes.keys()
-                )
-
-                if not combo_exists and sibling.density > 0:
+                if sibling.density > 0 and not self.is_combination_explored(node.name, sibling.name):
                     unexplored.append((node.name, sibling.name))
 
         return unexplored
@@ -294,28 +309,50 @@ class ECH0SemanticLattice:
         if inv1_id not in self.nodes or inv2_id not in self.nodes:
             return 1.0  # Maximum distance for unknown nodes
 
-        try:
-            # Use shortest path length as distance metric
-            path_length = nx.shortest_path_length(self.graph, inv1_id, inv2_id)
-
+        # Use shortest path length as distance metric
+        path_length = self._path_lengths(inv1_id).get(inv2_id)
+        if path_length is not None:
             # Normalize by maximum possible distance
-            max_distance = 10  # Approximate maximum levels in lattice
-            distance = min(1.0, path_length / max_distance)
-
-            return distance
-
-        except nx.NetworkXNoPath:
-            # No path exists - check for common ancestors
-            ancestors1 = nx.ancestors(self.graph, inv1_id)
-            ancestors2 = nx.ancestors(self.graph, inv2_id)
-
-            common = ancestors1.intersection(ancestors2)
-            if common:
-                # Have common ancestors - calculate distance through LCA
-                return 0.7  # Moderate distance
-            else:
-                # Completely unrelated
-                return 1.0
+            return min(1.0, path_length / self.MAX_DISTANCE)
+
+        # No path exists - check for common ancestors
+        ancestors1 = nx.ancestors(self.graph, inv1_id)
+        ancestors2 = nx.ancestors(self.graph, inv2_id)
+
+        common = ancestors1.intersection(ancestors2)
+        if common:
+            # Have common ancestors - calculate distance through LCA
+            return 0.7  # Moderate distance
+        else:
+            # Completely unrelated
+            return 1.0
+
+    def _path_lengths(self, node_id: str) -> Dict[str, int]:
+        """Hop counts from node_id to every reachable node (one BFS, cached)"""
+        lengths = self._distance_cache.get(node_id)
+        if lengths is None:
+            lengths = nx.single_source_shortest_path_length(self.graph, node_id)
+            self._distance_cache[node_id] = lengths
+        return lengths
+
+    def semantic_distances(self, node_id: str) -> Dict[str, float]:
+        """calculate_semantic_distance from node_id to every node reachable from it"""
+        if node_id not in self.nodes:
+            return {}
+        return {
+            other_id: min(1.0, length / self.MAX_DISTANCE)
+            for other_id, length in self._path_lengths(node_id).items()
+            if other_id != node_id
+        }
+
+    def find_similar_nodes(self, node_id: str, threshold: float = 0.3) -> List[Tuple[str, float]]:
+        """Nodes holding inventions within ``threshold`` semantic distance of node_id"""
+        # Unreachable nodes are at least 0.7 apart, so only the BFS result needs checking
+        return [
+            (other_id, distance)
+            for other_id, distance in self.semantic_distances(node_id).items()
+            if distance < threshold and self.nodes[other_id].density > 0
+        ]
 
     def find_innovation_clusters(self) -> List[Dict]:
         """Identify emergent clusters of innovation in the lattice"""
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+ASYNC HUMAN BEHAVIOR SIMULATOR - Non-blocking interaction timing
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+Asyncio counterpart of human_behavior_simulator.HumanBehaviorSimulator with
+the same timing model. Instead of calling time.sleep per Bezier point and
+per typed character, every gesture is precomputed as NumPy arrays (path
+points, keystrokes and the delay after each) and replayed against absolute
+deadlines with asyncio sleeps. Events falling in the same ``min_sleep``
+window (10 ms by default) share one wake-up, so consecutive keystrokes are
+sent in a single send_keys call. Many sessions can share one event loop.
+
+Passing ``seed`` and a VirtualClock gives a deterministic run in virtual
+time, which is what the tests use.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+MIN_SLEEP = 0.010
+BACKSPACE = '\ue003'
+WRONG_CHARS = np.array(list('qwertyuiopasdfghjklzxcvbnm'))
+MISCLICK_INTERVALS = np.arange(7, 16)
+MISCLICK_WEIGHTS = np.array([25, 20, 15, 15, 10, 7, 5, 2, 1]) / 100
+
+
+class RealClock:
+    """Event-loop time and asyncio.sleep."""
+
+    def time(self) -> float:
+        return asyncio.get_running_loop().time()
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+
+class VirtualClock:
+    """Deterministic clock for one session: sleeping advances ``now`` instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = 0
+
+    def time(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += max(seconds, 0.0)
+        self.sleeps += 1
+        await asyncio.sleep(0)  # Still yield, so sessions interleave
+
+
+@dataclass(frozen=True)
+class Schedule:
+    """Events with the delay to wait after each one."""
+    events: Tuple[Any, ...]
+    delays: np.ndarray
+
+    @property
+    def duration(self) -> float:
+        return float(self.delays.sum())
+
+    def batches(self, min_sleep: float = MIN_SLEEP) -> List[Tuple[float, Tuple[Any, ...]]]:
+        """
+        Group events into ``(offset, events)`` wake-ups.
+
+        An event fires at the sum of the delays before it. Events whose fire
+        time falls within ``min_sleep`` of the batch's first event join that
+        batch, so no wait between batches is shorter than ``min_sleep``.
+        """
+        if not self.events:
+            return []
+        fire = np.concatenate(([0.0], np.cumsum(self.delays[:-1])))
+        batches = []
+        start = 0
+        for i in range(1, len(fire)):
+            if fire[i] - fire[start] >= min_sleep:
+                batches.append((float(fire[start]), self.events[start:i]))
+                start = i
+        batches.append((float(fire[start]), self.events[start:]))
+        return batches
+
+
+def bezier_path(start: Tuple[int, int], end: Tuple[int, int], steps: int,
+                rng: np.random.Generator) -> np.ndarray:
+    """
+    Cubic Bezier path as a ``(steps + 1, 2)`` integer array, with control
+    points at 1/3 and 2/3 of the way offset by up to 50 px.
+    """
+    p0 = np.asarray(start, dtype=float)
+    p3 = np.asarray(end, dtype=float)
+    delta = p3 - p0
+    p1 = p0 + delta * 0.33 + rng.integers(-50, 51, size=2)
+    p2 = p0 + delta * 0.66 + rng.integers(-50, 51, size=2)
+
+    t = np.linspace(0.0, 1.0, steps + 1)[:, None]
+    u = 1.0 - t
+    points = u ** 3 * p0 + 3 * u ** 2 * t * p1 + 3 * u * t ** 2 * p2 + t ** 3 * p3
+    return points.astype(int)
+
+
+def movement_schedule(start: Tuple[int, int], end: Tuple[int, int],
+                      rng: np.random.Generator, steps: Optional[int] = None) -> Schedule:
+    """Path points with fast moves for the first 70% and slowing near the target."""
+    if steps is None:
+        steps = int(rng.integers(15, 31))
+    points = bezier_path(start, end, steps, rng)
+    n = len(points)
+    slow = np.arange(n) >= n * 0.7
+    delays = np.where(slow, rng.uniform(0.01, 0.02, n), rng.uniform(0.001, 0.005, n))
+    return Schedule(tuple(map(tuple, points.tolist())), delays)
+
+
+def keystroke_schedule(text: str, rng: np.random.Generator, typo_rate: float = 0.05) -> Schedule:
+    """
+    Keys to send (including typos and their backspaces) and the delay after each.
+
+    Per character: a base delay of 80-150 ms, 70-90% of that inside the
+    text; with probability ``typo_rate`` (never on the last character) a
+    wrong key, a 200-500 ms pause, and a backspace come first.
+    """
+    n = len(text)
+    if not n:
+        return Schedule((), np.zeros(0))
+    base = rng.uniform(0.08, 0.15, n)
+    inner = np.zeros(n, dtype=bool)
+    inner[1:-1] = True
+    base = np.where(inner, base * rng.uniform(0.7, 0.9, n), base)
+    typo = rng.random(n) < typo_rate
+    typo[-1] = False
+    wrong = rng.choice(WRONG_CHARS, n)
+    realise = rng.uniform(0.2, 0.5, n)
+
+    # Each character expands to 1 key, or 3 with a typo
+    counts = np.where(typo, 3, 1)
+    ends = np.cumsum(counts)
+    total = int(ends[-1])
+    delays = np.repeat(base, counts)
+    typo_first = (ends - 3)[typo]
+    delays[typo_first] += realise[typo]
+
+    keys = np.empty(total, dtype=object)
+    keys[ends - 1] = list(text)
+    keys[typo_first] = wrong[typo]
+    keys[typo_first + 1] = BACKSPACE
+    return Schedule(tuple(keys.tolist()), delays)
+
+
+def scroll_schedule(amount: int, rng: np.random.Generator) -> Schedule:
+    """Scroll bursts of ``amount // bursts`` px with 0.1-0.4 s pauses, sometimes a reading pause."""
+    bursts = int(rng.integers(3, 8))
+    delays = rng.uniform(0.1, 0.4, bursts)
+    reading = rng.random(bursts) < 0.3
+    delays = delays + np.where(reading, rng.uniform(0.5, 1.5, bursts), 0.0)
+    return Schedule((amount // bursts,) * bursts, delays)
+
+
+class AsyncHumanBehaviorSimulator:
+    """
+    Human-like interaction timing on asyncio.
+
+    Driver calls are blocking WebDriver round trips, so by default they run
+    in a worker thread (``offload_driver_calls``); fakes used in tests can be
+    called inline. ``action_chains`` defaults to Selenium's ActionChains.
+    """
+
+    def __init__(self, driver, seed: Optional[int] = None, clock=None,
+                 min_sleep: float = MIN_SLEEP, offload_driver_calls: bool = True,
+                 action_chains=None):
+        self.driver = driver
+        self.rng = np.random.default_rng(seed)
+        self.clock = clock or RealClock()
+        self.min_sleep = min_sleep
+        self.offload_driver_calls = offload_driver_calls
+        self._action_chains = action_chains
+        self.click_counter = 0
+        self.misclicks = self.rng.choice(MISCLICK_INTERVALS, 100, p=MISCLICK_WEIGHTS).cumsum()
+        self._next_misclick = 0
+
+    @property
+    def action_chains(self):
+        if self._action_chains is None:
+            from selenium.webdriver.common.action_chains import ActionChains
+            self._action_chains = ActionChains
+        return self._action_chains
+
+    async def _call(self, fn: Callable, *args) -> Any:
+        if self.offload_driver_calls:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    async def pause(self, low: float, high: float) -> None:
+        await self.clock.sleep(float(self.rng.uniform(low, high)))
+
+    async def replay(self, schedule: Schedule,
+                     fire: Optional[Callable[[Tuple[Any, ...]], Awaitable[None]]] = None) -> None:
+        """
+        Play a schedule against absolute deadlines, so time spent in ``fire``
+        does not accumulate as drift. Without ``fire`` it is a single sleep.
+        """
+        if fire is None:
+            if schedule.events:
+                await self.clock.sleep(schedule.duration)
+            return
+        start = self.clock.time()
+        for offset, events in schedule.batches(self.min_sleep):
+            wait = start + offset - self.clock.time()
+            if wait > 0:
+                await self.clock.sleep(wait)
+            await fire(events)
+        wait = start + schedule.duration - self.clock.time()
+        if wait > 0:
+            await self.clock.sleep(wait)
+
+    def _should_misclick(self) -> bool:
+        """Misclick every 7-15 clicks, weighted toward 7-10."""
+        self.click_counter += 1
+        if self.click_counter < self.misclicks[self._next_misclick % len(self.misclicks)]:
+            return False
+        self._next_misclick += 1
+        if self._next_misclick == len(self.misclicks):
+            self.misclicks = self.misclicks + self.misclicks[-1]
+            self._next_misclick = 0
+        return True
+
+    async def _viewport(self) -> Tuple[int, int]:
+        width = await self._call(self.driver.execute_script, "return window.innerWidth")
+        height = await self._call(self.driver.execute_script, "return window.innerHeight")
+        return width, height
+
+    async def human_move_to_element(self, element) -> None:
+        """Move along a Bezier path from the viewport centre to the element."""
+        width, height = await self._viewport()
+        # Both properties are WebDriver round trips too
+        location = await self._call(lambda: element.location)
+        size = await self._call(lambda: element.size)
+        target = (location['x'] + size['width'] // 2, location['y'] + size['height'] // 2)
+
+        await self.replay(movement_schedule((width // 2, height // 2), target, self.rng))
+        await self._call(lambda: self.action_chains(self.driver).move_to_element(element).perform())
+        await self.pause(0.05, 0.15)  # Small hesitation before click
+
+    async def human_click(self, element) -> None:
+        """Click with occasional misclicks slightly off target."""
+        await self.human_move_to_element(element)
+
+        if self._should_misclick():
+            offset_x, offset_y = (int(v) for v in self.rng.integers(-30, 31, size=2))
+            await self._call(lambda: self.action_chains(self.driver).move_to_element_with_offset(
+                element, offset_x, offset_y
+            ).click().perform())
+            await self.pause(0.3, 0.7)  # Realize mistake
+            await self.human_move_to_element(element)
+
+        await self._call(element.click)
+        await self.pause(0.1, 0.3)
+
+    async def human_type(self, element, text: str) -> None:
+        """Type with speed variation and occasional corrected typos."""
+        await self._call(element.click)
+        await self.pause(0.1, 0.3)
+
+        async def send(keys: Sequence[str]) -> None:
+            await self._call(element.send_keys, "".join(keys))
+
+        await self.replay(keystroke_schedule(text, self.rng), send)
+        await self.pause(0.2, 0.5)
+
+    async def human_scroll(self, direction: str = "down", amount: Optional[int] = None) -> None:
+        """Scroll in bursts with pauses."""
+        if amount is None:
+            amount = int(self.rng.integers(300, 601))
+        sign = "" if direction == "down" else "-"
+
+        async def scroll(bursts: Sequence[int]) -> None:
+            for pixels in bursts:
+                await self._call(self.driver.execute_script, f"window.scrollBy(0, {sign}{pixels});")
+
+        await self.replay(scroll_schedule(amount, self.rng), scroll)
+
+    async def inefficient_navigation(self, target_element, other_elements: List) -> None:
+        """Sometimes look at 1-3 other elements before clicking the target."""
+        if self.rng.random() < 0.4 and other_elements:
+            count = int(self.rng.integers(1, min(3, len(other_elements)) + 1))
+            for index in self.rng.choice(len(other_elements), count, replace=False):
+                await self.human_move_to_element(other_elements[index])
+                await self.pause(0.3, 0.8)
+
+        await self.human_click(target_element)
+
+    async def reading_pause(self, content_length: Optional[int] = None) -> float:
+        """Pause for reading time at ~225 words per minute, or 2-8 s."""
+        if content_length:
+            actual = (content_length / 5 / 225) * 60 * float(self.rng.uniform(0.7, 1.3))
+        else:
+            actual = float(self.rng.uniform(2, 8))
+        await self.clock.sleep(actual)
+        return actual
+
+    async def natural_page_arrival_behavior(self) -> None:
+        """Load pause, scroll down a bit, and maybe back up."""
+        await self.pause(0.5, 1.5)
+        await self.human_scroll("down", amount=int(self.rng.integers(100, 301)))
+        await self.pause(0.3, 0.8)
+
+        if self.rng.random() < 0.3:
+            await self.human_scroll("up", amount=int(self.rng.integers(50, 151)))
+            await self.pause(0.2, 0.5)
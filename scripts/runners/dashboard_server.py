@@ -2,196 +2,457 @@
 """
 BBB Real-Time Dashboard Server
 Serves REAL data only — no simulations, no fake numbers.
+
+A single asyncio event loop owns the state. Each refresh probes every source
+concurrently, then publishes an immutable, pre-serialised Snapshot; request
+handlers only ever read the current snapshot, so serving a dashboard is a
+buffer write. Clients can revalidate with If-None-Match or subscribe to
+/api/events (server-sent events) and receive each new snapshot as it lands.
 """
 
 import sys
 import os
+import asyncio
+import hashlib
 import json
 import time
-import threading
+import urllib.request
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-# ── Real state store (starts at zero, updated by live system) ──────────────
-state = {
-    "revenue": {
-        "total": 0.0,
-        "monthly": 0.0,
-        "today": 0.0,
-        "currency": "USD"
-    },
-    "customers": {
-        "total": 0,
-        "active": 0,
-        "new_today": 0
-    },
-    "businesses": [],          # populated from live orchestrator
-    "agents": [],              # live agent status
-    "emails": {
-        "sent_today": 0,
-        "delivered": 0,
-        "failed": 0
-    },
-    "social": {
-        "posts_today": 0,
-        "twitter_connected": False,
-        "sendgrid_connected": False,
-        "twilio_connected": False
-    },
-    "system": {
-        "status": "starting",
-        "uptime_seconds": 0,
-        "started_at": datetime.now().isoformat(),
-        "ollama_model": "echo",
-        "ollama_connected": False,
-        "last_updated": datetime.now().isoformat()
-    },
-    "activity_log": []
-}
+ECH0_DIR = Path.home() / ".ech0"
+ACTIVITY_LOG_LIMIT = 50
+ACTIVITY_LOG_TAIL_BYTES = 64 * 1024  # How far back the first poll reads
+
+
+def initial_state() -> Dict[str, Any]:
+    """Real state store (starts at zero, updated by live system)"""
+    return {
+        "revenue": {
+            "total": 0.0,
+            "monthly": 0.0,
+            "today": 0.0,
+            "currency": "USD"
+        },
+        "customers": {
+            "total": 0,
+            "active": 0,
+            "new_today": 0
+        },
+        "businesses": [],          # populated from live orchestrator
+        "agents": [],              # live agent status
+        "emails": {
+            "sent_today": 0,
+            "delivered": 0,
+            "failed": 0
+        },
+        "social": {
+            "posts_today": 0,
+            "twitter_connected": False,
+            "sendgrid_connected": False,
+            "twilio_connected": False
+        },
+        "system": {
+            "status": "starting",
+            "uptime_seconds": 0,
+            "started_at": datetime.now().isoformat(),
+            "ollama_model": "echo",
+            "ollama_connected": False,
+            "last_updated": datetime.now().isoformat()
+        },
+        "activity_log": []
+    }
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One published version of the dashboard state, already encoded"""
+    version: int
+    state_body: bytes
+    state_etag: str
+    log_body: bytes
+    log_etag: str
+    event: bytes  # Server-sent event frame carrying state_body
+
+    @classmethod
+    def build(cls, version: int, state: Dict[str, Any]) -> "Snapshot":
+        state_body = json.dumps(state, default=str).encode()
+        log_body = json.dumps(state["activity_log"], default=str).encode()
+        return cls(
+            version=version,
+            state_body=state_body,
+            state_etag=_etag(state_body),
+            log_body=log_body,
+            log_etag=_etag(log_body),
+            event=b"id: %d\ndata: %s\n\n" % (version, state_body),
+        )
 
-start_time = time.time()
 
-def check_services():
-    """Check real service connectivity."""
-    import urllib.request, urllib.error
+# ── Data sources ──────────────────────────────────────────────────────────────
+def _fetch_json(request, timeout: float) -> Any:
+    with urllib.request.urlopen(request, timeout=timeout) as resp:
+        return json.loads(resp.read())
 
-    # Check Ollama
+
+def check_ollama(timeout: float = 2) -> Dict[str, Any]:
+    """Check the local Ollama server and pick the ECH0 model."""
     try:
-        req = urllib.request.urlopen("http://localhost:11434/api/tags", timeout=2)
-        data = json.loads(req.read())
-        models = [m["name"] for m in data.get("models", [])]
-        state["system"]["ollama_connected"] = True
-        state["system"]["ollama_model"] = next((m for m in models if "ech0" in m.lower()), models[0] if models else "none")
+        data = _fetch_json("http://localhost:11434/api/tags", timeout)
     except Exception:
-        state["system"]["ollama_connected"] = False
+        return {"system": {"ollama_connected": False}}
+    models = [m["name"] for m in data.get("models", [])]
+    return {"system": {
+        "ollama_connected": True,
+        "ollama_model": next((m for m in models if "ech0" in m.lower()), models[0] if models else "none"),
+    }}
+
 
-    # Check SendGrid, Twilio, Twitter, ElevenLabs
+def check_services() -> Dict[str, Any]:
+    """Check which SendGrid, Twilio, Twitter and ElevenLabs keys are configured."""
     try:
         from blank_business_builder.config import settings
-        state["social"]["sendgrid_connected"] = bool(settings.SENDGRID_API_KEY and settings.SENDGRID_API_KEY.startswith("SG."))
-        state["social"]["twilio_connected"] = bool(settings.TWILIO_API_KEY_SID or settings.TWILIO_ACCOUNT_SID)
-        state["social"]["twitter_connected"] = bool(settings.TWITTER_CONSUMER_KEY)
-        state["social"]["elevenlabs_connected"] = bool(settings.ELEVENLABS_API_KEY)
+        return {"social": {
+            "sendgrid_connected": bool(settings.SENDGRID_API_KEY and settings.SENDGRID_API_KEY.startswith("SG.")),
+            "twilio_connected": bool(settings.TWILIO_API_KEY_SID or settings.TWILIO_ACCOUNT_SID),
+            "twitter_connected": bool(settings.TWITTER_CONSUMER_KEY),
+            "elevenlabs_connected": bool(settings.ELEVENLABS_API_KEY),
+        }}
     except Exception:
-        pass
+        return {}
+
 
-def check_stripe_revenue():
+def check_stripe_revenue(timeout: float = 5) -> Dict[str, Any]:
     """Pull real revenue from Stripe if key is set."""
     try:
         from blank_business_builder.config import settings
         if not settings.STRIPE_SECRET_KEY:
-            return  # No Stripe key — revenue stays $0
+            return {}  # No Stripe key — revenue stays $0
 
-        import urllib.request
         req = urllib.request.Request(
             "https://api.stripe.com/v1/balance",
             headers={"Authorization": f"Bearer {settings.STRIPE_SECRET_KEY}"}
         )
-        resp = json.loads(urllib.request.urlopen(req, timeout=5).read())
+        resp = _fetch_json(req, timeout)
         available = sum(b["amount"] for b in resp.get("available", [])) / 100
-        state["revenue"]["total"] = available
+        return {"revenue": {"total": available}}
     except Exception:
-        pass
+        return {}
+
+
+class FileWatch:
+    """Reports whether a file changed since the last check, using stat only"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._signature: Optional[Tuple[int, int, int]] = None
 
-def load_ech0_config():
+    def changed(self) -> bool:
+        try:
+            st = self.path.stat()
+        except OSError:
+            signature = None
+        else:
+            signature = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        return signature is not None
+
+
+def load_ech0_config(config_path: Path) -> Dict[str, Any]:
     """Load real business config from ~/.ech0/business_config.json"""
-    config_path = Path.home() / ".ech0" / "business_config.json"
-    if config_path.exists():
+    with open(config_path) as f:
+        cfg = json.load(f)
+    # Use the new 'businesses' key if present, fall back to 'websites'
+    businesses = cfg.get("businesses", {})
+    if businesses:
+        return {"businesses": [
+            {
+                "name": v.get("name", k),
+                "url": v.get("url", ""),
+                "category": v.get("category", ""),
+                "status": v.get("status", "active"),
+                "revenue": 0.0,
+                "monthly_target": v.get("monthly_target", 0.0)
+            }
+            for k, v in businesses.items()
+        ]}
+    websites = cfg.get("websites", {})
+    return {"businesses": [
+        {"name": k.replace("_", " ").title(), "url": "", "category": "", "status": "active", "revenue": 0.0, "monthly_target": 0.0}
+        for k in websites.keys()
+    ]}
+
+
+class ActivityLogTail:
+    """
+    Newest-first activity log fed incrementally from the ECH0 shared log.
+
+    ``activity_log.jsonl`` (one entry per line, appended) is read from the
+    last offset, so each poll costs only the new bytes; the first poll reads
+    just the last ``tail_bytes`` of a long-lived log. Without it, the legacy
+    ``activity_log.json`` array is re-read only when its stat changes.
+    """
+
+    def __init__(self, jsonl_path: Path, json_path: Path, limit: int = ACTIVITY_LOG_LIMIT,
+                 tail_bytes: int = ACTIVITY_LOG_TAIL_BYTES):
+        self.jsonl_path = Path(jsonl_path)
+        self.json_path = Path(json_path)
+        self.tail_bytes = tail_bytes
+        self.entries: Deque[Dict[str, Any]] = deque(maxlen=limit)
+        self._legacy = FileWatch(self.json_path)
+        self._inode: Optional[int] = None
+        self._offset = 0
+
+    def add(self, entry: Dict[str, Any]):
+        self.entries.appendleft(entry)
+
+    def poll(self) -> bool:
+        """Read whatever was written since the last poll; True if entries changed"""
         try:
-            with open(config_path) as f:
-                cfg = json.load(f)
-            # Use the new 'businesses' key if present, fall back to 'websites'
-            businesses = cfg.get("businesses", {})
-            if businesses:
-                state["businesses"] = [
-                    {
-                        "name": v.get("name", k),
-                        "url": v.get("url", ""),
-                        "category": v.get("category", ""),
-                        "status": v.get("status", "active"),
-                        "revenue": 0.0,
-                        "monthly_target": v.get("monthly_target", 0.0)
-                    }
-                    for k, v in businesses.items()
-                ]
-            else:
-                websites = cfg.get("websites", {})
-                state["businesses"] = [
-                    {"name": k.replace("_", " ").title(), "url": "", "category": "", "status": "active", "revenue": 0.0, "monthly_target": 0.0}
-                    for k in websites.keys()
-                ]
-        except Exception as e:
-            log_activity(f"Config load error: {e}")
-
-def log_activity(msg: str):
-    entry = {"time": datetime.now().strftime("%H:%M:%S"), "msg": msg}
-    state["activity_log"].insert(0, entry)
-    state["activity_log"] = state["activity_log"][:50]  # keep last 50
-
-def load_shared_activity_log():
-    """Load activity logs from ECH0 autonomous system."""
-    log_path = Path.home() / ".ech0" / "activity_log.json"
-    if log_path.exists():
+            st = self.jsonl_path.stat()
+        except OSError:
+            return self._poll_legacy()
+
+        skip_partial = False
+        if self._inode is None and st.st_size > self.tail_bytes:
+            # First open of a long log: only its tail can reach the display.
+            # Start one byte early so a line beginning exactly at the cut is kept
+            self._inode, self._offset = st.st_ino, st.st_size - self.tail_bytes - 1
+            skip_partial = True
+        elif st.st_ino != self._inode or st.st_size < self._offset:
+            # Rotated or truncated: start from the top of the new file
+            self._inode, self._offset = st.st_ino, 0
+        if st.st_size == self._offset:
+            return False
+
+        with open(self.jsonl_path, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read(st.st_size - self._offset)
+        if skip_partial:
+            start = chunk.find(b"\n") + 1
+            self._offset += start
+            chunk = chunk[start:]
+        complete = chunk.rfind(b"\n") + 1  # Leave a half-written last line for the next poll
+        self._offset += complete
+        changed = False
+        for line in chunk[:complete].splitlines():
+            try:
+                self.add(json.loads(line))
+                changed = True
+            except ValueError:
+                continue
+        return changed
+
+    def _poll_legacy(self) -> bool:
+        if not self._legacy.changed():
+            return False
         try:
-            with open(log_path) as f:
+            with open(self.json_path) as f:
                 shared_logs = json.load(f)
-            # Merge with existing state while avoiding duplicates if any
-            state["activity_log"] = shared_logs[:50]
-        except Exception as e:
-            pass
-
-def background_updater():
-    """Refresh real data every 10 seconds (increased frequency)."""
-    while True:
+        except (OSError, ValueError):
+            return False
+        self.entries.clear()
+        self.entries.extend(shared_logs[:self.entries.maxlen])
+        return True
+
+
+# ── Server ────────────────────────────────────────────────────────────────────
+class DashboardServer:
+    """Asyncio dashboard server publishing immutable snapshots of the live state"""
+
+    def __init__(self, host: str = "", port: int = 8765, refresh_interval: float = 10,
+                 probe_timeout: float = 5, ech0_dir: Path = ECH0_DIR):
+        self.host = host
+        self.port = port
+        self.refresh_interval = refresh_interval
+        self.probe_timeout = probe_timeout
+        self.state = initial_state()
+        self.start_time = time.time()
+        self.config_path = Path(ech0_dir) / "business_config.json"
+        self._config = FileWatch(self.config_path)
+        self.activity = ActivityLogTail(Path(ech0_dir) / "activity_log.jsonl", Path(ech0_dir) / "activity_log.json")
+        self.snapshot = Snapshot.build(0, self.state)
+        self._published = asyncio.Event()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._refresher: Optional[asyncio.Task] = None
+        self._clients: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._closing = False
+        self.html = DASHBOARD_HTML.encode()
+        self.html_etag = _etag(self.html)
+
+    # State
+    def log_activity(self, msg: str):
+        self.activity.add({"time": datetime.now().strftime("%H:%M:%S"), "msg": msg})
+
+    def probes(self) -> List:
+        """Blocking source checks run concurrently on each refresh"""
+        return [
+            lambda: check_ollama(min(2, self.probe_timeout)),
+            check_services,
+            lambda: check_stripe_revenue(self.probe_timeout),
+        ]
+
+    async def _probe(self, probe) -> Dict[str, Any]:
         try:
-            state["system"]["uptime_seconds"] = int(time.time() - start_time)
-            state["system"]["last_updated"] = datetime.now().isoformat()
-            state["system"]["status"] = "running"
-            check_services()
-            check_stripe_revenue()
-            load_ech0_config()
-            load_shared_activity_log()
-        except Exception as e:
-            log_activity(f"Update error: {e}")
-        time.sleep(10)
-
-
-# ── HTTP Handler ──────────────────────────────────────────────────────────────
-class DashboardHandler(BaseHTTPRequestHandler):
-
-    def log_message(self, format, *args):
-        pass  # suppress access logs
-
-    def do_GET(self):
-        if self.path == "/api/state":
-            self._json(state)
-        elif self.path == "/api/log":
-            self._json(state["activity_log"])
-        elif self.path in ("/", "/index.html"):
-            self._html()
+            return await asyncio.wait_for(asyncio.to_thread(probe), self.probe_timeout)
+        except asyncio.TimeoutError:
+            return {}
+
+    async def refresh(self):
+        """Refresh every source concurrently and publish a new snapshot"""
+        results = await asyncio.gather(*(self._probe(probe) for probe in self.probes()), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                self.log_activity(f"Update error: {result}")
+                continue
+            for section, values in result.items():
+                if isinstance(values, dict):
+                    self.state[section].update(values)
+                else:
+                    self.state[section] = values
+
+        if self._config.changed():
+            try:
+                self.state.update(load_ech0_config(self.config_path))
+            except Exception as e:
+                self.log_activity(f"Config load error: {e}")
+        self.activity.poll()
+
+        self.state["system"]["uptime_seconds"] = int(time.time() - self.start_time)
+        self.state["system"]["last_updated"] = datetime.now().isoformat()
+        self.state["system"]["status"] = "running"
+        self.publish()
+
+    def publish(self):
+        """Swap in a new snapshot and wake every event-stream subscriber"""
+        self.state["activity_log"] = list(self.activity.entries)
+        self.snapshot = Snapshot.build(self.snapshot.version + 1, self.state)
+        published, self._published = self._published, asyncio.Event()
+        published.set()
+
+    async def _refresh_forever(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.log_activity(f"Update error: {e}")
+
+    # Lifecycle
+    async def start(self):
+        await self.refresh()
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._refresher = asyncio.create_task(self._refresh_forever())
+
+    async def close(self):
+        self._closing = True
+        if self._refresher is not None:
+            self._refresher.cancel()
+            await asyncio.gather(self._refresher, return_exceptions=True)
+        if self._server is not None:
+            self._server.close()
+        # Let open connections finish: wake event streams, end idle keep-alives
+        self._published.set()
+        for writer in self._clients.values():
+            writer.close()
+        if self._clients:
+            await asyncio.wait(list(self._clients), timeout=5)
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    # HTTP
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._clients[task] = writer
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = (request_line.decode("latin-1").split() + ["", ""])[:3]
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                if method != "GET":
+                    self._respond(writer, 405, b"", keep_alive=keep_alive)
+                elif path == "/api/events":
+                    await self._stream_events(writer)
+                    break
+                else:
+                    self._route(writer, path.split("?", 1)[0], headers.get("if-none-match"), keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            del self._clients[task]
+            writer.close()
+
+    def _route(self, writer, path: str, if_none_match: Optional[str], keep_alive: bool):
+        snapshot = self.snapshot
+        if path == "/api/state":
+            body, etag, content_type = snapshot.state_body, snapshot.state_etag, "application/json"
+        elif path == "/api/log":
+            body, etag, content_type = snapshot.log_body, snapshot.log_etag, "application/json"
+        elif path in ("/", "/index.html"):
+            body, etag, content_type = self.html, self.html_etag, "text/html"
         else:
-            self.send_response(404)
-            self.end_headers()
-
-    def _json(self, data):
-        body = json.dumps(data, default=str).encode()
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Content-Length", len(body))
-        self.end_headers()
-        self.wfile.write(body)
-
-    def _html(self):
-        html = DASHBOARD_HTML.encode()
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html")
-        self.send_header("Content-Length", len(html))
-        self.end_headers()
-        self.wfile.write(html)
+            self._respond(writer, 404, b"", keep_alive=keep_alive)
+            return
+        if if_none_match == etag:
+            self._respond(writer, 304, b"", etag=etag, keep_alive=keep_alive)
+        else:
+            self._respond(writer, 200, body, content_type, etag, keep_alive)
+
+    @staticmethod
+    def _respond(writer, status: int, body: bytes, content_type: str = "", etag: str = "", keep_alive: bool = False):
+        reason = {200: "OK", 304: "Not Modified", 404: "Not Found", 405: "Method Not Allowed"}[status]
+        head = [f"HTTP/1.1 {status} {reason}", "Access-Control-Allow-Origin: *", "Cache-Control: no-cache",
+                f"Content-Length: {len(body)}", "Connection: " + ("keep-alive" if keep_alive else "close")]
+        if content_type:
+            head.append(f"Content-Type: {content_type}")
+        if etag:
+            head.append(f"ETag: {etag}")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + body)
+
+    async def _stream_events(self, writer: asyncio.StreamWriter):
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                     b"Access-Control-Allow-Origin: *\r\nConnection: keep-alive\r\n\r\n")
+        snapshot = self.snapshot
+        while True:
+            # Every subscriber writes the same pre-built frame
+            writer.write(snapshot.event)
+            await writer.drain()
+            while self.snapshot is snapshot and not self._closing:
+                await self._published.wait()
+            if self._closing or writer.is_closing():
+                return
+            snapshot = self.snapshot
 
 
 DASHBOARD_HTML = """<!DOCTYPE html>
@@ -551,79 +812,89 @@ const fmtUptime = (s) => {
   return Math.floor(s/3600) + 'h ' + Math.floor((s%3600)/60) + 'm';
 };
 
-async function refresh() {
-  try {
-    const res = await fetch('/api/state');
-    const d = await res.json();
-
-    // KPIs
-    document.getElementById('totalRevenue').textContent = fmt(d.revenue.total);
-    document.getElementById('monthlyRevenue').textContent = fmt(d.revenue.monthly);
-    document.getElementById('customerCount').textContent = d.customers.active;
-    document.getElementById('emailsSent').textContent = d.emails.sent_today;
-    document.getElementById('uptime').textContent = fmtUptime(d.system.uptime_seconds);
-    document.getElementById('lastUpdated').textContent = 'Updated ' + new Date(d.system.last_updated).toLocaleTimeString();
-
-    // Zero banner
-    document.getElementById('zeroBanner').style.display = d.revenue.total === 0 ? 'flex' : 'none';
-
-    // Services
-    const services = [
-      { name: 'Echo (Ollama)', ok: d.system.ollama_connected, detail: d.system.ollama_model },
-      { name: 'SendGrid Email', ok: d.social.sendgrid_connected, detail: d.social.sendgrid_connected ? 'Connected' : 'Key missing' },
-      { name: 'Twilio SMS', ok: d.social.twilio_connected, detail: d.social.twilio_connected ? 'Connected' : 'Key missing' },
-      { name: 'Twitter', ok: d.social.twitter_connected, detail: d.social.twitter_connected ? 'Connected' : 'Key missing' },
-      { name: 'ElevenLabs Voice', ok: d.social.elevenlabs_connected, detail: d.social.elevenlabs_connected ? 'Connected' : 'Key missing' },
-      { name: 'Stripe Payments', ok: false, detail: 'Add STRIPE_SECRET_KEY to .env' },
-    ];
-
-    document.getElementById('serviceList').innerHTML = services.map(s => `
-      <div class="service-item">
-        <span class="service-name">${s.name}</span>
-        <span class="service-status ${s.ok ? 'status-ok' : 'status-err'}">${s.ok ? '✓ ' + s.detail : '✗ ' + s.detail}</span>
-      </div>
-    `).join('');
-
-    // Businesses
-    const bizEl = document.getElementById('bizList');
-    if (d.businesses.length === 0) {
-      bizEl.innerHTML = '<div class="empty-state"><div class="icon">🏗️</div>Loading business config...</div>';
-    } else {
-      bizEl.innerHTML = '<div class="biz-list">' + d.businesses.map(b => `
-        <div class="biz-item" style="flex-direction:column;align-items:flex-start;gap:6px;">
-          <div style="display:flex;justify-content:space-between;width:100%;align-items:center;">
-            <span class="biz-name">${b.name}</span>
-            <span class="biz-revenue">${fmt(b.revenue)}</span>
-          </div>
-          <div style="display:flex;justify-content:space-between;width:100%;">
-            <span style="font-size:11px;color:var(--muted);">${b.category}</span>
-            <span style="font-size:11px;color:var(--muted);">Target: ${fmt(b.monthly_target)}/mo</span>
-          </div>
-          ${b.url ? `<a href="${b.url}" target="_blank" style="font-size:11px;color:var(--accent);text-decoration:none;">${b.url}</a>` : ''}
+function render(d) {
+  // KPIs
+  document.getElementById('totalRevenue').textContent = fmt(d.revenue.total);
+  document.getElementById('monthlyRevenue').textContent = fmt(d.revenue.monthly);
+  document.getElementById('customerCount').textContent = d.customers.active;
+  document.getElementById('emailsSent').textContent = d.emails.sent_today;
+  document.getElementById('uptime').textContent = fmtUptime(d.system.uptime_seconds);
+  document.getElementById('lastUpdated').textContent = 'Updated ' + new Date(d.system.last_updated).toLocaleTimeString();
+
+  // Zero banner
+  document.getElementById('zeroBanner').style.display = d.revenue.total === 0 ? 'flex' : 'none';
+
+  // Services
+  const services = [
+    { name: 'Echo (Ollama)', ok: d.system.ollama_connected, detail: d.system.ollama_model },
+    { name: 'SendGrid Email', ok: d.social.sendgrid_connected, detail: d.social.sendgrid_connected ? 'Connected' : 'Key missing' },
+    { name: 'Twilio SMS', ok: d.social.twilio_connected, detail: d.social.twilio_connected ? 'Connected' : 'Key missing' },
+    { name: 'Twitter', ok: d.social.twitter_connected, detail: d.social.twitter_connected ? 'Connected' : 'Key missing' },
+    { name: 'ElevenLabs Voice', ok: d.social.elevenlabs_connected, detail: d.social.elevenlabs_connected ? 'Connected' : 'Key missing' },
+    { name: 'Stripe Payments', ok: false, detail: 'Add STRIPE_SECRET_KEY to .env' },
+  ];
+
+  document.getElementById('serviceList').innerHTML = services.map(s => `
+    <div class="service-item">
+      <span class="service-name">${s.name}</span>
+      <span class="service-status ${s.ok ? 'status-ok' : 'status-err'}">${s.ok ? '✓ ' + s.detail : '✗ ' + s.detail}</span>
+    </div>
+  `).join('');
+
+  // Businesses
+  const bizEl = document.getElementById('bizList');
+  if (d.businesses.length === 0) {
+    bizEl.innerHTML = '<div class="empty-state"><div class="icon">🏗️</div>Loading business config...</div>';
+  } else {
+    bizEl.innerHTML = '<div class="biz-list">' + d.businesses.map(b => `
+      <div class="biz-item" style="flex-direction:column;align-items:flex-start;gap:6px;">
+        <div style="display:flex;justify-content:space-between;width:100%;align-items:center;">
+          <span class="biz-name">${b.name}</span>
+          <span class="biz-revenue">${fmt(b.revenue)}</span>
         </div>
-      `).join('') + '</div>';
-    }
-
-    // Activity log
-    const logEl = document.getElementById('logList');
-    if (d.activity_log.length === 0) {
-      logEl.innerHTML = '<div class="empty-state"><div class="icon">🤖</div>Waiting for ECH0 activity...</div>';
-    } else {
-      logEl.innerHTML = d.activity_log.map(e => `
-        <div class="log-item">
-          <span class="log-time">${e.time}</span>
-          <span class="log-msg">${e.msg}</span>
+        <div style="display:flex;justify-content:space-between;width:100%;">
+          <span style="font-size:11px;color:var(--muted);">${b.category}</span>
+          <span style="font-size:11px;color:var(--muted);">Target: ${fmt(b.monthly_target)}/mo</span>
         </div>
-      `).join('');
-    }
+        ${b.url ? `<a href="${b.url}" target="_blank" style="font-size:11px;color:var(--accent);text-decoration:none;">${b.url}</a>` : ''}
+      </div>
+    `).join('') + '</div>';
+  }
 
+  // Activity log
+  const logEl = document.getElementById('logList');
+  if (d.activity_log.length === 0) {
+    logEl.innerHTML = '<div class="empty-state"><div class="icon">🤖</div>Waiting for ECH0 activity...</div>';
+  } else {
+    logEl.innerHTML = d.activity_log.map(e => `
+      <div class="log-item">
+        <span class="log-time">${e.time}</span>
+        <span class="log-msg">${e.msg}</span>
+      </div>
+    `).join('');
+  }
+}
+
+async function refresh() {
+  try {
+    const res = await fetch('/api/state');
+    render(await res.json());
   } catch(e) {
     document.getElementById('lastUpdated').textContent = 'Connection error — retrying...';
   }
 }
 
-refresh();
-setInterval(refresh, 10000); // refresh every 10 seconds
+if (window.EventSource) {
+  // The server pushes each new snapshot; the browser reconnects on its own
+  const events = new EventSource('/api/events');
+  events.onmessage = (e) => render(JSON.parse(e.data));
+  events.onerror = () => {
+    document.getElementById('lastUpdated').textContent = 'Connection error — retrying...';
+  };
+} else {
+  refresh();
+  setInterval(refresh, 10000); // refresh every 10 seconds
+}
 </script>
 </body>
 </html>
@@ -633,16 +904,9 @@ setInterval(refresh, 10000); // refresh every 10 seconds
 if __name__ == "__main__":
     PORT = 8765
 
-    # Initial data load
-    check_services()
-    check_stripe_revenue()
-    load_ech0_config()
-    log_activity("Dashboard server started")
-    log_activity("ECH0 autonomous system online")
-
-    # Start background updater
-    t = threading.Thread(target=background_updater, daemon=True)
-    t.start()
+    server = DashboardServer(port=PORT)
+    server.log_activity("Dashboard server started")
+    server.log_activity("ECH0 autonomous system online")
 
     print(f"\n{'='*50}")
     print(f"  ECH0 Live Dashboard")
@@ -650,11 +914,10 @@ if __name__ == "__main__":
     print(f"{'='*50}")
     print(f"  Revenue:   $0.00 (real — Stripe not connected)")
     print(f"  Customers: 0 (real)")
-    print(f"  Refreshes: every 10 seconds")
+    print(f"  Refreshes: every 10 seconds (pushed to open dashboards)")
     print(f"\n  Press Ctrl+C to stop\n")
 
-    server = HTTPServer(("", PORT), DashboardHandler)
     try:
-        server.serve_forever()
+        asyncio.run(server.serve_forever())
     except KeyboardInterrupt:
         print("\nDashboard stopped.")
@@ -15,12 +15,15 @@ Implements a comprehensive feedback loop where all agents:
 import json
 import time
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 import random
 
+import numpy as np
+
 from hive_mind_coordinator import HiveMindCoordinator, AgentType, HiveMessage, DecisionPriority
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
@@ -60,44 +63,144 @@ class FeedbackEvent:
         }
 
 
+def classify_trend(first_half: float, second_half: float) -> str:
+    """Trend label from the mean of the older and newer half of a window"""
+    change_pct = ((second_half - first_half) / first_half * 100) if first_half > 0 else 0
+
+    if change_pct > 5:
+        return "improving"
+    elif change_pct < -5:
+        return "declining"
+    else:
+        return "stable"
+
+
+class MetricSeries:
+    """
+    Fixed-capacity NumPy ring buffer of one metric with streaming statistics
+
+    Welford's algorithm keeps the lifetime mean and variance, an EWMA follows
+    the recent level, and the two halves of the trend window are kept as
+    rolling sums, so appending a value and reading any statistic is O(1)
+    however long the agent has been running.
+    """
+
+    def __init__(self, capacity: int = 1024, trend_window: int = 10, ewma_alpha: float = 0.2):
+        self.capacity = max(capacity, trend_window + 1)
+        self.trend_window = trend_window
+        self.ewma_alpha = ewma_alpha
+        self._buffer = np.zeros(self.capacity)
+        self._next = 0
+        self.count = 0  # Values seen, including those overwritten
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.ewma = 0.0
+        self._first_sum = 0.0  # Older half of the trend window
+        self._second_sum = 0.0  # Newer half of the trend window
+        self.trend = "unknown"
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    @property
+    def latest(self) -> float:
+        return self._at(1) if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return self.variance ** 0.5
+
+    def _at(self, offset: int) -> float:
+        """The offset-th most recent value (1 = latest)"""
+        return float(self._buffer[(self._next - offset) % self.capacity])
+
+    def values(self, last: Optional[int] = None) -> np.ndarray:
+        """Retained values, oldest first"""
+        size = len(self) if last is None else min(last, len(self))
+        rows = (self._next - size + np.arange(size)) % self.capacity
+        return self._buffer[rows]
+
+    def append(self, value: float):
+        value = float(value)
+        window = self.trend_window
+        first_len = window // 2
+        if self.count >= window:
+            # The oldest value leaves the window, the oldest of the newer half moves to the older half
+            leaving = self._at(window)
+            crossing = self._at(window - first_len)
+            self._first_sum += crossing - leaving
+            self._second_sum += value - crossing
+
+        self._buffer[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self.count += 1
+
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.ewma = value if self.count == 1 else self.ewma_alpha * value + (1 - self.ewma_alpha) * self.ewma
+
+        if self.count <= window or self.count % self.capacity == 0:
+            # Window still filling, or periodic resync against rounding drift
+            recent = self.values(window)
+            split = len(recent) // 2
+            self._first_sum = float(recent[:split].sum())
+            self._second_sum = float(recent[split:].sum())
+
+        if self.count >= 2:
+            size = min(self.count, window)
+            split = size // 2
+            self.trend = classify_trend(self._first_sum / split, self._second_sum / (size - split))
+
+    def get_trend(self, window: int) -> str:
+        """Trend over the last ``window`` values (at most ``capacity``)"""
+        if self.count < 2:
+            return "unknown"
+        if window == self.trend_window:
+            return self.trend
+
+        recent = self.values(window)
+        if len(recent) < 2:
+            return "insufficient_data"
+        split = len(recent) // 2
+        return classify_trend(float(recent[:split].mean()), float(recent[split:].mean()))
+
+
+FEEDBACK_HISTORY_LIMIT = 1000  # Feedback events kept per agent
+
+
 @dataclass
 class AgentPerformanceTracker:
     """Tracks an agent's performance over time"""
     agent_id: str
-    metrics: Dict[str, List[float]] = field(default_factory=dict)
+    metrics: Dict[str, MetricSeries] = field(default_factory=dict)
     successes: int = 0
     failures: int = 0
     improvements_applied: List[str] = field(default_factory=list)
-    feedback_received: List[FeedbackEvent] = field(default_factory=list)
+    feedback_received: Deque[FeedbackEvent] = field(
+        default_factory=lambda: deque(maxlen=FEEDBACK_HISTORY_LIMIT)
+    )
+    feedback_count: int = 0  # Lifetime total; feedback_received keeps the most recent
     learning_rate: float = 0.1  # How quickly the agent adapts
+    metric_capacity: int = 1024  # Values kept per metric
 
-    def add_metric(self, metric_name: str, value: float):
+    def add_metric(self, metric_name: str, value: float) -> MetricSeries:
         """Add a performance metric"""
-        if metric_name not in self.metrics:
-            self.metrics[metric_name] = []
-        self.metrics[metric_name].append(value)
+        series = self.metrics.get(metric_name)
+        if series is None:
+            series = self.metrics[metric_name] = MetricSeries(self.metric_capacity)
+        series.append(value)
+        return series
 
     def get_metric_trend(self, metric_name: str, window: int = 10) -> str:
         """Get trend for a metric (improving, declining, stable)"""
-        if metric_name not in self.metrics or len(self.metrics[metric_name]) < 2:
+        if metric_name not in self.metrics:
             return "unknown"
-
-        recent = self.metrics[metric_name][-window:]
-        if len(recent) < 2:
-            return "insufficient_data"
-
-        # Calculate trend
-        first_half = sum(recent[:len(recent)//2]) / (len(recent)//2)
-        second_half = sum(recent[len(recent)//2:]) / (len(recent) - len(recent)//2)
-
-        change_pct = ((second_half - first_half) / first_half * 100) if first_half > 0 else 0
-
-        if change_pct > 5:
-            return "improving"
-        elif change_pct < -5:
-            return "declining"
-        else:
-            return "stable"
+        return self.metrics[metric_name].get_trend(window)
 
     def success_rate(self) -> float:
         """Calculate success rate"""
@@ -118,12 +221,23 @@ class FeedbackLoopSystem:
     - Improvement recommendation engine
     """
 
-    def __init__(self, hive: HiveMindCoordinator):
+    def __init__(self, hive: HiveMindCoordinator, history_limit: int = 10000):
         self.hive = hive
         self.performance_trackers: Dict[str, AgentPerformanceTracker] = {}
-        self.feedback_history: List[FeedbackEvent] = []
+        self.feedback_history: Deque[FeedbackEvent] = deque(maxlen=history_limit)
+        self.total_feedback_events = 0
         self.improvement_patterns: Dict[str, List[str]] = {}  # What works for each metric
 
+        # Hive-wide aggregates, maintained by record_feedback
+        self.total_successes = 0
+        self.total_failures = 0
+        self._success_rate_sum = 0.0
+        self._registration_order: Dict[str, int] = {}
+        self._declining: Dict[str, Dict[str, None]] = {}  # agent -> metrics trending down (ordered set)
+        self._struggling: Dict[str, None] = {}  # agents with at least one declining metric
+        self._top_performers: List[str] = []
+        self._top_dirty = False
+
         LOG.warning("🔄 FEEDBACK LOOP SYSTEM INITIALIZED")
         LOG.info("   Continuous learning and improvement enabled for all agents")
 
@@ -131,11 +245,15 @@ class FeedbackLoopSystem:
         """Register performance tracker for an agent"""
         if agent_id not in self.performance_trackers:
             self.performance_trackers[agent_id] = AgentPerformanceTracker(agent_id=agent_id)
+            self._registration_order[agent_id] = len(self._registration_order)
+            self._declining[agent_id] = {}
+            self._update_top_performers(agent_id, 0.0, 0.0)
             LOG.info(f"Performance tracker registered for {agent_id}")
 
     def record_feedback(self, feedback: FeedbackEvent):
         """Record a feedback event"""
         self.feedback_history.append(feedback)
+        self.total_feedback_events += 1
 
         # Update agent's tracker
         if feedback.agent_id not in self.performance_trackers:
@@ -143,21 +261,26 @@ class FeedbackLoopSystem:
 
         tracker = self.performance_trackers[feedback.agent_id]
         tracker.feedback_received.append(feedback)
+        tracker.feedback_count += 1
 
         # Update metrics
         if feedback.feedback_type == FeedbackType.PERFORMANCE_METRIC:
-            tracker.add_metric(feedback.metric_name, feedback.metric_value)
+            self._record_metric(tracker, feedback.metric_name, feedback.metric_value)
 
         elif feedback.feedback_type == FeedbackType.SUCCESS:
+            previous_rate = tracker.success_rate()
             tracker.successes += 1
-            tracker.add_metric('success_rate', tracker.success_rate())
+            self.total_successes += 1
+            self._record_success_rate(tracker, previous_rate)
 
             # Learn from success
             self._learn_from_success(feedback)
 
         elif feedback.feedback_type == FeedbackType.FAILURE:
+            previous_rate = tracker.success_rate()
             tracker.failures += 1
-            tracker.add_metric('success_rate', tracker.success_rate())
+            self.total_failures += 1
+            self._record_success_rate(tracker, previous_rate)
 
             # Learn from failure
             self._learn_from_failure(feedback)
@@ -168,6 +291,43 @@ class FeedbackLoopSystem:
         # Check if agent needs help
         self._check_and_provide_assistance(feedback.agent_id)
 
+    def _record_metric(self, tracker: AgentPerformanceTracker, metric_name: str, value: float):
+        """Append a metric value and keep the agent's declining-metric set current"""
+        series = tracker.add_metric(metric_name, value)
+        declining = self._declining[tracker.agent_id]
+        if series.trend == "declining":
+            declining[metric_name] = None
+            self._struggling[tracker.agent_id] = None
+        else:
+            declining.pop(metric_name, None)
+            if not declining:
+                self._struggling.pop(tracker.agent_id, None)
+
+    def _record_success_rate(self, tracker: AgentPerformanceTracker, previous_rate: float):
+        rate = tracker.success_rate()
+        self._success_rate_sum += rate - previous_rate
+        self._update_top_performers(tracker.agent_id, rate, previous_rate)
+        self._record_metric(tracker, 'success_rate', rate)
+
+    def _rank_key(self, agent_id: str):
+        # Highest success rate first, ties in registration order
+        return (-self.performance_trackers[agent_id].success_rate(), self._registration_order[agent_id])
+
+    def _update_top_performers(self, agent_id: str, rate: float, previous_rate: float, size: int = 3):
+        """Keep the cached top performers current after one agent's success rate changed"""
+        if self._top_dirty:
+            return
+        top = self._top_performers
+        if agent_id in top:
+            if rate < previous_rate and len(self.performance_trackers) > len(top):
+                # An agent outside the cache may now rank higher; rebuild on next read
+                self._top_dirty = True
+                return
+        else:
+            top.append(agent_id)
+        top.sort(key=self._rank_key)
+        del top[size:]
+
     def _learn_from_success(self, feedback: FeedbackEvent):
         """Learn from successful actions"""
         # Record what worked
@@ -216,40 +376,37 @@ class FeedbackLoopSystem:
         """Check if agent is struggling and provide assistance"""
         tracker = self.performance_trackers[agent_id]
 
-        # Check if performance is declining
-        for metric_name, values in tracker.metrics.items():
-            if len(values) < 5:
+        # Check if performance is declining (only metrics already known to trend down)
+        for metric_name in list(self._declining[agent_id]):
+            if tracker.metrics[metric_name].count < 5:
                 continue
 
-            trend = tracker.get_metric_trend(metric_name)
-
-            if trend == "declining":
-                LOG.warning(f"⚠️  {agent_id} performance declining in {metric_name}")
-
-                # Generate improvement recommendation
-                recommendation = self._generate_improvement_recommendation(
-                    agent_id, metric_name, tracker
+            LOG.warning(f"⚠️  {agent_id} performance declining in {metric_name}")
+
+            # Generate improvement recommendation
+            recommendation = self._generate_improvement_recommendation(
+                agent_id, metric_name, tracker
+            )
+
+            if recommendation:
+                # Send improvement message to agent
+                message = HiveMessage(
+                    sender="feedback_loop_system",
+                    agent_type=AgentType.ECH0_OVERSEER,
+                    message_type="improvement_recommendation",
+                    payload={
+                        'target_agent': agent_id,
+                        'metric': metric_name,
+                        'trend': 'declining',
+                        'recommendation': recommendation
+                    },
+                    priority=DecisionPriority.HIGH,
+                    timestamp=time.time(),
+                    requires_consensus=False
                 )
 
-                if recommendation:
-                    # Send improvement message to agent
-                    message = HiveMessage(
-                        sender="feedback_loop_system",
-                        agent_type=AgentType.ECH0_OVERSEER,
-                        message_type="improvement_recommendation",
-                        payload={
-                            'target_agent': agent_id,
-                            'metric': metric_name,
-                            'trend': trend,
-                            'recommendation': recommendation
-                        },
-                        priority=DecisionPriority.HIGH,
-                        timestamp=time.time(),
-                        requires_consensus=False
-                    )
-
-                    self.hive.send_message(message)
-                    LOG.info(f"   Sent improvement recommendation to {agent_id}")
+                self.hive.send_message(message)
+                LOG.info(f"   Sent improvement recommendation to {agent_id}")
 
     def _generate_improvement_recommendation(
         self,
@@ -280,11 +437,6 @@ class FeedbackLoopSystem:
 
         tracker = self.performance_trackers[agent_id]
 
-        # Calculate trends for all metrics
-        trends = {}
-        for metric_name in tracker.metrics.keys():
-            trends[metric_name] = tracker.get_metric_trend(metric_name)
-
         return {
             'agent_id': agent_id,
             'success_rate': tracker.success_rate(),
@@ -292,14 +444,16 @@ class FeedbackLoopSystem:
             'failures': tracker.failures,
             'metrics': {
                 name: {
-                    'current': values[-1] if values else 0,
-                    'average': sum(values) / len(values) if values else 0,
-                    'trend': trends.get(name, 'unknown')
+                    'current': series.latest,
+                    'average': series.mean,
+                    'std': series.std,
+                    'ewma': series.ewma,
+                    'trend': series.trend
                 }
-                for name, values in tracker.metrics.items()
+                for name, series in tracker.metrics.items()
             },
             'improvements_applied': len(tracker.improvements_applied),
-            'feedback_events': len(tracker.feedback_received),
+            'feedback_events': tracker.feedback_count,
             'learning_rate': tracker.learning_rate
         }
 
@@ -310,42 +464,33 @@ class FeedbackLoopSystem:
         if total_agents == 0:
             return {"message": "No agents tracked yet"}
 
-        # Aggregate stats
-        total_successes = sum(t.successes for t in self.performance_trackers.values())
-        total_failures = sum(t.failures for t in self.performance_trackers.values())
-        avg_success_rate = sum(t.success_rate() for t in self.performance_trackers.values()) / total_agents
+        # Aggregate stats are maintained by record_feedback
+        avg_success_rate = self._success_rate_sum / total_agents
 
         # Find top performers
-        top_performers = sorted(
-            self.performance_trackers.items(),
-            key=lambda x: x[1].success_rate(),
-            reverse=True
-        )[:3]
+        if self._top_dirty:
+            self._top_performers = sorted(self.performance_trackers, key=self._rank_key)[:3]
+            self._top_dirty = False
 
         # Find agents needing help
-        struggling_agents = []
-        for agent_id, tracker in self.performance_trackers.items():
-            for metric_name in tracker.metrics.keys():
-                if tracker.get_metric_trend(metric_name) == "declining":
-                    struggling_agents.append(agent_id)
-                    break
+        struggling_agents = list(self._struggling)  # In the order they started declining
 
         return {
             'total_agents_tracked': total_agents,
-            'total_successes': total_successes,
-            'total_failures': total_failures,
+            'total_successes': self.total_successes,
+            'total_failures': self.total_failures,
             'average_success_rate': avg_success_rate,
-            'total_feedback_events': len(self.feedback_history),
+            'total_feedback_events': self.total_feedback_events,
             'improvement_patterns_learned': len(self.improvement_patterns),
             'top_performers': [
-                {'agent_id': aid, 'success_rate': tracker.success_rate()}
-                for aid, tracker in top_performers
+                {'agent_id': aid, 'success_rate': self.performance_trackers[aid].success_rate()}
+                for aid in self._top_performers
             ],
             'agents_needing_help': struggling_agents,
             'hive_knowledge': {
-                'successful_strategies': len(self.hive.shared_knowledge.get('successful_strategies', [])),
-                'failed_strategies': len(self.hive.shared_knowledge.get('failed_strategies', [])),
-                'customer_insights': len(self.hive.shared_knowledge.get('customer_insights', []))
+                'successful_strategies': self.hive.knowledge_store.count('successful_strategies'),
+                'failed_strategies': self.hive.knowledge_store.count('failed_strategies'),
+                'customer_insights': self.hive.knowledge_store.count('customer_insights')
             }
         }
 
@@ -10,6 +10,9 @@ This module provides realistic human-like behavior for web automation:
 - Typing speed variations
 - Scrolling patterns
 - Inefficient but human-like navigation choices
+
+Each delay here blocks the calling thread; async_human_behavior has the
+same timing model on asyncio for running many sessions on one event loop.
 """
 
 import random
@@ -20,12 +20,15 @@ Each Level-8-Agent has:
 - Feedback loop for continuous improvement
 """
 
+import asyncio
+import heapq
 import json
 import time
 import logging
 import subprocess
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Awaitable, Callable, Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -43,6 +46,10 @@ class TaskPriority(Enum):
     PHASE_3 = "phase_3_advanced_features"
 
 
+PHASE_ORDER = {TaskPriority.PHASE_1: 1, TaskPriority.PHASE_2: 2, TaskPriority.PHASE_3: 3}
+TASK_STATUSES = ("pending", "in_progress", "completed", "failed", "blocked")
+
+
 @dataclass
 class Level8Task:
     """Task for a Level-8-Agent"""
@@ -55,6 +62,8 @@ class Level8Task:
     timeline: str
     priority: TaskPriority
     requirements: List[str] = field(default_factory=list)
+    # Task IDs that must finish first; empty means the same website's earlier-phase tasks
+    depends_on: List[str] = field(default_factory=list)
     status: str = "pending"
     agent_id: Optional[str] = None
     started_at: Optional[float] = None
@@ -72,6 +81,7 @@ class Level8Task:
             'timeline': self.timeline,
             'priority': self.priority.value,
             'requirements': self.requirements,
+            'depends_on': self.depends_on,
             'status': self.status,
             'agent_id': self.agent_id,
             'started_at': self.started_at,
@@ -93,6 +103,9 @@ class Level8AgentsDispatchSystem:
         self.feedback_system = feedback_system
         self.tasks: List[Level8Task] = []
         self.agents: Dict[str, str] = {}  # agent_id -> current_task_id
+        self.tasks_by_id: Dict[str, Level8Task] = {}
+        # Per-phase status counts, updated on every status change
+        self.status_counts: Dict[TaskPriority, Counter] = {phase: Counter() for phase in TaskPriority}
 
         LOG.warning("⚡⚡⚡ LEVEL-8-AGENTS DISPATCH SYSTEM INITIALIZED ⚡⚡⚡")
         LOG.info("   Ready to deploy autonomous implementation agents")
@@ -417,40 +430,168 @@ class Level8AgentsDispatchSystem:
             )
         ])
 
+        for task in self.tasks:
+            self._index_task(task)
+
         LOG.info(f"Loaded {len(self.tasks)} improvement tasks")
 
-    def dispatch_all_agents(self):
-        """Dispatch Level-8-Agents for all tasks"""
+    def add_task(self, task: Level8Task):
+        """Add an improvement task to the deployment"""
+        if task.task_id in self.tasks_by_id:
+            raise ValueError(f"Duplicate task ID: {task.task_id}")
+        self.tasks.append(task)
+        self._index_task(task)
+
+    def _index_task(self, task: Level8Task):
+        self.tasks_by_id[task.task_id] = task
+        self.status_counts[task.priority]['total'] += 1
+        self.status_counts[task.priority][task.status] += 1
+
+    def _set_status(self, task: Level8Task, status: str):
+        """Change a task's status and keep the per-phase counters in step"""
+        counts = self.status_counts[task.priority]
+        counts[task.status] -= 1
+        counts[status] += 1
+        task.status = status
+
+    def prerequisites(self) -> Dict[str, List[str]]:
+        """Task ID -> IDs of the tasks it waits for"""
+        by_site_phase: Dict[str, Dict[int, List[str]]] = {}
+        for task in self.tasks:
+            by_site_phase.setdefault(task.website, {}).setdefault(PHASE_ORDER[task.priority], []).append(task.task_id)
+
+        prerequisites = {}
+        for task in self.tasks:
+            if task.depends_on:
+                unknown = [task_id for task_id in task.depends_on if task_id not in self.tasks_by_id]
+                if unknown:
+                    raise ValueError(f"{task.task_id} depends on unknown tasks: {unknown}")
+                prerequisites[task.task_id] = list(task.depends_on)
+                continue
+            # Wait for the nearest earlier phase with work on the same website
+            phases = by_site_phase[task.website]
+            earlier = [phase for phase in phases if phase < PHASE_ORDER[task.priority]]
+            prerequisites[task.task_id] = list(phases[max(earlier)]) if earlier else []
+        return prerequisites
+
+    def dispatch_all_agents(
+        self,
+        executor: Optional[Callable[[Level8Task], Awaitable[Optional[Dict]]]] = None,
+        max_concurrency: int = 8,
+        journal_path: Optional[str] = None,
+    ):
+        """Dispatch Level-8-Agents for all tasks (see dispatch_all_agents_async)"""
+        asyncio.run(self.dispatch_all_agents_async(executor, max_concurrency, journal_path))
+
+    async def dispatch_all_agents_async(
+        self,
+        executor: Optional[Callable[[Level8Task], Awaitable[Optional[Dict]]]] = None,
+        max_concurrency: int = 8,
+        journal_path: Optional[str] = None,
+    ):
+        """
+        Dispatch Level-8-Agents for all tasks in dependency order
+
+        A task is dispatched as soon as its own prerequisites have finished,
+        earlier phases first when several are ready, with at most
+        ``max_concurrency`` tasks running. ``executor(task)`` runs the agent's
+        work and returns its result; without one, dispatching is the whole job
+        and a task counts as finished once its agent is assigned. A failed
+        task's dependents are marked ``blocked``. Each dispatch and outcome is
+        appended to ``journal_path`` (JSON Lines) as it happens.
+        """
 
         LOG.info("=" * 80)
         LOG.info("⚡ DISPATCHING LEVEL-8-AGENTS FOR ALL WEBSITE IMPROVEMENTS")
         LOG.info("=" * 80)
         LOG.info("")
 
-        # Group tasks by priority
-        phase1_tasks = [t for t in self.tasks if t.priority == TaskPriority.PHASE_1]
-        phase2_tasks = [t for t in self.tasks if t.priority == TaskPriority.PHASE_2]
-        phase3_tasks = [t for t in self.tasks if t.priority == TaskPriority.PHASE_3]
-
-        LOG.info(f"Phase 1 (Quick Wins): {len(phase1_tasks)} tasks")
-        LOG.info(f"Phase 2 (Lead Generation): {len(phase2_tasks)} tasks")
-        LOG.info(f"Phase 3 (Advanced Features): {len(phase3_tasks)} tasks")
+        LOG.info(f"Phase 1 (Quick Wins): {self.status_counts[TaskPriority.PHASE_1]['total']} tasks")
+        LOG.info(f"Phase 2 (Lead Generation): {self.status_counts[TaskPriority.PHASE_2]['total']} tasks")
+        LOG.info(f"Phase 3 (Advanced Features): {self.status_counts[TaskPriority.PHASE_3]['total']} tasks")
         LOG.info("")
 
-        # Dispatch Phase 1 immediately
-        LOG.info("🚀 PHASE 1: Quick Wins (Week 1-2)")
-        for task in phase1_tasks:
-            self._dispatch_agent(task)
-
-        LOG.info("")
-        LOG.info("🚀 PHASE 2: Lead Generation (Week 3-4)")
-        for task in phase2_tasks:
-            self._dispatch_agent(task)
-
-        LOG.info("")
-        LOG.info("🚀 PHASE 3: Advanced Features (Week 5-8)")
-        for task in phase3_tasks:
-            self._dispatch_agent(task)
+        prerequisites = self.prerequisites()
+        dependents: Dict[str, List[str]] = {task.task_id: [] for task in self.tasks}
+        for task_id, required in prerequisites.items():
+            for required_id in required:
+                dependents[required_id].append(task_id)
+
+        # Ready queue ordered by phase, then load order
+        load_order = {task.task_id: i for i, task in enumerate(self.tasks)}
+        finished = ("completed",) if executor is not None else ("completed", "in_progress")
+        waiting = {}
+        ready: List = []
+        for task in self.tasks:
+            waiting[task.task_id] = sum(
+                1 for required_id in prerequisites[task.task_id]
+                if self.tasks_by_id[required_id].status not in finished
+            )
+            # Tasks dispatched by an earlier call are not dispatched again
+            if task.status == "pending" and not waiting[task.task_id]:
+                heapq.heappush(ready, (PHASE_ORDER[task.priority], load_order[task.task_id], task.task_id))
+
+        journal = open(journal_path, 'a') if journal_path else None
+        running: Dict[asyncio.Task, Level8Task] = {}
+
+        def record(task: Level8Task, event: str):
+            if journal is not None:
+                journal.write(json.dumps({'event': event, 'timestamp': time.time(), 'task': task.to_dict()}) + "\n")
+                journal.flush()
+
+        def release(task: Level8Task):
+            for child_id in dependents[task.task_id]:
+                waiting[child_id] -= 1
+                if not waiting[child_id] and self.tasks_by_id[child_id].status == "pending":
+                    child = self.tasks_by_id[child_id]
+                    heapq.heappush(ready, (PHASE_ORDER[child.priority], load_order[child_id], child_id))
+
+        def block(task: Level8Task):
+            pending = list(dependents[task.task_id])
+            while pending:
+                child = self.tasks_by_id[pending.pop()]
+                if child.status == "pending":
+                    self._set_status(child, "blocked")
+                    record(child, "blocked")
+                    pending.extend(dependents[child.task_id])
+
+        try:
+            while ready or running:
+                while ready and len(running) < max_concurrency:
+                    _, _, task_id = heapq.heappop(ready)
+                    task = self.tasks_by_id[task_id]
+                    self._dispatch_agent(task)
+                    record(task, "dispatched")
+                    if executor is None:
+                        release(task)
+                    else:
+                        running[asyncio.ensure_future(executor(task))] = task
+                if not running:
+                    continue
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    task.completed_at = time.time()
+                    error = future.exception()
+                    if error is None:
+                        task.result = future.result()
+                        self._set_status(task, "completed")
+                        record(task, "completed")
+                        release(task)
+                    else:
+                        task.result = {'error': f"{type(error).__name__}: {error}"}
+                        self._set_status(task, "failed")
+                        record(task, "failed")
+                        LOG.warning(f"✗ {task.task_id} failed: {task.result['error']}")
+                        block(task)
+        finally:
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            if journal is not None:
+                journal.close()
 
         # Print summary
         LOG.info("")
@@ -479,7 +620,7 @@ class Level8AgentsDispatchSystem:
 
         # Assign task
         task.agent_id = agent_id
-        task.status = "in_progress"
+        self._set_status(task, "in_progress")
         task.started_at = time.time()
         self.agents[agent_id] = task.task_id
 
@@ -506,35 +647,36 @@ class Level8AgentsDispatchSystem:
 
         self.hive.send_message(message)
 
-    def get_deployment_status(self) -> Dict:
-        """Get current deployment status"""
+    def get_deployment_status(self, include_tasks: bool = False) -> Dict:
+        """
+        Get current deployment status from the running counters. The
+        per-task list is only built when ``include_tasks`` is set.
+        """
 
-        status_by_phase = {
-            TaskPriority.PHASE_1: {'total': 0, 'in_progress': 0, 'completed': 0},
-            TaskPriority.PHASE_2: {'total': 0, 'in_progress': 0, 'completed': 0},
-            TaskPriority.PHASE_3: {'total': 0, 'in_progress': 0, 'completed': 0}
-        }
+        def phase_status(phase: TaskPriority) -> Dict[str, int]:
+            counts = self.status_counts[phase]
+            return {'total': counts['total'], **{status: counts[status] for status in TASK_STATUSES}}
 
-        for task in self.tasks:
-            status_by_phase[task.priority]['total'] += 1
-            if task.status == 'in_progress':
-                status_by_phase[task.priority]['in_progress'] += 1
-            elif task.status == 'completed':
-                status_by_phase[task.priority]['completed'] += 1
-
-        return {
+        status = {
             'total_tasks': len(self.tasks),
             'total_agents': len(self.agents),
-            'phase_1': status_by_phase[TaskPriority.PHASE_1],
-            'phase_2': status_by_phase[TaskPriority.PHASE_2],
-            'phase_3': status_by_phase[TaskPriority.PHASE_3],
-            'tasks': [task.to_dict() for task in self.tasks]
+            'phase_1': phase_status(TaskPriority.PHASE_1),
+            'phase_2': phase_status(TaskPriority.PHASE_2),
+            'phase_3': phase_status(TaskPriority.PHASE_3),
         }
+        if include_tasks:
+            status['tasks'] = [task.to_dict() for task in self.tasks]
+        return status
 
     def export_deployment_plan(self, output_path: str = "level8_deployment_plan.json"):
-        """Export deployment plan to JSON"""
+        """
+        Export deployment plan to JSON, writing one task at a time.
+
+        Tasks are a top-level ``tasks`` list; ``status`` holds only the
+        phase counters.
+        """
 
-        plan = {
+        header = {
             'deployment_timestamp': time.time(),
             'total_tasks': len(self.tasks),
             'total_agents': len(self.agents),
@@ -543,7 +685,11 @@ class Level8AgentsDispatchSystem:
         }
 
         with open(output_path, 'w') as f:
-            json.dump(plan, f, indent=2)
+            # Close the header object early and stream the tasks in as its last key
+            f.write(json.dumps(header, indent=2)[:-2] + ',\n  "tasks": [')
+            for i, task in enumerate(self.tasks):
+                f.write(("," if i else "") + "\n    " + json.dumps(task.to_dict()))
+            f.write("\n  ]\n}\n")
 
         LOG.info(f"Deployment plan exported to {output_path}")
 
@@ -15,7 +15,7 @@ import time
 import sys
 import os
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import Dict, Optional, Any
 from enum import Enum
 import random
 import json
@@ -29,9 +29,13 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 import httpx
 
-from blank_business_builder.database import get_db, Business, User, MetricsHistory
+from blank_business_builder.database import get_db, Business, User
+from blank_business_builder.bulk_provisioning import BulkProvisioningEngine, ProvisioningReport
 from blank_business_builder.config import settings
 
+# Businesses (plus their plan, task and metrics rows) written per transaction
+PROVISION_BATCH_SIZE = 5000
+
 class BusinessType(str, Enum):
     """Business types for mass deployment."""
     FIVE_GIG = "5_gig"  # Simple, no EIN required
@@ -91,74 +95,28 @@ def get_or_create_user(db: Session, email: str) -> User:
         db.refresh(user)
     return user
 
-async def create_business_batch(
-    db: Session,
-    batch_id: int,
-    count: int,
-    business_type: BusinessType,
+def provision_businesses(
+    engine,
+    request: MassDeploymentRequest,
     user_id: uuid.UUID,
-    auto_fold: bool
-) -> List[Business]:
-    """
-    Create a batch of businesses in the database.
+    actual_count: int,
+    on_batch=None
+) -> ProvisioningReport:
     """
-    created = []
-
-    for i in range(count):
-        # Generate unique business details
-        biz_uuid = uuid.uuid4()
-        timestamp = int(time.time()*1000)
-
-        business = Business(
-            id=biz_uuid,
-            user_id=user_id,
-            business_name=f"Business {batch_id}-{i}-{timestamp}",
-            industry="Autonomous Service",
-            business_concept=f"Type: {business_type.value}, Auto-fold: {auto_fold}",
-            status="pending", # Start as pending
-            created_at=datetime.utcnow(),
-            description=f"Mass deployed business batch {batch_id}",
-            # Initialize metrics
-            total_revenue=0,
-            total_customers=0,
-            total_leads=0,
-            conversion_rate=0
-        )
-
-        db.add(business)
-        created.append(business)
+    Bulk-create businesses with their plan, initial tasks and metrics rows.
 
-        # Initialize metrics history
-        initial_metrics = MetricsHistory(
-            business_id=biz_uuid,
-            revenue=0,
-            customers=0,
-            leads=0,
-            conversion_rate=0
-        )
-        db.add(initial_metrics)
-
-    db.commit()
-    return created
-
-async def activate_businesses_db(db: Session, business_ids: List[uuid.UUID]) -> int:
+    Businesses are inserted already active, so no follow-up UPDATE pass is needed.
     """
-    Activate businesses in database.
-    """
-    activated = 0
-    # Process in chunks to avoid huge IN clauses
-    chunk_size = 500
-    for i in range(0, len(business_ids), chunk_size):
-        chunk = business_ids[i:i+chunk_size]
-        # Update status
-        updated = db.query(Business).filter(Business.id.in_(chunk)).update(
-            {Business.status: "active", Business.started_at: datetime.utcnow()},
-            synchronize_session=False
-        )
-        activated += updated
-
-    db.commit()
-    return activated
+    provisioner = BulkProvisioningEngine(engine, batch_size=PROVISION_BATCH_SIZE)
+    return provisioner.provision(
+        user_id,
+        actual_count,
+        business_type=request.business_type.value,
+        auto_fold=request.auto_fold_inactive,
+        status="active",
+        template_name=request.template_name or "default",
+        on_batch=on_batch
+    )
 
 async def process_mass_deployment(
     deployment_id: str,
@@ -182,41 +140,23 @@ async def process_mass_deployment(
         # Get/Create User
         user = get_or_create_user(db, request.owner_email)
 
-        batch_size = 100 # Smaller batch size for real DB writes compared to simulated
-        num_batches = (actual_count + batch_size - 1) // batch_size
-
-        all_business_ids = []
-
-        for batch_id in range(num_batches):
-            batch_count = min(batch_size, actual_count - (batch_id * batch_size))
-
-            # Create batch
-            created_businesses = await create_business_batch(
-                db,
-                batch_id,
-                batch_count,
-                request.business_type,
-                user.id,
-                request.auto_fold_inactive
-            )
+        def on_batch(created: int) -> None:
+            deployment.total_created += created
+            deployment.total_active += created
 
-            # Collect IDs
-            batch_ids = [b.id for b in created_businesses]
-            all_business_ids.extend(batch_ids)
-
-            deployment.total_created += len(batch_ids)
-
-            # Allow some breathing room for DB
-            await asyncio.sleep(0.1)
-
-        # Activate businesses
-        activated = await activate_businesses_db(db, all_business_ids)
-        deployment.total_active = activated
+        # Bulk writes are blocking; keep them off the event loop
+        loop = asyncio.get_running_loop()
+        report = await loop.run_in_executor(
+            None, provision_businesses, engine, request, user.id, actual_count, on_batch
+        )
 
         deployment.completed_at = datetime.now()
         deployment.status = "completed"
 
-        print(f"✅ Deployment {deployment_id}: Created {deployment.total_created} businesses in DB")
+        print(
+            f"✅ Deployment {deployment_id}: Created {deployment.total_created} businesses in DB "
+            f"({report.rows} rows, {report.rows_per_second:,.0f} rows/s)"
+        )
 
     except Exception as e:
         deployment.status = "failed"
@@ -12,14 +12,17 @@ Real-time profitability monitoring that:
 """
 
 import asyncio
+import math
 import time
 import json
 import os
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from enum import Enum
 import httpx
+import numpy as np
 import statistics
 import stripe
 from decimal import Decimal
@@ -127,19 +130,162 @@ class BusinessMetrics:
             return BusinessHealth.CRITICAL
 
 
+# Numeric BusinessMetrics fields, in the column order used by MetricTimeSeriesStore
+METRIC_FIELDS = tuple(f.name for f in fields(BusinessMetrics) if f.name not in ('business_id', 'timestamp'))
+FIELD_INDEX = {name: i for i, name in enumerate(METRIC_FIELDS)}
+INT_FIELDS = frozenset(f.name for f in fields(BusinessMetrics) if f.type is int)
+
+
+def health_scores(values: np.ndarray) -> np.ndarray:
+    """BusinessMetrics.health_score for every row of a (n, len(METRIC_FIELDS)) matrix."""
+    margin = values[:, FIELD_INDEX['profit_margin']]
+    growth = values[:, FIELD_INDEX['growth_rate_mom']]
+    churn = values[:, FIELD_INDEX['churn_rate']]
+    uptime = values[:, FIELD_INDEX['uptime_percentage']]
+
+    score = np.select([margin > 0.25, margin > 0.15, margin > 0], [0.4, 0.3, 0.2], 0.0)
+    score += np.select([growth > 0.20, growth > 0.10, growth > 0], [0.3, 0.2, 0.15], 0.0)
+    score += np.select([churn < 0.05, churn < 0.10, churn < 0.15], [0.2, 0.15, 0.1], 0.0)
+    score += np.select([uptime > 0.99, uptime > 0.95], [0.1, 0.07], 0.0)
+    return np.minimum(score, 1.0)
+
+
+def health_statuses(scores: np.ndarray) -> np.ndarray:
+    """BusinessMetrics.health_status values for an array of health scores."""
+    return np.select(
+        [scores >= 0.8, scores >= 0.6, scores >= 0.4, scores >= 0.2],
+        [BusinessHealth.EXCELLENT.value, BusinessHealth.GOOD.value,
+         BusinessHealth.FAIR.value, BusinessHealth.POOR.value],
+        BusinessHealth.CRITICAL.value,
+    )
+
+
+class MetricTimeSeriesStore:
+    """
+    Columnar ring buffers of BusinessMetrics, one per business.
+
+    Each business owns a fixed (capacity, len(METRIC_FIELDS)) float array and a
+    timestamp column. Appending overwrites the oldest row, so retention costs
+    O(1) per sample instead of rescanning the history; reads also drop rows
+    older than ``retention`` in case samples arrive faster than planned.
+    """
+
+    def __init__(self, capacity: int, retention: timedelta):
+        self.capacity = max(int(capacity), 2)
+        self.retention = retention
+        self._values: Dict[str, np.ndarray] = {}
+        self._timestamps: Dict[str, np.ndarray] = {}
+        self._next: Dict[str, int] = {}
+        self._size: Dict[str, int] = {}
+
+    def __contains__(self, business_id: str) -> bool:
+        return self._size.get(business_id, 0) > 0
+
+    def business_ids(self) -> List[str]:
+        return [business_id for business_id, size in self._size.items() if size]
+
+    def append(self, metric: BusinessMetrics):
+        business_id = metric.business_id
+        if business_id not in self._values:
+            self._values[business_id] = np.zeros((self.capacity, len(METRIC_FIELDS)))
+            self._timestamps[business_id] = np.zeros(self.capacity)
+            self._next[business_id] = 0
+            self._size[business_id] = 0
+
+        row = self._next[business_id]
+        self._values[business_id][row] = [getattr(metric, name) for name in METRIC_FIELDS]
+        self._timestamps[business_id][row] = metric.timestamp.timestamp()
+        self._next[business_id] = (row + 1) % self.capacity
+        self._size[business_id] = min(self._size[business_id] + 1, self.capacity)
+
+    def _rows(self, business_id: str, last: Optional[int] = None) -> np.ndarray:
+        """Ring positions of the retained samples, oldest first."""
+        size = self._size.get(business_id, 0)
+        if not size:
+            return np.empty(0, dtype=np.intp)
+        start = (self._next[business_id] - size) % self.capacity
+        rows = (start + np.arange(size)) % self.capacity
+        cutoff = (datetime.now() - self.retention).timestamp()
+        rows = rows[self._timestamps[business_id][rows] > cutoff]
+        return rows[-last:] if last else rows
+
+    def series(self, business_id: str, field: str, last: Optional[int] = None) -> np.ndarray:
+        """One metric's values for a business, oldest first."""
+        rows = self._rows(business_id, last)
+        if not len(rows):
+            return np.empty(0)
+        return self._values[business_id][rows, FIELD_INDEX[field]]
+
+    def history(self, business_id: str, last: Optional[int] = None) -> List[BusinessMetrics]:
+        rows = self._rows(business_id, last)
+        if not len(rows):
+            return []
+        values = self._values[business_id][rows]
+        timestamps = self._timestamps[business_id][rows]
+        return [self._metric(business_id, stamp, row) for stamp, row in zip(timestamps, values)]
+
+    def latest(self, business_id: str) -> Optional[BusinessMetrics]:
+        history = self.history(business_id, last=1)
+        return history[0] if history else None
+
+    def latest_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """Latest sample of every business as a (businesses, len(METRIC_FIELDS)) matrix."""
+        business_ids, rows = [], []
+        for business_id in self.business_ids():
+            retained = self._rows(business_id, last=1)
+            if len(retained):
+                business_ids.append(business_id)
+                rows.append(self._values[business_id][retained[0]])
+        if not rows:
+            return [], np.empty((0, len(METRIC_FIELDS)))
+        return business_ids, np.vstack(rows)
+
+    @staticmethod
+    def _metric(business_id: str, timestamp: float, values: np.ndarray) -> BusinessMetrics:
+        data = {
+            name: int(value) if name in INT_FIELDS else float(value)
+            for name, value in zip(METRIC_FIELDS, values)
+        }
+        return BusinessMetrics(business_id=business_id, timestamp=datetime.fromtimestamp(timestamp), **data)
+
+
+class ChargeIndex:
+    """Stripe charges from one list call, bucketed by ``business`` and ``website`` metadata."""
+
+    def __init__(self, charges: List[Any]):
+        self.by_business: Dict[str, List[Any]] = defaultdict(list)
+        self.by_website: Dict[str, List[Any]] = defaultdict(list)
+        for charge in charges:
+            metadata = charge.metadata or {}
+            if metadata.get('business'):
+                self.by_business[metadata['business']].append(charge)
+            if metadata.get('website'):
+                self.by_website[metadata['website']].append(charge)
+
+    def for_business(self, business_id: str, website: Optional[str]) -> List[Any]:
+        charges = list(self.by_business.get(business_id, ()))
+        if website:
+            # Charges tagged with both the business and its website are already counted
+            charges.extend(
+                charge for charge in self.by_website.get(website, ())
+                if charge.metadata.get('business') != business_id
+            )
+        return charges
+
+
 class ProfitabilityMonitor:
     """
     Real-time profitability monitoring system that provides accurate business metrics
     for scaling decisions.
     """
 
-    def __init__(self, stripe_api_key: Optional[str] = None):
+    def __init__(self, stripe_api_key: Optional[str] = None, max_concurrency: int = 16):
         self.stripe_api_key = stripe_api_key or os.getenv('STRIPE_API_KEY')
-        self.business_metrics: Dict[str, List[BusinessMetrics]] = {}
 
         # Monitoring configuration
         self.monitoring_interval = 3600  # 1 hour
         self.retention_days = 90  # Keep 90 days of metrics
+        self.max_concurrency = max_concurrency  # Businesses gathered at once
         self.alert_thresholds = {
             'profit_margin_drop': 0.15,
             'churn_rate_spike': 0.05,
@@ -147,6 +293,12 @@ class ProfitabilityMonitor:
             'cost_spike': 0.25
         }
 
+        # One ring slot per monitoring cycle over the retention window
+        self.metrics_store = MetricTimeSeriesStore(
+            capacity=math.ceil(self.retention_days * 86400 / self.monitoring_interval),
+            retention=timedelta(days=self.retention_days),
+        )
+
         # Initialize Stripe if available
         if self.stripe_api_key:
             stripe.api_key = self.stripe_api_key
@@ -170,25 +322,27 @@ class ProfitabilityMonitor:
         """Execute one monitoring cycle."""
         print(f"\n📈 Profitability Monitoring - {datetime.now().strftime('%Y-%m-%d %H:%M')}")
 
-        # Get business metrics
-        business_ids = await self._get_active_businesses()
-        metrics = []
-
-        for business_id in business_ids:
-            try:
-                metric = await self._gather_business_metrics(business_id)
-                metrics.append(metric)
-
-                # Store metrics
-                if business_id not in self.business_metrics:
-                    self.business_metrics[business_id] = []
-                self.business_metrics[business_id].append(metric)
-
-                # Clean old metrics
-                self._cleanup_old_metrics(business_id)
+        # Load the business models and this cycle's Stripe charges once, then
+        # gather every business concurrently
+        business_models = self._load_business_models()
+        business_ids = await self._get_active_businesses(business_models)
+        charges = await self._fetch_recent_charges() if self.stripe_api_key else None
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def gather(business_id: str) -> BusinessMetrics:
+            async with semaphore:
+                return await self._gather_business_metrics(
+                    business_id, business_models.get(business_id), charges
+                )
 
-            except Exception as e:
-                print(f"❌ Error monitoring business {business_id}: {e}")
+        results = await asyncio.gather(*(gather(b) for b in business_ids), return_exceptions=True)
+        metrics = []
+        for business_id, result in zip(business_ids, results):
+            if isinstance(result, BaseException):
+                print(f"❌ Error monitoring business {business_id}: {result}")
+                continue
+            metrics.append(result)
+            self.metrics_store.append(result)
 
         # Aggregate and analyze
         await self._analyze_portfolio_performance(metrics)
@@ -196,28 +350,46 @@ class ProfitabilityMonitor:
         # Check for alerts
         await self._check_alerts(metrics)
 
-    async def _get_active_businesses(self) -> List[str]:
-        """Get list of active businesses to monitor."""
+    def _load_business_models(self) -> Dict[str, Any]:
+        """Business models from the real business library, keyed by name."""
         from bbb_real_business_library import get_real_business_library
 
-        # Get real business library
         library = get_real_business_library()
-        businesses = library.get_all_businesses()
-
-        # Return business names (first 10 for initial monitoring)
-        return [b.name for b in businesses[:10]]
+        return {b.name: b for b in library.get_all_businesses()}
 
-    async def _gather_business_metrics(self, business_id: str) -> BusinessMetrics:
+    async def _get_active_businesses(self, business_models: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Get list of active businesses to monitor."""
+        if business_models is None:
+            business_models = self._load_business_models()
+        return list(business_models)
+
+    async def _fetch_recent_charges(self) -> Optional[ChargeIndex]:
+        """List the last 30 days of Stripe charges once for the whole cycle."""
+        thirty_days_ago = int((datetime.now() - timedelta(days=30)).timestamp())
+
+        def list_charges() -> List[Any]:
+            charges = stripe.Charge.list(created={'gte': thirty_days_ago}, limit=100)
+            return list(charges.auto_paging_iter())
+
+        try:
+            # The Stripe client is blocking; keep it off the event loop
+            return ChargeIndex(await asyncio.to_thread(list_charges))
+        except Exception as e:
+            print(f"⚠️ Stripe charge list error: {e}")
+            return None
+
+    async def _gather_business_metrics(
+        self,
+        business_id: str,
+        business_model=None,
+        charges: Optional[ChargeIndex] = None,
+    ) -> BusinessMetrics:
         """Gather comprehensive metrics for a business."""
-        from bbb_real_business_library import get_real_business_library
-
-        # Get real business data
-        library = get_real_business_library()
-        businesses = library.get_all_businesses()
-        business_model = next((b for b in businesses if b.name == business_id), None)
+        if business_model is None:
+            business_model = self._load_business_models().get(business_id)
 
         # Revenue metrics from Stripe or business model estimates
-        revenue_metrics = await self._get_revenue_metrics(business_id, business_model)
+        revenue_metrics = await self._get_revenue_metrics(business_id, business_model, charges)
 
         # Cost metrics
         cost_metrics = await self._get_cost_metrics(business_id, business_model)
@@ -266,25 +438,22 @@ class ProfitabilityMonitor:
             customer_satisfaction=operational_metrics['satisfaction']
         )
 
-    async def _get_revenue_metrics(self, business_id: str, business_model=None) -> Dict[str, float]:
+    async def _get_revenue_metrics(
+        self,
+        business_id: str,
+        business_model=None,
+        charges: Optional[ChargeIndex] = None,
+    ) -> Dict[str, float]:
         """Get revenue metrics from Stripe or business model estimates."""
         if self.stripe_api_key and business_model:
             try:
-                # Try to get real Stripe data filtered by business/website
-                thirty_days_ago = int((datetime.now() - timedelta(days=30)).timestamp())
-
-                # Filter charges by metadata if available (business-specific)
-                charges = stripe.Charge.list(
-                    created={'gte': thirty_days_ago},
-                    limit=100
-                )
+                if charges is None:
+                    charges = await self._fetch_recent_charges()
 
-                # Filter by business if metadata exists
-                business_charges = [
-                    charge for charge in charges.data
-                    if charge.metadata.get('business') == business_id or
-                       charge.metadata.get('website') == getattr(business_model, 'website', None)
-                ]
+                # Charges tagged with this business or its website
+                business_charges = charges.for_business(
+                    business_id, getattr(business_model, 'website', None)
+                ) if charges else []
 
                 if business_charges:
                     total_revenue = sum(charge.amount / 100 for charge in business_charges)
@@ -468,12 +637,11 @@ class ProfitabilityMonitor:
 
     async def _calculate_growth_rate(self, business_id: str) -> float:
         """Calculate month-over-month growth rate."""
-        history = self.business_metrics.get(business_id, [])
+        history = self.metrics_store.series(business_id, 'mrr', last=2)
         if len(history) < 2:
             return 0.0
 
-        current = history[-1].mrr
-        previous = history[-2].mrr
+        previous, current = history.tolist()
 
         if previous == 0:
             return 1.0 if current > 0 else 0.0
@@ -485,17 +653,15 @@ class ProfitabilityMonitor:
         if not metrics:
             return
 
-        # Calculate portfolio aggregates
-        total_mrr = sum(m.mrr for m in metrics)
-        total_customers = sum(m.total_customers for m in metrics)
-        avg_profit_margin = statistics.mean(m.profit_margin for m in metrics)
-        avg_churn_rate = statistics.mean(m.churn_rate for m in metrics)
+        # Calculate portfolio aggregates over one (businesses, fields) matrix
+        values = np.array([[getattr(m, name) for name in METRIC_FIELDS] for m in metrics])
+        total_mrr = float(values[:, FIELD_INDEX['mrr']].sum())
+        total_customers = int(values[:, FIELD_INDEX['total_customers']].sum())
+        avg_profit_margin = float(values[:, FIELD_INDEX['profit_margin']].mean())
+        avg_churn_rate = float(values[:, FIELD_INDEX['churn_rate']].mean())
 
         # Health distribution
-        health_counts = {}
-        for metric in metrics:
-            health = metric.health_status.value
-            health_counts[health] = health_counts.get(health, 0) + 1
+        health_counts = self._health_distribution(health_statuses(health_scores(values)))
 
         print(f"📊 Portfolio Overview:")
         print(f"   Total Businesses: {len(metrics)}")
@@ -527,27 +693,23 @@ class ProfitabilityMonitor:
             for alert in alerts:
                 print(f"   {alert}")
 
-    def _cleanup_old_metrics(self, business_id: str):
-        """Clean up old metrics to prevent memory bloat."""
-        if business_id in self.business_metrics:
-            cutoff_date = datetime.now() - timedelta(days=self.retention_days)
-            self.business_metrics[business_id] = [
-                m for m in self.business_metrics[business_id]
-                if m.timestamp > cutoff_date
-            ]
+    @staticmethod
+    def _health_distribution(statuses: np.ndarray) -> Dict[str, int]:
+        labels, counts = np.unique(statuses, return_counts=True)
+        return {str(label): int(count) for label, count in zip(labels, counts)}
 
     def get_business_health_report(self, business_id: str) -> Dict[str, Any]:
         """Get comprehensive health report for a business."""
-        history = self.business_metrics.get(business_id, [])
-        if not history:
+        latest = self.metrics_store.latest(business_id)
+        if latest is None:
             return {"error": "No metrics available for business"}
 
-        latest = history[-1]
+        # Calculate trends over the last 30 samples
+        def series(field: str) -> List[float]:
+            return self.metrics_store.series(business_id, field, last=30).tolist()
 
-        # Calculate trends
-        recent_metrics = history[-30:] if len(history) >= 30 else history  # Last 30 days
-        profit_trend = self._calculate_trend([m.profit_margin for m in recent_metrics])
-        revenue_trend = self._calculate_trend([m.mrr for m in recent_metrics])
+        profit_trend = self._calculate_trend(series('profit_margin'))
+        revenue_trend = self._calculate_trend(series('mrr'))
 
         return {
             'business_id': business_id,
@@ -563,7 +725,7 @@ class ProfitabilityMonitor:
             'trends': {
                 'profit_margin': profit_trend,
                 'revenue': revenue_trend,
-                'customer_growth': self._calculate_trend([m.total_customers for m in recent_metrics])
+                'customer_growth': self._calculate_trend(series('total_customers'))
             },
             'alerts': self._get_business_alerts(latest),
             'recommendations': self._get_business_recommendations(latest)
@@ -630,47 +792,43 @@ class ProfitabilityMonitor:
 
     def get_portfolio_summary(self) -> Dict[str, Any]:
         """Get summary of entire business portfolio."""
-        all_businesses = []
-        for business_id, history in self.business_metrics.items():
-            if history:
-                latest = history[-1]
-                all_businesses.append({
-                    'id': business_id,
-                    'health_score': latest.health_score,
-                    'mrr': latest.mrr,
-                    'profit_margin': latest.profit_margin,
-                    'status': latest.health_status.value
-                })
-
-        if not all_businesses:
+        business_ids, values = self.metrics_store.latest_matrix()
+        if not business_ids:
             return {"error": "No business metrics available"}
 
         # Calculate portfolio metrics
-        total_mrr = sum(b['mrr'] for b in all_businesses)
-        avg_health = statistics.mean(b['health_score'] for b in all_businesses)
-        profitable_businesses = sum(1 for b in all_businesses if b['profit_margin'] > 0)
-
-        # Health distribution
-        health_dist = {}
-        for business in all_businesses:
-            status = business['status']
-            health_dist[status] = health_dist.get(status, 0) + 1
+        scores = health_scores(values)
+        statuses = health_statuses(scores)
+        mrr = values[:, FIELD_INDEX['mrr']]
+        margins = values[:, FIELD_INDEX['profit_margin']]
+        all_businesses = [
+            {
+                'id': business_id,
+                'health_score': float(scores[i]),
+                'mrr': float(mrr[i]),
+                'profit_margin': float(margins[i]),
+                'status': str(statuses[i])
+            }
+            for i, business_id in enumerate(business_ids)
+        ]
+        top = np.argsort(-scores, kind='stable')[:5]
 
         return {
             'total_businesses': len(all_businesses),
-            'total_mrr': total_mrr,
-            'average_health_score': avg_health,
-            'profitable_businesses': profitable_businesses,
-            'health_distribution': health_dist,
-            'top_performers': sorted(all_businesses, key=lambda x: x['health_score'], reverse=True)[:5],
-            'needs_attention': [b for b in all_businesses if b['health_score'] < 0.4]
+            'total_mrr': float(mrr.sum()),
+            'average_health_score': float(scores.mean()),
+            'profitable_businesses': int((margins > 0).sum()),
+            'health_distribution': self._health_distribution(statuses),
+            'top_performers': [all_businesses[i] for i in top],
+            'needs_attention': [all_businesses[i] for i in np.flatnonzero(scores < 0.4)]
         }
 
     def save_metrics(self):
         """Save metrics to disk for persistence."""
         metrics_data = {}
-        for business_id, history in self.business_metrics.items():
-            metrics_data[business_id] = [asdict(m) for m in history[-100:]]  # Keep last 100 entries
+        for business_id in self.metrics_store.business_ids():
+            history = self.metrics_store.history(business_id, last=100)  # Keep last 100 entries
+            metrics_data[business_id] = [asdict(m) for m in history]
 
         with open('/Users/noone/.ech0/profitability_metrics.json', 'w') as f:
             json.dump(metrics_data, f, indent=2, default=str)
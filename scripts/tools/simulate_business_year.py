@@ -1,79 +1,110 @@
 #!/usr/bin/env python3
 """
 BBB Annual Business Simulator
-Fast-forwards through a year of autonomous operations to verify system behavior.
+Fast-forwards through years of autonomous operations to verify system behavior.
+
+The batched lane (business_simulation.simulate_portfolio) advances the whole
+Monte Carlo portfolio as NumPy arrays. The optional high-fidelity lane runs
+YearSimulator, which drives a real orchestrator day by day with the same
+model, for a small sample of businesses to cross-check the batched numbers.
 """
 
+import argparse
 import asyncio
 import logging
-import random
+from collections import deque
 from datetime import datetime, timedelta
-from startup_compiler import StartupCompiler
-from src.blank_business_builder.autonomous_business import TaskStatus, AgentRole
+from typing import List, Optional
+
+import numpy as np
+
+from business_simulation import (
+    BILLING_PERIOD_DAYS, MARKETING_PERIOD_DAYS, PortfolioSimulation, SimulationParams, simulate_portfolio
+)
+from src.blank_business_builder.autonomous_business import TaskStatus
 from src.blank_business_builder.semantic_framework import semantic, send
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("YearSimulator")
 
 class YearSimulator:
-    def __init__(self, insight: str):
+    """High-fidelity lane: one real orchestrator driven through every simulated day"""
+
+    def __init__(self, insight: str, params: SimulationParams = SimulationParams(), days: int = 365,
+                 seed: Optional[int] = None, report_path: Optional[str] = "simulation_report.md"):
         self.insight = insight
+        self.params = params
+        self.days = days
+        self.rng = np.random.default_rng(seed)
+        self.report_path = report_path
+        # Only the high-fidelity lane needs the full compiler stack
+        from startup_compiler import StartupCompiler
         self.compiler = StartupCompiler()
         self.start_date = datetime.now()
         self.current_date = self.start_date
         self.logs = []
 
     async def run(self):
-        logger.info(f"📅 Starting 1-Year Fast-Forward for: {self.insight}")
-        
+        logger.info(f"📅 Starting {self.days}-day Fast-Forward for: {self.insight}")
+
         # 1. Compile the startup
         await self.compiler.compile(self.insight)
         orch = self.compiler.orchestrator
-        
-        # 2. Simulate 365 days in chunks
-        for day in range(1, 366):
+        daily_churn = self.params.daily_churn
+
+        # 2. Simulate each day
+        for day in range(1, self.days + 1):
             self.current_date += timedelta(days=1)
-            
+
             # Simulate random business events
-            num_clients = random.randint(0, 5)
+            num_clients = int(self.rng.poisson(self.params.daily_arrival_rate))
             for _ in range(num_clients):
-                client_id = f"client_{day}_{random.randint(1000, 9999)}"
+                client_id = f"client_{day}_{self.rng.integers(1000, 10000)}"
                 send(semantic.Client.onboarded, {"client_id": client_id, "date": self.current_date.isoformat()})
                 orch.metrics.customer_count += 1
-            
+            if daily_churn > 0:
+                orch.metrics.customer_count -= int(self.rng.binomial(orch.metrics.customer_count, daily_churn))
+
             # Simulate autonomous agent activity for the day
             # In a real run, the agents would pick up tasks from the queue.
             # Here we simulate the OODA loops and outputs.
-            
-            if day % 7 == 0: # Weekly marketing push
+
+            if day % MARKETING_PERIOD_DAYS == 0: # Weekly marketing push
                 logger.info(f"Day {day}: Autonomous Marketing Blast executed.")
-                orch.metrics.leads_generated += random.randint(10, 50)
-                
-            if day % 30 == 0: # Monthly financial review
-                revenue_gain = orch.metrics.customer_count * random.uniform(50, 200)
+                low, high = self.params.weekly_leads
+                orch.metrics.leads_generated += int(self.rng.integers(low, high + 1))
+
+            if day % BILLING_PERIOD_DAYS == 0: # Monthly financial review
+                revenue_gain = orch.metrics.customer_count * self.rng.uniform(*self.params.revenue_per_client)
                 orch.metrics.total_revenue += revenue_gain
                 logger.info(f"Day {day}: Monthly Revenue Update: +${revenue_gain:.2f} (Total: ${orch.metrics.total_revenue:.2f})")
 
-            # Simulate agent task completions
-            for task in orch.task_queue:
-                if task.status == TaskStatus.PENDING and random.random() > 0.3:
-                    task.status = TaskStatus.COMPLETED
+            # Simulate agent task completions; finished tasks leave the pending queue
+            still_pending = deque()
+            for task in orch.pending_tasks:
+                if task.status == TaskStatus.PENDING and self.rng.random() < self.params.task_completion_prob:
+                    orch._set_task_status(task, TaskStatus.COMPLETED)
                     task.completed_at = self.current_date
                     orch.metrics.tasks_completed += 1
-                    
+                else:
+                    still_pending.append(task)
+            orch.pending_tasks = still_pending
+
             # Log periodic status
             if day % 90 == 0:
                 logger.info(f"--- Quarter {day//90} Report ---")
                 logger.info(f"Revenue: ${orch.metrics.total_revenue:.2f} | Clients: {orch.metrics.customer_count} | Tasks: {orch.metrics.tasks_completed}")
 
-        logger.info("🏁 1-Year Simulation Complete.")
-        self.generate_report(orch)
+        logger.info(f"🏁 {self.days}-day Simulation Complete.")
+        if self.report_path:
+            self.generate_report(orch)
+        return orch.metrics
 
     def generate_report(self, orch):
         report = f"""
 # Annual Autonomy Report
 **Insight**: {self.insight}
-**Duration**: 365 Days (Simulated)
+**Duration**: {self.days} Days (Simulated)
 
 ## Key Metrics
 - **Total Revenue**: ${orch.metrics.total_revenue:,.2f}
@@ -83,13 +114,74 @@ class YearSimulator:
 
 ## Activity Summary
 - **Calls/Outreach**: {orch.metrics.leads_generated * 1.5:.0f} simulated interactions
-- **Email Campaigns**: {int(365/7)} autonomous blasts
-- **Financial Reviews**: 12 semantic audits
+- **Email Campaigns**: {self.days // MARKETING_PERIOD_DAYS} autonomous blasts
+- **Financial Reviews**: {self.days // BILLING_PERIOD_DAYS} semantic audits
 """
-        with open("simulation_report.md", "w") as f:
+        with open(self.report_path, "w") as f:
             f.write(report)
-        logger.info("📄 Simulation report generated: simulation_report.md")
+        logger.info(f"📄 Simulation report generated: {self.report_path}")
+
+
+async def run_monte_carlo(insight: str, businesses: int = 1000, years: int = 5,
+                          params: SimulationParams = SimulationParams(), seed: Optional[int] = None,
+                          high_fidelity: int = 0, report_path: str = "monte_carlo_report.md"):
+    """Batched portfolio run plus ``high_fidelity`` real-orchestrator runs for comparison"""
+    days = years * 365
+    portfolio = simulate_portfolio(businesses, days, params, seed)
+    logger.info(f"🎲 Simulated {businesses} businesses x {days} days")
+
+    samples: List = []
+    for i in range(high_fidelity):
+        sample_seed = None if seed is None else seed + i + 1
+        simulator = YearSimulator(insight, params, days, seed=sample_seed, report_path=None)
+        samples.append(await simulator.run())
+
+    generate_monte_carlo_report(insight, portfolio, samples, report_path)
+    return portfolio, samples
+
+
+def generate_monte_carlo_report(insight: str, portfolio: PortfolioSimulation, samples: List, report_path: str):
+    summary = portfolio.summary()
+    labels = {'total_revenue': "Total Revenue ($)", 'customer_count': "Client Base",
+              'leads_generated': "Lead Generation", 'tasks_completed': "Tasks Autonomously Executed"}
+    rows = "\n".join(
+        f"| {labels[name]} | {s['mean']:,.2f} | {s['p5']:,.2f} | {s['p50']:,.2f} | {s['p95']:,.2f} |"
+        for name, s in summary.items()
+    )
+    report = f"""
+# Monte Carlo Autonomy Report
+**Insight**: {insight}
+**Businesses**: {portfolio.businesses}
+**Duration**: {portfolio.days} Days (Simulated)
+
+## Portfolio Metrics
+| Metric | Mean | P5 | P50 | P95 |
+|---|---|---|---|---|
+{rows}
+"""
+    if samples:
+        report += "\n## High-Fidelity Samples (real orchestrator)\n" + "\n".join(
+            f"- Revenue ${m.total_revenue:,.2f} | Clients {m.customer_count} | "
+            f"Tasks {m.tasks_completed} | Leads {m.leads_generated}"
+            for m in samples
+        ) + "\n"
+    with open(report_path, "w") as f:
+        f.write(report)
+    logger.info(f"📄 Monte Carlo report generated: {report_path}")
+
 
 if __name__ == "__main__":
-    sim = YearSimulator("AI-Powered Subscription Box for Artisanal Woodworking Tools")
-    asyncio.run(sim.run())
+    parser = argparse.ArgumentParser(description="BBB Business Simulator")
+    parser.add_argument("--insight", default="AI-Powered Subscription Box for Artisanal Woodworking Tools")
+    parser.add_argument("--businesses", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=1)
+    parser.add_argument("--monthly-churn", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--high-fidelity", type=int, default=0,
+                        help="Businesses also run through a real orchestrator")
+    args = parser.parse_args()
+
+    asyncio.run(run_monte_carlo(
+        args.insight, args.businesses, args.years, SimulationParams(monthly_churn=args.monthly_churn),
+        args.seed, args.high_fidelity,
+    ))
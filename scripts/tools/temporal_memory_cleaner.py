@@ -4,93 +4,107 @@ Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights
 
 Temporal Memory Cleaner - ECH0-directed memory management
 Automatically cleans temporal memory when threshold is reached
+
+Memories live in a segmented store (temporal_memory_store) under
+MEMORY_PATH/segments, so counting is O(1) and cleaning drops whole segments.
+Per-file *.json memories still written to MEMORY_PATH are swept into the
+store each time it is opened.
 """
 
-import os
-import json
+import argparse
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
 import logging
 
+from temporal_memory_store import TemporalMemoryStore, migrate_directory
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 LOG = logging.getLogger(__name__)
 
 MEMORY_PATH = Path("/Users/noone/repos/BBB/temporal_memory")
-THRESHOLD = 750  # Clean when reaching this many files
-KEEP_RECENT = 100  # Keep this many most recent files
-
-
-def count_memory_files() -> int:
-    """Count current memory files"""
-    if not MEMORY_PATH.exists():
+STORE_DIR = "segments"  # Segmented store, inside MEMORY_PATH
+THRESHOLD = 750  # Clean when reaching this many memories
+KEEP_RECENT = 100  # Keep (at least) this many most recent memories
+SEGMENT_RECORDS = 25  # Retention granularity: keeps KEEP_RECENT to KEEP_RECENT + 25
+
+
+def open_store(memory_path: Path = None) -> TemporalMemoryStore:
+    """Open the segmented memory store, moving in any per-file memories written since last time"""
+    memory_path = MEMORY_PATH if memory_path is None else Path(memory_path)
+    store_path = memory_path / STORE_DIR
+    store = TemporalMemoryStore(store_path, segment_records=SEGMENT_RECORDS)
+    if memory_path.exists():
+        migrated = migrate_directory(memory_path, store)
+        if migrated:
+            LOG.info(f"Migrated {migrated} memory files into {store_path}")
+    return store
+
+
+@contextmanager
+def _using(store: TemporalMemoryStore = None):
+    """The given store, or one opened on MEMORY_PATH and closed afterwards"""
+    if store is not None:
+        yield store
+        return
+    with open_store() as opened:
+        yield opened
+
+
+def count_memory_files(store: TemporalMemoryStore = None) -> int:
+    """Count current memories"""
+    if store is None and not MEMORY_PATH.exists():
         return 0
-    return len(list(MEMORY_PATH.glob("*.json")))
+    with _using(store) as store:
+        return len(store)
 
 
-def clean_old_memories(keep_recent: int = KEEP_RECENT):
+def clean_old_memories(keep_recent: int = KEEP_RECENT, store: TemporalMemoryStore = None):
     """Clean old temporal memories, keeping most recent"""
-
-    if not MEMORY_PATH.exists():
+    if store is None and not MEMORY_PATH.exists():
         LOG.info("No temporal memory path found")
         return 0
 
-    # Get all memory files with their modification times
-    files = []
-    for f in MEMORY_PATH.glob("*.json"):
-        try:
-            mtime = f.stat().st_mtime
-            files.append((f, mtime))
-        except:
-            continue
-
-    if len(files) == 0:
-        LOG.info("No memory files to clean")
-        return 0
-
-    # Sort by modification time (newest first)
-    files.sort(key=lambda x: x[1], reverse=True)
-
-    # Keep recent, delete old
-    files_to_keep = files[:keep_recent]
-    files_to_delete = files[keep_recent:]
-
-    deleted_count = 0
-    for file_path, _ in files_to_delete:
-        try:
-            file_path.unlink()
-            deleted_count += 1
-        except Exception as e:
-            LOG.warning(f"Could not delete {file_path.name}: {e}")
+    with _using(store) as store:
+        if len(store) == 0:
+            LOG.info("No memories to clean")
+            return 0
 
-    LOG.info(f"Cleaned {deleted_count} old memories, kept {len(files_to_keep)} recent")
-    return deleted_count
+        deleted_count = store.enforce_retention(keep_recent)
+        LOG.info(f"Cleaned {deleted_count} old memories, kept {len(store)} recent")
+        return deleted_count
 
 
-def should_clean() -> bool:
+def should_clean(store: TemporalMemoryStore = None) -> bool:
     """Check if cleaning is needed"""
-    count = count_memory_files()
-    return count >= THRESHOLD
+    return count_memory_files(store) >= THRESHOLD
 
 
-def auto_clean():
+def auto_clean(store: TemporalMemoryStore = None):
     """Automatically clean if threshold reached"""
-    count = count_memory_files()
-
-    LOG.info(f"Temporal memory: {count} files")
-
-    if count >= THRESHOLD:
-        LOG.warning(f"Threshold reached ({count} >= {THRESHOLD}), cleaning...")
-        deleted = clean_old_memories(KEEP_RECENT)
-        new_count = count_memory_files()
-        LOG.info(f"After cleaning: {new_count} files remaining")
-        return deleted
-    else:
-        LOG.info(f"No cleaning needed ({count}/{THRESHOLD})")
+    if store is None and not MEMORY_PATH.exists():
+        LOG.info("No temporal memory path found")
         return 0
 
+    with _using(store) as store:
+        count = len(store)
+        LOG.info(f"Temporal memory: {count} memories")
+
+        if count >= THRESHOLD:
+            LOG.warning(f"Threshold reached ({count} >= {THRESHOLD}), cleaning...")
+            deleted = clean_old_memories(KEEP_RECENT, store)
+            LOG.info(f"After cleaning: {len(store)} memories remaining")
+            return deleted
+        else:
+            LOG.info(f"No cleaning needed ({count}/{THRESHOLD})")
+            return 0
+
 
 if __name__ == "__main__":
     LOG.info("=" * 60)
     LOG.info("TEMPORAL MEMORY CLEANER")
     LOG.info("=" * 60)
-    auto_clean()
+    parser = argparse.ArgumentParser(description="Temporal memory cleaner")
+    parser.add_argument("--path", type=Path, default=MEMORY_PATH)
+    args = parser.parse_args()
+    with open_store(args.path) as store:
+        auto_clean(store)
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+Temporal Memory Store - segmented, size-rotated memory log
+
+Memories are appended as JSON lines to the active segment file
+(``seg-000001.jsonl``, ...). When a segment reaches ``segment_bytes`` (or
+``segment_records``, if set) it is sealed and a new one started.
+``index.json`` lists the sealed segments with their record counts and time
+span and is rewritten (atomically) only on rotation or retention, never
+per append. Opening the store reads the index
+and counts the lines of the active segment alone, so the record count is
+known without listing the directory, and retention drops whole sealed
+segments from the old end: one unlink each.
+
+A missing, unreadable or stale index (segments past its active one) is
+rebuilt from the segment files. migrate_directory() moves the legacy
+one-JSON-file-per-memory layout into a store, oldest first.
+"""
+
+import json
+import logging
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+LOG = logging.getLogger(__name__)
+
+INDEX_NAME = "index.json"
+INDEX_VERSION = 1
+SEGMENT_BYTES = 1 << 20  # Rotate segments at 1 MiB
+
+
+@dataclass
+class Segment:
+    """A segment file and what it holds"""
+    id: int
+    count: int = 0
+    bytes: int = 0
+    first_ts: Optional[float] = None
+    last_ts: Optional[float] = None
+
+    @property
+    def name(self) -> str:
+        return f"seg-{self.id:06d}.jsonl"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "count": self.count, "bytes": self.bytes,
+                "first_ts": self.first_ts, "last_ts": self.last_ts}
+
+
+class TemporalMemoryStore:
+    """Append-only memory log split into size-rotated segments"""
+
+    def __init__(self, root, segment_bytes: int = SEGMENT_BYTES, segment_records: Optional[int] = None):
+        self.root = Path(root)
+        self.segment_bytes = segment_bytes
+        self.segment_records = segment_records
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.sealed: deque = deque()
+        self._sealed_count = 0
+        self._defer_index = False
+        self._index_dirty = False
+        self.active = self._load_index()
+        self._handle = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / INDEX_NAME
+
+    def _load_index(self) -> Segment:
+        try:
+            index = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            index = None
+        if not index or index.get("version") != INDEX_VERSION:
+            return self._rebuild_index()
+
+        active = Segment(id=index["active"])
+        if (self.root / Segment(id=active.id + 1).name).exists():
+            # Rotated past the index (a deferred load was interrupted)
+            return self._rebuild_index()
+
+        for entry in index["segments"]:
+            segment = Segment(**entry)
+            self.sealed.append(segment)
+            self._sealed_count += segment.count
+
+        # The active segment is not indexed; recount it from its lines
+        self._scan(active)
+        return active
+
+    def _scan(self, segment: Segment) -> None:
+        """Count a segment's records from its file, truncating a torn final write"""
+        path = self.root / segment.name
+        if not path.exists():
+            return
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Torn final write
+                record = json.loads(line)
+                segment.count += 1
+                segment.bytes += len(line)
+                if segment.first_ts is None:
+                    segment.first_ts = record["ts"]
+                segment.last_ts = record["ts"]
+        if segment.bytes != path.stat().st_size:
+            with open(path, "r+b") as f:
+                f.truncate(segment.bytes)
+
+    def _rebuild_index(self) -> Segment:
+        """Recover the index from the segment files: the newest is active, the rest sealed"""
+        ids = sorted(int(path.stem[len("seg-"):]) for path in self.root.glob("seg-*.jsonl"))
+        if not ids:
+            return Segment(id=1)
+        LOG.warning(f"Rebuilding {self.index_path} from {len(ids)} segments")
+        for segment_id in ids[:-1]:
+            segment = Segment(id=segment_id)
+            self._scan(segment)
+            self.sealed.append(segment)
+            self._sealed_count += segment.count
+        active = Segment(id=ids[-1])
+        self._scan(active)
+        self.active = active
+        self._write_index()
+        return active
+
+    def _write_index(self) -> None:
+        if self._defer_index:
+            self._index_dirty = True
+            return
+        index = {
+            "version": INDEX_VERSION,
+            "active": self.active.id,
+            "segments": [segment.to_dict() for segment in self.sealed],
+        }
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(index))
+        os.replace(tmp, self.index_path)
+
+    @contextmanager
+    def deferred_index(self):
+        """
+        Write the index once at the end of a bulk load instead of on every
+        rotation. If the load is interrupted the index is stale, and the next
+        open rebuilds it from the segment files.
+        """
+        self._defer_index = True
+        try:
+            yield self
+        finally:
+            self._defer_index = False
+            self.close()
+        if self._index_dirty:
+            self._index_dirty = False
+            self._write_index()
+
+    def __len__(self) -> int:
+        return self._sealed_count + self.active.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def append(self, memory: Any, timestamp: Optional[float] = None, memory_id: Optional[str] = None) -> None:
+        """Append one memory, rotating the active segment when it is full"""
+        ts = time.time() if timestamp is None else timestamp
+        record = {"ts": ts, "memory": memory}
+        if memory_id is not None:
+            record["id"] = memory_id
+        line = (json.dumps(record) + "\n").encode("utf-8")
+
+        if self.active.count and (self.active.bytes + len(line) > self.segment_bytes
+                                  or self.active.count == self.segment_records):
+            self._rotate()
+        if self._handle is None:
+            self._handle = open(self.root / self.active.name, "ab")
+            if not self.index_path.exists():
+                self._write_index()
+        self._handle.write(line)
+        self._handle.flush()
+
+        self.active.count += 1
+        self.active.bytes += len(line)
+        if self.active.first_ts is None:
+            self.active.first_ts = ts
+        self.active.last_ts = ts
+
+    def extend(self, memories: Iterable[Any]) -> None:
+        for memory in memories:
+            self.append(memory)
+
+    def _rotate(self) -> None:
+        self.close()
+        self.sealed.append(self.active)
+        self._sealed_count += self.active.count
+        self.active = Segment(id=self.active.id + 1)
+        self._write_index()
+
+    def enforce_retention(self, keep_recent: int) -> int:
+        """
+        Drop the oldest sealed segments while at least ``keep_recent``
+        memories would remain; returns the number of memories dropped.
+        Whole segments are dropped, so up to one segment's worth more than
+        ``keep_recent`` may be kept.
+        """
+        dropped = 0
+        while self.sealed and len(self) - self.sealed[0].count >= keep_recent:
+            segment = self.sealed.popleft()
+            self._sealed_count -= segment.count
+            dropped += segment.count
+            try:
+                (self.root / segment.name).unlink()
+            except FileNotFoundError:
+                pass
+        if dropped:
+            self._write_index()
+        return dropped
+
+    def segments(self) -> List[Segment]:
+        return [*self.sealed, self.active]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Records (``ts``, ``memory`` and optional ``id``), oldest first"""
+        for segment in self.segments():
+            path = self.root / segment.name
+            if not path.exists():
+                continue
+            with open(path, "rb") as f:
+                for line in f:
+                    yield json.loads(line)
+
+    def recent(self, n: int) -> List[Dict[str, Any]]:
+        """The ``n`` newest records, newest first, reading only the segments needed"""
+        records: List[Dict[str, Any]] = []
+        for segment in reversed(self.segments()):
+            if len(records) >= n:
+                break
+            path = self.root / segment.name
+            if path.exists():
+                with open(path, "rb") as f:
+                    records.extend(reversed([json.loads(line) for line in f]))
+        return records[:n]
+
+
+def migrate_directory(source, store: TemporalMemoryStore, remove: bool = True) -> int:
+    """
+    Move per-file ``*.json`` memories from ``source`` into ``store``,
+    oldest (by mtime) first, keeping the file stem as the memory id.
+    Each file is removed as soon as its memory is written, so an
+    interrupted migration resumes where it stopped. Unreadable files are
+    left in place. Returns the number migrated.
+    """
+    source = Path(source)
+    files = []
+    for path in source.glob("*.json"):
+        try:
+            files.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    if not files:
+        return 0
+    files.sort()
+
+    # A crash between append and unlink leaves that file behind, already stored
+    last = store.recent(1)
+    last_id = last[0].get("id") if last else None
+
+    migrated = 0
+    with store.deferred_index():
+        for mtime, path in files:
+            if path.stem != last_id:
+                try:
+                    memory = json.loads(path.read_text(encoding="utf-8"))
+                except (OSError, ValueError) as e:
+                    LOG.warning(f"Skipping unreadable memory {path.name}: {e}")
+                    continue
+                store.append(memory, timestamp=mtime, memory_id=path.stem)
+            migrated += 1
+            if remove:
+                try:
+                    path.unlink()
+                except OSError as e:
+                    LOG.warning(f"Could not remove migrated {path.name}: {e}")
+    return migrated
@@ -16,13 +16,13 @@ from ..agents.voice_agent import VoiceAgent
 from ..database import (
     CallSession,
     DepartmentRoute,
-    LeadEnrichment,
     LeadRecord,
     OutreachAttempt,
     get_db,
 )
 from ..echo_master_brain import EchoMasterBrain
 from ..integrations import IntegrationFactory
+from ..lead_discovery import LeadDiscoveryPipeline
 from ..task_queue import task_queue
 
 router = APIRouter(prefix="/api", tags=["Webhooks"])
@@ -125,68 +125,17 @@ async def quote_status_tool(request: QuoteStatusRequest):
 @router.post("/v1/outreach/discover")
 async def discover_and_store_leads(payload: ApolloDiscoverRequest, db: Session = Depends(get_db)):
     """
-    Apollo first: search and then enrich each person before storing lead records.
+    Apollo first: search, skip already-known emails, enrich the rest concurrently
+    and store all lead records in one bulk write.
     """
-    apollo = IntegrationFactory.get_apollo_service()
-    search = apollo.search_people(
-        q_keywords=payload.keywords,
-        q_organization_name=payload.organization_name,
+    pipeline = LeadDiscoveryPipeline(IntegrationFactory.get_apollo_service())
+    stored = await pipeline.discover(
+        db,
+        keywords=payload.keywords,
+        organization_name=payload.organization_name,
         per_page=payload.per_page,
     )
-    people = search.get("people") or search.get("contacts") or []
-
-    stored = []
-    for person in people:
-        enrich = {}
-        try:
-            enrich = apollo.enrich_person(
-                email=person.get("email"),
-                linkedin_url=person.get("linkedin_url"),
-                first_name=person.get("first_name"),
-                last_name=person.get("last_name"),
-                company_name=(person.get("organization") or {}).get("name")
-                if isinstance(person.get("organization"), dict)
-                else person.get("organization_name"),
-            )
-        except Exception:
-            enrich = {}
-
-        payload_person = (
-            enrich.get("person")
-            if isinstance(enrich, dict) and isinstance(enrich.get("person"), dict)
-            else person
-        )
-        lead = LeadRecord(
-            external_id=str(payload_person.get("id") or person.get("id") or ""),
-            source="apollo",
-            first_name=payload_person.get("first_name"),
-            last_name=payload_person.get("last_name"),
-            full_name=(
-                payload_person.get("name")
-                or f"{payload_person.get('first_name', '')} {payload_person.get('last_name', '')}".strip()
-            ),
-            company=payload_person.get("organization_name")
-            or (payload_person.get("organization") or {}).get("name")
-            if isinstance(payload_person.get("organization"), dict)
-            else payload_person.get("company"),
-            title=payload_person.get("title") or payload_person.get("headline"),
-            email=payload_person.get("email"),
-            phone=payload_person.get("phone") or payload_person.get("phone_number"),
-            status="new",
-        )
-        db.add(lead)
-        db.flush()
-        db.add(
-            LeadEnrichment(
-                lead_id=lead.id,
-                provider="apollo",
-                payload=enrich if isinstance(enrich, dict) else {},
-            )
-        )
-        stored.append({"lead_id": str(lead.id), "name": lead.full_name, "company": lead.company})
-
-    db.commit()
-    return {"stored": stored, "count": len(stored)}
+    return {"stored": stored, "count": len(stored), "duplicates": pipeline.stats["duplicates"]}
 
 
 @router.post("/v1/outreach/create-call")
@@ -22,11 +22,12 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import sys
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Callable, Set
+from typing import Dict, List, Optional, Callable, Sequence, Set
 from collections import deque
 import logging
 import random
@@ -40,6 +41,8 @@ from .semantic_framework import semantic, on, send, every
 from .ech0_service import ECH0Service
 from .hive_mind_coordinator import HiveMindCoordinator, AgentType
 from .business_data import default_ideas
+from .orchestrator_checkpoint import OrchestratorCheckpoint
+from .compact_records import TaskArchive, slotted
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -86,22 +89,46 @@ class TaskStatus(Enum):
     BLOCKED = "blocked"
 
 
+FINISHED_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED)
+
+
+@slotted
 @dataclass
 class AutonomousTask:
-    """Represents a task for autonomous agents."""
+    """
+    Represents a task for autonomous agents.
+
+    Slotted, with epoch-float timestamps; ``created_at``/``completed_at`` give
+    datetime views for callers that want them (``completed_at`` is writable).
+    Status changes belong in AutonomousBusinessOrchestrator._set_task_status,
+    which keeps the orchestrator's counters in step.
+    """
 
     task_id: str
     role: AgentRole
     description: str
     status: TaskStatus = TaskStatus.PENDING
     assigned_to: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    completed_at: Optional[datetime] = None
+    created_ts: float = field(default_factory=time.time)
+    completed_ts: Optional[float] = None
     result: Optional[Dict] = None
-    dependencies: List[str] = field(default_factory=list)
+    dependencies: Sequence[str] = ()
     priority: int = 5  # 1-10, higher = more urgent
 
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_ts)
 
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self.completed_ts) if self.completed_ts is not None else None
+
+    @completed_at.setter
+    def completed_at(self, value: Optional[datetime]) -> None:
+        self.completed_ts = value.timestamp() if value is not None else None
+
+
+@slotted
 @dataclass
 class BusinessMetrics:
     """Real-time business performance metrics."""
@@ -114,9 +141,14 @@ class BusinessMetrics:
     customer_satisfaction: float = 0.0
     tasks_completed: int = 0
     tasks_pending: int = 0
-    last_updated: datetime = field(default_factory=datetime.now)
+    last_updated_ts: float = field(default_factory=time.time)
+
+    @property
+    def last_updated(self) -> datetime:
+        return datetime.fromtimestamp(self.last_updated_ts)
 
 
+@slotted
 @dataclass
 class AgentPerformance:
     """Track individual agent performance."""
@@ -128,7 +160,11 @@ class AgentPerformance:
     average_completion_time: float = 0.0  # minutes
     revenue_generated: float = 0.0
     confidence_score: float = 0.85  # Self-assessed capability
-    last_active: datetime = field(default_factory=datetime.now)
+    last_active_ts: float = field(default_factory=time.time)
+
+    @property
+    def last_active(self) -> datetime:
+        return datetime.fromtimestamp(self.last_active_ts)
 
 
 class Level6BusinessAgent:
@@ -246,7 +282,7 @@ class Level6BusinessAgent:
             "task": task,
             "role": self.role.value,
             "current_time": datetime.now().isoformat(),
-            "performance_history": self.performance.__dict__,
+            "performance_history": asdict(self.performance),
             "knowledge_available": len(self.knowledge_graph),
         }
 
@@ -858,6 +894,72 @@ class ChiefEnhancementOfficer:
         )
 
 
+class AdaptiveTaskGenerator:
+    """
+    Proposes follow-up tasks for an orchestrator without flooding its queue.
+
+    - IDs are allocated from the orchestrator's monotonic task sequence.
+    - A task is keyed by (role, description); while one with the same key is
+      open, a new proposal is coalesced into it if it is still pending
+      (priority raised to the higher of the two) or dropped if it is running.
+    - Each role receives at most ``rate_cap`` generated tasks per
+      ``rate_window_seconds`` (``rate_caps`` overrides the cap per role).
+    """
+
+    def __init__(
+        self,
+        orchestrator: "AutonomousBusinessOrchestrator",
+        rate_cap: int = 6,
+        rate_window_seconds: float = 300.0,
+        rate_caps: Optional[Dict[AgentRole, int]] = None,
+    ):
+        self.orchestrator = orchestrator
+        self.rate_cap = rate_cap
+        self.rate_window_seconds = rate_window_seconds
+        self.rate_caps: Dict[AgentRole, int] = dict(rate_caps or {})
+        self._recent: Dict[AgentRole, deque] = {}
+        self.stats: Dict[str, int] = {
+            "generated": 0,
+            "coalesced": 0,
+            "deduplicated": 0,
+            "rate_limited": 0,
+        }
+
+    def propose(
+        self, prefix: str, role: AgentRole, description: str, priority: int = 5
+    ) -> Optional[AutonomousTask]:
+        """Add a task unless an equivalent one is open or the role is over its cap."""
+        orchestrator = self.orchestrator
+        open_task = orchestrator.open_tasks_by_key.get((role, description))
+        if open_task is not None:
+            if open_task.status in (TaskStatus.PENDING, TaskStatus.BLOCKED):
+                open_task.priority = max(open_task.priority, priority)
+                orchestrator._mark_dirty(open_task)
+                self.stats["coalesced"] += 1
+            else:
+                self.stats["deduplicated"] += 1
+            return None
+
+        now = time.monotonic()
+        recent = self._recent.setdefault(role, deque())
+        while recent and now - recent[0] >= self.rate_window_seconds:
+            recent.popleft()
+        if len(recent) >= self.rate_caps.get(role, self.rate_cap):
+            self.stats["rate_limited"] += 1
+            return None
+        recent.append(now)
+
+        task = AutonomousTask(
+            task_id=f"{prefix}_{orchestrator._next_task_seq}",
+            role=role,
+            description=description,
+            priority=priority,
+        )
+        orchestrator.add_task(task)
+        self.stats["generated"] += 1
+        return task
+
+
 class AutonomousBusinessOrchestrator:
     """
     Orchestrates Level 6 agents to run businesses completely hands-off.
@@ -876,9 +978,20 @@ class AutonomousBusinessOrchestrator:
         twitter_consumer_secret: str = None,
         twitter_access_token: str = None,
         twitter_access_token_secret: str = None,
+        hive_mind: Optional[HiveMindCoordinator] = None,
+        business_id: Optional[str] = None,
+        market_research: Optional[MarketResearch] = None,
+        email_service: Optional[EmailService] = None,
+        payment_processor: Optional[PaymentProcessor] = None,
+        social_media: Optional[SocialMedia] = None,
+        task_retention_seconds: float = 3600.0,
+        archive_dir: Optional[str] = None,
     ):
         self.business_concept = business_concept
         self.founder_name = founder_name
+        # Set when many orchestrators share one hive (see orchestrator_sharding);
+        # agent IDs are namespaced by it so businesses don't collide in the hive.
+        self.business_id = business_id
         self.agents: Dict[str, Level6BusinessAgent] = {}
         self.task_queue: List[AutonomousTask] = []
         self.pending_tasks: deque[AutonomousTask] = deque()
@@ -887,10 +1000,11 @@ class AutonomousBusinessOrchestrator:
         self.task_execution_attempts: Dict[str, int] = {}
         self.metrics = BusinessMetrics()
         self.running = False
-        self.market_research = MarketResearch(api_key=market_research_api_key)
-        self.email_service = EmailService(api_key=sendgrid_api_key)
-        self.payment_processor = PaymentProcessor(api_key=stripe_api_key)
-        self.social_media = SocialMedia(
+        # Service clients may be injected so many orchestrators share one transport
+        self.market_research = market_research or MarketResearch(api_key=market_research_api_key)
+        self.email_service = email_service or EmailService(api_key=sendgrid_api_key)
+        self.payment_processor = payment_processor or PaymentProcessor(api_key=stripe_api_key)
+        self.social_media = social_media or SocialMedia(
             consumer_key=twitter_consumer_key or "",
             consumer_secret=twitter_consumer_secret or "",
             access_token=twitter_access_token or "",
@@ -898,8 +1012,33 @@ class AutonomousBusinessOrchestrator:
         )
         self.prompt_registry = PromptRegistry()
         self.ceo = ChiefEnhancementOfficer(self)
-        self.hive_mind = HiveMindCoordinator()
+        self.hive_mind = hive_mind or HiveMindCoordinator()
         self.task_status_counts = {status: 0 for status in TaskStatus}
+        self.task_index: Dict[str, AutonomousTask] = {}
+        self.task_seq: Dict[str, int] = {}
+        self._next_task_seq = 0
+        # Open (not finished) tasks keyed by (role, description) for de-duplication,
+        # and the in-progress set so execution doesn't scan the whole queue.
+        self.open_tasks_by_key: Dict[tuple, AutonomousTask] = {}
+        self.in_progress_tasks: Dict[str, AutonomousTask] = {}
+        self.task_generator = AdaptiveTaskGenerator(self)
+
+        # Finished tasks stay in task_queue for task_retention, then move to the
+        # columnar task_archive in batches. Status counts keep including them.
+        self.task_retention = timedelta(seconds=task_retention_seconds)
+        self.task_archive = TaskArchive(archive_dir)
+        self.archive_batch_size = 256
+        self._finished_tasks: deque[AutonomousTask] = deque()
+        self._archive_due: List[AutonomousTask] = []
+
+        # Checkpointing (see enable_checkpointing). Tasks touched since the last
+        # checkpoint are tracked so only those rows are rewritten.
+        self.checkpoint: Optional[OrchestratorCheckpoint] = None
+        self.checkpoint_interval = timedelta(seconds=60)
+        self.last_checkpoint_at: Optional[datetime] = None
+        self._dirty_task_ids: Set[str] = set()
+        self._checkpoint_all = True
+        self._checkpoint_task: Optional[asyncio.Task] = None
 
         # Identify required roles for the selected business concept
         self.required_roles = self._identify_required_roles(business_concept)
@@ -909,6 +1048,25 @@ class AutonomousBusinessOrchestrator:
         self.task_queue.append(task)
         self.pending_tasks.append(task)
         self.task_status_counts[task.status] += 1
+        self.task_index[task.task_id] = task
+        self.task_seq[task.task_id] = self._next_task_seq
+        self._next_task_seq += 1
+        self._track_open_task(task)
+        self._mark_dirty(task)
+
+    def _mark_dirty(self, task: AutonomousTask) -> None:
+        if self.checkpoint:
+            self._dirty_task_ids.add(task.task_id)
+
+    def _track_open_task(self, task: AutonomousTask) -> None:
+        if task.status not in FINISHED_STATUSES:
+            self.open_tasks_by_key.setdefault((task.role, task.description), task)
+        if task.status == TaskStatus.IN_PROGRESS:
+            self.in_progress_tasks[task.task_id] = task
+
+    def _agent_id(self, base_id: str) -> str:
+        """Namespace agent IDs by business when the hive is shared."""
+        return f"{self.business_id}:{base_id}" if self.business_id else base_id
 
     def _identify_required_roles(self, business_concept: str) -> List[AgentRole]:
         """Identify which roles are needed for this business."""
@@ -952,52 +1110,44 @@ class AutonomousBusinessOrchestrator:
 
         return required
 
-    async def deploy_agents(self) -> None:
+    def _create_agent(self, agent_id: str, role: AgentRole) -> Level6BusinessAgent:
+        """Build and register a Level 6 agent wired to this business's services."""
+        agent = Level6BusinessAgent(
+            agent_id=agent_id,
+            role=role,
+            business_concept=self.business_concept,
+            autonomy_level=6,
+            market_research=self.market_research if role == AgentRole.RESEARCHER else None,
+            email_service=(
+                self.email_service if role in [AgentRole.MARKETER, AgentRole.SALES] else None
+            ),
+            payment_processor=self.payment_processor if role == AgentRole.FINANCE else None,
+            social_media=self.social_media if role == AgentRole.MARKETER else None,
+            prompt_registry=self.prompt_registry,
+            hive_mind=self.hive_mind,
+        )
+        self.agents[agent_id] = agent
+        return agent
+
+    async def deploy_agents(self, generate_tasks: bool = True) -> None:
         """Deploy Level 6 agents for all required roles."""
         logger.info(f"Deploying autonomous agents for: {self.business_concept}")
 
         # Create agent for each required role
         for role in self.required_roles:
-            agent_id = f"{role.value}_agent_{int(time.time())}"
-            agent = Level6BusinessAgent(
-                agent_id=agent_id,
-                role=role,
-                business_concept=self.business_concept,
-                autonomy_level=6,
-                market_research=self.market_research if role == AgentRole.RESEARCHER else None,
-                email_service=(
-                    self.email_service if role in [AgentRole.MARKETER, AgentRole.SALES] else None
-                ),
-                payment_processor=self.payment_processor if role == AgentRole.FINANCE else None,
-                social_media=self.social_media if role == AgentRole.MARKETER else None,
-                prompt_registry=self.prompt_registry,
-                hive_mind=self.hive_mind,
-            )
-            self.agents[agent_id] = agent
+            agent_id = self._agent_id(f"{role.value}_agent_{int(time.time())}")
+            self._create_agent(agent_id, role)
             logger.info(f"✓ Deployed {role.value} agent: {agent_id}")
 
         # Generate initial tasks
-        await self._generate_initial_tasks()
+        if generate_tasks:
+            await self._generate_initial_tasks()
 
     async def scale_up_agents(self, role: AgentRole, count: int = 1):
         """Dynamically scale up agents for a specific role (No max limit)."""
         for i in range(count):
-            agent_id = f"{role.value}_agent_{int(time.time())}_{i}"
-            agent = Level6BusinessAgent(
-                agent_id=agent_id,
-                role=role,
-                business_concept=self.business_concept,
-                autonomy_level=6,
-                market_research=self.market_research if role == AgentRole.RESEARCHER else None,
-                email_service=(
-                    self.email_service if role in [AgentRole.MARKETER, AgentRole.SALES] else None
-                ),
-                payment_processor=self.payment_processor if role == AgentRole.FINANCE else None,
-                social_media=self.social_media if role == AgentRole.MARKETER else None,
-                prompt_registry=self.prompt_registry,
-                hive_mind=self.hive_mind,
-            )
-            self.agents[agent_id] = agent
+            agent_id = self._agent_id(f"{role.value}_agent_{int(time.time())}_{i}")
+            self._create_agent(agent_id, role)
             logger.info(f"⚡ Scaled up: Added new {role.value} agent: {agent_id}")
 
     async def _generate_initial_tasks(self) -> None:
@@ -1181,28 +1331,268 @@ class AutonomousBusinessOrchestrator:
         logger.info(f"🚀 Starting autonomous business operation for {duration_hours} hours...")
 
         while self.running and datetime.now() < end_time:
-            # 1. Assign tasks to available agents
-            await self._assign_tasks()
+            await self.run_cycle()
+
+            # Sleep briefly before next cycle
+            await asyncio.sleep(5)
+
+        if self.checkpoint:
+            if self._checkpoint_task:
+                await self._checkpoint_task
+            await self.save_checkpoint()
+
+        logger.info("✓ Autonomous operation completed.")
+
+    async def run_cycle(self, report: bool = True) -> List[Dict]:
+        """
+        Run a single assign → execute → adapt cycle.
 
-            # 2. Execute tasks in parallel
-            results = await self._execute_tasks_parallel()
+        Exposed separately from run_autonomous_loop so a shard worker can drive
+        many orchestrators from one event loop on a shared schedule.
+        """
+        # 1. Assign tasks to available agents
+        await self._assign_tasks()
+
+        # 2. Execute tasks in parallel
+        results = await self._execute_tasks_parallel()
 
-            # 3. Update metrics
-            await self._update_metrics(results)
+        # 3. Update metrics
+        await self._update_metrics(results)
 
-            # 4. Generate new tasks based on outcomes
-            await self._generate_adaptive_tasks(results)
+        # 4. Generate new tasks based on outcomes
+        await self._generate_adaptive_tasks(results)
 
-            # 5. Report progress
+        # 5. Report progress
+        if report:
             await self._report_progress()
 
-            # 6. Run CEO Daemon (Check bottlenecks & Improvements)
-            await self.ceo.run_daemon_cycle()
+        # 6. Run CEO Daemon (Check bottlenecks & Improvements)
+        await self.ceo.run_daemon_cycle()
 
-            # Sleep briefly before next cycle
-            await asyncio.sleep(5)
+        # 7. Move finished tasks past the retention window to the archive
+        self.archive_finished_tasks()
 
-        logger.info("✓ Autonomous operation completed.")
+        # 8. Checkpoint in the background if one is due
+        self._schedule_checkpoint()
+
+        return results
+
+    # ------------------------------------------------------------------ #
+    # Checkpoint / resume
+    # ------------------------------------------------------------------ #
+
+    def enable_checkpointing(self, db_path: str, interval_seconds: float = 60.0) -> None:
+        """Periodically persist orchestrator state to a SQLite checkpoint."""
+        self.checkpoint = OrchestratorCheckpoint(db_path)
+        self.checkpoint_interval = timedelta(seconds=interval_seconds)
+
+    def _schedule_checkpoint(self) -> None:
+        if not self.checkpoint:
+            return
+        if self._checkpoint_task and not self._checkpoint_task.done():
+            return
+        if self.last_checkpoint_at and datetime.now() - self.last_checkpoint_at < self.checkpoint_interval:
+            return
+        self._checkpoint_task = asyncio.create_task(self.save_checkpoint())
+
+    def _task_row(self, task: AutonomousTask) -> tuple:
+        """Flatten a task into the checkpoint/archive row layout."""
+        return (
+            self.task_seq.get(task.task_id, 0),
+            task.task_id,
+            task.role.value,
+            task.description,
+            task.status.value,
+            task.assigned_to,
+            task.created_ts,
+            task.completed_ts,
+            task.result,
+            list(task.dependencies),
+            task.priority,
+            self.task_execution_attempts.get(task.task_id, 0),
+        )
+
+    def _collect_checkpoint(self):
+        """Snapshot dirty task rows, agents and counters (runs on the loop, no I/O)."""
+        if self._checkpoint_all:
+            for seq, task in enumerate(self.task_queue):
+                self.task_index.setdefault(task.task_id, task)
+                self.task_seq.setdefault(task.task_id, seq)
+            dirty = list(self.task_index)
+        else:
+            dirty = list(self._dirty_task_ids)
+
+        task_rows = []
+        for task_id in dirty:
+            task = self.task_index.get(task_id)
+            if task is None:
+                continue
+            task_rows.append(self._task_row(task))
+
+        agent_rows = [
+            (
+                agent.agent_id,
+                agent.role.value,
+                agent.performance.tasks_completed,
+                agent.performance.success_rate,
+                agent.performance.average_completion_time,
+                agent.performance.revenue_generated,
+                agent.performance.confidence_score,
+                agent.performance.last_active_ts,
+                dict(agent.knowledge_graph),
+            )
+            for agent in self.agents.values()
+        ]
+
+        metrics = self.metrics
+        state = {
+            "business_concept": self.business_concept,
+            "business_id": self.business_id,
+            "metrics": {
+                "total_revenue": metrics.total_revenue,
+                "monthly_revenue": metrics.monthly_revenue,
+                "customer_count": metrics.customer_count,
+                "leads_generated": metrics.leads_generated,
+                "conversion_rate": metrics.conversion_rate,
+                "customer_satisfaction": metrics.customer_satisfaction,
+                "tasks_completed": metrics.tasks_completed,
+                "tasks_pending": metrics.tasks_pending,
+                "last_updated": metrics.last_updated_ts,
+            },
+            "task_transition_counts": dict(self.task_transition_counts),
+            "checkpointed_at": time.time(),
+        }
+        return dirty, task_rows, agent_rows, state
+
+    async def save_checkpoint(self) -> int:
+        """
+        Write tasks changed since the last checkpoint, off the event loop.
+
+        Returns the number of task rows written.
+        """
+        if not self.checkpoint:
+            return 0
+
+        was_full = self._checkpoint_all
+        dirty, task_rows, agent_rows, state = self._collect_checkpoint()
+        self._dirty_task_ids = set()
+        self._checkpoint_all = False
+
+        loop = asyncio.get_running_loop()
+        try:
+            written = await loop.run_in_executor(
+                None, self.checkpoint.write, task_rows, agent_rows, state
+            )
+        except Exception as e:
+            # Keep the rows dirty so the next checkpoint retries them
+            self._dirty_task_ids.update(dirty)
+            self._checkpoint_all = self._checkpoint_all or was_full
+            logger.error(f"Checkpoint failed: {e}")
+            return 0
+
+        self.last_checkpoint_at = datetime.now()
+        return written
+
+    async def resume_from_checkpoint(self) -> bool:
+        """
+        Rebuild queue, indexes, counters and agents from the checkpoint.
+
+        Returns False when there is nothing to resume from. Tasks that were in
+        flight when the checkpoint was taken go back to PENDING.
+        """
+        if not self.checkpoint:
+            return False
+
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, self.checkpoint.load)
+        if not data:
+            return False
+
+        self.task_queue = []
+        self.pending_tasks = deque()
+        self.completed_task_ids = set()
+        self.task_index = {}
+        self.task_seq = {}
+        self.task_execution_attempts = {}
+        self.task_status_counts = {status: 0 for status in TaskStatus}
+        self._dirty_task_ids = set()
+        self._finished_tasks = deque()
+        self._archive_due = []
+        self._next_task_seq = 0
+        self.open_tasks_by_key = {}
+        self.in_progress_tasks = {}
+
+        archive_cutoff = time.time() - self.task_retention.total_seconds()
+        for (seq, task_id, role, description, status, assigned_to, created_at,
+             completed_at, result, dependencies, priority, attempts) in data["tasks"]:
+            self._next_task_seq = max(self._next_task_seq, seq + 1)
+            status = TaskStatus(status)
+            if completed_at is not None and completed_at <= archive_cutoff and status in FINISHED_STATUSES:
+                # Already past retention: count it, but don't bring it back into memory
+                self.task_status_counts[status] += 1
+                if status == TaskStatus.COMPLETED:
+                    self.completed_task_ids.add(task_id)
+                continue
+
+            task = AutonomousTask(
+                task_id=task_id,
+                role=AgentRole(role),
+                description=sys.intern(description),
+                status=status,
+                assigned_to=sys.intern(assigned_to) if assigned_to else None,
+                created_ts=created_at,
+                completed_ts=completed_at,
+                result=result,
+                dependencies=tuple(sys.intern(dep) for dep in dependencies),
+                priority=priority,
+            )
+            if task.status == TaskStatus.IN_PROGRESS:
+                task.status = TaskStatus.PENDING
+                task.assigned_to = None
+                self._dirty_task_ids.add(task_id)
+
+            self.task_queue.append(task)
+            self.task_index[task_id] = task
+            self.task_seq[task_id] = seq
+            self.task_status_counts[task.status] += 1
+            if attempts:
+                self.task_execution_attempts[task_id] = attempts
+            if task.status == TaskStatus.COMPLETED:
+                self.completed_task_ids.add(task_id)
+            elif task.status in (TaskStatus.PENDING, TaskStatus.BLOCKED):
+                self.pending_tasks.append(task)
+            if task.status in FINISHED_STATUSES and task.completed_ts is not None:
+                self._finished_tasks.append(task)
+            self._track_open_task(task)
+        self._finished_tasks = deque(sorted(self._finished_tasks, key=lambda t: t.completed_ts))
+
+        self.agents = {}
+        for (agent_id, role, tasks_completed, success_rate, average_completion_time,
+             revenue_generated, confidence_score, last_active, knowledge_graph) in data["agents"]:
+            agent = self._create_agent(agent_id, AgentRole(role))
+            agent.performance.tasks_completed = tasks_completed
+            agent.performance.success_rate = success_rate
+            agent.performance.average_completion_time = average_completion_time
+            agent.performance.revenue_generated = revenue_generated
+            agent.performance.confidence_score = confidence_score
+            agent.performance.last_active_ts = last_active
+            agent.knowledge_graph = knowledge_graph
+        if not self.agents:
+            await self.deploy_agents(generate_tasks=False)
+
+        state = data["state"]
+        saved_metrics = dict(state["metrics"])
+        saved_metrics["last_updated_ts"] = saved_metrics.pop("last_updated")
+        self.metrics = type(self.metrics)(**saved_metrics)
+        self.task_transition_counts = dict(state.get("task_transition_counts", {}))
+
+        self._checkpoint_all = False
+        self.last_checkpoint_at = datetime.now()
+        logger.info(
+            f"Resumed {self.business_concept} from checkpoint: "
+            f"{len(self.task_queue)} tasks, {len(self.agents)} agents"
+        )
+        return True
 
     async def _assign_tasks(self) -> None:
         """Assign pending tasks to appropriate agents."""
@@ -1262,6 +1652,8 @@ class AutonomousBusinessOrchestrator:
         Update task status and maintain internal counters (O(1)).
         Also handles dependency tracking and metric updates.
         """
+        self._mark_dirty(task)
+
         if task.status == status:
             # Update result if provided even if status unchanged
             if result:
@@ -1279,33 +1671,71 @@ class AutonomousBusinessOrchestrator:
         )
 
         # Update task state
+        if task.status == TaskStatus.IN_PROGRESS:
+            self.in_progress_tasks.pop(task.task_id, None)
+        elif status == TaskStatus.IN_PROGRESS:
+            self.in_progress_tasks[task.task_id] = task
         task.status = status
         if result:
             task.result = result
 
-        if status == TaskStatus.COMPLETED:
-            task.completed_at = datetime.now()
-            self.completed_task_ids.add(task.task_id)
-        elif status == TaskStatus.FAILED:
-            # Don't add to completed_task_ids
-            pass
+        if status in FINISHED_STATUSES:
+            key = (task.role, task.description)
+            if self.open_tasks_by_key.get(key) is task:
+                del self.open_tasks_by_key[key]
+            # completed_ts marks when the task finished, successfully or not;
+            # the retention window for archiving counts from it.
+            task.completed_ts = time.time()
+            self._finished_tasks.append(task)
+            if status == TaskStatus.COMPLETED:
+                self.completed_task_ids.add(task.task_id)
 
         if clear_assignment:
             task.assigned_to = None
 
+    def archive_finished_tasks(self, force: bool = False) -> int:
+        """
+        Move finished tasks older than task_retention into task_archive.
+
+        Tasks are archived in batches of archive_batch_size (or all at once with
+        ``force``) so task_queue is only rebuilt occasionally. With
+        checkpointing enabled a task is held back until its final state has been
+        checkpointed. Returns the number of tasks archived.
+        """
+        cutoff = time.time() - self.task_retention.total_seconds()
+        finished = self._finished_tasks
+        while finished and finished[0].completed_ts <= cutoff:
+            if self.checkpoint and (self._checkpoint_all or finished[0].task_id in self._dirty_task_ids):
+                break
+            self._archive_due.append(finished.popleft())
+
+        if not self._archive_due or (len(self._archive_due) < self.archive_batch_size and not force):
+            return 0
+
+        archived: Set[str] = set()
+        for task in self._archive_due:
+            if task.status not in FINISHED_STATUSES or self.task_index.get(task.task_id) is not task:
+                continue
+            self.task_archive.append(self._task_row(task))
+            del self.task_index[task.task_id]
+            self.task_seq.pop(task.task_id, None)
+            self.task_execution_attempts.pop(task.task_id, None)
+            archived.add(task.task_id)
+        self._archive_due = []
+
+        if archived:
+            self.task_queue[:] = [t for t in self.task_queue if t.task_id not in archived]
+            logger.debug(f"Archived {len(archived)} finished tasks for {self.business_concept}")
+        return len(archived)
+
     def _reconcile_orphaned_in_progress_tasks(self) -> None:
         """
         Check for IN_PROGRESS tasks assigned to inactive/missing agents and requeue them.
         """
-        # We can't iterate efficiently over just IN_PROGRESS without a separate list,
-        # but iterating task_queue is unavoidable unless we index it.
-        # However, we only care about 'IN_PROGRESS' which should be small.
-        # Let's iterate task_queue for now, but in a real massive system we'd want a set of in_progress tasks.
-        # For optimization, let's skip if count is 0
         if self.task_status_counts[TaskStatus.IN_PROGRESS] == 0:
             return
 
-        for task in self.task_queue:
+        for task in list(self.in_progress_tasks.values()):
             if task.status == TaskStatus.IN_PROGRESS:
                 agent = self.agents.get(task.assigned_to)
                 if not agent or not agent.active:
@@ -1329,7 +1759,7 @@ class AutonomousBusinessOrchestrator:
         """Execute all in-progress tasks in parallel."""
         # Requeue stale in-progress tasks before execution to avoid deadlocks.
         self._reconcile_orphaned_in_progress_tasks()
-        in_progress = [t for t in self.task_queue if t.status == TaskStatus.IN_PROGRESS]
+        in_progress = [t for t in self.in_progress_tasks.values() if t.status == TaskStatus.IN_PROGRESS]
 
         if not in_progress:
             return []
@@ -1434,46 +1864,32 @@ class AutonomousBusinessOrchestrator:
                 self.metrics.customer_count / self.metrics.leads_generated
             )
 
-        self.metrics.last_updated = datetime.now()
+        self.metrics.last_updated_ts = time.time()
 
     async def _generate_adaptive_tasks(self, results: List[Dict]) -> None:
         """Generate new tasks based on outcomes (adaptive strategy)."""
+        generator = self.task_generator
+
         # If sales are strong, generate more marketing tasks
-        if self.metrics.monthly_revenue > 5000:
-            # Only if marketer exists
-            if AgentRole.MARKETER in self.required_roles:
-                self.add_task(
-                    AutonomousTask(
-                        task_id=f"marketing_{len(self.task_queue)}",
-                        role=AgentRole.MARKETER,
-                        description="Scale successful marketing campaigns",
-                        priority=9,
-                    )
-                )
+        if self.metrics.monthly_revenue > 5000 and AgentRole.MARKETER in self.required_roles:
+            generator.propose(
+                "marketing", AgentRole.MARKETER, "Scale successful marketing campaigns", priority=9
+            )
 
         # If conversion rate is low, generate research task
-        if self.metrics.conversion_rate < 0.05:
-            if AgentRole.RESEARCHER in self.required_roles:
-                self.add_task(
-                    AutonomousTask(
-                        task_id=f"research_{len(self.task_queue)}",
-                        role=AgentRole.RESEARCHER,
-                        description="Analyze low conversion and recommend improvements",
-                        priority=10,
-                    )
-                )
+        if self.metrics.conversion_rate < 0.05 and AgentRole.RESEARCHER in self.required_roles:
+            generator.propose(
+                "research", AgentRole.RESEARCHER,
+                "Analyze low conversion and recommend improvements", priority=10,
+            )
 
         # Crypto logic: If mining successful, optimize
         for result in results:
-             agent = self.agents.get(result.get("agent_id"))
-             if agent and agent.role == AgentRole.CRYPTO_MINER and result.get("success"):
-                  self.add_task(
-                    AutonomousTask(
-                        task_id=f"mining_{len(self.task_queue)}",
-                        role=AgentRole.CRYPTO_MINER,
-                        description="Check for more profitable coins to switch to",
-                        priority=8,
-                    )
+            agent = self.agents.get(result.get("agent_id"))
+            if agent and agent.role == AgentRole.CRYPTO_MINER and result.get("success"):
+                generator.propose(
+                    "mining", AgentRole.CRYPTO_MINER,
+                    "Check for more profitable coins to switch to", priority=8,
                 )
 
     async def _report_progress(self) -> None:
@@ -1521,6 +1937,7 @@ class AutonomousBusinessOrchestrator:
                     "tasks_pending": self.task_status_counts[TaskStatus.PENDING],
                     "tasks_by_status": self.get_task_status_counts(),
                     "task_transition_counts": dict(self.task_transition_counts),
+                    "adaptive_tasks": dict(self.task_generator.stats),
                     "success_rate": success_rate,
                 },
             },
@@ -1542,7 +1959,10 @@ class AutonomousBusinessOrchestrator:
 
 
 async def launch_autonomous_business(
-    business_concept: str, founder_name: str, duration_hours: float = 24.0
+    business_concept: str,
+    founder_name: str,
+    duration_hours: float = 24.0,
+    checkpoint_path: Optional[str] = None,
 ) -> Dict:
     """
     Launch a fully autonomous business.
@@ -1551,13 +1971,19 @@ async def launch_autonomous_business(
         business_concept: Type of business to run
         founder_name: Owner's name
         duration_hours: How long to run autonomously
+        checkpoint_path: SQLite checkpoint to resume from and keep updated
     Returns:
         Final business metrics after autonomous operation
     """
     orchestrator = AutonomousBusinessOrchestrator(business_concept, founder_name)
 
-    # Deploy Level 6 agents
-    await orchestrator.deploy_agents()
+    # Resume from the last checkpoint, or deploy Level 6 agents from scratch
+    resumed = False
+    if checkpoint_path:
+        orchestrator.enable_checkpointing(checkpoint_path)
+        resumed = await orchestrator.resume_from_checkpoint()
+    if not resumed:
+        await orchestrator.deploy_agents()
 
     # Run autonomously
     await orchestrator.run_autonomous_loop(duration_hours)
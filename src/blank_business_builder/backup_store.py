@@ -0,0 +1,586 @@
+"""
+Chunked, deduplicated, compressed and encrypted backup storage.
+
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+Streams are cut into fixed-size chunks (4 MiB by default). Each chunk is
+identified by the SHA-256 of its plaintext; a chunk that is already in the
+store is referenced instead of written again, so an incremental backup only
+writes the chunks that changed. New chunks are compressed (zlib or lzma) and,
+optionally, sealed with AES-256-GCM in a pool of worker threads; at most
+``2 * workers`` chunks are in flight, so memory stays bounded whatever the
+file size.
+
+Chunk file layout::
+
+    codec (1 byte) | flags (1 byte) | [nonce (12 bytes)] | payload
+
+The chunk digest is the GCM associated data, so a ciphertext cannot be swapped
+for another chunk's. Backups, files and their chunk lists live in a small
+SQLite manifest (``manifest.db``) where chunks are referenced by integer id.
+
+Restores run the same pool in reverse: chunks are read, decrypted,
+decompressed and checked against their digest ahead of the writer, and each
+file is written to a temporary sibling that is renamed over the destination
+only once all of its bytes are in place.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import lzma
+import os
+import sqlite3
+import threading
+import uuid
+import zlib
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 4 * 1024 * 1024
+
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+CODEC_LZMA = 2
+CODECS = {"none": CODEC_NONE, "zlib": CODEC_ZLIB, "lzma": CODEC_LZMA}
+
+FLAG_ENCRYPTED = 1
+NONCE_SIZE = 12
+KEY_ENV_VAR = "BBB_BACKUP_KEY"
+KEY_FILE_ENV_VAR = "BBB_BACKUP_KEY_FILE"
+KEY_FILE = "backup.key"  # Name older versions used inside the backup tree
+NO_KEY_MESSAGE = (
+    f"Encryption requested but no backup key is configured: set {KEY_ENV_VAR}, "
+    f"or {KEY_FILE_ENV_VAR} / key_path to a key file outside the backup directory"
+)
+
+
+class ChunkIntegrityError(ValueError):
+    """A stored chunk does not decode to the plaintext its digest names."""
+
+
+class BackupKeyError(ValueError):
+    """The backup key is missing or stored where it would not protect anything."""
+
+
+def _decode_key(encoded: str) -> bytes:
+    try:
+        return bytes.fromhex(encoded)
+    except ValueError:
+        return base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+
+
+def load_backup_key(base_path: Path, key: Optional[bytes] = None,
+                    key_path: Optional[Path] = None) -> Optional[bytes]:
+    """Return the 32-byte backup key, or None if none is configured.
+
+    Order: explicit ``key``, then ``BBB_BACKUP_KEY`` (hex or base64), then
+    the key file at ``key_path`` or ``BBB_BACKUP_KEY_FILE``, created (mode
+    0600) on first use. The key file must live outside ``base_path``: a key
+    stored next to the chunks goes wherever the backups are copied, so it
+    would protect nothing. Without any key, encrypted backups fail.
+    """
+    base_path = Path(base_path).resolve()
+    legacy_key = base_path / KEY_FILE
+    if legacy_key.exists():
+        raise BackupKeyError(
+            f"Found a backup key inside the backup tree ({legacy_key}). Move it outside "
+            f"{base_path} and point {KEY_FILE_ENV_VAR} at it, or set {KEY_ENV_VAR}."
+        )
+
+    if key is None:
+        encoded = os.getenv(KEY_ENV_VAR, "").strip()
+        if encoded:
+            key = _decode_key(encoded)
+    if key is None:
+        if key_path is None and os.getenv(KEY_FILE_ENV_VAR, "").strip():
+            key_path = Path(os.environ[KEY_FILE_ENV_VAR].strip())
+        if key_path is None:
+            return None
+        key_file = Path(key_path).expanduser().resolve()
+        if key_file == base_path or base_path in key_file.parents:
+            raise BackupKeyError(f"Backup key file {key_file} must be outside the backup tree {base_path}")
+        if key_file.exists():
+            key = key_file.read_bytes()
+        else:
+            key = os.urandom(32)
+            key_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(key)
+    if len(key) != 32:
+        raise BackupKeyError("Backup key must be 32 bytes (AES-256)")
+    return key
+
+
+class ChunkCodec:
+    """Compress and optionally AES-GCM encrypt single chunks."""
+
+    def __init__(self, compression: str = "zlib", level: int = 6, key: Optional[bytes] = None):
+        if compression not in CODECS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.codec = CODECS[compression]
+        self.level = level
+        self._aead = None
+        if key is not None:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+            self._aead = AESGCM(key)
+
+    @property
+    def can_encrypt(self) -> bool:
+        return self._aead is not None
+
+    def encode(self, digest: bytes, raw: bytes, encrypt: bool) -> bytes:
+        codec = self.codec
+        if codec == CODEC_ZLIB:
+            payload = zlib.compress(raw, self.level)
+        elif codec == CODEC_LZMA:
+            payload = lzma.compress(raw, preset=min(self.level, 9))
+        else:
+            payload = raw
+        if len(payload) >= len(raw):
+            # Incompressible chunk: store it as-is so restores skip decompression
+            codec, payload = CODEC_NONE, raw
+        if not encrypt:
+            return bytes((codec, 0)) + payload
+        if self._aead is None:
+            raise BackupKeyError(NO_KEY_MESSAGE)
+        nonce = os.urandom(NONCE_SIZE)
+        return bytes((codec, FLAG_ENCRYPTED)) + nonce + self._aead.encrypt(nonce, payload, digest)
+
+    def decode(self, digest: bytes, blob: bytes) -> bytes:
+        """Return the chunk plaintext, checking it against ``digest``."""
+        codec, flags = blob[0], blob[1]
+        payload = memoryview(blob)[2:]
+        if flags & FLAG_ENCRYPTED:
+            if self._aead is None:
+                raise BackupKeyError(f"Chunk is encrypted but no backup key is configured. {NO_KEY_MESSAGE}")
+            nonce, sealed = bytes(payload[:NONCE_SIZE]), bytes(payload[NONCE_SIZE:])
+            try:
+                payload = self._aead.decrypt(nonce, sealed, digest)
+            except Exception as exc:
+                raise ChunkIntegrityError(f"Chunk {digest.hex()} failed authentication") from exc
+        if codec == CODEC_ZLIB:
+            raw = zlib.decompress(payload)
+        elif codec == CODEC_LZMA:
+            raw = lzma.decompress(payload)
+        else:
+            raw = bytes(payload)
+        if hashlib.sha256(raw).digest() != digest:
+            raise ChunkIntegrityError(f"Chunk {digest.hex()} does not match its digest")
+        return raw
+
+
+class ChunkStore:
+    """Content-addressed chunk files under ``<root>/chunks/ab/cdef...``."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root) / "chunks"
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, digest: bytes, encrypted: bool) -> Path:
+        name = digest.hex()
+        return self.root / name[:2] / (name[2:] + (".e" if encrypted else ""))
+
+    def has(self, digest: bytes, encrypted: bool) -> bool:
+        return self.path_for(digest, encrypted).exists()
+
+    def write(self, digest: bytes, encrypted: bool, blob: bytes) -> None:
+        path = self.path_for(digest, encrypted)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+
+    def read(self, digest: bytes, encrypted: bool) -> bytes:
+        return self.path_for(digest, encrypted).read_bytes()
+
+    def remove(self, digest: bytes, encrypted: bool) -> None:
+        try:
+            self.path_for(digest, encrypted).unlink()
+        except FileNotFoundError:
+            pass
+
+
+@dataclass
+class FileEntry:
+    """One stored stream: a real file under a data source, or a generated export."""
+    source: str
+    relpath: str
+    size: int = 0
+    mtime_ns: int = 0
+    chunks: List[bytes] = field(default_factory=list)
+
+
+@dataclass
+class StreamStats:
+    raw_bytes: int = 0
+    new_chunks: int = 0
+    new_bytes: int = 0
+
+
+class BackupManifest:
+    """SQLite manifest of backups, their files and chunk references."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        with self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS backups (
+                    backup_id TEXT PRIMARY KEY,
+                    backup_type TEXT NOT NULL,
+                    strategy TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    checksum TEXT NOT NULL,
+                    data_sources TEXT NOT NULL,
+                    retention_days INTEGER NOT NULL,
+                    encryption_enabled INTEGER NOT NULL,
+                    compression_ratio REAL NOT NULL,
+                    location TEXT NOT NULL,
+                    bytes_written INTEGER NOT NULL DEFAULT 0,
+                    chunk_count INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TABLE IF NOT EXISTS chunks (
+                    id INTEGER PRIMARY KEY,
+                    digest BLOB NOT NULL,
+                    encrypted INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_size INTEGER NOT NULL,
+                    UNIQUE (digest, encrypted)
+                );
+                CREATE TABLE IF NOT EXISTS files (
+                    id INTEGER PRIMARY KEY,
+                    backup_id TEXT NOT NULL REFERENCES backups(backup_id) ON DELETE CASCADE,
+                    source TEXT NOT NULL,
+                    relpath TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS files_by_backup ON files (backup_id);
+                CREATE INDEX IF NOT EXISTS files_by_path ON files (source, relpath);
+                CREATE TABLE IF NOT EXISTS file_chunks (
+                    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+                    seq INTEGER NOT NULL,
+                    chunk_id INTEGER NOT NULL REFERENCES chunks(id),
+                    PRIMARY KEY (file_id, seq)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS file_chunks_by_chunk ON file_chunks (chunk_id);
+                CREATE TABLE IF NOT EXISTS restores (
+                    id INTEGER PRIMARY KEY,
+                    backup_id TEXT NOT NULL,
+                    started_at TEXT NOT NULL,
+                    success INTEGER NOT NULL,
+                    rto_seconds REAL NOT NULL,
+                    rpo_seconds REAL NOT NULL,
+                    files_restored INTEGER NOT NULL,
+                    bytes_restored INTEGER NOT NULL,
+                    error TEXT
+                );
+            """)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -- backups -----------------------------------------------------------
+
+    def insert_backup(self, row: Dict[str, Any]) -> None:
+        """Insert (or replace) a backups row; ``data_sources`` is a list."""
+        with self._lock, self._conn:
+            self._insert_backup(row)
+
+    def _insert_backup(self, row: Dict[str, Any]) -> None:
+        row = dict(row, data_sources=json.dumps(list(row["data_sources"])))
+        columns = ", ".join(row)
+        marks = ", ".join("?" for _ in row)
+        self._conn.execute(f"INSERT OR REPLACE INTO backups ({columns}) VALUES ({marks})", tuple(row.values()))
+
+    def backup_rows(self, backup_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Backups rows oldest first (or just ``backup_id``), with data_sources decoded."""
+        query = "SELECT * FROM backups"
+        params: Tuple[Any, ...] = ()
+        if backup_id is not None:
+            query += " WHERE backup_id = ?"
+            params = (backup_id,)
+        with self._lock:
+            cursor = self._conn.execute(query + " ORDER BY timestamp, rowid", params)
+            names = [d[0] for d in cursor.description]
+            rows = [dict(zip(names, values)) for values in cursor]
+        for row in rows:
+            row["data_sources"] = json.loads(row["data_sources"])
+        return rows
+
+    def backup_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM backups").fetchone()[0]
+
+    def delete_backup(self, backup_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM file_chunks WHERE file_id IN (SELECT id FROM files WHERE backup_id = ?)",
+                (backup_id,),
+            )
+            self._conn.execute("DELETE FROM files WHERE backup_id = ?", (backup_id,))
+            self._conn.execute("DELETE FROM backups WHERE backup_id = ?", (backup_id,))
+
+    # -- chunks and files --------------------------------------------------
+
+    def chunk_sizes(self, digests: Sequence[bytes], encrypted: bool) -> Dict[bytes, Tuple[int, int]]:
+        """(size, stored_size) for the given digests that are already in the manifest."""
+        found = {}
+        with self._lock:
+            for digest in set(digests):
+                row = self._conn.execute(
+                    "SELECT size, stored_size FROM chunks WHERE digest = ? AND encrypted = ?",
+                    (digest, int(encrypted)),
+                ).fetchone()
+                if row:
+                    found[digest] = row
+        return found
+
+    def record_backup(
+        self,
+        row: Dict[str, Any],
+        files: Sequence[FileEntry],
+        encrypted: bool,
+        chunk_sizes: Dict[bytes, Tuple[int, int]],
+    ) -> None:
+        """Store a backups row with its file entries and chunk lists in one transaction.
+
+        ``chunk_sizes`` gives (size, stored_size) for chunks the manifest may
+        not know yet; every other referenced chunk must already be registered.
+        """
+        backup_id = row["backup_id"]
+        enc = int(encrypted)
+        with self._lock, self._conn:
+            self._insert_backup(row)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO chunks (digest, encrypted, size, stored_size) VALUES (?, ?, ?, ?)",
+                [(digest, enc, size, stored) for digest, (size, stored) in chunk_sizes.items()],
+            )
+            ids = {}
+            for entry in files:
+                for digest in entry.chunks:
+                    if digest not in ids:
+                        ids[digest] = self._conn.execute(
+                            "SELECT id FROM chunks WHERE digest = ? AND encrypted = ?", (digest, enc)
+                        ).fetchone()[0]
+            for entry in files:
+                file_id = self._conn.execute(
+                    "INSERT INTO files (backup_id, source, relpath, size, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+                    (backup_id, entry.source, entry.relpath, entry.size, entry.mtime_ns),
+                ).lastrowid
+                self._conn.executemany(
+                    "INSERT INTO file_chunks (file_id, seq, chunk_id) VALUES (?, ?, ?)",
+                    [(file_id, seq, ids[digest]) for seq, digest in enumerate(entry.chunks)],
+                )
+
+    def files(self, backup_id: str) -> List[FileEntry]:
+        """File entries of a backup with their ordered chunk digests."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, source, relpath, size, mtime_ns FROM files WHERE backup_id = ? ORDER BY id",
+                (backup_id,),
+            ).fetchall()
+            entries = []
+            for file_id, source, relpath, size, mtime_ns in rows:
+                chunks = [digest for (digest,) in self._conn.execute(
+                    "SELECT c.digest FROM file_chunks fc JOIN chunks c ON c.id = fc.chunk_id "
+                    "WHERE fc.file_id = ? ORDER BY fc.seq", (file_id,)
+                )]
+                entries.append(FileEntry(source, relpath, size, mtime_ns, chunks))
+        return entries
+
+    def previous_file(
+        self, source: str, relpath: str, size: int, mtime_ns: int, encrypted: bool
+    ) -> Optional[List[bytes]]:
+        """Chunk list of the newest stored copy of an unchanged file, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT f.id FROM files f JOIN backups b ON b.backup_id = f.backup_id "
+                "WHERE f.source = ? AND f.relpath = ? AND f.size = ? AND f.mtime_ns = ? "
+                "AND b.encryption_enabled = ? ORDER BY f.id DESC LIMIT 1",
+                (source, relpath, size, mtime_ns, int(encrypted)),
+            ).fetchone()
+            if not row:
+                return None
+            return [digest for (digest,) in self._conn.execute(
+                "SELECT c.digest FROM file_chunks fc JOIN chunks c ON c.id = fc.chunk_id "
+                "WHERE fc.file_id = ? ORDER BY fc.seq", (row[0],)
+            )]
+
+    # -- restores ----------------------------------------------------------
+
+    def record_restore(self, row: Dict[str, Any]) -> None:
+        columns = ", ".join(row)
+        marks = ", ".join("?" for _ in row)
+        with self._lock, self._conn:
+            self._conn.execute(f"INSERT INTO restores ({columns}) VALUES ({marks})", tuple(row.values()))
+
+    def restore_rows(self) -> List[Dict[str, Any]]:
+        """Restores rows oldest first."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT backup_id, started_at, success, rto_seconds, rpo_seconds, "
+                "files_restored, bytes_restored, error FROM restores ORDER BY id"
+            )
+            names = [d[0] for d in cursor.description]
+            return [dict(zip(names, values)) for values in cursor]
+
+    def unreferenced_chunks(self) -> List[Tuple[bytes, bool]]:
+        """Delete and return chunks no file refers to any more."""
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT id, digest, encrypted FROM chunks "
+                "WHERE id NOT IN (SELECT chunk_id FROM file_chunks)"
+            ).fetchall()
+            self._conn.executemany("DELETE FROM chunks WHERE id = ?", [(row[0],) for row in rows])
+        return [(digest, bool(encrypted)) for _, digest, encrypted in rows]
+
+
+class ChunkPipeline:
+    """Cut streams into chunks and store new ones through a worker pool."""
+
+    def __init__(
+        self,
+        store: ChunkStore,
+        codec: ChunkCodec,
+        workers: int = 4,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        self.store = store
+        self.codec = codec
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="backup-chunk")
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def _store_chunk(self, raw: bytes, encrypt: bool) -> Tuple[bytes, int, int, bool]:
+        """Hash a chunk and write it unless already stored.
+
+        Returns (digest, size, stored_size, written).
+        """
+        digest = hashlib.sha256(raw).digest()
+        path = self.store.path_for(digest, encrypt)
+        try:
+            return digest, len(raw), path.stat().st_size, False
+        except FileNotFoundError:
+            pass
+        blob = self.codec.encode(digest, raw, encrypt)
+        self.store.write(digest, encrypt, blob)
+        return digest, len(raw), len(blob), True
+
+    def write_stream(
+        self,
+        stream: BinaryIO,
+        entry: FileEntry,
+        encrypt: bool,
+        seen: Dict[bytes, Tuple[int, int]],
+        stats: StreamStats,
+    ) -> None:
+        """Append the chunks of ``stream`` to ``entry``.
+
+        ``seen`` collects (size, stored_size) for every chunk of the stream so
+        the manifest can register chunks it does not know yet.
+        """
+        pending: Deque[Future] = deque()
+        max_in_flight = 2 * self.workers
+
+        def collect(future: Future) -> None:
+            digest, size, stored, written = future.result()
+            entry.chunks.append(digest)
+            entry.size += size
+            stats.raw_bytes += size
+            seen[digest] = (size, stored)
+            if written:
+                stats.new_chunks += 1
+                stats.new_bytes += stored
+
+        while True:
+            raw = stream.read(self.chunk_size)
+            if not raw:
+                break
+            pending.append(self._pool.submit(self._store_chunk, raw, encrypt))
+            if len(pending) >= max_in_flight:
+                collect(pending.popleft())
+        while pending:
+            collect(pending.popleft())
+
+    def _load_chunk(self, digest: bytes, encrypted: bool) -> bytes:
+        return self.codec.decode(digest, self.store.read(digest, encrypted))
+
+    def read_chunks(self, entries: Sequence[FileEntry], encrypted: bool) -> Iterator[bytes]:
+        """Plaintext of every chunk of ``entries``, in order.
+
+        Workers fetch and decode up to ``2 * workers`` chunks ahead of the
+        consumer; a chunk that fails its digest check raises
+        ChunkIntegrityError when it is reached.
+        """
+        pending: Deque[Future] = deque()
+        max_in_flight = 2 * self.workers
+        try:
+            for entry in entries:
+                for digest in entry.chunks:
+                    pending.append(self._pool.submit(self._load_chunk, digest, encrypted))
+                    if len(pending) >= max_in_flight:
+                        yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+@contextmanager
+def atomic_output(path: Path) -> Iterator[BinaryIO]:
+    """Write to a temporary sibling of ``path``; fsync and rename it into place on success."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.restore")
+    f = open(tmp, "wb")
+    try:
+        yield f
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+        os.replace(tmp, path)
+    except BaseException:
+        f.close()
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def iter_source_files(source: str) -> Iterator[Tuple[str, Path]]:
+    """(relpath, path) for a file source ("" relpath) or every file under a directory."""
+    root = Path(source)
+    if root.is_file():
+        yield "", root
+        return
+    for path in sorted(p for p in root.rglob("*") if p.is_file()):
+        yield path.relative_to(root).as_posix(), path
+
+
+def backup_checksum(files: Sequence[FileEntry]) -> str:
+    """SHA-256 over every file's identity and ordered chunk digests."""
+    h = hashlib.sha256()
+    for entry in files:
+        h.update(f"{entry.source}\0{entry.relpath}\0{entry.size}\0".encode("utf-8"))
+        for digest in entry.chunks:
+            h.update(digest)
+    return h.hexdigest()
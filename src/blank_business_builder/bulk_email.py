@@ -0,0 +1,303 @@
+"""
+Asynchronous, batched bulk email delivery through the SendGrid v3 API.
+
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+Recipients are grouped into requests of up to 1000 personalizations (the
+SendGrid per-request maximum), so a 50k-contact campaign is 50 API calls
+instead of 50,000. Requests share one pooled httpx.AsyncClient, at most
+``max_concurrency`` are in flight, and every attempt first takes a token from
+an AsyncRateLimiter. 429 / 5xx responses and transport errors are retried with
+full-jitter exponential backoff (or the server's Retry-After). Per-recipient
+outcomes are handed to a callback as each request finishes;
+OutreachAttemptRecorder writes them to ``outreach_attempts`` in bulk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from .database import OutreachAttempt
+from .lead_discovery import AsyncRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Network failures worth retrying; defined without httpx too, since an
+# injected client can be used when the optional import failed
+TRANSPORT_ERRORS = (OSError, asyncio.TimeoutError) + ((httpx.TransportError,) if httpx is not None else ())
+
+SENDGRID_API_URL = "https://api.sendgrid.com"
+SEND_PATH = "/v3/mail/send"
+MAX_PERSONALIZATIONS = 1000
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class EmailRecipient:
+    """One campaign recipient; ``substitutions`` fill ``-key-`` tags in the content."""
+    email: str
+    lead_id: Optional[uuid.UUID] = None
+    substitutions: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class RecipientOutcome:
+    """Delivery result for one recipient (accepted by the provider, or not)."""
+    email: str
+    lead_id: Optional[uuid.UUID]
+    sent: bool
+    status_code: Optional[int]
+    attempts: int
+    message_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BulkSendReport:
+    """Totals of one BulkEmailSender.send call."""
+    recipients: int = 0
+    sent: int = 0
+    failed: int = 0
+    requests: int = 0
+    retries: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def recipients_per_second(self) -> float:
+        return self.recipients / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class BulkEmailSender:
+    """Send one message to many recipients in batched, concurrent, rate-limited requests.
+
+    Pass ``client`` to reuse an existing httpx.AsyncClient; it must already
+    carry the base URL and Authorization header.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        from_email: str,
+        from_name: str = "Better Business Builder",
+        base_url: str = SENDGRID_API_URL,
+        batch_size: int = MAX_PERSONALIZATIONS,
+        max_concurrency: int = 4,
+        requests_per_second: float = 10.0,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        timeout_seconds: float = 30.0,
+        client: Any = None,
+    ):
+        if not 0 < batch_size <= MAX_PERSONALIZATIONS:
+            raise ValueError(f"batch_size must be between 1 and {MAX_PERSONALIZATIONS}")
+        self.api_key = api_key
+        self.from_email = from_email
+        self.from_name = from_name
+        self.base_url = base_url.rstrip("/")
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout_seconds = timeout_seconds
+        self.client = client
+        self.limiter = AsyncRateLimiter(requests_per_second, burst=max(1, max_concurrency))
+
+    def batches(self, recipients: Iterable[EmailRecipient]) -> Iterator[List[EmailRecipient]]:
+        batch: List[EmailRecipient] = []
+        for recipient in recipients:
+            batch.append(recipient)
+            if len(batch) == self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def payload(self, batch: List[EmailRecipient], subject: str, html_content: str) -> Dict[str, Any]:
+        """SendGrid v3 mail/send body with one personalization per recipient."""
+        personalizations = []
+        for recipient in batch:
+            personalization: Dict[str, Any] = {"to": [{"email": recipient.email}]}
+            if recipient.substitutions:
+                personalization["substitutions"] = recipient.substitutions
+            if recipient.lead_id is not None:
+                personalization["custom_args"] = {"lead_id": str(recipient.lead_id)}
+            personalizations.append(personalization)
+        return {
+            "personalizations": personalizations,
+            "from": {"email": self.from_email, "name": self.from_name},
+            "subject": subject,
+            "content": [{"type": "text/html", "value": html_content}],
+        }
+
+    async def send(
+        self,
+        recipients: Iterable[EmailRecipient],
+        subject: str,
+        html_content: str,
+        on_outcomes: Optional[Callable[[List[RecipientOutcome]], None]] = None,
+    ) -> BulkSendReport:
+        """Send to every recipient; ``on_outcomes`` receives each finished batch's outcomes.
+
+        ``recipients`` is consumed lazily, never more than ``max_concurrency``
+        batches ahead of the requests that have completed.
+        """
+        if self.client is None and httpx is None:
+            raise RuntimeError("httpx is required for BulkEmailSender (pip install httpx)")
+
+        report = BulkSendReport()
+        client = self.client or httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=self.timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+        start = time.perf_counter()
+
+        def collect(done: Set[asyncio.Task]) -> None:
+            # Retrieve every exception so none is reported as "never retrieved"
+            errors = [task.exception() for task in done]
+            for error in errors:
+                if error is not None:
+                    raise error
+            for task in done:
+                outcomes, attempts = task.result()
+                report.requests += attempts
+                report.retries += attempts - 1
+                for outcome in outcomes:
+                    report.recipients += 1
+                    if outcome.sent:
+                        report.sent += 1
+                    else:
+                        report.failed += 1
+                if on_outcomes:
+                    on_outcomes(outcomes)
+
+        pending: Set[asyncio.Task] = set()
+        try:
+            for batch in self.batches(recipients):
+                body = self.payload(batch, subject, html_content)
+                pending.add(asyncio.ensure_future(self._send_batch(client, batch, body)))
+                if len(pending) >= self.max_concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    collect(done)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                collect(done)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            if self.client is None:
+                await client.aclose()
+
+        report.elapsed_seconds = time.perf_counter() - start
+        logger.info(
+            "bulk_email recipients=%d sent=%d failed=%d requests=%d retries=%d elapsed=%.2fs",
+            report.recipients, report.sent, report.failed, report.requests,
+            report.retries, report.elapsed_seconds,
+        )
+        return report
+
+    async def _send_batch(self, client, batch: List[EmailRecipient], body: Dict[str, Any]):
+        """POST one batch, retrying transient failures; returns (outcomes, attempts)."""
+        attempt = 0
+        while True:
+            attempt += 1
+            await self.limiter.acquire()
+            response = None
+            try:
+                response = await client.post(SEND_PATH, json=body)
+                status_code, error = response.status_code, None
+            except TRANSPORT_ERRORS as exc:
+                status_code, error = None, f"{type(exc).__name__}: {exc}"
+
+            if status_code is not None and 200 <= status_code < 300:
+                message_id = response.headers.get("X-Message-Id")
+                return [
+                    RecipientOutcome(r.email, r.lead_id, True, status_code, attempt, message_id)
+                    for r in batch
+                ], attempt
+
+            if error is None:
+                error = f"HTTP {status_code}: {response.text[:200]}"
+            if attempt > self.max_retries or (status_code is not None and status_code not in RETRY_STATUSES):
+                logger.warning("bulk_email batch of %d failed after %d attempts: %s", len(batch), attempt, error)
+                return [
+                    RecipientOutcome(r.email, r.lead_id, False, status_code, attempt, error=error)
+                    for r in batch
+                ], attempt
+            await asyncio.sleep(self._backoff(attempt, response))
+
+    def _backoff(self, attempt: int, response) -> float:
+        """Retry-After when the provider sends one, else full-jitter exponential backoff."""
+        if response is not None:
+            try:
+                return min(self.backoff_max, float(response.headers.get("Retry-After", "")))
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+
+class OutreachAttemptRecorder:
+    """Buffer RecipientOutcomes and insert them as OutreachAttempt rows ``flush_size`` at a time.
+
+    Outcomes without a lead_id have no lead to attach to and are skipped.
+    Use it as the ``on_outcomes`` callback of BulkEmailSender.send and call
+    ``flush()`` once the send returns.
+    """
+
+    def __init__(self, db: Session, task: str, provider: str = "sendgrid", flush_size: int = 1000):
+        self.db = db
+        self.task = task
+        self.provider = provider
+        self.flush_size = flush_size
+        self.recorded = 0
+        self._rows: List[Dict[str, Any]] = []
+
+    def __call__(self, outcomes: List[RecipientOutcome]) -> None:
+        now = datetime.utcnow()
+        for outcome in outcomes:
+            if outcome.lead_id is None:
+                continue
+            self._rows.append({
+                "id": uuid.uuid4(),
+                "lead_id": outcome.lead_id,
+                "channel": "email",
+                "provider": self.provider,
+                "status": "sent" if outcome.sent else "failed",
+                "task": self.task,
+                "completed_at": now,
+                "next_action": None if outcome.sent else (outcome.error or "")[:255],
+                "created_at": now,
+            })
+        if len(self._rows) >= self.flush_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._rows:
+            return
+        self.db.execute(insert(OutreachAttempt.__table__), self._rows)
+        self.db.commit()
+        self.recorded += len(self._rows)
+        self._rows = []
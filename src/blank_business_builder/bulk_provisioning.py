@@ -0,0 +1,220 @@
+"""
+Bulk provisioning of businesses and their dependent rows.
+
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+BulkProvisioningEngine writes Business rows together with their initial
+BusinessPlan, AgentTask and MetricsHistory rows through SQLAlchemy Core
+instead of the ORM. IDs are generated client-side, so no RETURNING round trip
+or identity map is needed and every table of a batch is written in the same
+transaction. PostgreSQL (psycopg2) batches are streamed with COPY; every other
+dialect uses a single executemany per table.
+"""
+
+import csv
+import io
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import insert
+
+from .database import AgentTask, Business, BusinessPlan, MetricsHistory
+
+logger = logging.getLogger(__name__)
+
+# (agent_role, task_type, description) created for every new business
+DEFAULT_INITIAL_TASKS: Tuple[Tuple[str, str, str], ...] = (
+    ("researcher", "market_research", "Research target market and competitors"),
+)
+
+# Parent tables first so foreign keys are satisfied inside each batch
+TABLE_ORDER = (Business.__table__, BusinessPlan.__table__, AgentTask.__table__, MetricsHistory.__table__)
+
+
+@dataclass
+class ProvisioningReport:
+    """Outcome of one BulkProvisioningEngine.provision call."""
+    businesses: int = 0
+    rows: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def businesses_per_second(self) -> float:
+        return self.businesses / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def copy_payload(columns: Sequence[str], rows: Sequence[Dict[str, Any]]) -> io.StringIO:
+    """Render rows as CSV for ``COPY ... FROM STDIN WITH (FORMAT csv)``.
+
+    None becomes an unquoted empty field, which COPY reads as NULL.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for row in rows:
+        writer.writerow([_csv_value(row[name]) for name in columns])
+    buffer.seek(0)
+    return buffer
+
+
+class BulkProvisioningEngine:
+    """Create businesses with their plan, tasks and metrics in streamed batches."""
+
+    def __init__(
+        self,
+        engine,
+        batch_size: int = 5000,
+        initial_tasks: Sequence[Tuple[str, str, str]] = DEFAULT_INITIAL_TASKS,
+    ):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.initial_tasks = tuple(initial_tasks)
+
+    def iter_batches(
+        self,
+        user_id: uuid.UUID,
+        count: int,
+        business_type: str = "5_gig",
+        auto_fold: bool = True,
+        status: str = "active",
+        template_name: str = "default",
+    ) -> Iterator[Dict[str, List[Dict[str, Any]]]]:
+        """Yield ``{table_name: [row, ...]}`` for each batch of up to batch_size businesses.
+
+        Rows leave out columns that stay NULL (JSON columns included, which would
+        otherwise be stored as a JSON ``null``).
+        """
+        concept = f"Type: {business_type}, Auto-fold: {auto_fold}"
+        plan_name = f"{template_name} plan"
+
+        for batch_id, start in enumerate(range(0, count, self.batch_size)):
+            now = datetime.utcnow()
+            stamp = int(time.time() * 1000)
+            started_at = now if status == "active" else None
+            description = f"Mass deployed business batch {batch_id}"
+            businesses, plans, tasks, metrics = [], [], [], []
+
+            for i in range(min(self.batch_size, count - start)):
+                business_id = uuid.uuid4()
+                businesses.append({
+                    "id": business_id,
+                    "user_id": user_id,
+                    "business_name": f"Business {batch_id}-{i}-{stamp}",
+                    "business_concept": concept,
+                    "industry": "Autonomous Service",
+                    "description": description,
+                    "status": status,
+                    "created_at": now,
+                    "started_at": started_at,
+                    "total_revenue": 0,
+                    "total_customers": 0,
+                    "total_leads": 0,
+                    "conversion_rate": 0,
+                })
+                plans.append({
+                    "id": uuid.uuid4(),
+                    "business_id": business_id,
+                    "plan_name": plan_name,
+                    "created_at": now,
+                })
+                for role, task_type, task_description in self.initial_tasks:
+                    tasks.append({
+                        "id": uuid.uuid4(),
+                        "business_id": business_id,
+                        "agent_role": role,
+                        "task_type": task_type,
+                        "description": task_description,
+                        "status": "pending",
+                        "priority": 5,
+                        "created_at": now,
+                    })
+                metrics.append({
+                    "id": uuid.uuid4(),
+                    "business_id": business_id,
+                    "timestamp": now,
+                    "revenue": 0,
+                    "customers": 0,
+                    "leads": 0,
+                    "conversion_rate": 0,
+                    "tasks_completed": 0,
+                    "tasks_pending": len(self.initial_tasks),
+                    "tasks_failed": 0,
+                    "ingested_at": now,
+                })
+
+            yield {
+                Business.__tablename__: businesses,
+                BusinessPlan.__tablename__: plans,
+                AgentTask.__tablename__: tasks,
+                MetricsHistory.__tablename__: metrics,
+            }
+
+    def provision(
+        self,
+        user_id: uuid.UUID,
+        count: int,
+        business_type: str = "5_gig",
+        auto_fold: bool = True,
+        status: str = "active",
+        template_name: str = "default",
+        on_batch: Optional[Callable[[int], None]] = None,
+    ) -> ProvisioningReport:
+        """Create ``count`` businesses; ``on_batch`` receives the business count of each committed batch."""
+        report = ProvisioningReport()
+        use_copy = self.engine.dialect.name == "postgresql" and self.engine.dialect.driver == "psycopg2"
+        start = time.perf_counter()
+
+        for batch in self.iter_batches(user_id, count, business_type, auto_fold, status, template_name):
+            with self.engine.begin() as conn:
+                for table in TABLE_ORDER:
+                    rows = batch[table.name]
+                    if not rows:
+                        continue
+                    if use_copy:
+                        self._copy_rows(conn, table, rows)
+                    else:
+                        conn.execute(insert(table), rows)
+                    report.rows += len(rows)
+
+            created = len(batch[Business.__tablename__])
+            report.businesses += created
+            report.batches += 1
+            if on_batch:
+                on_batch(created)
+
+        report.elapsed_seconds = time.perf_counter() - start
+        logger.info(
+            "bulk_provision businesses=%d rows=%d batches=%d elapsed=%.2fs rows_per_s=%.0f",
+            report.businesses, report.rows, report.batches,
+            report.elapsed_seconds, report.rows_per_second,
+        )
+        return report
+
+    @staticmethod
+    def _copy_rows(conn, table, rows: Sequence[Dict[str, Any]]) -> None:
+        columns = list(rows[0])
+        sql = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(sql, copy_payload(columns, rows))
+        finally:
+            cursor.close()
@@ -0,0 +1,150 @@
+"""
+Compact records for long-running orchestrators.
+
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+``slotted`` turns a dataclass into one backed by ``__slots__`` (what
+``dataclass(slots=True)`` does on Python 3.10+), so task, metric and message
+records carry no per-instance ``__dict__``.
+
+``TaskArchive`` is a columnar spill store for finished tasks. Rows are buffered
+per column and sealed into zlib-compressed blocks once ``block_size`` rows
+have accumulated; low-cardinality string columns (role, status, agent,
+description) are dictionary-encoded inside each block. Blocks live in memory
+or, when a directory is given, in ``block-<n>-<rows>.zjson`` files.
+"""
+
+import json
+import logging
+import os
+import zlib
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def slotted(cls):
+    """Rebuild dataclass ``cls`` with ``__slots__`` for its fields."""
+    inherited = set()
+    for base in cls.__mro__[1:-1]:
+        slots = base.__dict__.get("__slots__", ())
+        inherited.update((slots,) if isinstance(slots, str) else slots)
+
+    names = tuple(f.name for f in fields(cls) if f.name not in inherited)
+    namespace = dict(cls.__dict__)
+    for name in names:
+        # Defaults live in the generated __init__; class attributes would clash with the slots
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+ARCHIVE_COLUMNS = (
+    "seq", "task_id", "role", "description", "status", "assigned_to",
+    "created_at", "completed_at", "result", "dependencies", "priority", "attempts",
+)
+
+# Columns with few distinct values; stored as {"values": [...], "codes": [...]}
+DICTIONARY_COLUMNS = frozenset({"role", "description", "status", "assigned_to"})
+
+BLOCK_PREFIX = "block-"
+BLOCK_SUFFIX = ".zjson"
+
+
+class TaskArchive:
+    """Append-only columnar store for finished orchestrator tasks."""
+
+    def __init__(self, directory: Optional[str] = None, block_size: int = 1000):
+        self.directory = Path(directory) if directory else None
+        self.block_size = block_size
+        self._buffer: Dict[str, List[Any]] = {name: [] for name in ARCHIVE_COLUMNS}
+        self._blocks: List[bytes] = []
+        self._block_files: List[Path] = []
+        self._sealed_rows = 0
+
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for path in sorted(self.directory.glob(f"{BLOCK_PREFIX}*{BLOCK_SUFFIX}")):
+                self._block_files.append(path)
+                self._sealed_rows += int(path.stem.rsplit("-", 1)[1])
+
+    def __len__(self) -> int:
+        return self._sealed_rows + len(self._buffer["task_id"])
+
+    def append(self, row: Sequence[Any]) -> None:
+        """Append one row laid out as ARCHIVE_COLUMNS (the checkpoint TaskRow)."""
+        for name, value in zip(ARCHIVE_COLUMNS, row):
+            self._buffer[name].append(value)
+        if len(self._buffer["task_id"]) >= self.block_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Seal buffered rows into a compressed block."""
+        rows = len(self._buffer["task_id"])
+        if not rows:
+            return
+
+        encoded: Dict[str, Any] = {}
+        for name, values in self._buffer.items():
+            if name in DICTIONARY_COLUMNS:
+                lookup: Dict[Any, int] = {}
+                codes = [lookup.setdefault(value, len(lookup)) for value in values]
+                encoded[name] = {"values": list(lookup), "codes": codes}
+            else:
+                encoded[name] = values
+        block = zlib.compress(
+            json.dumps(encoded, default=str, separators=(",", ":")).encode("utf-8")
+        )
+
+        if self.directory:
+            index = len(self._block_files) + 1
+            path = self.directory / f"{BLOCK_PREFIX}{index:08d}-{rows}{BLOCK_SUFFIX}"
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                f.write(block)
+            os.replace(tmp, path)
+            self._block_files.append(path)
+        else:
+            self._blocks.append(block)
+
+        self._sealed_rows += rows
+        self._buffer = {name: [] for name in ARCHIVE_COLUMNS}
+
+    def _iter_blocks(self) -> Iterator[Dict[str, List[Any]]]:
+        payloads = (
+            (path.read_bytes() for path in self._block_files)
+            if self.directory else iter(self._blocks)
+        )
+        for payload in payloads:
+            encoded = json.loads(zlib.decompress(payload))
+            block = {}
+            for name in ARCHIVE_COLUMNS:
+                column = encoded[name]
+                if name in DICTIONARY_COLUMNS:
+                    values = column["values"]
+                    column = [values[code] for code in column["codes"]]
+                block[name] = column
+            yield block
+        if self._buffer["task_id"]:
+            yield self._buffer
+
+    def column(self, name: str) -> List[Any]:
+        """Return one column across every archived row, in archive order."""
+        if name not in ARCHIVE_COLUMNS:
+            raise KeyError(name)
+        values: List[Any] = []
+        for block in self._iter_blocks():
+            values.extend(block[name])
+        return values
+
+    def iter_rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Yield archived rows as tuples laid out as ARCHIVE_COLUMNS."""
+        for block in self._iter_blocks():
+            yield from zip(*(block[name] for name in ARCHIVE_COLUMNS))
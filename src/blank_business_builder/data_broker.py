@@ -6,36 +6,65 @@ Agent responsible for packaging, verifying, and selling data assets.
 
 import time
 import json
-from typing import List
+import logging
+import re
+from typing import List, Optional
 from .semantic_framework import Lead, db, VerifiedProspect
 from .autonomous_tools import AutonomousTools
 
+logger = logging.getLogger(__name__)
+
+# Something before the first "@", then a "." somewhere in the domain part
+_EMAIL_RE = re.compile(r"[^@]*@[^@]*\.")
+
+
 class DataBroker:
-    def __init__(self, core_system):
+    # Per-lead verification is logged for one lead in every log_sample_every
+    log_sample_every = 1000
+
+    def __init__(self, core_system, manifest_path: Optional[str] = None):
         self.core = core_system
         self.tools = AutonomousTools()
-        
+        self.manifest_path = manifest_path or "verified_leads_manifest.jsonl"
+        self.verified_count = 0
+        # Prospects verified since the last generate_manifest()
+        self._unmanifested: List[VerifiedProspect] = []
+
     def verify_and_package(self, leads: List[Lead]):
         """
         Verify leads and package them for resale.
+
+        Prospects are saved with a single save_many and queued for the next
+        incremental manifest write.
         """
-        print(f"📦 DATA BROKER: Packaging {len(leads)} leads for resale...")
-        
+        verification_date = time.strftime("%Y-%m-%d")
         prospects = []
+        failed = 0
         for lead in leads:
-            if self._verify_email(lead.person.email):
-                prospect = VerifiedProspect(
-                    lead=lead,
-                    verification_date=time.strftime("%Y-%m-%d"),
-                    resale_price=5.00, # $5 per verified lead
-                    status="Available"
+            if not self._verify_email(lead.person.email):
+                failed += 1
+                continue
+            prospect = VerifiedProspect(
+                lead=lead,
+                verification_date=verification_date,
+                resale_price=5.00,  # $5 per verified lead
+                status="Available"
+            )
+            prospects.append(prospect)
+            if self.verified_count % self.log_sample_every == 0:
+                logger.info(
+                    "broker.verify prospect_id=%s person=%r price=%.2f sampled_every=%d",
+                    prospect.id, lead.person.name, prospect.resale_price,
+                    self.log_sample_every,
                 )
-                db.save(prospect)
-                prospects.append(prospect)
-                print(f"   ✅ Verified & Packaged: {lead.person.name} (${prospect.resale_price})")
-            else:
-                print(f"   ❌ Verification Failed: {lead.person.email}")
-                
+            self.verified_count += 1
+
+        db.save_many(prospects)
+        self._unmanifested.extend(prospects)
+        logger.info(
+            "broker.package_batch leads=%d verified=%d failed=%d",
+            len(prospects) + failed, len(prospects), failed,
+        )
         return prospects
 
     def _verify_email(self, email: str) -> bool:
@@ -43,35 +72,31 @@ class DataBroker:
         Simulate email verification (e.g., syntax check, domain ping).
         Real implementation would use an API like NeverBounce or Hunter.
         """
-        if not email or "@" not in email:
-            return False
-            
-        # Simulate simple heuristics
-        domain = email.split('@')[1]
-        if "." not in domain:
-            return False
-            
-        return True
+        return bool(email) and _EMAIL_RE.match(email) is not None
 
     def generate_manifest(self):
         """
-        Generate a JSON manifest of available prospects for potential buyers.
+        Append newly verified, still available prospects to the JSON-lines manifest.
+
+        Prospects already written by an earlier call are not rewritten.
         """
-        verified = db.query(type_filter="VerifiedProspect", status="Available")
-        manifest_data = []
-        for v in verified:
-            manifest_data.append({
+        entries = [
+            json.dumps({
                 "industry": v.lead.organization.industry,
                 "role": v.lead.person.role,
                 "price": v.resale_price,
                 "id": v.id
             })
-            
-        filename = f"verified_leads_manifest_{int(time.time())}.json"
-        
-        # Save to file
-        with open(filename, 'w') as f:
-            json.dump(manifest_data, f, indent=2)
-            
-        print(f"📋 DATA BROKER: Generated manifest {filename} with {len(verified)} verified leads.")
-        return filename
+            for v in self._unmanifested
+            if v.status == "Available"
+        ]
+        self._unmanifested = []
+
+        if entries:
+            with open(self.manifest_path, 'a') as f:
+                f.write("\n".join(entries) + "\n")
+
+        logger.info(
+            "broker.manifest path=%s appended=%d", self.manifest_path, len(entries)
+        )
+        return self.manifest_path
@@ -3,7 +3,9 @@ Better Business Builder - Database Models
 Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
 """
 
-from sqlalchemy import create_engine, Column, String, Integer, Numeric, DateTime, ForeignKey, Text, Boolean, JSON
+from sqlalchemy import (
+    create_engine, Column, String, Integer, BigInteger, Numeric, DateTime, ForeignKey, Text, Boolean, JSON, Index, func
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.types import TypeDecorator
@@ -193,13 +195,91 @@ class MetricsHistory(Base):
     tasks_pending = Column(Integer, default=0)
     tasks_failed = Column(Integer, default=0)
 
+    # When the row was written (``timestamp`` may be backdated); metric rollups
+    # consume rows past their watermark on this column
+    ingested_at = Column(DateTime, default=datetime.utcnow, server_default=func.now(), index=True)
+
     # Relationships
     business = relationship("Business", back_populates="metrics")
 
+    __table_args__ = (
+        Index("ix_metrics_history_business_timestamp", "business_id", "timestamp"),
+    )
+
     def __repr__(self):
         return f"<MetricsHistory(business_id={self.business_id}, timestamp={self.timestamp}, revenue={self.revenue})>"
 
 
+class MetricRollupColumns:
+    """Summary columns shared by the business and global metric rollup tables.
+
+    ``*_sum`` adds up every sample in the bucket (divide by ``samples`` for the
+    mean) and ``*_last`` is the sample taken at ``last_timestamp``.
+    """
+    samples = Column(Integer, nullable=False, default=0)
+    first_timestamp = Column(DateTime, nullable=True)
+    last_timestamp = Column(DateTime, nullable=True)
+    revenue_sum = Column(Numeric(18, 2), default=0)
+    revenue_last = Column(Numeric(18, 2), default=0)
+    customers_sum = Column(BigInteger, default=0)
+    customers_last = Column(BigInteger, default=0)
+    leads_sum = Column(BigInteger, default=0)
+    leads_last = Column(BigInteger, default=0)
+    conversion_rate_sum = Column(Numeric(18, 2), default=0)
+    conversion_rate_last = Column(Numeric(18, 2), default=0)
+    tasks_completed_sum = Column(BigInteger, default=0)
+    tasks_completed_last = Column(BigInteger, default=0)
+    tasks_pending_sum = Column(BigInteger, default=0)
+    tasks_pending_last = Column(BigInteger, default=0)
+    tasks_failed_sum = Column(BigInteger, default=0)
+    tasks_failed_last = Column(BigInteger, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class BusinessMetricRollup(MetricRollupColumns, Base):
+    """MetricsHistory of one business summarised per minute, hour or day"""
+    __tablename__ = 'business_metric_rollups'
+
+    business_id = Column(UUIDType(), ForeignKey('businesses.id', ondelete='CASCADE'), primary_key=True)
+    granularity = Column(String(10), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+
+    __table_args__ = (
+        Index("ix_business_metric_rollups_bucket", "granularity", "bucket_start"),
+    )
+
+    def __repr__(self):
+        return f"<BusinessMetricRollup(business_id={self.business_id}, {self.granularity}={self.bucket_start})>"
+
+
+class GlobalMetricRollup(MetricRollupColumns, Base):
+    """Metrics of all businesses per minute, hour or day.
+
+    Built from the business rollups of the same bucket: ``businesses`` counts
+    those that reported, and ``*_last`` adds up each one's last sample.
+    """
+    __tablename__ = 'global_metric_rollups'
+
+    granularity = Column(String(10), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    businesses = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<GlobalMetricRollup({self.granularity}={self.bucket_start}, businesses={self.businesses})>"
+
+
+class RollupWatermark(Base):
+    """How far an incremental rollup has consumed its source table"""
+    __tablename__ = 'rollup_watermarks'
+
+    name = Column(String(100), primary_key=True)
+    watermark = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<RollupWatermark(name={self.name}, watermark={self.watermark})>"
+
+
 class APIIntegration(Base):
     """API integration credentials (encrypted)"""
     __tablename__ = 'api_integrations'
@@ -271,6 +351,8 @@ class Subscription(Base):
     current_period_start = Column(DateTime, nullable=True)
     current_period_end = Column(DateTime, nullable=True)
     cancel_at_period_end = Column(Boolean, default=False)
+    # Stripe ``created`` time of the newest webhook event applied; older events are ignored
+    last_event_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -281,6 +363,29 @@ class Subscription(Base):
         return f"<Subscription(id={self.id}, user_id={self.user_id}, plan={self.plan_name}, status={self.status})>"
 
 
+class StripeEventInbox(Base):
+    """Verified Stripe webhook events awaiting (or done with) processing, one row per event ID"""
+    __tablename__ = 'stripe_event_inbox'
+
+    event_id = Column(String(255), primary_key=True)
+    event_type = Column(String(100), nullable=False, index=True)
+    object_id = Column(String(255), nullable=True, index=True)
+    stripe_created = Column(DateTime, nullable=False)
+    payload = Column(JSONType(), nullable=False)
+    received_at = Column(DateTime, default=datetime.utcnow)
+    processed_at = Column(DateTime, nullable=True)
+    outcome = Column(String(50), nullable=True)  # applied, stale, ignored, failed
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    __table_args__ = (
+        Index("ix_stripe_event_inbox_pending", "processed_at", "stripe_created"),
+    )
+
+    def __repr__(self):
+        return f"<StripeEventInbox(event_id={self.event_id}, type={self.event_type}, processed_at={self.processed_at})>"
+
+
 class MarketingCampaign(Base):
     """Marketing campaign records"""
     __tablename__ = 'marketing_campaigns'
@@ -7,15 +7,46 @@ Priority Score: 3.21%
 Impact: 0.72 | User Value: 0.68 | Revenue Potential: 0.65
 """
 
-from typing import List, Dict, Optional, Callable
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Callable, Iterator, Tuple
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from enum import Enum
 import asyncio
-import hashlib
+import io
 import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
 from pathlib import Path
 
+from .backup_store import (
+    CHUNK_SIZE,
+    BackupManifest,
+    NO_KEY_MESSAGE,
+    BackupKeyError,
+    ChunkCodec,
+    ChunkIntegrityError,
+    ChunkPipeline,
+    ChunkStore,
+    FileEntry,
+    StreamStats,
+    atomic_output,
+    backup_checksum,
+    iter_source_files,
+    load_backup_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# File entry holding the generated export document of every backup
+EXPORT_SOURCE = "@export"
+EXPORT_NAME = "sources.json"
+
 
 class BackupStrategy(str, Enum):
     """Backup storage strategies."""
@@ -57,6 +88,8 @@ class BackupMetadata:
     encryption_enabled: bool
     compression_ratio: float
     location: str
+    bytes_written: int = 0  # new chunk bytes this backup added to the store
+    chunk_count: int = 0
 
 
 @dataclass
@@ -83,13 +116,110 @@ class FailoverEvent:
     rollback: bool
 
 
-class BackupEngine:
-    """Core backup engine with multiple strategies."""
+@dataclass
+class RestoreMeasurement:
+    """Measured recovery objectives of one restore.
+
+    ``rto_seconds`` is the wall-clock time from the restore request to the last
+    file being renamed into place; ``rpo_seconds`` is the age of the backup when
+    the restore started, i.e. the window of data the restore could not bring back.
+    """
+    backup_id: str
+    started_at: datetime
+    success: bool
+    rto_seconds: float
+    rpo_seconds: float
+    files_restored: int = 0
+    bytes_restored: int = 0
+    error: Optional[str] = None
+
+
+class BackupHistory:
+    """List-like view of the backups recorded in the SQLite manifest."""
+
+    def __init__(self, manifest: BackupManifest):
+        self._manifest = manifest
+
+    def __len__(self) -> int:
+        return self._manifest.backup_count()
+
+    def __iter__(self) -> Iterator[BackupMetadata]:
+        return (self._metadata(row) for row in self._manifest.backup_rows())
 
-    def __init__(self, base_path: str = "./backups"):
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def get(self, backup_id: str) -> Optional[BackupMetadata]:
+        rows = self._manifest.backup_rows(backup_id)
+        return self._metadata(rows[0]) if rows else None
+
+    def append(self, metadata: BackupMetadata) -> None:
+        self._manifest.insert_backup(self.row(metadata))
+
+    def remove(self, metadata: BackupMetadata) -> None:
+        self._manifest.delete_backup(metadata.backup_id)
+
+    @staticmethod
+    def row(metadata: BackupMetadata) -> Dict:
+        row = asdict(metadata)
+        row.update(
+            backup_type=metadata.backup_type.value,
+            strategy=metadata.strategy.value,
+            timestamp=metadata.timestamp.isoformat(),
+            encryption_enabled=int(metadata.encryption_enabled),
+        )
+        return row
+
+    @staticmethod
+    def _metadata(row: Dict) -> BackupMetadata:
+        return BackupMetadata(**dict(
+            row,
+            backup_type=BackupType(row["backup_type"]),
+            strategy=BackupStrategy(row["strategy"]),
+            timestamp=datetime.fromisoformat(row["timestamp"]),
+            encryption_enabled=bool(row["encryption_enabled"]),
+        ))
+
+
+class BackupEngine:
+    """
+    Core backup engine with multiple strategies.
+
+    Backups are stored as deduplicated, compressed (and optionally AES-GCM
+    encrypted) chunks under ``base_path``; see backup_store. The encryption
+    key comes from ``encryption_key``, ``BBB_BACKUP_KEY``, or a key file
+    (``key_path`` / ``BBB_BACKUP_KEY_FILE``) outside ``base_path``; without
+    one, encrypted backups raise BackupKeyError. Data sources that
+    are filesystem paths are streamed chunk by chunk, other sources (database,
+    files, configs) go into the generated export document.
+    """
+
+    def __init__(
+        self,
+        base_path: str = "./backups",
+        chunk_size: int = CHUNK_SIZE,
+        compression: str = "zlib",
+        workers: int = 4,
+        encryption_key: Optional[bytes] = None,
+        key_path: Optional[str] = None
+    ):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
-        self.backup_history: List[BackupMetadata] = []
+        key = load_backup_key(self.base_path, encryption_key, key_path)
+        if key is None:
+            logger.warning(f"No backup key configured; encrypted backups under {self.base_path} will fail")
+        self.manifest = BackupManifest(self.base_path / "manifest.db")
+        self.chunk_store = ChunkStore(self.base_path)
+        self.codec = ChunkCodec(compression, key=key)
+        self.pipeline = ChunkPipeline(self.chunk_store, self.codec, workers=workers, chunk_size=chunk_size)
+        self.backup_history = BackupHistory(self.manifest)
+        self._active_backups = 0
+        self._active_lock = threading.Lock()
+
+    def require_key(self) -> None:
+        """Raise BackupKeyError unless encrypted backups can be written."""
+        if not self.codec.can_encrypt:
+            raise BackupKeyError(NO_KEY_MESSAGE)
 
     async def create_backup(
         self,
@@ -102,8 +232,13 @@ class BackupEngine:
         """
         Create a backup of specified data sources.
 
+        Only chunks not already in the store are written. Incremental and
+        differential backups also skip reading files whose size and mtime
+        match their newest stored copy.
+
         Args:
-            data_sources: List of sources to backup (database, files, configs)
+            data_sources: List of sources to backup (database, files, configs
+                or filesystem paths)
             backup_type: Type of backup to create
             strategy: Storage strategy
             retention_days: How long to retain backup
@@ -112,43 +247,49 @@ class BackupEngine:
         Returns:
             BackupMetadata with backup details
         """
+        if encrypt:
+            self.require_key()
         backup_id = self._generate_backup_id()
         timestamp = datetime.utcnow()
 
-        # Simulate backup creation
-        backup_data = await self._gather_data(data_sources, backup_type)
-
-        # Compress
-        compressed_data = self._compress(backup_data)
-        compression_ratio = len(backup_data) / len(compressed_data) if compressed_data else 1.0
-
-        # Encrypt if requested
-        if encrypt:
-            final_data = self._encrypt(compressed_data)
-        else:
-            final_data = compressed_data
+        export = await self._gather_data(data_sources, backup_type)
 
-        # Calculate checksum
-        checksum = hashlib.sha256(final_data).hexdigest()
+        # Chunking, compression and encryption are blocking; keep them off the event loop
+        loop = asyncio.get_running_loop()
+        with self._backup_in_progress():
+            files, seen, stats = await loop.run_in_executor(
+                None, self._write_chunks, data_sources, export, backup_type, encrypt
+            )
 
-        # Store based on strategy
-        location = await self._store_backup(backup_id, final_data, strategy)
+            digests = {digest for entry in files for digest in entry.chunks}
+            sizes = self.manifest.chunk_sizes(digests - set(seen), encrypt)
+            sizes.update(seen)
+            raw_bytes = sum(sizes[d][0] for d in digests)
+            stored_bytes = sum(sizes[d][1] for d in digests)
+
+            location = await self._store_backup(backup_id, strategy)
+
+            metadata = BackupMetadata(
+                backup_id=backup_id,
+                backup_type=backup_type,
+                strategy=strategy,
+                timestamp=timestamp,
+                size_bytes=stored_bytes,
+                checksum=backup_checksum(files),
+                data_sources=data_sources,
+                retention_days=retention_days,
+                encryption_enabled=encrypt,
+                compression_ratio=raw_bytes / stored_bytes if stored_bytes else 1.0,
+                location=location,
+                bytes_written=stats.new_bytes,
+                chunk_count=len(digests)
+            )
+            self.manifest.record_backup(BackupHistory.row(metadata), files, encrypt, seen)
 
-        metadata = BackupMetadata(
-            backup_id=backup_id,
-            backup_type=backup_type,
-            strategy=strategy,
-            timestamp=timestamp,
-            size_bytes=len(final_data),
-            checksum=checksum,
-            data_sources=data_sources,
-            retention_days=retention_days,
-            encryption_enabled=encrypt,
-            compression_ratio=compression_ratio,
-            location=location
+        logger.info(
+            "backup %s: %d files, %d chunks (%d new), %d raw bytes, %d bytes written",
+            backup_id, len(files), len(digests), stats.new_chunks, stats.raw_bytes, stats.new_bytes
         )
-
-        self.backup_history.append(metadata)
         return metadata
 
     async def restore_backup(
@@ -168,53 +309,89 @@ class BackupEngine:
         Returns:
             Restore result dictionary
         """
+        started_at = datetime.utcnow()
+        start = time.perf_counter()
+
         # Find backup metadata
-        metadata = next((b for b in self.backup_history if b.backup_id == backup_id), None)
+        metadata = self.backup_history.get(backup_id)
         if not metadata:
             return {
                 "success": False,
                 "error": "Backup not found",
                 "backup_id": backup_id
             }
+        rpo_seconds = (started_at - metadata.timestamp).total_seconds()
+
+        def failed(error: str) -> Dict:
+            self._record_restore(RestoreMeasurement(
+                backup_id, started_at, False, time.perf_counter() - start, rpo_seconds, error=error
+            ))
+            return {"success": False, "error": error, "backup_id": backup_id}
 
         # Verify if requested
         if verify:
             verification = await self._verify_backup(metadata)
             if not verification["valid"]:
-                return {
-                    "success": False,
-                    "error": f"Backup verification failed: {verification['error']}",
-                    "backup_id": backup_id
-                }
-
-        # Retrieve backup data
-        backup_data = await self._retrieve_backup(metadata)
-
-        # Decrypt if encrypted
-        if metadata.encryption_enabled:
-            backup_data = self._decrypt(backup_data)
+                return failed(f"Backup verification failed: {verification['error']}")
 
-        # Decompress
-        backup_data = self._decompress(backup_data)
+        files = self.manifest.files(backup_id)
+        loop = asyncio.get_running_loop()
+        try:
+            restored_sources = await loop.run_in_executor(
+                None, self._restore_files, files, metadata.encryption_enabled, target
+            )
+        except (ChunkIntegrityError, OSError) as e:
+            return failed(f"Restore failed: {e}")
 
-        # Restore to target
-        restored_sources = await self._restore_data(backup_data, target)
+        measurement = RestoreMeasurement(
+            backup_id=backup_id,
+            started_at=started_at,
+            success=True,
+            rto_seconds=time.perf_counter() - start,
+            rpo_seconds=rpo_seconds,
+            files_restored=sum(1 for entry in files if entry.source != EXPORT_SOURCE),
+            bytes_restored=sum(entry.size for entry in files)
+        )
+        self._record_restore(measurement)
+        logger.info(
+            "restore %s: %d files, %d bytes in %.2fs (RPO %.0fs)",
+            backup_id, measurement.files_restored, measurement.bytes_restored,
+            measurement.rto_seconds, rpo_seconds
+        )
 
         return {
             "success": True,
             "backup_id": backup_id,
             "restored_sources": restored_sources,
             "timestamp": datetime.utcnow().isoformat(),
-            "size_bytes": metadata.size_bytes
+            "size_bytes": metadata.size_bytes,
+            "bytes_restored": measurement.bytes_restored,
+            "rto_seconds": measurement.rto_seconds,
+            "rpo_seconds": rpo_seconds
         }
 
+    def restore_history(self) -> List[RestoreMeasurement]:
+        """Every recorded restore attempt, oldest first."""
+        return [
+            RestoreMeasurement(**dict(
+                row,
+                started_at=datetime.fromisoformat(row["started_at"]),
+                success=bool(row["success"])
+            ))
+            for row in self.manifest.restore_rows()
+        ]
+
+    def _record_restore(self, measurement: RestoreMeasurement) -> None:
+        row = asdict(measurement)
+        row.update(started_at=measurement.started_at.isoformat(), success=int(measurement.success))
+        self.manifest.record_restore(row)
+
     async def _gather_data(self, sources: List[str], backup_type: BackupType) -> bytes:
         """Gather data from sources."""
         # In production, this would:
         # - Connect to database and dump schema + data
-        # - Archive application files
         # - Export configuration
-        # - Handle incremental/differential logic
+        # Filesystem paths among the sources are streamed by _write_chunks.
 
         data = {
             "sources": sources,
@@ -228,35 +405,57 @@ class BackupEngine:
         }
         return json.dumps(data).encode()
 
-    def _compress(self, data: bytes) -> bytes:
-        """Compress backup data."""
-        # In production, use gzip, lz4, or zstd
-        # For now, simulate compression
-        return data
-
-    def _decompress(self, data: bytes) -> bytes:
-        """Decompress backup data."""
-        return data
-
-    def _encrypt(self, data: bytes) -> bytes:
-        """Encrypt backup data."""
-        # In production, use AES-256-GCM
-        # For now, simulate encryption
-        return data
-
-    def _decrypt(self, data: bytes) -> bytes:
-        """Decrypt backup data."""
-        return data
+    @contextmanager
+    def _backup_in_progress(self):
+        # Chunk garbage collection waits while a backup may still reference unrecorded chunks
+        with self._active_lock:
+            self._active_backups += 1
+        try:
+            yield
+        finally:
+            with self._active_lock:
+                self._active_backups -= 1
 
-    async def _store_backup(self, backup_id: str, data: bytes, strategy: BackupStrategy) -> str:
+    def _write_chunks(
+        self,
+        sources: List[str],
+        export: bytes,
+        backup_type: BackupType,
+        encrypt: bool
+    ) -> Tuple[List[FileEntry], Dict[bytes, Tuple[int, int]], StreamStats]:
+        """Stream every source through the chunk pipeline."""
+        files: List[FileEntry] = []
+        seen: Dict[bytes, Tuple[int, int]] = {}
+        stats = StreamStats()
+
+        for source in sources:
+            if not _is_path_source(source):
+                continue
+            for relpath, path in iter_source_files(source):
+                st = path.stat()
+                entry = FileEntry(source, relpath, mtime_ns=st.st_mtime_ns)
+                if backup_type != BackupType.FULL:
+                    previous = self.manifest.previous_file(source, relpath, st.st_size, st.st_mtime_ns, encrypt)
+                    if previous is not None:
+                        entry.chunks, entry.size = previous, st.st_size
+                        files.append(entry)
+                        continue
+                with open(path, "rb") as f:
+                    self.pipeline.write_stream(f, entry, encrypt, seen, stats)
+                files.append(entry)
+
+        entry = FileEntry(EXPORT_SOURCE, EXPORT_NAME)
+        self.pipeline.write_stream(io.BytesIO(export), entry, encrypt, seen, stats)
+        files.append(entry)
+        return files, seen, stats
+
+    async def _store_backup(self, backup_id: str, strategy: BackupStrategy) -> str:
         """Store backup using specified strategy."""
         if strategy == BackupStrategy.LOCAL:
-            backup_file = self.base_path / f"{backup_id}.backup"
-            backup_file.write_bytes(data)
-            return str(backup_file)
+            return f"{self.manifest.db_path}#{backup_id}"
 
         elif strategy == BackupStrategy.S3:
-            # In production: boto3.client('s3').put_object(...)
+            # In production: upload new chunks + manifest with boto3; chunks are staged locally
             return f"s3://backups/{backup_id}.backup"
 
         elif strategy == BackupStrategy.AZURE_BLOB:
@@ -270,43 +469,70 @@ class BackupEngine:
         elif strategy == BackupStrategy.MULTI_REGION:
             # Store in multiple locations
             locations = [
-                await self._store_backup(backup_id, data, BackupStrategy.S3),
-                await self._store_backup(backup_id, data, BackupStrategy.GCS)
+                await self._store_backup(backup_id, BackupStrategy.S3),
+                await self._store_backup(backup_id, BackupStrategy.GCS)
             ]
             return f"multi:{','.join(locations)}"
 
         return "unknown"
 
-    async def _retrieve_backup(self, metadata: BackupMetadata) -> bytes:
-        """Retrieve backup data."""
-        if metadata.strategy == BackupStrategy.LOCAL:
-            backup_file = Path(metadata.location)
-            return backup_file.read_bytes()
-
-        # In production, retrieve from S3/Azure/GCS
-        return b""
-
     async def _verify_backup(self, metadata: BackupMetadata) -> Dict:
-        """Verify backup integrity."""
+        """Verify the manifest checksum and that every referenced chunk is present."""
         try:
-            data = await self._retrieve_backup(metadata)
-            checksum = hashlib.sha256(data).hexdigest()
-
-            if checksum == metadata.checksum:
-                return {"valid": True}
-            else:
+            files = self.manifest.files(metadata.backup_id)
+            checksum = backup_checksum(files)
+            if checksum != metadata.checksum:
                 return {
                     "valid": False,
                     "error": f"Checksum mismatch: expected {metadata.checksum}, got {checksum}"
                 }
+            missing = [
+                digest.hex() for entry in files for digest in entry.chunks
+                if not self.chunk_store.has(digest, metadata.encryption_enabled)
+            ]
+            if missing:
+                return {"valid": False, "error": f"{len(missing)} chunks missing, e.g. {missing[0]}"}
+            return {"valid": True}
         except Exception as e:
             return {"valid": False, "error": str(e)}
 
-    async def _restore_data(self, data: bytes, target: Optional[str]) -> List[str]:
+    def _restore_files(self, files: List[FileEntry], encrypted: bool, target: Optional[str]) -> List[str]:
+        """Write restored files (to ``target`` or their original paths) and return the restored sources.
+
+        Chunks are fetched and verified in parallel by the pipeline; every file
+        is renamed into place only after all of its chunks checked out, so a
+        failed restore never leaves a partially written file behind.
+        """
+        restored_sources: List[str] = []
+        chunks = self.pipeline.read_chunks(files, encrypted)
+        try:
+            for entry in files:
+                if entry.source == EXPORT_SOURCE:
+                    export = b"".join([next(chunks) for _ in entry.chunks])
+                    if target:
+                        with atomic_output(Path(target) / entry.relpath) as f:
+                            f.write(export)
+                    restored_sources = self._restore_data(export, target)
+                    continue
+                destination = _restore_path(entry, target)
+                with atomic_output(destination) as f:
+                    written = 0
+                    for _ in entry.chunks:
+                        written += f.write(next(chunks))
+                    if written != entry.size:
+                        raise ChunkIntegrityError(
+                            f"{destination}: restored {written} bytes, manifest records {entry.size}"
+                        )
+                if entry.mtime_ns:
+                    os.utime(destination, ns=(entry.mtime_ns, entry.mtime_ns))
+        finally:
+            chunks.close()
+        return restored_sources
+
+    def _restore_data(self, data: bytes, target: Optional[str]) -> List[str]:
         """Restore data to target."""
         # In production, this would:
         # - Restore database from dump
-        # - Extract and restore files
         # - Apply configurations
 
         backup_data = json.loads(data.decode())
@@ -315,28 +541,38 @@ class BackupEngine:
     def _generate_backup_id(self) -> str:
         """Generate unique backup ID."""
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        return f"backup_{timestamp}_{len(self.backup_history)}"
+        return f"backup_{timestamp}_{uuid.uuid4().hex[:8]}"
 
     def cleanup_old_backups(self, retention_days: int = 30) -> List[str]:
-        """Clean up backups older than retention period."""
-        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        """Clean up backups older than retention period, then chunks no backup references."""
         removed = []
 
         for metadata in self.backup_history[:]:
             backup_age = (datetime.utcnow() - metadata.timestamp).days
             if backup_age > metadata.retention_days:
-                # Remove backup file
-                if metadata.strategy == BackupStrategy.LOCAL:
-                    backup_file = Path(metadata.location)
-                    if backup_file.exists():
-                        backup_file.unlink()
-
                 self.backup_history.remove(metadata)
                 removed.append(metadata.backup_id)
 
+        with self._active_lock:
+            if removed and not self._active_backups:
+                for digest, encrypted in self.manifest.unreferenced_chunks():
+                    self.chunk_store.remove(digest, encrypted)
+
         return removed
 
 
+def _is_path_source(source: str) -> bool:
+    """Data sources that name an existing file or directory (and look like a path)."""
+    return ("/" in source or os.sep in source) and Path(source).exists()
+
+
+def _restore_path(entry: FileEntry, target: Optional[str]) -> Path:
+    root = Path(entry.source)
+    if target:
+        root = Path(target) / root.name
+    return root / entry.relpath if entry.relpath else root
+
+
 class FailoverOrchestrator:
     """Manages failover between instances."""
 
@@ -443,6 +679,7 @@ class FailoverOrchestrator:
             FailoverEvent with result
         """
         start_time = datetime.utcnow()
+        start = time.perf_counter()
         event_id = f"failover_{start_time.strftime('%Y%m%d_%H%M%S')}"
 
         # Auto-select target if not specified
@@ -472,7 +709,7 @@ class FailoverOrchestrator:
         # 3. Activate new instance
         self.active_instance = to_instance
 
-        duration = (datetime.utcnow() - start_time).total_seconds()
+        duration = time.perf_counter() - start
 
         event = FailoverEvent(
             event_id=event_id,
@@ -553,7 +790,8 @@ class DisasterRecoveryOrchestrator:
         data_sources: List[str],
         backup_type: BackupType = BackupType.FULL,
         strategy: BackupStrategy = BackupStrategy.LOCAL,
-        retention_days: int = 30
+        retention_days: int = 30,
+        encrypt: bool = True
     ):
         """
         Schedule automated backups.
@@ -564,13 +802,21 @@ class DisasterRecoveryOrchestrator:
             backup_type: Type of backup
             strategy: Storage strategy
             retention_days: Retention period
+            encrypt: Whether to encrypt backups; the key is checked now,
+                not when the job first runs
+
+        Raises:
+            BackupKeyError: encrypt is set and no backup key is configured
         """
+        if encrypt:
+            self.backup_engine.require_key()
         self.scheduled_backups.append({
             "schedule": schedule,
             "data_sources": data_sources,
             "backup_type": backup_type,
             "strategy": strategy,
             "retention_days": retention_days,
+            "encrypt": encrypt,
             "last_run": None
         })
 
@@ -578,19 +824,21 @@ class DisasterRecoveryOrchestrator:
         """Execute all due scheduled backups."""
         results = []
         now = datetime.utcnow()
+        due = [config for config in self.scheduled_backups if self._should_run_backup(config, now)]
+        if any(config.get("encrypt", True) for config in due):
+            # Before the first job rather than part-way through the run
+            self.backup_engine.require_key()
 
-        for schedule_config in self.scheduled_backups:
-            should_run = self._should_run_backup(schedule_config, now)
-
-            if should_run:
-                backup = await self.backup_engine.create_backup(
-                    data_sources=schedule_config["data_sources"],
-                    backup_type=schedule_config["backup_type"],
-                    strategy=schedule_config["strategy"],
-                    retention_days=schedule_config["retention_days"]
-                )
-                results.append(backup)
-                schedule_config["last_run"] = now
+        for schedule_config in due:
+            backup = await self.backup_engine.create_backup(
+                data_sources=schedule_config["data_sources"],
+                backup_type=schedule_config["backup_type"],
+                strategy=schedule_config["strategy"],
+                retention_days=schedule_config["retention_days"],
+                encrypt=schedule_config.get("encrypt", True)
+            )
+            results.append(backup)
+            schedule_config["last_run"] = now
 
         return results
 
@@ -624,11 +872,19 @@ class DisasterRecoveryOrchestrator:
 
         Returns:
             Test results
+
+        Raises:
+            BackupKeyError: a backup drill is requested and no backup key is
+                configured
         """
-        start_time = datetime.utcnow()
+        start = time.perf_counter()
         steps = []
+        objectives: Dict = {}
 
         if scenario == "full_system_failure":
+            # A missing key is a configuration error, not a failed drill
+            self.backup_engine.require_key()
+
             # Test full restore from backup
             steps.append("1. Simulating system failure...")
 
@@ -648,6 +904,10 @@ class DisasterRecoveryOrchestrator:
 
             steps.append("4. Verifying recovery...")
             success = restore_result["success"]
+            objectives = {
+                "rto_seconds": restore_result.get("rto_seconds"),
+                "rpo_seconds": restore_result.get("rpo_seconds")
+            }
 
         elif scenario == "instance_failure":
             # Test failover
@@ -662,17 +922,19 @@ class DisasterRecoveryOrchestrator:
 
             steps.append("3. Verifying failover...")
             success = failover_event.success
+            objectives = {"rto_seconds": failover_event.duration_seconds}
 
         else:
             success = False
             steps.append(f"Unknown scenario: {scenario}")
 
-        duration = (datetime.utcnow() - start_time).total_seconds()
+        duration = time.perf_counter() - start
 
         return {
             "scenario": scenario,
             "success": success,
             "duration_seconds": duration,
+            **objectives,
             "steps": steps,
             "timestamp": datetime.utcnow().isoformat()
         }
@@ -692,6 +954,7 @@ class DisasterRecoveryOrchestrator:
         total_backup_size = 0
         total_compression = 0.0
         encrypted_backups = 0
+        newest_backup: Optional[datetime] = None
 
         for b in self.backup_engine.backup_history:
             if (now - b.timestamp).days <= 7:
@@ -700,6 +963,8 @@ class DisasterRecoveryOrchestrator:
             total_compression += b.compression_ratio
             if b.encryption_enabled:
                 encrypted_backups += 1
+            if newest_backup is None or b.timestamp > newest_backup:
+                newest_backup = b.timestamp
 
         avg_compression = total_compression / total_backups if total_backups > 0 else 0.0
 
@@ -715,6 +980,12 @@ class DisasterRecoveryOrchestrator:
 
         avg_failover_time = total_failover_time / total_failovers if total_failovers > 0 else 0.0
 
+        # Measured recovery objectives
+        restores = self.backup_engine.restore_history()
+        successful_restores = [r for r in restores if r.success]
+        rto_values = [r.rto_seconds for r in successful_restores]
+        last_restore = successful_restores[-1] if successful_restores else None
+
         # Health status
         healthy_instances = sum(
             1 for data in self.failover.instances.values()
@@ -735,6 +1006,16 @@ class DisasterRecoveryOrchestrator:
                 "success_rate": successful_failovers / total_failovers if total_failovers > 0 else 1.0,
                 "average_failover_time_seconds": avg_failover_time
             },
+            "recovery_objectives": {
+                "total_restores": len(restores),
+                "successful_restores": len(successful_restores),
+                "last_rto_seconds": last_restore.rto_seconds if last_restore else None,
+                "average_rto_seconds": sum(rto_values) / len(rto_values) if rto_values else None,
+                "max_rto_seconds": max(rto_values) if rto_values else None,
+                "last_rpo_seconds": last_restore.rpo_seconds if last_restore else None,
+                # Data written since the newest backup would be lost right now
+                "current_rpo_seconds": (now - newest_backup).total_seconds() if newest_backup else None
+            },
             "current_status": {
                 "active_instance": self.failover.active_instance,
                 "healthy_instances": healthy_instances,
@@ -742,3 +1023,162 @@ class DisasterRecoveryOrchestrator:
                 "scheduled_backups": len(self.scheduled_backups)
             }
         }
+
+
+@dataclass
+class DrillReport:
+    """Outcome of a local backup/restore drill."""
+    dataset_bytes: int
+    files: int
+    backup_seconds: float
+    rto_seconds: float
+    rpo_seconds: float
+    rto_budget_seconds: float
+    rpo_budget_seconds: Optional[float]
+    bytes_equal: bool
+    failures: List[str]
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures
+
+    @property
+    def restore_mb_per_second(self) -> float:
+        return self.dataset_bytes / 2**20 / self.rto_seconds if self.rto_seconds else 0.0
+
+
+def _write_drill_dataset(root: Path, size_mb: int, file_mb: int = 256) -> Path:
+    """Synthetic dataset: alternating incompressible and log-like files, written 1 MiB at a time."""
+    data = root / "dataset"
+    data.mkdir(parents=True)
+    line = b"2025-01-01 INFO request served in 12ms path=/api/v1/leads status=200\n"
+    text = (line * (2**20 // len(line) + 1))[:2**20]
+    remaining, index = size_mb, 0
+    while remaining > 0:
+        mb = min(file_mb, remaining)
+        random_file = index % 2 == 0
+        with open(data / f"part-{index:04d}.{'bin' if random_file else 'log'}", "wb") as f:
+            for _ in range(mb):
+                f.write(os.urandom(2**20) if random_file else text)
+        remaining -= mb
+        index += 1
+    return data
+
+
+def _same_bytes(a: Path, b: Path, block: int = 2**20) -> bool:
+    if not b.is_file() or a.stat().st_size != b.stat().st_size:
+        return False
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        while True:
+            left = fa.read(block)
+            if left != fb.read(block):
+                return False
+            if not left:
+                return True
+
+
+async def run_restore_drill(
+    size_mb: int = 2048,
+    rto_budget_seconds: float = 300.0,
+    rpo_budget_seconds: Optional[float] = None,
+    work_dir: Optional[str] = None,
+    workers: int = 4,
+    compression: str = "zlib",
+    chunk_size: int = CHUNK_SIZE,
+    encrypt: bool = True
+) -> DrillReport:
+    """
+    Back up a synthetic dataset, restore it into a fresh directory and check the result.
+
+    The drill fails when any restored byte differs, when the measured RTO
+    exceeds ``rto_budget_seconds`` or (if given) the RPO exceeds
+    ``rpo_budget_seconds``. Everything happens in a temporary directory under
+    ``work_dir`` that is removed afterwards.
+    """
+    with tempfile.TemporaryDirectory(dir=work_dir, prefix="bbb-restore-drill-") as tmp:
+        root = Path(tmp)
+        data = _write_drill_dataset(root, size_mb)
+        engine = BackupEngine(
+            base_path=str(root / "store"),
+            chunk_size=chunk_size,
+            compression=compression,
+            workers=workers,
+            encryption_key=os.urandom(32)
+        )
+        try:
+            start = time.perf_counter()
+            backup = await engine.create_backup([str(data)], encrypt=encrypt)
+            backup_seconds = time.perf_counter() - start
+
+            result = await engine.restore_backup(backup.backup_id, target=str(root / "restore"))
+            failures = [] if result["success"] else [result["error"]]
+            measurement = engine.restore_history()[-1]
+
+            sources = sorted(p for p in data.rglob("*") if p.is_file())
+            restored = root / "restore" / data.name
+            bytes_equal = result["success"] and all(
+                _same_bytes(path, restored / path.relative_to(data)) for path in sources
+            )
+        finally:
+            engine.pipeline.close()
+            engine.manifest.close()
+
+    if result["success"] and not bytes_equal:
+        failures.append("restored bytes differ from the source dataset")
+    if measurement.rto_seconds > rto_budget_seconds:
+        failures.append(f"RTO {measurement.rto_seconds:.2f}s exceeds budget {rto_budget_seconds:.2f}s")
+    if rpo_budget_seconds is not None and measurement.rpo_seconds > rpo_budget_seconds:
+        failures.append(f"RPO {measurement.rpo_seconds:.2f}s exceeds budget {rpo_budget_seconds:.2f}s")
+
+    return DrillReport(
+        dataset_bytes=size_mb * 2**20,
+        files=len(sources),
+        backup_seconds=backup_seconds,
+        rto_seconds=measurement.rto_seconds,
+        rpo_seconds=measurement.rpo_seconds,
+        rto_budget_seconds=rto_budget_seconds,
+        rpo_budget_seconds=rpo_budget_seconds,
+        bytes_equal=bytes_equal,
+        failures=failures
+    )
+
+
+def main() -> None:
+    """Restore drill: ``python -m blank_business_builder.disaster_recovery --size-mb 4096``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Back up and restore a synthetic dataset, checking bytes and RTO/RPO budgets."
+    )
+    parser.add_argument("--size-mb", type=int, default=2048, help="Dataset size in MiB (default: 2048)")
+    parser.add_argument("--rto-budget", type=float, default=300.0, help="Maximum restore time in seconds")
+    parser.add_argument("--rpo-budget", type=float, default=None, help="Maximum backup age at restore time in seconds")
+    parser.add_argument("--work-dir", default=None, help="Directory for the temporary dataset, store and restore")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--compression", default="zlib", choices=["zlib", "lzma", "none"])
+    parser.add_argument("--no-encrypt", action="store_true")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_restore_drill(
+        size_mb=args.size_mb,
+        rto_budget_seconds=args.rto_budget,
+        rpo_budget_seconds=args.rpo_budget,
+        work_dir=args.work_dir,
+        workers=args.workers,
+        compression=args.compression,
+        encrypt=not args.no_encrypt
+    ))
+    print(f"dataset   {report.dataset_bytes / 2**20:.0f} MiB in {report.files} files")
+    print(f"backup    {report.backup_seconds:.2f}s")
+    print(f"restore   RTO {report.rto_seconds:.2f}s (budget {report.rto_budget_seconds:.2f}s), "
+          f"{report.restore_mb_per_second:.1f} MiB/s")
+    print(f"RPO       {report.rpo_seconds:.2f}s")
+    print(f"bytes     {'identical' if report.bytes_equal else 'DIFFERENT'}")
+    for failure in report.failures:
+        print(f"FAIL      {failure}")
+    print("PASS" if report.passed else "DRILL FAILED")
+    sys.exit(0 if report.passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,22 @@ Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights
 Reverse-engineered and improved from Zapier + Make + n8n
 Adds AI auto-creation and quantum optimization they don't have.
 """
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Mapping, Optional, Any
 from datetime import datetime
 from dataclasses import dataclass
 import asyncio
 
 from ..integrations import IntegrationFactory
+from .workflow_dag import (
+    StepResultCache,
+    WorkflowDAG,
+    WorkflowExecutor,
+    WorkflowRun,
+    step_references,
+)
+
+# Steps that everything after them must wait for (branching, loops, delays)
+BARRIER_STEP_TYPES = frozenset({"condition", "loop", "delay"})
 
 
 @dataclass
@@ -77,6 +87,9 @@ class AIWorkflowBuilder:
         # 10,000+ integrations (more than Zapier's 7,000)
         self.available_apps = self._load_integrations()
 
+        # Results of pure steps (ai, code, transform) shared across executions
+        self.step_cache = StepResultCache()
+
     def _load_integrations(self) -> Dict[str, Dict]:
         """
         Load all available app integrations.
@@ -209,11 +222,8 @@ class AIWorkflowBuilder:
             )
             steps.append(step)
 
-        # Link steps
-        for i in range(len(steps) - 1):
-            steps[i].next_steps = [steps[i + 1].step_id]
-
-        return steps
+        # Link steps by their data dependencies
+        return [trigger] + self._identify_parallel_steps(steps[1:], trigger)
 
     # ===== VISUAL WORKFLOW BUILDER (Like Make) =====
 
@@ -224,25 +234,20 @@ class AIWorkflowBuilder:
         """
         nodes = []
         edges = []
-
-        # Add trigger node
-        nodes.append({
-            "id": workflow.trigger.step_id,
-            "type": "trigger",
-            "app": workflow.trigger.app,
-            "action": workflow.trigger.action,
-            "position": {"x": 100, "y": 100}
-        })
-
-        # Add action nodes
-        for idx, step in enumerate(workflow.steps):
-            nodes.append({
-                "id": step.step_id,
-                "type": step.step_type,
-                "app": step.app,
-                "action": step.action,
-                "position": {"x": 100 + (idx * 200), "y": 300}
-            })
+        dag = self.compile_workflow(workflow)
+
+        # One column per DAG level; steps that can run in parallel share a column
+        for level, step_ids in enumerate(dag.levels):
+            for row, step_id in enumerate(step_ids):
+                step = dag.steps[step_id]
+                nodes.append({
+                    "id": step.step_id,
+                    "type": step.step_type,
+                    "app": step.app,
+                    "action": step.action,
+                    "level": level,
+                    "position": {"x": 100 + (level * 200), "y": 100 + (row * 200)}
+                })
 
         # Add edges (connections)
         all_steps = [workflow.trigger] + workflow.steps
@@ -253,9 +258,11 @@ class AIWorkflowBuilder:
                     "target": next_id
                 })
 
+        critical_path, _ = dag.critical_path()
         return {
             "nodes": nodes,
             "edges": edges,
+            "critical_path": critical_path,
             "workflow_id": workflow.workflow_id
         }
 
@@ -317,16 +324,108 @@ class AIWorkflowBuilder:
         # Simulated optimization
 
         # Identify steps that can run in parallel
-        optimized_steps = self._identify_parallel_steps(workflow.steps)
+        optimized_steps = self._identify_parallel_steps(workflow.steps, workflow.trigger)
 
         workflow.steps = optimized_steps
+        self.compile_workflow(workflow)
         return workflow
 
-    def _identify_parallel_steps(self, steps: List[WorkflowStep]) -> List[WorkflowStep]:
-        """Identify which steps can execute in parallel."""
-        # In production: Dependency analysis
-        # For now, return as-is
-        return steps
+    def _identify_parallel_steps(
+        self,
+        steps: List[WorkflowStep],
+        trigger: Optional[WorkflowStep] = None
+    ) -> List[WorkflowStep]:
+        """
+        Identify which steps can execute in parallel.
+
+        Rewrites ``next_steps`` from data dependencies: a step depends on the
+        steps its config references as ``{{<step_id>.field}}``, on the ids in
+        ``config["depends_on"]``, and on the latest condition/loop/delay step
+        before it (or the trigger). Condition/loop/delay steps wait for every
+        step since the previous one. Returns the steps in level order.
+        """
+        aliases = {step.step_id: step.step_id for step in steps}
+        if trigger is not None:
+            aliases[trigger.step_id] = trigger.step_id
+            aliases["trigger"] = trigger.step_id
+        trigger_id = trigger.step_id if trigger is not None else None
+
+        parents: Dict[str, List[str]] = {}
+        barrier = trigger_id
+        since_barrier: List[str] = []
+        for step in steps:
+            names = step_references(step.config) | set(step.config.get("depends_on", []))
+            deps = {aliases[name] for name in names if name in aliases} - {step.step_id, trigger_id}
+            if step.step_type in BARRIER_STEP_TYPES:
+                deps.update(since_barrier)
+                if not deps and barrier is not None:
+                    deps.add(barrier)
+                barrier, since_barrier = step.step_id, []
+            else:
+                if barrier is not None and (barrier != trigger_id or not deps):
+                    deps.add(barrier)
+                since_barrier.append(step.step_id)
+            parents[step.step_id] = sorted(deps)
+
+        children: Dict[str, List[str]] = {step_id: [] for step_id in aliases.values()}
+        for step in steps:
+            for parent in parents[step.step_id]:
+                children[parent].append(step.step_id)
+        for step in steps:
+            step.next_steps = children[step.step_id]
+        if trigger is not None:
+            trigger.next_steps = children[trigger.step_id]
+
+        level: Dict[str, int] = {}
+
+        def depth(step_id: str, seen=()) -> int:
+            if step_id not in level:
+                if step_id in seen:
+                    return 0  # cycle; compile_workflow reports it
+                level[step_id] = 1 + max(
+                    (depth(p, seen + (step_id,)) for p in parents.get(step_id, [])), default=0
+                )
+            return level[step_id]
+
+        position = {step.step_id: idx for idx, step in enumerate(steps)}
+        return sorted(steps, key=lambda step: (depth(step.step_id), position[step.step_id]))
+
+    def compile_workflow(self, workflow: Workflow) -> WorkflowDAG:
+        """Dependency DAG of a workflow; raises WorkflowCycleError on cyclic links."""
+        return WorkflowDAG.from_workflow(workflow)
+
+    async def execute_workflow(
+        self,
+        workflow: Workflow,
+        trigger_payload: Any = None,
+        runner: Optional[Callable[[WorkflowStep, Mapping[str, Any]], Any]] = None,
+        max_concurrency: int = 8
+    ) -> WorkflowRun:
+        """
+        Execute a workflow, running independent steps concurrently.
+
+        ``runner(step, inputs)`` performs one step (default: simulated app
+        call); see WorkflowExecutor. Updates the workflow's execution stats.
+        """
+        dag = self.compile_workflow(workflow)
+        executor = WorkflowExecutor(runner or self._run_step, max_concurrency, self.step_cache)
+        run = await executor.run(dag, trigger_payload)
+
+        runs = workflow.executions_count
+        elapsed_ms = run.elapsed_seconds * 1000
+        workflow.avg_execution_time_ms = (workflow.avg_execution_time_ms * runs + elapsed_ms) / (runs + 1)
+        workflow.success_rate = (workflow.success_rate * runs + (1.0 if run.success else 0.0)) / (runs + 1)
+        workflow.executions_count = runs + 1
+        workflow.last_execution = datetime.utcnow()
+        if not run.success:
+            workflow.status = "error"
+        return run
+
+    async def _run_step(self, step: WorkflowStep, inputs: Mapping[str, Any]) -> Dict:
+        """Perform one step."""
+        # In production: Dispatch to the app connector for step.app
+        await asyncio.sleep(0)
+        return {"app": step.app, "action": step.action, "status": "completed"}
 
     # ===== SELF-HEALING (NEW feature) =====
 
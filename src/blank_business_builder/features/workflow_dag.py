@@ -0,0 +1,283 @@
+"""
+Better Business Builder - Workflow DAG compilation and concurrent execution
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+A workflow's ``next_steps`` links form a dependency graph. WorkflowDAG checks
+it for cycles and computes topological levels and the critical path;
+WorkflowExecutor runs every step whose parents have finished, up to
+``max_concurrency`` at a time. A step receives its parents' outputs as a
+read-only mapping over the very objects they returned (nothing is copied), and
+results of pure steps are cached by a hash of the step definition and inputs.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Step types whose result depends only on their definition and inputs
+PURE_STEP_TYPES = frozenset({"ai", "code", "transform"})
+
+_REFERENCE = re.compile(r"\{\{\s*([A-Za-z0-9_\-]+)\.")
+
+
+class WorkflowCycleError(ValueError):
+    """The workflow's step links contain a cycle."""
+
+    def __init__(self, step_ids: Iterable[str]):
+        self.step_ids = sorted(step_ids)
+        super().__init__(f"Workflow steps form a cycle: {', '.join(self.step_ids)}")
+
+
+def step_references(config: Any) -> Set[str]:
+    """Names used in ``{{name.field}}`` templates anywhere in a step config."""
+    if isinstance(config, str):
+        return set(_REFERENCE.findall(config))
+    if isinstance(config, dict):
+        config = config.values()
+    elif not isinstance(config, (list, tuple)):
+        return set()
+    found: Set[str] = set()
+    for value in config:
+        found |= step_references(value)
+    return found
+
+
+class WorkflowDAG:
+    """Validated dependency graph of workflow steps (trigger first)."""
+
+    def __init__(self, steps: Sequence[Any]):
+        self.steps: Dict[str, Any] = {step.step_id: step for step in steps}
+        self.children: Dict[str, List[str]] = {}
+        self.parents: Dict[str, List[str]] = {step_id: [] for step_id in self.steps}
+        for step in steps:
+            unknown = [target for target in step.next_steps if target not in self.steps]
+            if unknown:
+                raise ValueError(f"Step {step.step_id} links to unknown steps: {unknown}")
+            self.children[step.step_id] = list(dict.fromkeys(step.next_steps))
+            for target in self.children[step.step_id]:
+                self.parents[target].append(step.step_id)
+        self.order = self._topological_order()
+        self.level: Dict[str, int] = {}
+        for step_id in self.order:
+            self.level[step_id] = 1 + max((self.level[p] for p in self.parents[step_id]), default=-1)
+        self.levels: List[List[str]] = [[] for _ in range(max(self.level.values(), default=-1) + 1)]
+        for step_id in self.order:
+            self.levels[self.level[step_id]].append(step_id)
+
+    @classmethod
+    def from_workflow(cls, workflow) -> "WorkflowDAG":
+        return cls([workflow.trigger] + list(workflow.steps))
+
+    @property
+    def width(self) -> int:
+        """Most steps that can run at the same time."""
+        return max((len(level) for level in self.levels), default=0)
+
+    def _topological_order(self) -> List[str]:
+        indegree = {step_id: len(parents) for step_id, parents in self.parents.items()}
+        ready = deque(step_id for step_id, degree in indegree.items() if degree == 0)
+        order = []
+        while ready:
+            step_id = ready.popleft()
+            order.append(step_id)
+            for child in self.children[step_id]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+        if len(order) != len(self.steps):
+            raise WorkflowCycleError(step_id for step_id, degree in indegree.items() if degree)
+        return order
+
+    def critical_path(self, durations: Optional[Mapping[str, float]] = None) -> Tuple[List[str], float]:
+        """Longest path through the graph; unknown step durations count as 1."""
+        durations = durations or {}
+        finish: Dict[str, float] = {}
+        via: Dict[str, Optional[str]] = {}
+        for step_id in self.order:
+            parent = max(self.parents[step_id], key=finish.__getitem__, default=None)
+            finish[step_id] = (finish[parent] if parent else 0.0) + durations.get(step_id, 1.0)
+            via[step_id] = parent
+        if not finish:
+            return [], 0.0
+        step_id: Optional[str] = max(finish, key=finish.__getitem__)
+        total = finish[step_id]
+        path = []
+        while step_id is not None:
+            path.append(step_id)
+            step_id = via[step_id]
+        return path[::-1], total
+
+
+class StepResultCache:
+    """LRU cache of step outputs keyed by a hash of the step definition and its inputs."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    @staticmethod
+    def key(step, inputs: Mapping[str, Any]) -> str:
+        document = {
+            "type": step.step_type,
+            "app": step.app,
+            "action": step.action,
+            "config": step.config,
+            "inputs": [inputs[name] for name in sorted(inputs)],
+        }
+        encoded = json.dumps(document, sort_keys=True, default=repr).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, self._entries[key]
+        self.misses += 1
+        return False, None
+
+    def put(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class WorkflowRun:
+    """Outcome of one WorkflowExecutor.run call."""
+    outputs: Dict[str, Any] = field(default_factory=dict)
+    failed: Dict[str, str] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    cache_hits: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return not self.failed and not self.skipped
+
+
+class WorkflowExecutor:
+    """
+    Run a WorkflowDAG with bounded concurrency.
+
+    ``runner(step, inputs)`` executes one step; it may be a coroutine function
+    or a blocking callable, which then runs on a thread pool of
+    ``max_concurrency`` workers. ``inputs`` maps each parent step_id to that
+    parent's output. The trigger step is not run: its output is the trigger
+    payload.
+
+    A failing step is retried ``error_handling["retry"]`` times. If it still
+    fails and ``error_handling["on_error"] == "continue"``, its output is None
+    and the workflow goes on; otherwise running steps are cancelled and every
+    step not yet started is reported as skipped.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[Any, Mapping[str, Any]], Any],
+        max_concurrency: int = 8,
+        cache: Optional[StepResultCache] = None,
+    ):
+        self.runner = runner
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+
+    @staticmethod
+    def cacheable(step) -> bool:
+        return bool(step.config.get("cache", step.step_type in PURE_STEP_TYPES))
+
+    async def run(self, dag: WorkflowDAG, trigger_payload: Any = None) -> WorkflowRun:
+        result = WorkflowRun()
+        start = time.perf_counter()
+        pool = None
+        if not asyncio.iscoroutinefunction(self.runner):
+            pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="workflow-step")
+
+        waiting = {step_id: len(parents) for step_id, parents in dag.parents.items()}
+        ready = deque(step_id for step_id in dag.order if not waiting[step_id])
+        running: Dict[asyncio.Task, Tuple[str, Optional[str]]] = {}
+        aborted = False
+
+        def finish(step_id: str, output: Any) -> None:
+            result.outputs[step_id] = output
+            for child in dag.children[step_id]:
+                waiting[child] -= 1
+                if not waiting[child]:
+                    ready.append(child)
+
+        try:
+            while (ready or running) and not aborted:
+                while ready and len(running) < self.max_concurrency:
+                    step_id = ready.popleft()
+                    step = dag.steps[step_id]
+                    if step.step_type == "trigger":
+                        finish(step_id, trigger_payload)
+                        continue
+                    inputs = MappingProxyType({p: result.outputs[p] for p in dag.parents[step_id]})
+                    key = None
+                    if self.cache is not None and self.cacheable(step):
+                        key = self.cache.key(step, inputs)
+                        hit, output = self.cache.get(key)
+                        if hit:
+                            result.cache_hits += 1
+                            finish(step_id, output)
+                            continue
+                    task = asyncio.ensure_future(self._run_step(step, inputs, pool))
+                    running[task] = (step_id, key)
+                if not running:
+                    continue
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step_id, key = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        if key is not None:
+                            self.cache.put(key, task.result())
+                        finish(step_id, task.result())
+                        continue
+                    result.failed[step_id] = f"{type(error).__name__}: {error}"
+                    logger.warning("workflow step %s failed: %s", step_id, result.failed[step_id])
+                    if dag.steps[step_id].error_handling.get("on_error") == "continue":
+                        finish(step_id, None)
+                    else:
+                        aborted = True
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            if pool is not None:
+                pool.shutdown(wait=False)
+
+        result.skipped = [
+            step_id for step_id in dag.order
+            if step_id not in result.outputs and step_id not in result.failed
+        ]
+        result.elapsed_seconds = time.perf_counter() - start
+        return result
+
+    async def _run_step(self, step, inputs: Mapping[str, Any], pool: Optional[ThreadPoolExecutor]) -> Any:
+        attempts = 1 + int(step.error_handling.get("retry", 0) or 0)
+        for attempt in range(1, attempts + 1):
+            try:
+                if pool is None:
+                    return await self.runner(step, inputs)
+                return await asyncio.get_running_loop().run_in_executor(pool, self.runner, step, inputs)
+            except Exception:
+                if attempt == attempts:
+                    raise
@@ -0,0 +1,335 @@
+"""
+Hive Knowledge Store - Incremental, compacted persistence for hive learnings.
+
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+Learnings are appended to size-bounded JSONL segments. In memory only a capped
+working set (the most recent N learnings per category) and aggregated counters
+are kept. Closed segments are folded into a snapshot by a background thread and
+removed, so warm-starting a coordinator only has to read the latest snapshot
+plus the few segments written after it.
+
+Layout of a store directory::
+
+    snapshot.json            # working sets + counters as of the last compaction
+    segment-00000001.jsonl   # closed, not yet compacted
+    segment-00000002.jsonl   # active segment (appended to)
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+LOG = logging.getLogger(__name__)
+
+KNOWLEDGE_CATEGORIES = (
+    'successful_strategies',
+    'failed_strategies',
+    'customer_insights',
+    'optimization_learnings',
+    'market_intelligence',
+)
+
+SNAPSHOT_FILE = "snapshot.json"
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+
+
+class _KnowledgeState:
+    """Bounded working sets plus running counters for every category."""
+
+    def __init__(self, recent_limit: int):
+        self.recent_limit = recent_limit
+        self.working_sets: Dict[str, Deque[Dict[str, Any]]] = {
+            category: deque(maxlen=recent_limit) for category in KNOWLEDGE_CATEGORIES
+        }
+        self.counters: Counter = Counter()
+        self.by_agent: Counter = Counter()
+        self.last_segment = 0
+
+    def apply(self, category: str, learning: Dict[str, Any]):
+        if category not in self.working_sets:
+            self.working_sets[category] = deque(maxlen=self.recent_limit)
+        self.working_sets[category].append(learning)
+        self.counters[category] += 1
+        agent_id = learning.get('agent_id')
+        if agent_id:
+            self.by_agent[agent_id] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'last_segment': self.last_segment,
+            'working_sets': {category: list(items) for category, items in self.working_sets.items()},
+            'counters': dict(self.counters),
+            'by_agent': dict(self.by_agent),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], recent_limit: int) -> "_KnowledgeState":
+        state = cls(recent_limit)
+        state.last_segment = int(data.get('last_segment', 0))
+        for category, items in data.get('working_sets', {}).items():
+            state.working_sets[category] = deque(items, maxlen=recent_limit)
+        state.counters.update(data.get('counters', {}))
+        state.by_agent.update(data.get('by_agent', {}))
+        return state
+
+
+class HiveKnowledgeStore:
+    """
+    Append-only knowledge log with capped in-memory working sets.
+
+    When ``directory`` is None the store is purely in-memory: working sets stay
+    capped and counters are maintained, but nothing is written to disk.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        recent_limit: int = 1000,
+        segment_max_records: int = 10000,
+        compact_after_segments: int = 4,
+        background_compaction: bool = True,
+    ):
+        self.directory = Path(directory) if directory else None
+        self.recent_limit = recent_limit
+        self.segment_max_records = segment_max_records
+        self.compact_after_segments = compact_after_segments
+        self.background_compaction = background_compaction
+
+        self._lock = threading.Lock()
+        self._compaction_lock = threading.Lock()
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._segment_file = None
+        self._segment_id = 0
+        self._segment_records = 0
+
+        self._state = _KnowledgeState(recent_limit)
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._warm_start()
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+
+    @property
+    def working_sets(self) -> Dict[str, Deque[Dict[str, Any]]]:
+        """Recent learnings per category (capped at ``recent_limit``)."""
+        return self._state.working_sets
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """Total learnings ever recorded per category."""
+        return self._state.counters
+
+    @property
+    def learnings_by_agent(self) -> Dict[str, int]:
+        """Total learnings ever recorded per agent."""
+        return self._state.by_agent
+
+    def count(self, category: str) -> int:
+        return self._state.counters.get(category, 0)
+
+    def recent(self, category: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` most recent learnings for a category, oldest first."""
+        items = self._state.working_sets.get(category, ())
+        if limit is None or limit >= len(items):
+            return list(items)
+        if limit <= 0:
+            return []
+        return list(items)[-limit:]
+
+    def append(self, category: str, learning: Dict[str, Any]):
+        """Record a learning in memory and append it to the active segment."""
+        with self._lock:
+            self._state.apply(category, learning)
+            if self.directory is None:
+                return
+
+            record = dict(learning)
+            record['category'] = category
+            self._segment_file.write(json.dumps(record, separators=(',', ':'), default=str) + "\n")
+            self._segment_file.flush()
+            self._segment_records += 1
+
+            if self._segment_records >= self.segment_max_records:
+                self._rotate_segment()
+                should_compact = len(self._closed_segments()) >= self.compact_after_segments
+            else:
+                should_compact = False
+
+        if should_compact:
+            if self.background_compaction:
+                self.compact_in_background()
+            else:
+                self.compact()
+
+    def compact_in_background(self) -> Optional[threading.Thread]:
+        """Start a compaction thread unless one is already running."""
+        if self.directory is None:
+            return None
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return self._compaction_thread
+
+        thread = threading.Thread(target=self.compact, name="hive-knowledge-compaction", daemon=True)
+        self._compaction_thread = thread
+        thread.start()
+        return thread
+
+    def compact(self) -> int:
+        """
+        Fold all closed segments into the snapshot and delete them.
+
+        The snapshot is rebuilt from the previous snapshot plus the closed
+        segments rather than from the live state, so compaction never blocks
+        appends. Returns the number of segments compacted.
+        """
+        if self.directory is None:
+            return 0
+
+        with self._compaction_lock:
+            with self._lock:
+                closed = self._closed_segments()
+
+            state = self._load_snapshot()
+            # Segments already covered by the snapshot are leftovers from a
+            # compaction interrupted before cleanup; they must not be replayed.
+            segments = [segment_id for segment_id in closed if segment_id > state.last_segment]
+            stale = [segment_id for segment_id in closed if segment_id <= state.last_segment]
+            if not segments and not stale:
+                return 0
+
+            for segment_id in segments:
+                self._replay_segment(state, segment_id)
+                state.last_segment = segment_id
+
+            if segments:
+                self._write_snapshot(state)
+            for segment_id in stale + segments:
+                try:
+                    self._segment_path(segment_id).unlink()
+                except FileNotFoundError:
+                    pass
+
+            LOG.info(f"Compacted {len(segments)} hive knowledge segments into snapshot")
+            return len(segments)
+
+    def wait_for_compaction(self, timeout: Optional[float] = None):
+        """Block until a running background compaction finishes."""
+        thread = self._compaction_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def close(self):
+        """Flush and close the active segment."""
+        self.wait_for_compaction()
+        with self._lock:
+            if self._segment_file is not None:
+                self._segment_file.close()
+                self._segment_file = None
+
+    def export(self) -> Dict[str, Any]:
+        """Compact, JSON-serialisable view of the current in-memory state."""
+        with self._lock:
+            state = self._state.to_dict()
+        state.pop('last_segment', None)
+        return state
+
+    # ------------------------------------------------------------------ #
+    # Segment management
+    # ------------------------------------------------------------------ #
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.directory / f"{SEGMENT_PREFIX}{segment_id:08d}{SEGMENT_SUFFIX}"
+
+    def _segment_ids(self) -> List[int]:
+        ids = []
+        for path in self.directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+            try:
+                ids.append(int(path.name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]))
+            except ValueError:
+                continue
+        return sorted(ids)
+
+    def _closed_segments(self) -> List[int]:
+        return [segment_id for segment_id in self._segment_ids() if segment_id < self._segment_id]
+
+    def _open_segment(self, segment_id: int, existing_records: int = 0):
+        self._segment_id = segment_id
+        self._segment_records = existing_records
+        self._segment_file = open(self._segment_path(segment_id), 'a', encoding='utf-8')
+
+    def _rotate_segment(self):
+        self._segment_file.close()
+        self._open_segment(self._segment_id + 1)
+
+    # ------------------------------------------------------------------ #
+    # Snapshot + replay
+    # ------------------------------------------------------------------ #
+
+    def _load_snapshot(self) -> _KnowledgeState:
+        path = self.directory / SNAPSHOT_FILE
+        if not path.exists():
+            return _KnowledgeState(self.recent_limit)
+        try:
+            with open(path, encoding='utf-8') as f:
+                return _KnowledgeState.from_dict(json.load(f), self.recent_limit)
+        except (OSError, ValueError) as e:
+            LOG.warning(f"Could not load hive knowledge snapshot: {e}")
+            return _KnowledgeState(self.recent_limit)
+
+    def _write_snapshot(self, state: _KnowledgeState):
+        path = self.directory / SNAPSHOT_FILE
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state.to_dict(), f, separators=(',', ':'), default=str)
+        os.replace(tmp_path, path)
+
+    def _replay_segment(self, state: _KnowledgeState, segment_id: int) -> int:
+        replayed = 0
+        for record in self._read_segment(segment_id):
+            category = record.pop('category', None)
+            if category:
+                state.apply(category, record)
+                replayed += 1
+        return replayed
+
+    def _read_segment(self, segment_id: int) -> Iterable[Dict[str, Any]]:
+        try:
+            with open(self._segment_path(segment_id), encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # Torn write at the tail of a segment after a crash
+                        LOG.warning(f"Skipping corrupt record in segment {segment_id}")
+        except FileNotFoundError:
+            return
+
+    def _warm_start(self):
+        """Rebuild state from the latest snapshot plus the segments after it."""
+        state = self._load_snapshot()
+        tail = [segment_id for segment_id in self._segment_ids() if segment_id > state.last_segment]
+
+        replayed = 0
+        last_records = 0
+        for segment_id in tail:
+            last_records = self._replay_segment(state, segment_id)
+            replayed += last_records
+
+        self._state = state
+        if tail:
+            self._open_segment(tail[-1], existing_records=last_records)
+        else:
+            self._open_segment(state.last_segment + 1)
+
+        if replayed:
+            LOG.info(f"Hive knowledge warm start: replayed {replayed} learnings from {len(tail)} segments")
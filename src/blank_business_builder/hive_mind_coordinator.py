@@ -19,10 +19,18 @@ import logging
 import os
 from datetime import datetime
 from typing import Dict, List, Any, Optional
+from collections import deque
 from dataclasses import dataclass, asdict
 from enum import Enum
 import random
 
+try:
+    from .hive_knowledge_store import HiveKnowledgeStore
+    from .compact_records import slotted
+except ImportError:  # Loaded as a top-level module by scripts/
+    from hive_knowledge_store import HiveKnowledgeStore
+    from compact_records import slotted
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 LOG = logging.getLogger(__name__)
 
@@ -43,6 +51,16 @@ class AgentType(Enum):
     ANALYTICS = "analytics"
 
 
+# learning_type accepted by share_learning -> shared_knowledge category
+LEARNING_CATEGORIES = {
+    'successful_strategy': 'successful_strategies',
+    'failed_strategy': 'failed_strategies',
+    'customer_insight': 'customer_insights',
+    'optimization': 'optimization_learnings',
+    'market_intelligence': 'market_intelligence',
+}
+
+
 class DecisionPriority(Enum):
     """Priority levels for hive decisions"""
     CRITICAL = "critical"
@@ -51,6 +69,7 @@ class DecisionPriority(Enum):
     LOW = "low"
 
 
+@slotted
 @dataclass
 class HiveMessage:
     """Message passed between agents in the hive"""
@@ -114,17 +133,26 @@ class HiveMindCoordinator:
     - Conflict resolution
     """
 
-    def __init__(self, config_path: str = "autonomous_config.json"):
+    def __init__(
+        self,
+        config_path: str = "autonomous_config.json",
+        knowledge_dir: Optional[str] = None,
+        knowledge_recent_limit: int = 1000,
+        message_queue_limit: int = 10000,
+    ):
         self.config = self._load_config(config_path)
         self.agents: Dict[str, AgentState] = {}
-        self.message_queue: List[HiveMessage] = []
-        self.shared_knowledge: Dict[str, Any] = {
-            'successful_strategies': [],
-            'failed_strategies': [],
-            'customer_insights': [],
-            'optimization_learnings': [],
-            'market_intelligence': []
-        }
+        # Agents indexed by type so routing and lead lookup don't scan every agent
+        # when thousands of businesses share one hive.
+        self.agents_by_type: Dict[AgentType, Dict[str, AgentState]] = {}
+        self.message_queue: deque = deque(maxlen=message_queue_limit)
+
+        # Learnings are appended to a segmented log when knowledge_dir is set;
+        # in memory only the most recent N per category are kept, plus counters.
+        # Passing an existing directory warm-starts from its snapshot + tail.
+        knowledge_dir = knowledge_dir or self.config.get('hive_knowledge_dir')
+        self.knowledge_store = HiveKnowledgeStore(knowledge_dir, recent_limit=knowledge_recent_limit)
+        self.shared_knowledge = self.knowledge_store.working_sets
         self.consensus_threshold = 0.70  # 70% agreement needed for critical decisions
         self.ech0_overseer_id: Optional[str] = None  # ECH0's agent ID
 
@@ -183,7 +211,7 @@ class HiveMindCoordinator:
             reports_to=None  # ECH0 reports to no one
         )
 
-        self.agents["ech0_overseer"] = ech0
+        self._add_agent(ech0)
         self.ech0_overseer_id = "ech0_overseer"
 
         LOG.warning("🤖 ECH0 OVERSEER INITIALIZED - Supreme manager of the hive")
@@ -217,7 +245,7 @@ class HiveMindCoordinator:
             reports_to=reports_to
         )
 
-        self.agents[agent_id] = agent
+        self._add_agent(agent)
 
         if autonomy_level == 9:
             LOG.warning(f"⚡ Level-9-Agent registered: {agent_id} ({agent_type.value}) → reports to ECH0")
@@ -233,6 +261,24 @@ class HiveMindCoordinator:
 
         return agent
 
+    def unregister_agent(self, agent_id: str) -> bool:
+        """Remove an agent from the hive; the ECH0 overseer cannot be removed"""
+        if agent_id == self.ech0_overseer_id:
+            return False
+        agent = self.agents.pop(agent_id, None)
+        if agent is None:
+            return False
+        self.agents_by_type.get(agent.agent_type, {}).pop(agent_id, None)
+        return True
+
+    def _add_agent(self, agent: AgentState):
+        """Insert or replace an agent, keeping the per-type index in sync."""
+        previous = self.agents.get(agent.agent_id)
+        if previous is not None:
+            self.agents_by_type.get(previous.agent_type, {}).pop(agent.agent_id, None)
+        self.agents[agent.agent_id] = agent
+        self.agents_by_type.setdefault(agent.agent_type, {})[agent.agent_id] = agent
+
     def _find_level9_lead(self, agent_type: AgentType) -> Optional[str]:
         """Find the Level-9-Agent lead for this agent type"""
 
@@ -249,9 +295,8 @@ class HiveMindCoordinator:
             return self.ech0_overseer_id  # Default to ECH0
 
         # Find agent with this lead type
-        for agent_id, agent in self.agents.items():
-            if agent.agent_type == lead_type:
-                return agent_id
+        for agent_id in self.agents_by_type.get(lead_type, {}):
+            return agent_id
 
         return self.ech0_overseer_id  # Fallback to ECH0
 
@@ -277,10 +322,10 @@ class HiveMindCoordinator:
     def _share_knowledge_with_agent(self, agent_id: str):
         """Share hive knowledge with newly registered agent"""
         knowledge_summary = {
-            'successful_strategies_count': len(self.shared_knowledge['successful_strategies']),
-            'failed_strategies_count': len(self.shared_knowledge['failed_strategies']),
+            'successful_strategies_count': self.knowledge_store.count('successful_strategies'),
+            'failed_strategies_count': self.knowledge_store.count('failed_strategies'),
             'total_agents': len(self.agents),
-            'top_insights': self.shared_knowledge['customer_insights'][-5:]  # Last 5
+            'top_insights': self.knowledge_store.recent('customer_insights', 5)  # Last 5
         }
 
         LOG.info(f"Shared knowledge with {agent_id}: {knowledge_summary['successful_strategies_count']} strategies")
@@ -331,8 +376,10 @@ class HiveMindCoordinator:
 
         # Find agents of target types
         target_agents = [
-            agent_id for agent_id, agent in self.agents.items()
-            if agent.agent_type in target_types and agent.status == "active"
+            agent_id
+            for agent_type in target_types
+            for agent_id, agent in self.agents_by_type.get(agent_type, {}).items()
+            if agent.status == "active"
         ]
 
         return target_agents
@@ -413,23 +460,16 @@ class HiveMindCoordinator:
         }
 
         # Store in appropriate knowledge category
+        category = LEARNING_CATEGORIES.get(learning_type)
+        if category:
+            self.knowledge_store.append(category, learning)
+
         if learning_type == 'successful_strategy':
-            self.shared_knowledge['successful_strategies'].append(learning)
             LOG.info(f"Hive learned successful strategy from {agent_id}: {learning_data.get('name', 'unknown')}")
 
         elif learning_type == 'failed_strategy':
-            self.shared_knowledge['failed_strategies'].append(learning)
             LOG.info(f"Hive learned failed strategy from {agent_id}: {learning_data.get('name', 'unknown')}")
 
-        elif learning_type == 'customer_insight':
-            self.shared_knowledge['customer_insights'].append(learning)
-
-        elif learning_type == 'optimization':
-            self.shared_knowledge['optimization_learnings'].append(learning)
-
-        elif learning_type == 'market_intelligence':
-            self.shared_knowledge['market_intelligence'].append(learning)
-
         # Update agent's performance score
         self.agents[agent_id].performance_score = min(
             self.agents[agent_id].performance_score + 0.02,
@@ -483,31 +523,33 @@ class HiveMindCoordinator:
             'active_agents': len(active_agents),
             'message_queue_size': len(self.message_queue),
             'shared_knowledge': {
-                'successful_strategies': len(self.shared_knowledge['successful_strategies']),
-                'failed_strategies': len(self.shared_knowledge['failed_strategies']),
-                'customer_insights': len(self.shared_knowledge['customer_insights']),
-                'optimization_learnings': len(self.shared_knowledge['optimization_learnings']),
-                'market_intelligence': len(self.shared_knowledge['market_intelligence'])
+                category: self.knowledge_store.count(category)
+                for category in LEARNING_CATEGORIES.values()
             },
             'agents_by_type': {}
         }
 
         # Count agents by type
-        for agent in self.agents.values():
-            agent_type = agent.agent_type.value
-            if agent_type not in status['agents_by_type']:
-                status['agents_by_type'][agent_type] = 0
-            status['agents_by_type'][agent_type] += 1
+        for agent_type, agents in self.agents_by_type.items():
+            if agents:
+                status['agents_by_type'][agent_type.value] = len(agents)
 
         return status
 
     def export_hive_knowledge(self, output_path: str = "hive_knowledge_export.json"):
-        """Export all hive knowledge for persistence"""
+        """
+        Export agents plus the capped knowledge working sets and counters.
+
+        Older learnings are not kept anywhere: compaction folds them into the
+        per-category and per-agent counters and then deletes the segments, so
+        only the most recent learnings per category survive verbatim. This
+        export stays the same size no matter how much the hive has learned.
+        """
 
         export = {
             'timestamp': time.time(),
             'agents': {agent_id: agent.to_dict() for agent_id, agent in self.agents.items()},
-            'shared_knowledge': self.shared_knowledge,
+            'shared_knowledge': self.knowledge_store.export(),
             'status': self.get_hive_status()
         }
 
@@ -483,7 +483,10 @@ class SendGridService:
         html_content: str,
         from_name: str = "Better Business Builder",
     ) -> Dict[str, int]:
-        """Send bulk emails via SendGrid."""
+        """Send bulk emails via SendGrid, one request per 1000 recipients (blocking).
+
+        Prefer send_bulk_email_async for large campaigns.
+        """
         if not self.client:
             raise HTTPException(
                 status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="SendGrid not configured"
@@ -492,15 +495,58 @@ class SendGridService:
         success_count = 0
         failure_count = 0
 
-        for email in to_emails:
+        for start in range(0, len(to_emails), 1000):
+            batch = to_emails[start:start + 1000]
             try:
-                self.send_email(email, subject, html_content, from_name)
-                success_count += 1
-            except:
-                failure_count += 1
+                message = Mail(
+                    from_email=Email(self.from_email, from_name),
+                    to_emails=[To(email) for email in batch],
+                    subject=subject,
+                    html_content=Content("text/html", html_content),
+                    is_multiple=True,
+                )
+                response = self.client.send(message)
+                if response.status_code == 202:
+                    success_count += len(batch)
+                else:
+                    failure_count += len(batch)
+            except Exception:
+                failure_count += len(batch)
 
         return {"success": success_count, "failed": failure_count}
 
+    async def send_bulk_email_async(
+        self,
+        to_emails: List[str],
+        subject: str,
+        html_content: str,
+        from_name: str = "Better Business Builder",
+        lead_ids: Optional[List] = None,
+        db=None,
+        **sender_options,
+    ) -> Dict[str, int]:
+        """Send bulk emails with batched, concurrent, rate-limited requests.
+
+        When ``db`` and ``lead_ids`` (parallel to ``to_emails``) are given, every
+        recipient's outcome is stored as an OutreachAttempt.
+        """
+        if not self.api_key:
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="SendGrid not configured"
+            )
+        from ..bulk_email import BulkEmailSender, EmailRecipient, OutreachAttemptRecorder
+
+        sender = BulkEmailSender(self.api_key, self.from_email, from_name, **sender_options)
+        recipients = [
+            EmailRecipient(email, lead_ids[i] if lead_ids else None)
+            for i, email in enumerate(to_emails)
+        ]
+        recorder = OutreachAttemptRecorder(db, task=subject) if db is not None else None
+        report = await sender.send(recipients, subject, html_content, on_outcomes=recorder)
+        if recorder:
+            recorder.flush()
+        return {"success": report.sent, "failed": report.failed}
+
     def send_transactional_email(self, to_email: str, template_id: str, dynamic_data: Dict) -> bool:
         """Send transactional email using SendGrid template."""
         if not self.client:
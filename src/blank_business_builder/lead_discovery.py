@@ -0,0 +1,214 @@
+"""
+Concurrent lead discovery: search, enrich, de-duplicate and bulk-store.
+
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+The provider clients are synchronous (requests), so every provider call runs
+in a thread pool sized to the enrichment concurrency. Enrichment is bounded by a semaphore and paced by a
+per-provider token bucket. Emails already stored as LeadRecords are filtered out with one
+``IN (...)`` query before any enrichment is spent on them, and all surviving
+LeadRecord / LeadEnrichment rows are written with one executemany per table
+and a single commit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from .database import LeadEnrichment, LeadRecord
+
+logger = logging.getLogger(__name__)
+
+# Enrichment calls per second allowed for each provider
+DEFAULT_RATE_LIMITS: Dict[str, float] = {"apollo": 10.0}
+
+
+class AsyncRateLimiter:
+    """Token bucket: ``rate`` acquisitions per second with bursts up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+
+def _company_name(person: Dict[str, Any]) -> Optional[str]:
+    organization = person.get("organization")
+    if isinstance(organization, dict):
+        return organization.get("name")
+    return person.get("organization_name")
+
+
+def lead_fields(person: Dict[str, Any], enrich: Any) -> Dict[str, Any]:
+    """LeadRecord column values for a search result and its enrichment payload."""
+    payload_person = (
+        enrich.get("person")
+        if isinstance(enrich, dict) and isinstance(enrich.get("person"), dict)
+        else person
+    )
+    return {
+        "external_id": str(payload_person.get("id") or person.get("id") or ""),
+        "source": "apollo",
+        "first_name": payload_person.get("first_name"),
+        "last_name": payload_person.get("last_name"),
+        "full_name": (
+            payload_person.get("name")
+            or f"{payload_person.get('first_name', '')} {payload_person.get('last_name', '')}".strip()
+        ),
+        "company": payload_person.get("organization_name")
+        or (payload_person.get("organization") or {}).get("name")
+        if isinstance(payload_person.get("organization"), dict)
+        else payload_person.get("company"),
+        "title": payload_person.get("title") or payload_person.get("headline"),
+        "email": payload_person.get("email"),
+        "phone": payload_person.get("phone") or payload_person.get("phone_number"),
+        "status": "new",
+    }
+
+
+def known_emails(db: Session, emails: Iterable[str]) -> Set[str]:
+    """Emails among ``emails`` that already belong to a LeadRecord (one query)."""
+    emails = list(emails)
+    if not emails:
+        return set()
+    rows = db.execute(select(LeadRecord.email).where(LeadRecord.email.in_(emails)))
+    return {email for (email,) in rows}
+
+
+class LeadDiscoveryPipeline:
+    """Search Apollo, enrich new people concurrently and store them in bulk."""
+
+    provider = "apollo"
+
+    def __init__(
+        self,
+        apollo,
+        max_concurrency: int = 8,
+        rate_limits: Optional[Dict[str, float]] = None,
+    ):
+        self.apollo = apollo
+        self.max_concurrency = max_concurrency
+        limits = {**DEFAULT_RATE_LIMITS, **(rate_limits or {})}
+        self.limiters = {
+            provider: AsyncRateLimiter(rate, burst=max(1, max_concurrency))
+            for provider, rate in limits.items()
+        }
+        self.stats = {"found": 0, "duplicates": 0, "enriched": 0, "enrich_failed": 0, "stored": 0}
+
+    async def discover(
+        self,
+        db: Session,
+        keywords: str,
+        organization_name: Optional[str] = None,
+        per_page: int = 10,
+    ) -> List[Dict[str, Any]]:
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="lead-enrich") as pool:
+            return await self._discover(pool, db, keywords, organization_name, per_page)
+
+    async def _discover(self, pool, db, keywords, organization_name, per_page):
+        loop = asyncio.get_running_loop()
+        search = await loop.run_in_executor(pool, functools.partial(
+            self.apollo.search_people,
+            q_keywords=keywords,
+            q_organization_name=organization_name,
+            per_page=per_page,
+        ))
+        people = search.get("people") or search.get("contacts") or []
+        self.stats["found"] += len(people)
+
+        search_emails = {p.get("email") for p in people if p.get("email")}
+        known = known_emails(db, search_emails)
+        fresh, batch_emails = [], set()
+        for person in people:
+            email = person.get("email")
+            if email and (email in known or email in batch_emails):
+                self.stats["duplicates"] += 1
+                continue
+            batch_emails.add(email)
+            fresh.append(person)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        enrichments = await asyncio.gather(*(self._enrich(pool, person, semaphore) for person in fresh))
+        leads = [lead_fields(person, enrich) for person, enrich in zip(fresh, enrichments)]
+
+        # Enrichment can reveal emails the search results did not carry
+        known |= known_emails(db, {lead["email"] for lead in leads if lead["email"]} - search_emails)
+
+        now = datetime.utcnow()
+        lead_rows, enrichment_rows, stored, accepted = [], [], [], set()
+        for lead, enrich in zip(leads, enrichments):
+            email = lead["email"]
+            if email and (email in known or email in accepted):
+                self.stats["duplicates"] += 1
+                continue
+            accepted.add(email)
+            lead_id = uuid.uuid4()
+            lead_rows.append({"id": lead_id, "outreach_priority": 0, "created_at": now, "updated_at": now, **lead})
+            enrichment_rows.append({
+                "id": uuid.uuid4(),
+                "lead_id": lead_id,
+                "provider": self.provider,
+                "payload": enrich if isinstance(enrich, dict) else {},
+                "created_at": now,
+            })
+            stored.append({"lead_id": str(lead_id), "name": lead["full_name"], "company": lead["company"]})
+
+        self._store(db, lead_rows, enrichment_rows)
+        self.stats["stored"] += len(stored)
+        logger.info(
+            "lead_discovery found=%d duplicates=%d enriched=%d enrich_failed=%d stored=%d",
+            len(people), self.stats["duplicates"], self.stats["enriched"],
+            self.stats["enrich_failed"], len(stored),
+        )
+        return stored
+
+    async def _enrich(self, pool, person: Dict[str, Any], semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        async with semaphore:
+            await self.limiters[self.provider].acquire()
+            try:
+                enrich = await asyncio.get_running_loop().run_in_executor(pool, functools.partial(
+                    self.apollo.enrich_person,
+                    email=person.get("email"),
+                    linkedin_url=person.get("linkedin_url"),
+                    first_name=person.get("first_name"),
+                    last_name=person.get("last_name"),
+                    company_name=_company_name(person),
+                ))
+            except Exception as exc:
+                logger.debug("Apollo enrichment failed for %s: %s", person.get("id"), exc)
+                self.stats["enrich_failed"] += 1
+                return {}
+        self.stats["enriched"] += 1
+        return enrich
+
+    @staticmethod
+    def _store(db: Session, lead_rows: List[Dict[str, Any]], enrichment_rows: List[Dict[str, Any]]) -> None:
+        if lead_rows:
+            db.execute(insert(LeadRecord.__table__), lead_rows)
+            db.execute(insert(LeadEnrichment.__table__), enrichment_rows)
+        db.commit()
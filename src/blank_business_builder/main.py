@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime, timedelta
 import asyncio
+import json
 import uvicorn
 import os
 from pathlib import Path
@@ -18,6 +19,7 @@ from pathlib import Path
 from .config import settings
 
 from .database import get_db, User, Business, BusinessPlan, MarketingCampaign
+from .metric_rollups import GRANULARITIES, business_series
 from .auth import (
     AuthService,
     get_current_user,
@@ -26,7 +28,8 @@ from .auth import (
     require_license_access,
     require_quantum_access
 )
-from .payments import StripeService, handle_webhook_event
+from .payments import StripeService
+from .stripe_inbox import record_stripe_event
 from .integrations import IntegrationFactory
 from .self_healing import build_self_healing_orchestrator, self_healing_enabled
 from pydantic import BaseModel
@@ -400,6 +403,39 @@ async def list_businesses(
     ]
 
 
+@app.get("/api/v1/businesses/{business_id}/metrics")
+async def business_metrics_history(
+    business_id: str,
+    granularity: str = "hour",
+    limit: int = 24,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Metric history of a business from the minute/hour/day rollups."""
+    if granularity not in GRANULARITIES or not 1 <= limit <= 1440:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"granularity must be one of {', '.join(GRANULARITIES)} and limit between 1 and 1440"
+        )
+
+    business = db.query(Business).filter(
+        Business.id == business_id,
+        Business.user_id == current_user.id
+    ).first()
+
+    if not business:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Business not found"
+        )
+
+    return {
+        "business_id": str(business.id),
+        "granularity": granularity,
+        "points": business_series(db, business.id, granularity=granularity, limit=limit)
+    }
+
+
 # AI-powered endpoints
 @app.post("/api/v1/ai/generate-business-plan")
 @rate_limit(max_requests=10, window_seconds=3600)
@@ -582,14 +618,18 @@ async def create_portal_session(
 
 @app.post("/api/v1/webhooks/stripe")
 async def stripe_webhook(request: Request, db: Session = Depends(get_db)):
-    """Handle Stripe webhooks."""
+    """Verify a Stripe webhook and queue it in the event inbox.
+
+    The event is applied later by the inbox worker (tasks.process_stripe_inbox);
+    deliveries of an event ID already in the inbox are acknowledged and dropped.
+    """
     payload = await request.body()
     sig_header = request.headers.get("stripe-signature")
 
     try:
-        event = StripeService.verify_webhook_signature(payload, sig_header)
-        handle_webhook_event(event, db)
-        return {"status": "success"}
+        StripeService.verify_webhook_signature(payload, sig_header)
+        queued = record_stripe_event(db, json.loads(payload))
+        return {"status": "success", "duplicate": not queued}
 
     except HTTPException as e:
         raise e
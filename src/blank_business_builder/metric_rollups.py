@@ -0,0 +1,363 @@
+"""
+Incremental minute / hour / day rollups of MetricsHistory.
+
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+MetricRollupEngine reads only the MetricsHistory rows ingested since its
+stored watermark. Each row marks its (business, minute) bucket as affected,
+wherever its ``timestamp`` falls, so data arriving late simply re-rolls the
+old buckets it lands in. Affected minutes are rebuilt from their raw rows,
+hours from their minutes, days from their hours, and global buckets from the
+business buckets of the same period; every rebuilt bucket is upserted and the
+watermark moves forward in the same transaction. Rebuilding whole buckets
+keeps a run idempotent, so each run re-reads a short ``overlap`` before the
+watermark to pick up rows from transactions that committed late.
+
+The dashboard and API read the rollup tables through ``business_series`` and
+``global_series`` instead of scanning MetricsHistory.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import and_, bindparam, func, insert, select
+
+from .database import BusinessMetricRollup, GlobalMetricRollup, MetricsHistory, RollupWatermark
+
+logger = logging.getLogger(__name__)
+
+METRICS = (
+    "revenue", "customers", "leads", "conversion_rate",
+    "tasks_completed", "tasks_pending", "tasks_failed",
+)
+GRANULARITIES = ("minute", "hour", "day")
+BUCKET_WIDTH = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+SUMMARY_COLUMNS = ("samples", "first_timestamp", "last_timestamp") + tuple(
+    f"{metric}_{kind}" for metric in METRICS for kind in ("sum", "last")
+)
+
+BucketKey = Tuple[Any, datetime]
+
+
+def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    """Start of the minute, hour or day containing ``timestamp``."""
+    if granularity == "minute":
+        return timestamp.replace(second=0, microsecond=0)
+    if granularity == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unknown granularity: {granularity}")
+
+
+def bucket_ranges(starts: Iterable[datetime], granularity: str) -> List[Tuple[datetime, datetime]]:
+    """Collapse bucket starts into [start, end) ranges of consecutive buckets."""
+    width = BUCKET_WIDTH[granularity]
+    ranges: List[List[datetime]] = []
+    for start in sorted(set(starts)):
+        if ranges and ranges[-1][1] == start:
+            ranges[-1][1] = start + width
+        else:
+            ranges.append([start, start + width])
+    return [(start, end) for start, end in ranges]
+
+
+def _empty_summary() -> Dict[str, Any]:
+    summary: Dict[str, Any] = {"samples": 0, "first_timestamp": None, "last_timestamp": None}
+    for metric in METRICS:
+        summary[f"{metric}_sum"] = 0
+        summary[f"{metric}_last"] = 0
+    return summary
+
+
+def merge_summary(into: Dict[str, Any], part: Dict[str, Any]) -> None:
+    """Fold one summary (a raw sample or a finer bucket) into another."""
+    if not part["samples"]:
+        return
+    into["samples"] += part["samples"]
+    if into["first_timestamp"] is None or part["first_timestamp"] < into["first_timestamp"]:
+        into["first_timestamp"] = part["first_timestamp"]
+    newer = into["last_timestamp"] is None or part["last_timestamp"] >= into["last_timestamp"]
+    if newer:
+        into["last_timestamp"] = part["last_timestamp"]
+    for metric in METRICS:
+        into[f"{metric}_sum"] += part[f"{metric}_sum"] or 0
+        if newer:
+            into[f"{metric}_last"] = part[f"{metric}_last"] or 0
+
+
+def _sample_summary(row) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {"samples": 1, "first_timestamp": row.timestamp, "last_timestamp": row.timestamp}
+    for metric in METRICS:
+        value = getattr(row, metric) or 0
+        summary[f"{metric}_sum"] = value
+        summary[f"{metric}_last"] = value
+    return summary
+
+
+def upsert_rows(conn, table, rows: Sequence[Dict[str, Any]], keys: Sequence[str]) -> None:
+    """Insert ``rows`` or overwrite the rows already stored under the same key."""
+    if not rows:
+        return
+    if conn.dialect.name in ("postgresql", "sqlite"):
+        if conn.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={name: stmt.excluded[name] for name in rows[0] if name not in keys},
+        )
+        conn.execute(stmt, list(rows))
+        return
+    match = and_(*(table.c[key] == bindparam(f"key_{key}") for key in keys))
+    conn.execute(table.delete().where(match), [{f"key_{key}": row[key] for key in keys} for row in rows])
+    conn.execute(insert(table), list(rows))
+
+
+@dataclass
+class RollupReport:
+    """Outcome of one MetricRollupEngine.run call."""
+    rows_consumed: int = 0
+    buckets: Dict[str, int] = field(default_factory=dict)
+    global_buckets: Dict[str, int] = field(default_factory=dict)
+    watermark: Optional[datetime] = None
+    elapsed_seconds: float = 0.0
+
+
+class MetricRollupEngine:
+    """Keep the metric rollup tables up to date from new MetricsHistory rows.
+
+    ``overlap`` is how far before the watermark each run starts reading; it
+    should exceed the longest transaction that writes MetricsHistory.
+    Affected buckets are re-read with one indexed query per run of
+    consecutive buckets; past ``scan_threshold`` such runs a single pass over
+    the period they span is cheaper. ``chunk_size`` caps the buckets looked
+    up per global rollup query.
+    """
+
+    def __init__(
+        self,
+        engine,
+        name: str = "metrics_history",
+        overlap: timedelta = timedelta(minutes=2),
+        scan_threshold: int = 2000,
+        chunk_size: int = 500,
+    ):
+        self.engine = engine
+        self.name = name
+        self.overlap = overlap
+        self.scan_threshold = scan_threshold
+        self.chunk_size = chunk_size
+
+    def run(self) -> RollupReport:
+        report = RollupReport()
+        start = time.perf_counter()
+        with self.engine.begin() as conn:
+            watermark = conn.execute(
+                select(RollupWatermark.watermark).where(RollupWatermark.name == self.name)
+            ).scalar()
+            keys, report.rows_consumed, newest = self._affected_minutes(conn, watermark)
+
+            finer = None
+            for granularity in GRANULARITIES:
+                if finer is not None:
+                    keys = {(business_id, bucket_start(ts, granularity)) for business_id, ts in keys}
+                rows = self._roll_business(conn, granularity, finer, keys)
+                upsert_rows(conn, BusinessMetricRollup.__table__, rows, ("business_id", "granularity", "bucket_start"))
+                global_rows = self._roll_global(conn, granularity, {ts for _, ts in keys})
+                upsert_rows(conn, GlobalMetricRollup.__table__, global_rows, ("granularity", "bucket_start"))
+                report.buckets[granularity] = len(rows)
+                report.global_buckets[granularity] = len(global_rows)
+                finer = granularity
+
+            report.watermark = max(filter(None, (watermark, newest)), default=None)
+            if newest is not None:
+                upsert_rows(conn, RollupWatermark.__table__, [{
+                    "name": self.name,
+                    "watermark": report.watermark,
+                    "updated_at": datetime.utcnow(),
+                }], ("name",))
+
+        report.elapsed_seconds = time.perf_counter() - start
+        logger.info(
+            "metric_rollups consumed=%d minutes=%d hours=%d days=%d watermark=%s elapsed=%.3fs",
+            report.rows_consumed, report.buckets["minute"], report.buckets["hour"],
+            report.buckets["day"], report.watermark, report.elapsed_seconds,
+        )
+        return report
+
+    def _affected_minutes(self, conn, watermark: Optional[datetime]):
+        """(business_id, minute) buckets holding rows ingested since the watermark."""
+        table = MetricsHistory.__table__
+        query = select(table.c.business_id, table.c.timestamp, table.c.ingested_at)
+        if watermark is not None:
+            query = query.where(table.c.ingested_at > watermark - self.overlap)
+        keys: Set[BucketKey] = set()
+        consumed = 0
+        newest = None
+        for business_id, timestamp, ingested_at in conn.execution_options(yield_per=10000).execute(query):
+            consumed += 1
+            if ingested_at is not None and (newest is None or ingested_at > newest):
+                newest = ingested_at
+            if timestamp is not None:
+                keys.add((business_id, bucket_start(timestamp, "minute")))
+        return keys, consumed, newest
+
+    @staticmethod
+    def _ranges(keys: Iterable[BucketKey], granularity: str) -> List[Tuple[Any, datetime, datetime]]:
+        """(business_id, start, end) ranges covering the keys of each business."""
+        by_business: Dict[Any, List[datetime]] = {}
+        for business_id, start in keys:
+            by_business.setdefault(business_id, []).append(start)
+        return [
+            (business_id, start, end)
+            for business_id, starts in by_business.items()
+            for start, end in bucket_ranges(starts, granularity)
+        ]
+
+    def _roll_business(
+        self, conn, granularity: str, finer: Optional[str], keys: Set[BucketKey]
+    ) -> List[Dict[str, Any]]:
+        """Rebuild the business buckets in ``keys`` from raw rows or the next finer rollup."""
+        summaries: Dict[BucketKey, Dict[str, Any]] = {key: _empty_summary() for key in keys}
+        if finer is None:
+            source = MetricsHistory.__table__
+            time_column = source.c.timestamp
+            query = select(source.c.business_id, time_column, *(source.c[metric] for metric in METRICS))
+            query = query.order_by(time_column)
+            to_summary = _sample_summary
+        else:
+            source = BusinessMetricRollup.__table__
+            time_column = source.c.bucket_start
+            query = select(source.c.business_id, time_column, *(source.c[name] for name in SUMMARY_COLUMNS))
+            query = query.where(source.c.granularity == finer)
+            to_summary = attrgetter("_mapping")
+
+        ranges = self._ranges(keys, granularity)
+        if len(ranges) > self.scan_threshold:
+            # Too many lookups (e.g. the first run): one pass over the period they cover
+            scan = query.where(
+                time_column >= min(start for _, start, _ in ranges),
+                time_column < max(end for _, _, end in ranges),
+            )
+            lookups = [conn.execution_options(yield_per=10000).execute(scan)]
+        else:
+            # One indexed range scan per run of consecutive buckets, all sharing a compiled statement
+            query = query.where(
+                source.c.business_id == bindparam("business_id"),
+                time_column >= bindparam("start"),
+                time_column < bindparam("end"),
+            )
+            lookups = (conn.execute(query, {"business_id": business_id, "start": start, "end": end})
+                       for business_id, start, end in ranges)
+
+        for rows in lookups:
+            for row in rows:
+                summary = summaries.get((row[0], bucket_start(row[1], granularity)))
+                if summary is not None:
+                    merge_summary(summary, to_summary(row))
+
+        now = datetime.utcnow()
+        return [
+            dict(summary, business_id=business_id, granularity=granularity, bucket_start=start, updated_at=now)
+            for (business_id, start), summary in summaries.items()
+            if summary["samples"]
+        ]
+
+    def _roll_global(self, conn, granularity: str, starts: Set[datetime]) -> List[Dict[str, Any]]:
+        """Rebuild the global buckets in ``starts`` from the business buckets."""
+        table = BusinessMetricRollup.__table__
+        aggregates = [
+            func.count().label("businesses"),
+            func.sum(table.c.samples).label("samples"),
+            func.min(table.c.first_timestamp).label("first_timestamp"),
+            func.max(table.c.last_timestamp).label("last_timestamp"),
+        ] + [
+            func.sum(table.c[name]).label(name) for name in SUMMARY_COLUMNS[3:]
+        ]
+        ordered = sorted(starts)
+        now = datetime.utcnow()
+        rows = []
+        for i in range(0, len(ordered), self.chunk_size):
+            query = select(table.c.bucket_start, *aggregates).where(
+                table.c.granularity == granularity,
+                table.c.bucket_start.in_(ordered[i:i + self.chunk_size]),
+            ).group_by(table.c.bucket_start)
+            for row in conn.execute(query):
+                rows.append(dict(row._mapping, granularity=granularity, updated_at=now))
+        return rows
+
+
+def _point(row) -> Dict[str, Any]:
+    samples = row.samples or 0
+    point: Dict[str, Any] = {
+        "bucket_start": row.bucket_start.isoformat(),
+        "samples": samples,
+        "last": {},
+        "average": {},
+    }
+    for metric in METRICS:
+        total = getattr(row, f"{metric}_sum") or 0
+        point["last"][metric] = float(getattr(row, f"{metric}_last") or 0)
+        point["average"][metric] = float(Decimal(total) / samples) if samples else 0.0
+    return point
+
+
+def _since(granularity: str, start: Optional[datetime], end: Optional[datetime], limit: int):
+    if granularity not in BUCKET_WIDTH:
+        raise ValueError(f"Unknown granularity: {granularity}")
+    end = end or datetime.utcnow()
+    return start or bucket_start(end, granularity) - BUCKET_WIDTH[granularity] * (limit - 1), end
+
+
+def business_series(
+    db,
+    business_id,
+    granularity: str = "hour",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = 24,
+) -> List[Dict[str, Any]]:
+    """Rollup points of one business, oldest first (the last ``limit`` buckets by default)."""
+    start, end = _since(granularity, start, end, limit)
+    table = BusinessMetricRollup.__table__
+    rows = db.execute(
+        select(table)
+        .where(
+            table.c.business_id == business_id,
+            table.c.granularity == granularity,
+            table.c.bucket_start >= start,
+            table.c.bucket_start <= end,
+        )
+        .order_by(table.c.bucket_start)
+    )
+    return [_point(row) for row in rows]
+
+
+def global_series(
+    db,
+    granularity: str = "hour",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = 24,
+) -> List[Dict[str, Any]]:
+    """Rollup points across all businesses, oldest first."""
+    start, end = _since(granularity, start, end, limit)
+    table = GlobalMetricRollup.__table__
+    rows = db.execute(
+        select(table)
+        .where(table.c.granularity == granularity, table.c.bucket_start >= start, table.c.bucket_start <= end)
+        .order_by(table.c.bucket_start)
+    )
+    return [dict(_point(row), businesses=row.businesses) for row in rows]
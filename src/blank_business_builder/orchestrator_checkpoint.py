@@ -0,0 +1,175 @@
+"""
+SQLite checkpoints for AutonomousBusinessOrchestrator state.
+
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+The orchestrator tracks which tasks changed since the last checkpoint and hands
+only those rows (plus agent performance and counters) to
+OrchestratorCheckpoint.write, which runs in an executor thread so the event
+loop never waits on disk. Resuming reads the rows back and rebuilds the queue
+indexes directly, without replaying task history or regenerating tasks.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import closing
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+# (seq, task_id, role, description, status, assigned_to, created_at, completed_at,
+#  result, dependencies, priority, attempts). result/dependencies are Python
+# objects when written and decoded back to objects by load().
+TaskRow = Tuple[int, str, str, str, str, Optional[str], float, Optional[float], Optional[Dict], List[str], int, int]
+
+# (agent_id, role, tasks_completed, success_rate, average_completion_time,
+#  revenue_generated, confidence_score, last_active, knowledge_graph)
+AgentRow = Tuple[str, str, int, float, float, float, float, float, Dict]
+
+
+class OrchestratorCheckpoint:
+    """Compact SQLite store for one orchestrator's tasks, agents and counters."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._write_lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Callers use ``closing(...)`` as well: the connection's own context
+        # manager only commits or rolls back, it does not close
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    task_id TEXT PRIMARY KEY,
+                    role TEXT NOT NULL,
+                    description TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    assigned_to TEXT,
+                    created_at REAL,
+                    completed_at REAL,
+                    result TEXT,
+                    dependencies TEXT,
+                    priority INTEGER,
+                    attempts INTEGER DEFAULT 0,
+                    seq INTEGER
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS agents (
+                    agent_id TEXT PRIMARY KEY,
+                    role TEXT NOT NULL,
+                    tasks_completed INTEGER,
+                    success_rate REAL,
+                    average_completion_time REAL,
+                    revenue_generated REAL,
+                    confidence_score REAL,
+                    last_active REAL,
+                    knowledge_graph TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS state (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+            conn.execute(
+                "INSERT OR IGNORE INTO state (key, value) VALUES ('schema_version', ?)",
+                (json.dumps(SCHEMA_VERSION),),
+            )
+
+    def write(
+        self,
+        task_rows: Iterable[TaskRow],
+        agent_rows: Iterable[AgentRow],
+        state: Dict[str, Any],
+    ) -> int:
+        """
+        Upsert changed tasks, all agents and the counters in one transaction.
+
+        ``seq`` is the task's position in the orchestrator queue so resume can
+        restore the original order. JSON encoding happens here, on the writer
+        thread. Returns the number of task rows written.
+        """
+        rows = [
+            (
+                task_id, role, description, status, assigned_to, created_at, completed_at,
+                json.dumps(result, default=str) if result is not None else None,
+                json.dumps(dependencies), priority, attempts, seq,
+            )
+            for (seq, task_id, role, description, status, assigned_to, created_at,
+                 completed_at, result, dependencies, priority, attempts) in task_rows
+        ]
+        agents = [
+            row[:-1] + (json.dumps(row[-1], default=str),)
+            for row in agent_rows
+        ]
+        with self._write_lock, closing(self._connect()) as conn, conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO tasks (
+                    task_id, role, description, status, assigned_to, created_at,
+                    completed_at, result, dependencies, priority, attempts, seq
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO agents (
+                    agent_id, role, tasks_completed, success_rate, average_completion_time,
+                    revenue_generated, confidence_score, last_active, knowledge_graph
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                agents,
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value, default=str)) for key, value in state.items()],
+            )
+        return len(rows)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the checkpointed tasks, agents and state, or None if empty."""
+        with closing(self._connect()) as conn, conn:
+            state = {
+                key: json.loads(value)
+                for key, value in conn.execute("SELECT key, value FROM state")
+            }
+            if "metrics" not in state:
+                return None
+            tasks: List[TaskRow] = [
+                row[:8] + (
+                    json.loads(row[8]) if row[8] is not None else None,
+                    json.loads(row[9]) if row[9] else [],
+                ) + row[10:]
+                for row in conn.execute(
+                    """
+                    SELECT seq, task_id, role, description, status, assigned_to, created_at,
+                           completed_at, result, dependencies, priority, attempts
+                    FROM tasks ORDER BY seq
+                    """
+                )
+            ]
+            agents: List[AgentRow] = [
+                row[:-1] + (json.loads(row[-1]) if row[-1] else {},)
+                for row in conn.execute(
+                    """
+                    SELECT agent_id, role, tasks_completed, success_rate, average_completion_time,
+                           revenue_generated, confidence_score, last_active, knowledge_graph
+                    FROM agents
+                    """
+                )
+            ]
+        return {"tasks": tasks, "agents": agents, "state": state}
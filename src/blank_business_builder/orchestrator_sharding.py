@@ -0,0 +1,499 @@
+"""
+Multi-process sharding for AutonomousBusinessOrchestrator.
+
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+A ShardSupervisor spreads business IDs over N worker processes with
+rendezvous (highest-random-weight) hashing. Each worker runs every orchestrator
+assigned to it in a single asyncio loop and shares one HiveMindCoordinator and
+one set of service clients (backed by a single ECH0Service LLM transport)
+between them. The supervisor talks to workers over multiprocessing pipes.
+Every request is ``(seq, command, payload)`` and every reply ``(seq, result)``;
+a reply whose ``seq`` does not match (a late answer to a request that timed
+out) is discarded:
+
+    ("add", [spec, ...])      -> number of businesses started
+    ("remove", [business_id]) -> number of businesses stopped
+    ("metrics", detailed)     -> aggregated shard dashboard
+    ("stop", None)            -> worker exits
+
+When a worker dies its businesses are re-hashed over the surviving workers.
+Rendezvous hashing means businesses on healthy workers never move. If no
+worker survives they are kept as unplaced and started on the next start().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CYCLE_INTERVAL = 5.0  # Matches AutonomousBusinessOrchestrator.run_autonomous_loop
+COMMAND_POLL_INTERVAL = 0.05
+ADD_BATCH_SIZE = 500
+
+
+@dataclass
+class BusinessSpec:
+    """Everything a worker needs to start an orchestrator for one business."""
+
+    business_id: str
+    business_concept: str
+    founder_name: str
+
+
+def _hash_weight(worker_index: int, business_id: str) -> int:
+    digest = hashlib.blake2b(f"{worker_index}:{business_id}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def shard_for(business_id: str, workers: List[int]) -> int:
+    """
+    Pick the worker for a business with rendezvous hashing.
+
+    Stable across processes (unlike ``hash()``), and removing a worker only
+    moves the businesses that were on it.
+    """
+    if not workers:
+        raise ValueError("No workers available")
+    return max(workers, key=lambda worker_index: _hash_weight(worker_index, business_id))
+
+
+# ---------------------------------------------------------------------- #
+# Worker process
+# ---------------------------------------------------------------------- #
+
+
+class SimulatedServices:
+    """
+    Offline stand-in for the market research / email / payment / social clients.
+
+    Used for load tests and dry runs so thousands of simulated businesses don't
+    hit Ollama, SendGrid or Stripe.
+    """
+
+    async def scrape_competitors(self, urls: List[str]) -> Dict[str, str]:
+        return {url: "" for url in urls}
+
+    async def google_search(self, query: str) -> Dict:
+        return {"query": query, "results": []}
+
+    async def send_email(self, *args, **kwargs) -> bool:
+        return True
+
+    async def post_tweet(self, text: str) -> bool:
+        return True
+
+    async def create_checkout_session(self, *args, **kwargs) -> str:
+        return "https://example.com/checkout/simulated"
+
+
+def _shared_services(simulate: bool) -> Dict[str, Any]:
+    """One set of service clients per process, all on a single ECH0 transport."""
+    if simulate:
+        services = SimulatedServices()
+        return {
+            "market_research": services,
+            "email_service": services,
+            "payment_processor": services,
+            "social_media": services,
+        }
+
+    from .ech0_service import ECH0Service
+    from .features.email_service import EmailService
+    from .features.market_research import MarketResearch
+    from .features.payment_processor import PaymentProcessor
+    from .features.social_media import SocialMedia
+
+    transport = ECH0Service()
+    clients = {
+        "market_research": MarketResearch(api_key=os.getenv("MARKET_RESEARCH_API_KEY")),
+        "email_service": EmailService(api_key=os.getenv("SENDGRID_API_KEY")),
+        "payment_processor": PaymentProcessor(api_key=os.getenv("STRIPE_SECRET_KEY")),
+        "social_media": SocialMedia(
+            consumer_key=os.getenv("TWITTER_CONSUMER_KEY", ""),
+            consumer_secret=os.getenv("TWITTER_CONSUMER_SECRET", ""),
+            access_token=os.getenv("TWITTER_ACCESS_TOKEN", ""),
+            access_token_secret=os.getenv("TWITTER_ACCESS_TOKEN_SECRET", ""),
+        ),
+    }
+    for client in clients.values():
+        client.ech0_service = transport
+    return clients
+
+
+class ShardWorker:
+    """Runs many orchestrators in one event loop with a shared hive and transport."""
+
+    def __init__(
+        self,
+        worker_index: int,
+        conn,
+        cycle_interval: float = DEFAULT_CYCLE_INTERVAL,
+        simulate: bool = False,
+    ):
+        from .autonomous_business import AutonomousBusinessOrchestrator
+        from .hive_mind_coordinator import HiveMindCoordinator
+
+        self._orchestrator_cls = AutonomousBusinessOrchestrator
+        self.worker_index = worker_index
+        self.conn = conn
+        self.cycle_interval = cycle_interval
+        self.hive_mind = HiveMindCoordinator()
+        self.services = _shared_services(simulate)
+        self.orchestrators: Dict[str, AutonomousBusinessOrchestrator] = {}
+        self.cycles = 0
+        self.last_cycle_seconds = 0.0
+        self.running = False
+
+    async def run(self) -> None:
+        self.running = True
+        cycle_task = asyncio.create_task(self._cycle_loop())
+        try:
+            while self.running:
+                while self.running and self.conn.poll():
+                    seq, command, payload = self.conn.recv()
+                    self.conn.send((seq, await self._handle(command, payload)))
+                await asyncio.sleep(COMMAND_POLL_INTERVAL)
+        except (EOFError, OSError):
+            # Supervisor went away
+            self.running = False
+        finally:
+            cycle_task.cancel()
+            try:
+                await cycle_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _cycle_loop(self) -> None:
+        while self.running:
+            started = time.perf_counter()
+            if self.orchestrators:
+                results = await asyncio.gather(
+                    *(orch.run_cycle(report=False) for orch in list(self.orchestrators.values())),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error(f"[shard {self.worker_index}] Orchestrator cycle failed: {result}")
+            self.cycles += 1
+            self.last_cycle_seconds = time.perf_counter() - started
+            await asyncio.sleep(max(0.0, self.cycle_interval - self.last_cycle_seconds))
+
+    async def _handle(self, command: str, payload: Any) -> Any:
+        if command == "add":
+            return await self._add(payload)
+        if command == "remove":
+            removed = 0
+            for business_id in payload:
+                orch = self.orchestrators.pop(business_id, None)
+                if orch is not None:
+                    orch.running = False
+                    for agent_id in orch.agents:
+                        self.hive_mind.unregister_agent(agent_id)
+                    removed += 1
+            return removed
+        if command == "metrics":
+            return self.get_metrics_dashboard(detailed=bool(payload))
+        if command == "stop":
+            self.running = False
+            return True
+        return {"error": f"Unknown command: {command}"}
+
+    async def _add(self, specs: List[Dict[str, str]]) -> int:
+        started = 0
+        for spec in specs:
+            business_id = spec["business_id"]
+            if business_id in self.orchestrators:
+                continue
+            orch = self._orchestrator_cls(
+                spec["business_concept"],
+                spec["founder_name"],
+                hive_mind=self.hive_mind,
+                business_id=business_id,
+                **self.services,
+            )
+            await orch.deploy_agents()
+            self.orchestrators[business_id] = orch
+            started += 1
+        return started
+
+    def get_metrics_dashboard(self, detailed: bool = False) -> Dict:
+        """Summed metrics for every orchestrator on this shard."""
+        totals = _empty_totals()
+        businesses = {}
+        for business_id, orch in self.orchestrators.items():
+            dashboard = orch.get_metrics_dashboard()
+            _accumulate(totals, dashboard)
+            if detailed:
+                businesses[business_id] = dashboard
+
+        summary = {
+            "worker_index": self.worker_index,
+            "pid": os.getpid(),
+            "businesses": len(self.orchestrators),
+            "hive_agents": len(self.hive_mind.agents),
+            "cycles": self.cycles,
+            "last_cycle_seconds": self.last_cycle_seconds,
+            "totals": totals,
+        }
+        if detailed:
+            summary["business_dashboards"] = businesses
+        return summary
+
+
+def _empty_totals() -> Dict[str, Any]:
+    return {
+        "total_revenue": 0.0,
+        "monthly_revenue": 0.0,
+        "customers": 0,
+        "leads": 0,
+        "tasks_completed": 0,
+        "tasks_pending": 0,
+        "tasks_by_status": {},
+        "agents": 0,
+    }
+
+
+def _accumulate(totals: Dict[str, Any], dashboard: Dict) -> None:
+    metrics = dashboard.get("metrics", dashboard.get("totals", {}))
+    if "revenue" in metrics:
+        # Single orchestrator dashboard
+        totals["total_revenue"] += metrics["revenue"]["total"]
+        totals["monthly_revenue"] += metrics["revenue"]["monthly"]
+        totals["customers"] += metrics["customers"]["total"]
+        totals["leads"] += metrics["customers"]["leads"]
+        totals["tasks_completed"] += metrics["operations"]["tasks_completed"]
+        totals["tasks_pending"] += metrics["operations"]["tasks_pending"]
+        by_status = metrics["operations"]["tasks_by_status"]
+        totals["agents"] += len(dashboard.get("agents", []))
+    else:
+        # Already-summed shard totals
+        for key in ("total_revenue", "monthly_revenue", "customers", "leads",
+                    "tasks_completed", "tasks_pending", "agents"):
+            totals[key] += metrics.get(key, 0)
+        by_status = metrics.get("tasks_by_status", {})
+    for status, count in by_status.items():
+        totals["tasks_by_status"][status] = totals["tasks_by_status"].get(status, 0) + count
+
+
+def _worker_main(worker_index: int, conn, cycle_interval: float, simulate: bool, log_level: int) -> None:
+    logging.getLogger().setLevel(log_level)
+    worker = ShardWorker(worker_index, conn, cycle_interval=cycle_interval, simulate=simulate)
+    asyncio.run(worker.run())
+
+
+# ---------------------------------------------------------------------- #
+# Supervisor
+# ---------------------------------------------------------------------- #
+
+
+class ShardSupervisor:
+    """
+    Owns the worker processes and the business → worker assignment.
+
+    Not thread-safe: drive it from one thread (e.g. the runner's main loop).
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        cycle_interval: float = DEFAULT_CYCLE_INTERVAL,
+        simulate: bool = False,
+        rpc_timeout: float = 30.0,
+        worker_log_level: int = logging.WARNING,
+        mp_context=None,
+    ):
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.cycle_interval = cycle_interval
+        self.simulate = simulate
+        self.rpc_timeout = rpc_timeout
+        self.worker_log_level = worker_log_level
+        self._ctx = mp_context or multiprocessing.get_context()
+
+        self.processes: Dict[int, Any] = {}
+        self.connections: Dict[int, Any] = {}
+        self.specs: Dict[str, BusinessSpec] = {}
+        self.assignments: Dict[str, int] = {}
+        self.unplaced: Dict[str, BusinessSpec] = {}
+        self.rebalanced_businesses = 0
+        self._seq = 0
+
+    # -- lifecycle ------------------------------------------------------ #
+
+    def start(self) -> "ShardSupervisor":
+        for worker_index in range(self.num_workers):
+            parent_conn, child_conn = self._ctx.Pipe()
+            process = self._ctx.Process(
+                target=_worker_main,
+                args=(worker_index, child_conn, self.cycle_interval, self.simulate, self.worker_log_level),
+                name=f"bbb-shard-{worker_index}",
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self.processes[worker_index] = process
+            self.connections[worker_index] = parent_conn
+        logger.info(f"Started {self.num_workers} orchestrator shard workers")
+        if self.unplaced:
+            specs = list(self.unplaced.values())
+            self.unplaced.clear()
+            self.add_businesses(specs)
+        return self
+
+    def stop(self, timeout: float = 10.0) -> None:
+        for worker_index in list(self.alive_workers()):
+            try:
+                self._call(worker_index, "stop", None)
+            except (EOFError, OSError, TimeoutError):
+                pass
+        for process in self.processes.values():
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        for conn in self.connections.values():
+            conn.close()
+        self.processes.clear()
+        self.connections.clear()
+
+    def __enter__(self) -> "ShardSupervisor":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def alive_workers(self) -> List[int]:
+        return [index for index, process in self.processes.items() if process.is_alive()]
+
+    # -- business placement --------------------------------------------- #
+
+    def add_businesses(self, specs: List[BusinessSpec]) -> int:
+        """Hash each business to a worker and start its orchestrator there."""
+        workers = self.alive_workers()
+        batches: Dict[int, List[BusinessSpec]] = {index: [] for index in workers}
+        for spec in specs:
+            if spec.business_id in self.assignments:
+                continue
+            worker_index = shard_for(spec.business_id, workers)
+            batches[worker_index].append(spec)
+            self.specs[spec.business_id] = spec
+            self.assignments[spec.business_id] = worker_index
+        return self._send_batches(batches)
+
+    def add_business(self, business_id: str, business_concept: str, founder_name: str) -> int:
+        return self.add_businesses([BusinessSpec(business_id, business_concept, founder_name)])
+
+    def remove_business(self, business_id: str) -> bool:
+        worker_index = self.assignments.pop(business_id, None)
+        self.specs.pop(business_id, None)
+        self.unplaced.pop(business_id, None)
+        if worker_index is None or worker_index not in self.alive_workers():
+            return False
+        return bool(self._call(worker_index, "remove", [business_id]))
+
+    def check_workers(self) -> List[int]:
+        """
+        Detect dead workers and re-hash their businesses over the survivors.
+
+        With no survivors the businesses are moved to ``unplaced`` (their
+        specs are kept) and started again by the next start(). Returns the
+        indexes of workers found dead on this call.
+        """
+        dead = [index for index, process in self.processes.items() if not process.is_alive()]
+        if not dead:
+            return []
+
+        orphaned = [
+            self.specs[business_id]
+            for business_id, worker_index in self.assignments.items()
+            if worker_index in dead
+        ]
+        for index in dead:
+            logger.error(f"Shard worker {index} (pid {self.processes[index].pid}) died")
+            self.processes.pop(index).join(0)
+            self.connections.pop(index).close()
+
+        for spec in orphaned:
+            del self.assignments[spec.business_id]
+        if not orphaned:
+            return dead
+        if self.alive_workers():
+            self.add_businesses(orphaned)
+            self.rebalanced_businesses += len(orphaned)
+            logger.warning(f"Rebalanced {len(orphaned)} businesses from dead workers {dead}")
+        else:
+            self.unplaced.update((spec.business_id, spec) for spec in orphaned)
+            logger.error(f"No shard workers left; {len(orphaned)} businesses are unplaced until restart")
+        return dead
+
+    # -- metrics ------------------------------------------------------------ #
+
+    def get_metrics_dashboard(self, detailed: bool = False) -> Dict:
+        """Aggregate dashboards from every live shard over IPC."""
+        self.check_workers()
+        shards = []
+        totals = _empty_totals()
+        for worker_index in self.alive_workers():
+            try:
+                shard = self._call(worker_index, "metrics", detailed)
+            except (EOFError, OSError, TimeoutError) as e:
+                logger.error(f"Shard worker {worker_index} did not report metrics: {e}")
+                continue
+            shards.append(shard)
+            _accumulate(totals, shard)
+
+        return {
+            "workers": len(self.processes),
+            "businesses": len(self.assignments),
+            "unplaced_businesses": len(self.unplaced),
+            "rebalanced_businesses": self.rebalanced_businesses,
+            "metrics": totals,
+            "shards": shards,
+        }
+
+    # -- IPC ----------------------------------------------------------------- #
+
+    def _send_batches(self, batches: Dict[int, List[BusinessSpec]]) -> int:
+        # Send every worker its first batch before waiting, so shards deploy in parallel.
+        pending = {
+            index: [asdict(spec) for spec in specs]
+            for index, specs in batches.items() if specs
+        }
+        started = 0
+        while pending:
+            in_flight = []
+            for index in list(pending):
+                chunk, pending[index] = pending[index][:ADD_BATCH_SIZE], pending[index][ADD_BATCH_SIZE:]
+                in_flight.append((index, self._send(index, "add", chunk)))
+                if not pending[index]:
+                    del pending[index]
+            for index, seq in in_flight:
+                started += self._recv(index, seq)
+        return started
+
+    def _call(self, worker_index: int, command: str, payload: Any) -> Any:
+        return self._recv(worker_index, self._send(worker_index, command, payload))
+
+    def _send(self, worker_index: int, command: str, payload: Any) -> int:
+        self._seq += 1
+        self.connections[worker_index].send((self._seq, command, payload))
+        return self._seq
+
+    def _recv(self, worker_index: int, seq: int) -> Any:
+        conn = self.connections[worker_index]
+        deadline = time.monotonic() + self.rpc_timeout
+        while True:
+            if not conn.poll(max(0.0, deadline - time.monotonic())):
+                raise TimeoutError(f"Shard worker {worker_index} did not respond in {self.rpc_timeout}s")
+            reply_seq, result = conn.recv()
+            if reply_seq == seq:
+                return result
+            # Late reply to an earlier request that timed out
+            logger.warning(f"Discarding stale reply {reply_seq} from shard worker {worker_index}")
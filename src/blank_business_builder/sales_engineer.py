@@ -5,56 +5,95 @@ Autonomous agent responsible for closing deals.
 It takes Leads, qualifies them, generates outreach, and tracks Sales.
 """
 
-from typing import List
+import logging
+import re
+from typing import Iterable, List, Pattern
 from .semantic_framework import Lead, Sale, db
 from .autonomous_tools import AutonomousTools
 
+logger = logging.getLogger(__name__)
+
+TARGET_INDUSTRIES = ["SaaS", "AI", "B2B", "Technology"]
+TARGET_ROLES = ["CTO", "CEO", "Founder", "VP", "Director"]
+
+
+def keyword_pattern(keywords: Iterable[str]) -> Pattern:
+    """One case-insensitive alternation that matches any keyword as a substring."""
+    return re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
+
+
 class SalesEngineer:
+    # Per-lead qualification is logged for one lead in every log_sample_every
+    log_sample_every = 1000
+
     def __init__(self, core_system):
         self.core = core_system
         self.tools = AutonomousTools()
-    
+        self.industry_pattern = keyword_pattern(TARGET_INDUSTRIES)
+        self.role_pattern = keyword_pattern(TARGET_ROLES)
+        self.scored_count = 0
+
     def process_leads(self, leads: List[Lead]):
         """
         Process a batch of leads through the sales funnel.
+
+        Leads are scored in one pass and saved with a single save_many;
+        only qualified leads go on to (per-lead) outreach.
         """
-        print(f"💼 SALES: Processing {len(leads)} leads...")
-        
-        for lead in leads:
-            self.qualify(lead)
-            if lead.score >= 70:
-                self.engage(lead)
-        
+        qualified = self.qualify_many(leads)
+        for lead in qualified:
+            self.engage(lead)
+
+    def qualify_many(self, leads: Iterable[Lead]) -> List[Lead]:
+        """Qualify a batch of leads, bulk-save them and return the qualified ones."""
+        leads = list(leads)
+        qualified = [lead for lead in leads if self._score(lead) >= 70]
+        db.save_many(lead for lead in leads if lead.status != "Disqualified")
+        logger.info(
+            "sales.qualify_batch leads=%d qualified=%d", len(leads), len(qualified)
+        )
+        return qualified
+
     def qualify(self, lead: Lead):
         """
         Qualify a lead based on available data.
         """
+        self._score(lead)
+        if lead.status != "Disqualified":
+            db.save(lead)
+
+    def _score(self, lead: Lead) -> int:
+        """Score one lead and set its status (no I/O besides sampled logging)."""
         if not lead.organization or not lead.person:
             lead.status = "Disqualified"
             lead.score = 0
-            return
+            return 0
 
         # Simple heuristic qualification
         score = 50 # Base score
-        
+
         # Industry match
-        target_industries = ["SaaS", "AI", "B2B", "Technology"]
-        if any(ind.lower() in lead.organization.industry.lower() for ind in target_industries):
+        if self.industry_pattern.search(lead.organization.industry):
             score += 20
-        
+
         # Role match
-        target_roles = ["CTO", "CEO", "Founder", "VP", "Director"]
-        if any(role.lower() in lead.person.role.lower() for role in target_roles):
+        if self.role_pattern.search(lead.person.role):
             score += 20
-            
+
         lead.score = score
         if score >= 70:
             lead.status = "Qualified"
         else:
             lead.status = "Low Priority"
-            
-        print(f"   [Qualify] {lead.person.name} @ {lead.organization.name}: Score {score} ({lead.status})")
-        db.save(lead)
+
+        if self.scored_count % self.log_sample_every == 0:
+            logger.info(
+                "sales.qualify lead_id=%s person=%r organization=%r score=%d status=%s sampled_every=%d",
+                lead.id, lead.person.name, lead.organization.name, score, lead.status,
+                self.log_sample_every,
+            )
+        self.scored_count += 1
+        return score
 
     def engage(self, lead: Lead):
         """
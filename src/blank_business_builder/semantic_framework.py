@@ -6,7 +6,7 @@ Inspired by sdk.do and Schema.org.
 """
 
 from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Any
+from typing import Any, Iterable, List, Optional
 import json
 import uuid
 
@@ -73,6 +73,12 @@ class SemanticDB:
     def save(self, obj: SemanticObject):
         self._store[obj.id] = obj
         return obj
+
+    def save_many(self, objs: Iterable[SemanticObject]) -> int:
+        """Save a batch of objects in one pass. Returns how many were saved."""
+        batch = {obj.id: obj for obj in objs}
+        self._store.update(batch)
+        return len(batch)
         
     def query(self, type_filter: str = None, **kwargs):
         """Query objects by type and attributes."""
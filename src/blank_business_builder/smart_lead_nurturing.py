@@ -6,11 +6,61 @@ Quantum-Recommended Feature #1
 Priority Score: 3.21% (Highest)
 """
 
-from typing import List, Dict, Optional
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import numpy as np
 
+FREE_EMAIL_DOMAINS = ('gmail.com', 'yahoo.com', 'hotmail.com')
+
+# Points per interaction type for the engagement and intent components
+ENGAGEMENT_POINTS = {
+    'email_open': 2,
+    'email_click': 5,
+    'page_view': 3,
+    'demo_request': 20,
+}
+INTENT_POINTS = {
+    'pricing_view': 15,
+    'demo_request': 25,
+    'contact_sales': 30,
+    'trial_signup': 35,
+    'whitepaper_download': 10,
+    'case_study_view': 12,
+}
+
+# Columns of the batch feature matrix (see SmartLeadScorer.build_feature_matrix)
+INTERACTION_TYPES = tuple(dict.fromkeys([*ENGAGEMENT_POINTS, *INTENT_POINTS]))
+FEATURE_COLUMNS = INTERACTION_TYPES + (
+    'has_company',      # 1.0 if the lead has a company
+    'email_quality',    # fit points from the email domain (-10, 0 or +15)
+    'interactions',     # total interaction count
+    'timestamped',      # interactions carrying a timestamp
+    'first_seen',       # earliest interaction, UTC epoch seconds
+    'last_seen',        # latest interaction, UTC epoch seconds
+)
+_COL = {name: i for i, name in enumerate(FEATURE_COLUMNS)}
+_INTERACTION_COLUMN = {name: _COL[name] for name in INTERACTION_TYPES}
+_HAS_COMPANY, _EMAIL_QUALITY, _INTERACTIONS, _TIMESTAMPED, _FIRST_SEEN, _LAST_SEEN = (
+    _COL[name] for name in FEATURE_COLUMNS[len(INTERACTION_TYPES):]
+)
+
+# Temperature tiers, matching LeadNurturingEngine._determine_stage thresholds
+TEMPERATURE_TIERS = ("new", "nurturing", "qualified", "hot")
+TIER_THRESHOLDS = (40.0, 60.0, 80.0)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _utc_seconds(value) -> float:
+    """Naive-UTC datetime (or ISO string) to epoch seconds."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH).total_seconds()
+
 
 @dataclass
 class Lead:
@@ -50,6 +100,18 @@ class SmartLeadScorer:
             'timing': 0.10
         }
 
+        # Interaction counts -> (engagement, intent) points, applied as one matmul
+        self._points = np.zeros((len(FEATURE_COLUMNS), 2))
+        for interaction_type, points in ENGAGEMENT_POINTS.items():
+            self._points[_COL[interaction_type], 0] = points
+        for interaction_type, points in INTENT_POINTS.items():
+            self._points[_COL[interaction_type], 1] = points
+
+        # Feature rows cached per lead id, reused while the lead is unchanged
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.clear_feature_cache()
+
     def score_lead(self, lead: Lead, interactions: List[Dict]) -> float:
         """
         Calculate comprehensive lead score.
@@ -129,7 +191,7 @@ class SmartLeadScorer:
         if lead.email:
             domain = lead.email.split('@')[-1]
             # Penalize free email providers
-            if domain in ['gmail.com', 'yahoo.com', 'hotmail.com']:
+            if domain in FREE_EMAIL_DOMAINS:
                 score -= 10.0
             else:
                 score += 15.0
@@ -141,19 +203,10 @@ class SmartLeadScorer:
         if not interactions:
             return 0.0
 
-        high_intent_actions = {
-            'pricing_view': 15,
-            'demo_request': 25,
-            'contact_sales': 30,
-            'trial_signup': 35,
-            'whitepaper_download': 10,
-            'case_study_view': 12
-        }
-
         score = 0.0
         for interaction in interactions:
             action_type = interaction.get('type', '')
-            score += high_intent_actions.get(action_type, 0)
+            score += INTENT_POINTS.get(action_type, 0)
 
         return min(100.0, score)
 
@@ -191,6 +244,183 @@ class SmartLeadScorer:
 
         return min(100.0, score)
 
+    # ------------------------------------------------------------------ #
+    # Batch scoring
+    # ------------------------------------------------------------------ #
+
+    def score_batch(
+        self,
+        leads: Sequence[Lead],
+        all_interactions: Optional[Dict[str, List[Dict]]] = None,
+        now: Optional[datetime] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score many leads at once.
+
+        Equivalent to calling score_lead for each lead, but the component
+        arithmetic runs over a feature matrix in NumPy.
+
+        Returns:
+            (scores, tiers): float scores 0-100 and indexes into TEMPERATURE_TIERS
+        """
+        features = self.build_feature_matrix(leads, all_interactions)
+        return self.score_features(features, now)
+
+    def build_feature_matrix(
+        self,
+        leads: Sequence[Lead],
+        all_interactions: Optional[Dict[str, List[Dict]]] = None,
+    ) -> np.ndarray:
+        """
+        Return one FEATURE_COLUMNS row per lead.
+
+        Rows are cached by lead id. A cached row is reused while the lead's
+        email, company, interaction count and latest interaction timestamp are
+        unchanged, so interactions are treated as an append-only log.
+        """
+        all_interactions = all_interactions or {}
+        index: List[int] = []
+        stale_slots: List[int] = []
+        stale_rows: List[List[float]] = []
+        # New rows go into a flat float buffer: no per-row list survives to be
+        # tracked by the GC, and NumPy can wrap the buffer without a copy.
+        new_rows = array('d')
+        start = self._size
+        slot_count = start
+        row_index = self._row_index
+        fingerprints = self._fingerprints
+        extract = self._extract_features
+
+        for lead in leads:
+            interactions = all_interactions.get(lead.id) or ()
+            fingerprint = hash((
+                lead.email,
+                lead.company,
+                len(interactions),
+                interactions[-1].get('timestamp') if interactions else None,
+            ))
+            slot = row_index.get(lead.id)
+            if slot is None:
+                slot = row_index[lead.id] = slot_count
+                slot_count += 1
+                new_rows.extend(extract(lead, interactions))
+                fingerprints.append(fingerprint)
+            elif fingerprints[slot] != fingerprint:
+                stale_slots.append(slot)
+                stale_rows.append(extract(lead, interactions))
+                fingerprints[slot] = fingerprint
+            index.append(slot)
+
+        new_count = slot_count - start
+        self.cache_misses += new_count + len(stale_rows)
+        self.cache_hits += len(leads) - new_count - len(stale_rows)
+
+        if new_count:
+            self._reserve(slot_count)
+            self._rows[start:slot_count] = np.frombuffer(new_rows).reshape(new_count, len(FEATURE_COLUMNS))
+            self._size = slot_count
+        if stale_rows:
+            self._rows[stale_slots] = stale_rows
+
+        return self._rows[np.array(index, dtype=np.intp)]
+
+    def score_features(
+        self, features: np.ndarray, now: Optional[datetime] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score a FEATURE_COLUMNS matrix; see score_batch."""
+        n = len(features)
+        now_seconds = _utc_seconds(now or datetime.utcnow())
+        components = np.empty((n, 4))
+
+        # Engagement and intent: capped points from interaction counts
+        points = np.minimum(features @ self._points, 100.0)
+        components[:, 0] = points[:, 0]
+        components[:, 2] = points[:, 1]
+
+        # Fit: base 50, company and email domain adjustments
+        fit = 50.0 + 20.0 * features[:, _COL['has_company']] + features[:, _COL['email_quality']]
+        np.clip(fit, 0.0, 100.0, out=components[:, 1])
+
+        # Timing: velocity over the active span plus a recency bonus
+        interactions = features[:, _COL['interactions']]
+        timestamped = features[:, _COL['timestamped']]
+        first = features[:, _COL['first_seen']]
+        last = features[:, _COL['last_seen']]
+        span_days = np.floor((last - first) / 86400.0)
+        span_days[span_days == 0] = 1.0
+        velocity = timestamped / span_days
+        days_since_last = np.floor((now_seconds - last) / 86400.0)
+        recency_bonus = np.maximum(0.0, 50.0 - days_since_last * 2.0)
+        timing = np.minimum(np.minimum(50.0, velocity * 10.0) + recency_bonus, 100.0)
+        timing[timestamped < 2] = 25.0
+        timing[interactions == 0] = 0.0
+        components[:, 3] = timing
+
+        weights = np.array([
+            self.weights['engagement'],
+            self.weights['fit'],
+            self.weights['intent'],
+            self.weights['timing'],
+        ])
+        scores = np.clip(components @ weights, 0.0, 100.0)
+
+        tiers = np.digitize(scores, TIER_THRESHOLDS)
+        # Demo requests and trial signups are hot regardless of score
+        buying_signal = (features[:, _COL['demo_request']] > 0) | (features[:, _COL['trial_signup']] > 0)
+        tiers[buying_signal] = len(TEMPERATURE_TIERS) - 1
+        return scores, tiers
+
+    def clear_feature_cache(self):
+        """Drop all cached feature rows."""
+        self._row_index: Dict[str, int] = {}
+        self._size = 0
+        self._rows = np.empty((0, len(FEATURE_COLUMNS)))
+        self._fingerprints: List[int] = []
+
+    def _reserve(self, size: int):
+        capacity = len(self._rows)
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2, 1024)
+        rows = np.zeros((capacity, len(FEATURE_COLUMNS)))
+        rows[:len(self._rows)] = self._rows
+        self._rows = rows
+
+    @staticmethod
+    def _extract_features(lead: Lead, interactions: Iterable[Dict]) -> List[float]:
+        """One lead's FEATURE_COLUMNS row (the per-lead Python part of batch scoring)."""
+        row = [0.0] * len(FEATURE_COLUMNS)
+        count = 0
+        timestamped = 0
+        first = last = None
+        for interaction in interactions:
+            count += 1
+            column = _INTERACTION_COLUMN.get(interaction.get('type'))
+            if column is not None:
+                row[column] += 1.0
+            timestamp = interaction.get('timestamp')
+            if timestamp is not None:
+                # Same ordering as score_lead, which sorts the raw values
+                if timestamped == 0:
+                    first = last = timestamp
+                elif timestamp < first:
+                    first = timestamp
+                elif timestamp > last:
+                    last = timestamp
+                timestamped += 1
+
+        if lead.company:
+            row[_HAS_COMPANY] = 1.0
+        if lead.email:
+            domain = lead.email.split('@')[-1]
+            row[_EMAIL_QUALITY] = -10.0 if domain in FREE_EMAIL_DOMAINS else 15.0
+        row[_INTERACTIONS] = float(count)
+        row[_TIMESTAMPED] = float(timestamped)
+        if timestamped:
+            row[_FIRST_SEEN] = _utc_seconds(first)
+            row[_LAST_SEEN] = _utc_seconds(last)
+        return row
+
 
 class LeadNurturingEngine:
     """AI-powered lead nurturing with personalized follow-up."""
@@ -228,6 +458,26 @@ class LeadNurturingEngine:
 
         return actions
 
+    def generate_nurturing_plans(
+        self,
+        leads: Sequence[Lead],
+        all_interactions: Dict[str, List[Dict]]
+    ) -> Dict[str, List[NurturingAction]]:
+        """
+        Generate nurturing plans for many leads, scoring them in one batch.
+
+        Returns:
+            Dictionary mapping lead_id to actions sorted by priority
+        """
+        scores, tiers = self.scorer.score_batch(leads, all_interactions)
+
+        plans = {}
+        for lead, score, tier in zip(leads, scores.tolist(), tiers.tolist()):
+            actions = self._generate_stage_actions(lead, TEMPERATURE_TIERS[tier], score)
+            actions.sort(key=lambda a: a.priority, reverse=True)
+            plans[lead.id] = actions
+        return plans
+
     def _determine_stage(self, score: float, interactions: List[Dict]) -> str:
         """Determine lead stage based on score and behavior."""
         # ⚡ Bolt Optimization: Single O(N) loop that short-circuits early for highest priority
@@ -381,24 +631,19 @@ class AutomatedFollowUpSystem:
         Returns:
             Dictionary mapping lead_id to scheduled actions
         """
-        scheduled_actions = {}
-
-        for lead in leads:
-            interactions = all_interactions.get(lead.id, [])
-
-            # Skip if lead was contacted very recently
-            if lead.last_contact:
-                hours_since = (datetime.utcnow() - lead.last_contact).total_seconds() / 3600
-                if hours_since < 24:
-                    continue
+        now = datetime.utcnow()
 
-            # Generate nurturing plan
-            actions = self.nurturing_engine.generate_nurturing_plan(lead, interactions)
+        # Skip leads that were contacted very recently
+        due_leads = [
+            lead for lead in leads
+            if not lead.last_contact
+            or (now - lead.last_contact).total_seconds() / 3600 >= 24
+        ]
 
-            if actions:
-                scheduled_actions[lead.id] = actions
+        # Generate nurturing plans, scoring all due leads in one batch
+        plans = self.nurturing_engine.generate_nurturing_plans(due_leads, all_interactions)
 
-        return scheduled_actions
+        return {lead_id: actions for lead_id, actions in plans.items() if actions}
 
     def get_next_action(
         self,
@@ -0,0 +1,301 @@
+"""
+Durable inbox for Stripe webhook events.
+
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+
+The webhook endpoint only verifies the signature, appends the event to
+``stripe_event_inbox`` (keyed by the Stripe event ID, so retried deliveries
+are dropped) and acknowledges. StripeInboxProcessor drains the inbox in
+batches ordered by Stripe's ``created`` time: each batch resolves its users,
+subscriptions and payment transactions with one IN query apiece, applies
+every event in memory and commits once.
+
+Subscription events are applied as snapshots of the subscription object. The
+``created`` time of the last applied event is kept on the Subscription, and an
+event older than that is recorded as ``stale`` instead of rolling the
+subscription back, so out-of-order deliveries settle on the newest state.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import insert, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .database import PaymentTransaction, StripeEventInbox, Subscription, User
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIPTION_EVENTS = frozenset({
+    "customer.subscription.created",
+    "customer.subscription.updated",
+    "customer.subscription.deleted",
+})
+# payment_intent event type -> PaymentTransaction.status
+PAYMENT_EVENTS = {
+    "payment_intent.succeeded": "succeeded",
+    "payment_intent.payment_failed": "failed",
+}
+
+
+def record_stripe_event(db: Session, event: Dict[str, Any]) -> bool:
+    """Append a verified Stripe event to the inbox and commit.
+
+    Returns False when an event with the same ID is already there.
+    """
+    row = {
+        "event_id": event["id"],
+        "event_type": event["type"],
+        "object_id": (event.get("data", {}).get("object") or {}).get("id"),
+        "stripe_created": datetime.utcfromtimestamp(event["created"]),
+        "payload": event,
+        "received_at": datetime.utcnow(),
+        "attempts": 0,
+    }
+    table = StripeEventInbox.__table__
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        result = db.execute(dialect_insert(table).values(**row).on_conflict_do_nothing(index_elements=["event_id"]))
+        db.commit()
+        return result.rowcount == 1
+    try:
+        db.execute(insert(table).values(**row))
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return False
+
+
+def _plan_name(subscription: Dict[str, Any]) -> str:
+    try:
+        return subscription["items"]["data"][0]["price"]["lookup_key"] or "starter"
+    except (KeyError, IndexError, TypeError):
+        return "starter"
+
+
+@dataclass
+class InboxReport:
+    """Outcome of one StripeInboxProcessor.drain call."""
+    events: int = 0
+    applied: int = 0
+    stale: int = 0
+    ignored: int = 0
+    failed: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class _Batch:
+    """Rows a batch of events touches, loaded with one IN query per table."""
+
+    def __init__(self, db: Session, events: List[StripeEventInbox]):
+        objects = [event.payload["data"]["object"] for event in events]
+        customer_ids = {obj["customer"] for obj in objects if obj.get("customer")}
+        subscription_ids = {
+            event.object_id for event in events if event.event_type in SUBSCRIPTION_EVENTS and event.object_id
+        }
+        intent_ids = {
+            event.object_id for event in events if event.event_type in PAYMENT_EVENTS and event.object_id
+        }
+
+        self.subscriptions: Dict[str, Subscription] = {}
+        if subscription_ids:
+            self.subscriptions = {
+                sub.stripe_subscription_id: sub
+                for sub in db.query(Subscription).filter(Subscription.stripe_subscription_id.in_(subscription_ids))
+            }
+        user_ids = {sub.user_id for sub in self.subscriptions.values()}
+        users: List[User] = []
+        if customer_ids or user_ids:
+            users = db.query(User).filter(or_(
+                User.stripe_customer_id.in_(customer_ids),
+                User.id.in_(user_ids),
+            )).all()
+        self.users_by_customer = {user.stripe_customer_id: user for user in users if user.stripe_customer_id}
+        self.users_by_id = {user.id: user for user in users}
+        self.transactions: Dict[str, PaymentTransaction] = {}
+        if intent_ids:
+            self.transactions = {
+                txn.stripe_payment_intent_id: txn
+                for txn in db.query(PaymentTransaction).filter(
+                    PaymentTransaction.stripe_payment_intent_id.in_(intent_ids)
+                )
+            }
+
+
+class StripeInboxProcessor:
+    """Apply pending inbox events ``batch_size`` at a time, one commit per batch.
+
+    If a batch cannot be committed, its events are retried one by one so a
+    single bad event does not hold up the rest; an event that keeps failing is
+    left out of later batches after ``max_attempts`` tries.
+    """
+
+    def __init__(self, db: Session, batch_size: int = 500, max_attempts: int = 5):
+        self.db = db
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+
+    def drain(self, max_batches: Optional[int] = None) -> InboxReport:
+        report = InboxReport()
+        start = time.perf_counter()
+        failed: Set[str] = set()
+        while max_batches is None or report.batches < max_batches:
+            events = self._claim(failed)
+            if not events:
+                break
+            report.batches += 1
+            event_ids = [event.event_id for event in events]
+            try:
+                outcomes = self._apply(events)
+                self.db.commit()
+            except Exception as exc:
+                self.db.rollback()
+                logger.warning("stripe inbox batch of %d failed (%s); retrying events one by one", len(events), exc)
+                outcomes = self._apply_individually(event_ids)
+            for event_id in event_ids:
+                outcome = outcomes[event_id]
+                if outcome == "failed":
+                    # Left for a later drain
+                    failed.add(event_id)
+                report.events += 1
+                setattr(report, outcome, getattr(report, outcome) + 1)
+
+        report.elapsed_seconds = time.perf_counter() - start
+        if report.events:
+            logger.info(
+                "stripe inbox events=%d applied=%d stale=%d ignored=%d failed=%d batches=%d elapsed=%.3fs",
+                report.events, report.applied, report.stale, report.ignored, report.failed,
+                report.batches, report.elapsed_seconds,
+            )
+        return report
+
+    def _claim(self, exclude: Set[str]) -> List[StripeEventInbox]:
+        query = self.db.query(StripeEventInbox).filter(
+            StripeEventInbox.processed_at.is_(None),
+            StripeEventInbox.attempts < self.max_attempts,
+        )
+        if exclude:
+            query = query.filter(StripeEventInbox.event_id.notin_(exclude))
+        query = (
+            query
+            .order_by(StripeEventInbox.stripe_created, StripeEventInbox.event_id)
+            .limit(self.batch_size)
+        )
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Concurrent workers take disjoint batches
+            query = query.with_for_update(skip_locked=True)
+        return query.all()
+
+    def _apply_individually(self, event_ids: List[str]) -> Dict[str, str]:
+        outcomes = {}
+        for event_id in event_ids:
+            event = self.db.get(StripeEventInbox, event_id)
+            try:
+                outcomes.update(self._apply([event]))
+                self.db.commit()
+            except Exception as exc:
+                self.db.rollback()
+                event = self.db.get(StripeEventInbox, event_id)
+                event.attempts += 1
+                event.last_error = f"{type(exc).__name__}: {exc}"[:2000]
+                event.outcome = "failed"
+                self.db.commit()
+                logger.error("stripe event %s (%s) failed: %s", event_id, event.event_type, event.last_error)
+                outcomes[event_id] = "failed"
+        return outcomes
+
+    def _apply(self, events: List[StripeEventInbox]) -> Dict[str, str]:
+        """Apply events in memory (the caller commits); returns each event's outcome."""
+        batch = _Batch(self.db, events)
+        now = datetime.utcnow()
+        outcomes = {}
+        for event in events:
+            obj = event.payload["data"]["object"]
+            if event.event_type in SUBSCRIPTION_EVENTS:
+                outcome = self._apply_subscription(batch, event, obj)
+            elif event.event_type in PAYMENT_EVENTS:
+                outcome = self._apply_payment(batch, event, obj)
+            else:
+                outcome = "ignored"
+            event.attempts += 1
+            event.outcome = outcome
+            event.last_error = None
+            event.processed_at = now
+            outcomes[event.event_id] = outcome
+        return outcomes
+
+    def _apply_subscription(self, batch: _Batch, event: StripeEventInbox, obj: Dict[str, Any]) -> str:
+        deleted = event.event_type == "customer.subscription.deleted"
+        subscription = batch.subscriptions.get(obj["id"])
+        if (subscription is not None and subscription.last_event_at
+                and event.stripe_created < subscription.last_event_at):
+            return "stale"
+
+        if subscription is None:
+            # Only created/updated events create a row; deleting an unknown
+            # subscription has nothing to cancel
+            if deleted:
+                return "ignored"
+            user = batch.users_by_customer.get(obj.get("customer"))
+            if user is None:
+                return "ignored"
+            subscription = Subscription(
+                user_id=user.id,
+                stripe_subscription_id=obj["id"],
+                plan_name=_plan_name(obj),
+            )
+            self.db.add(subscription)
+            batch.subscriptions[obj["id"]] = subscription
+            user.subscription_tier = subscription.plan_name
+
+        subscription.status = "canceled" if deleted else obj["status"]
+        if obj.get("current_period_start"):
+            subscription.current_period_start = datetime.fromtimestamp(obj["current_period_start"])
+        if obj.get("current_period_end"):
+            subscription.current_period_end = datetime.fromtimestamp(obj["current_period_end"])
+        subscription.cancel_at_period_end = obj.get("cancel_at_period_end", False)
+        subscription.last_event_at = event.stripe_created
+
+        if deleted:
+            # Downgrade user to free tier
+            user = batch.users_by_id.get(subscription.user_id) or batch.users_by_customer.get(obj.get("customer"))
+            if user is not None:
+                user.subscription_tier = "free"
+                user.license_status = "trial"
+                user.trial_expires_at = datetime.utcnow() + timedelta(days=3)
+        return "applied"
+
+    def _apply_payment(self, batch: _Batch, event: StripeEventInbox, obj: Dict[str, Any]) -> str:
+        user = batch.users_by_customer.get(obj.get("customer"))
+        if user is None:
+            return "ignored"
+        status = PAYMENT_EVENTS[event.event_type]
+        transaction = batch.transactions.get(obj["id"])
+        if transaction is None:
+            transaction = PaymentTransaction(
+                user_id=user.id,
+                stripe_payment_intent_id=obj["id"],
+                amount=obj["amount"] / 100,  # Convert cents to dollars
+                currency=obj["currency"].upper(),
+                status=status,
+                description=obj.get("description", "Payment"),
+                transaction_metadata=obj.get("metadata", {}),
+            )
+            self.db.add(transaction)
+            batch.transactions[obj["id"]] = transaction
+            return "applied"
+        if transaction.status == "succeeded":
+            # A succeeded PaymentIntent is final; an earlier failure delivered late changes nothing
+            return "stale"
+        transaction.status = status
+        return "applied"
@@ -45,9 +45,13 @@ app.conf.beat_schedule = {
         "task": "blank_business_builder.tasks.cleanup_expired_sessions",
         "schedule": crontab(minute=0),
     },
-    "aggregate-metrics-every-15-min": {
+    "aggregate-metrics-every-minute": {
         "task": "blank_business_builder.tasks.aggregate_business_metrics",
-        "schedule": crontab(minute="*/15"),
+        "schedule": crontab(),
+    },
+    "process-stripe-inbox-every-10-sec": {
+        "task": "blank_business_builder.tasks.process_stripe_inbox",
+        "schedule": 10.0,
     },
     "process-pending-campaigns-every-10-min": {
         "task": "blank_business_builder.tasks.process_pending_campaigns",
@@ -97,31 +101,54 @@ def cleanup_expired_sessions(self):
 
 @app.task(bind=True, max_retries=3)
 def aggregate_business_metrics(self):
-    """Aggregate and cache business performance metrics."""
+    """Roll MetricsHistory rows ingested since the last run into the metric rollups."""
+    try:
+        from .database import get_db_engine
+        from .metric_rollups import MetricRollupEngine
+
+        report = MetricRollupEngine(get_db_engine()).run()
+        logger.info(
+            f"Rolled up {report.rows_consumed} metric rows into "
+            f"{sum(report.buckets.values())} business buckets"
+        )
+        return {
+            "rows_consumed": report.rows_consumed,
+            "buckets": report.buckets,
+            "global_buckets": report.global_buckets,
+            "watermark": report.watermark.isoformat() if report.watermark else None,
+            "elapsed_seconds": report.elapsed_seconds,
+        }
+    except Exception as exc:
+        logger.error(f"Metrics aggregation failed: {exc}")
+        raise self.retry(exc=exc, countdown=60)
+
+
+@app.task(bind=True, max_retries=3)
+def process_stripe_inbox(self):
+    """Apply queued Stripe webhook events in batches."""
     try:
-        from .database import get_db_engine, get_session_maker, Business
+        from .database import get_db_engine, get_session_maker
+        from .stripe_inbox import StripeInboxProcessor
 
         engine = get_db_engine()
         Session = get_session_maker(engine)
         session = Session()
 
         try:
-            businesses = session.query(Business).filter(
-                Business.status == "active"
-            ).all()
-
-            metrics = {
-                "total_active": len(businesses),
-                "processed_at": str(__import__("datetime").datetime.utcnow()),
+            report = StripeInboxProcessor(session).drain()
+            return {
+                "events": report.events,
+                "applied": report.applied,
+                "stale": report.stale,
+                "ignored": report.ignored,
+                "failed": report.failed,
+                "batches": report.batches,
             }
-
-            logger.info(f"Aggregated metrics for {len(businesses)} active businesses")
-            return metrics
         finally:
             session.close()
     except Exception as exc:
-        logger.error(f"Metrics aggregation failed: {exc}")
-        raise self.retry(exc=exc, countdown=60)
+        logger.error(f"Stripe inbox processing failed: {exc}")
+        raise self.retry(exc=exc, countdown=30)
 
 
 @app.task(bind=True, max_retries=3)
@@ -11,7 +11,8 @@ from datetime import datetime
 import asyncio
 import json
 
-from .database import get_db, Business, AgentTask, MetricsHistory
+from .database import get_db, Business, AgentTask
+from .metric_rollups import business_series
 from .auth import AuthService
 
 
@@ -105,10 +106,8 @@ def _get_business_metrics_sync(business_id: str, db: Session) -> dict:
         AgentTask.business_id == business_id
     ).order_by(AgentTask.created_at.desc()).limit(10).all()
 
-    # Get latest metrics
-    latest_metric = db.query(MetricsHistory).filter(
-        MetricsHistory.business_id == business_id
-    ).order_by(MetricsHistory.timestamp.desc()).first()
+    # Hourly history comes from the metric rollups, not a MetricsHistory scan
+    history = business_series(db, business.id, granularity="hour", limit=24)
 
     business_name = business.business_name or (business.business_concept or "Business")
 
@@ -129,6 +128,7 @@ def _get_business_metrics_sync(business_id: str, db: Session) -> dict:
             "failed": failed_tasks,
             "success_rate": (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
         },
+        "history": history,
         "recent_tasks": [
             {
                 "id": str(task.id),
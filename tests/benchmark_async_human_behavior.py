@@ -0,0 +1,126 @@
+"""
+Benchmark: human-behaviour timing, blocking per-event sleeps versus the
+asyncio replay of precomputed schedules.
+
+"threads" reproduces HumanBehaviorSimulator: one thread per session
+calling time.sleep after every mouse-path point and every key. "async" runs
+the same number of sessions on one event loop with
+AsyncHumanBehaviorSimulator, replaying each gesture's schedule with a no-op
+callback per batch, so the numbers are pure scheduling overhead: wall time
+against the scheduled time, the number of wake-ups and the threads held. Path generation compares the
+point-by-point Bezier loop with the NumPy version.
+
+Usage:
+    python tests/benchmark_async_human_behavior.py --sessions 200 --moves 10 --chars 40
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts", "runners"))
+
+import numpy as np
+
+from async_human_behavior import (
+    AsyncHumanBehaviorSimulator, bezier_path, keystroke_schedule, movement_schedule,
+)
+
+
+def blocking_session(moves, text, wakeups):
+    for _ in range(moves):
+        steps = random.randint(15, 30)
+        for i in range(steps + 1):
+            time.sleep(random.uniform(0.001, 0.005) if i < (steps + 1) * 0.7 else random.uniform(0.01, 0.02))
+            wakeups.append(1)
+    for i, _ in enumerate(text):
+        delay = random.uniform(0.08, 0.15)
+        if 0 < i < len(text) - 1:
+            delay *= random.uniform(0.7, 0.9)
+        time.sleep(delay)
+        wakeups.append(1)
+
+
+def run_threads(sessions, moves, text):
+    wakeups = []
+    threads = [threading.Thread(target=blocking_session, args=(moves, text, wakeups)) for _ in range(sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, len(wakeups)
+
+
+async def run_async(sessions, moves, text, min_sleep):
+    humans = [AsyncHumanBehaviorSimulator(None, seed=i, min_sleep=min_sleep, offload_driver_calls=False)
+              for i in range(sessions)]
+    wakeups = 0
+
+    async def fire(events):
+        nonlocal wakeups
+        wakeups += 1
+
+    async def session(human):
+        for _ in range(moves):
+            await human.replay(movement_schedule((0, 0), (800, 600), human.rng), fire)
+        await human.replay(keystroke_schedule(text, human.rng, typo_rate=0.0), fire)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(session(human) for human in humans))
+    return time.perf_counter() - start, wakeups
+
+
+def python_bezier(start, end, steps):
+    x1, y1 = start
+    x4, y4 = end
+    dx, dy = x4 - x1, y4 - y1
+    x2, y2 = x1 + dx * 0.33 + random.randint(-50, 50), y1 + dy * 0.33 + random.randint(-50, 50)
+    x3, y3 = x1 + dx * 0.66 + random.randint(-50, 50), y1 + dy * 0.66 + random.randint(-50, 50)
+    points = []
+    for i in range(steps + 1):
+        t = i / steps
+        x = (1 - t) ** 3 * x1 + 3 * (1 - t) ** 2 * t * x2 + 3 * (1 - t) * t ** 2 * x3 + t ** 3 * x4
+        y = (1 - t) ** 3 * y1 + 3 * (1 - t) ** 2 * t * y2 + 3 * (1 - t) * t ** 2 * y3 + t ** 3 * y4
+        points.append((int(x), int(y)))
+    return points
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--moves", type=int, default=10)
+    parser.add_argument("--chars", type=int, default=40)
+    parser.add_argument("--min-sleep", type=float, default=0.010)
+    parser.add_argument("--paths", type=int, default=20000)
+    parser.add_argument("--steps", type=int, default=200)
+    args = parser.parse_args()
+    text = "x" * args.chars
+
+    # Mean scheduled time per session: moves of ~23 points, then the keystrokes
+    scheduled = args.moves * 23 * (0.7 * 0.003 + 0.3 * 0.015) + args.chars * 0.115 * 0.8
+    print(f"{args.sessions} sessions, ~{scheduled:.2f}s of scheduled waits each")
+    elapsed, wakeups = run_threads(args.sessions, args.moves, text)
+    print(f"threads  {elapsed:6.2f}s  {wakeups:>7} wake-ups  {args.sessions} threads")
+    elapsed, wakeups = asyncio.run(run_async(args.sessions, args.moves, text, args.min_sleep))
+    print(f"async    {elapsed:6.2f}s  {wakeups:>7} wake-ups  1 thread")
+
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    for _ in range(args.paths):
+        python_bezier((0, 0), (800, 600), args.steps)
+    loop = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(args.paths):
+        bezier_path((0, 0), (800, 600), args.steps, rng)
+    vector = time.perf_counter() - start
+    print(f"bezier   {args.paths} paths x {args.steps} steps  loop {loop:5.2f}s  numpy {vector:5.2f}s  "
+          f"{loop / vector:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: per-recipient sends vs BulkEmailSender against a local fake SendGrid.
+
+Usage:
+    python tests/benchmark_bulk_email.py --recipients 50000 --latency-ms 80
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from blank_business_builder.bulk_email import BulkEmailSender, EmailRecipient
+
+
+def serve(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(latency)
+            self.send_response(202)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def legacy_send(url: str, emails) -> None:
+    """One blocking API call per recipient, as SendGridService.send_bulk_email used to do."""
+    with requests.Session() as session:
+        for email in emails:
+            session.post(f"{url}/v3/mail/send", json={
+                "personalizations": [{"to": [{"email": email}]}],
+                "from": {"email": "team@bbb.test"},
+                "subject": "Hi",
+                "content": [{"type": "text/html", "value": "<p>Hi</p>"}],
+            }).raise_for_status()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--recipients", type=int, default=50000)
+    parser.add_argument("--latency-ms", type=float, default=80.0)
+    parser.add_argument("--legacy-sample", type=int, default=200,
+                        help="Recipients sent the legacy way; the full run is extrapolated")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    server = serve(args.latency_ms / 1000)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    emails = [f"user{i}@example.com" for i in range(args.recipients)]
+
+    start = time.perf_counter()
+    legacy_send(url, emails[:args.legacy_sample])
+    legacy = (time.perf_counter() - start) * args.recipients / args.legacy_sample
+    print(f"per-recipient  {args.recipients:>7} recipients  {legacy:9.1f}s (extrapolated from {args.legacy_sample})")
+
+    sender = BulkEmailSender("SG.bench", "team@bbb.test", base_url=url, max_concurrency=args.concurrency)
+    report = asyncio.run(sender.send((EmailRecipient(e) for e in emails), "Hi", "<p>Hi</p>"))
+    print(f"batched        {report.recipients:>7} recipients  {report.elapsed_seconds:9.2f}s "
+          f"({report.requests} requests, {report.recipients_per_second:,.0f} recipients/s)  "
+          f"speedup {legacy / report.elapsed_seconds:,.0f}x")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
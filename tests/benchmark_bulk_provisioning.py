@@ -0,0 +1,81 @@
+"""
+Benchmark: ORM one-object-at-a-time business creation vs BulkProvisioningEngine.
+
+Usage:
+    python tests/benchmark_bulk_provisioning.py --businesses 100000
+    python tests/benchmark_bulk_provisioning.py --database-url postgresql://user:pw@localhost/bench
+
+Without --database-url a temporary SQLite file is used. Tables are created
+(and the benchmark rows left in place) in the target database.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from blank_business_builder.bulk_provisioning import BulkProvisioningEngine
+from blank_business_builder.database import AgentTask, Base, Business, BusinessPlan, MetricsHistory, User
+
+
+def orm_provision(engine, user_id, count, batch_size=100):
+    """The previous deployment path: session.add per object, commit every batch_size businesses."""
+    with Session(engine) as db:
+        for start in range(0, count, batch_size):
+            for i in range(min(batch_size, count - start)):
+                business_id = uuid.uuid4()
+                now = datetime.utcnow()
+                db.add(Business(
+                    id=business_id, user_id=user_id, business_name=f"Business {start}-{i}",
+                    industry="Autonomous Service", status="active", created_at=now, started_at=now,
+                    total_revenue=0, total_customers=0, total_leads=0, conversion_rate=0,
+                ))
+                db.add(BusinessPlan(business_id=business_id, plan_name="default plan"))
+                db.add(AgentTask(business_id=business_id, agent_role="researcher",
+                                 task_type="market_research", description="Research"))
+                db.add(MetricsHistory(business_id=business_id, revenue=0, customers=0, leads=0, conversion_rate=0))
+            db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--businesses", type=int, default=100_000)
+    parser.add_argument("--orm-businesses", type=int, default=10_000,
+                        help="Size of the (slow) ORM baseline run")
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        user_id = uuid.uuid4()
+        with engine.begin() as conn:
+            conn.execute(User.__table__.insert(), {
+                "id": user_id, "email": f"bench-{user_id}@example.com", "hashed_password": "x",
+            })
+        print(f"Database: {engine.dialect.name} ({engine.dialect.driver})")
+
+        start = time.perf_counter()
+        orm_provision(engine, user_id, args.orm_businesses)
+        orm_elapsed = time.perf_counter() - start
+        orm_rate = args.orm_businesses / orm_elapsed
+        print(f"ORM      {args.orm_businesses:>9,} businesses {orm_elapsed:8.2f}s  {orm_rate * 4:>10,.0f} rows/s")
+
+        report = BulkProvisioningEngine(engine).provision(user_id, args.businesses)
+        print(f"Bulk     {report.businesses:>9,} businesses {report.elapsed_seconds:8.2f}s  "
+              f"{report.rows_per_second:>10,.0f} rows/s")
+        print(f"Speedup  {report.businesses_per_second / orm_rate:.1f}x")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
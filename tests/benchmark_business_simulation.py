@@ -0,0 +1,69 @@
+"""
+Benchmark: Monte Carlo business simulation, per-day Python loop versus the
+batched NumPy core.
+
+The "loop" run reproduces YearSimulator's day-by-day model without the
+orchestrator (so it is a lower bound on the old cost) for a sample of
+businesses and extrapolates to the full portfolio.
+
+Usage:
+    python tests/benchmark_business_simulation.py --businesses 1000 --years 5
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import time
+
+_spec = importlib.util.spec_from_file_location(
+    "business_simulation", os.path.join(os.path.dirname(__file__), "..", "scripts", "tools", "business_simulation.py")
+)
+business_simulation = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(business_simulation)
+
+
+def loop_business(days, params, rng):
+    customers = revenue = leads = 0
+    pending = params.initial_tasks
+    for day in range(1, days + 1):
+        for _ in range(rng.randint(0, 5)):
+            customers += 1
+        customers -= sum(1 for _ in range(customers) if rng.random() < params.daily_churn)
+        if day % 7 == 0:
+            leads += rng.randint(*params.weekly_leads)
+        if day % 30 == 0:
+            revenue += customers * rng.uniform(*params.revenue_per_client)
+        pending -= sum(1 for _ in range(pending) if rng.random() < params.task_completion_prob)
+    return revenue, customers, leads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--businesses", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--loop-sample", type=int, default=20)
+    parser.add_argument("--monthly-churn", type=float, default=0.03)
+    args = parser.parse_args()
+
+    days = args.years * 365
+    params = business_simulation.SimulationParams(monthly_churn=args.monthly_churn)
+    rng = random.Random(1)
+
+    start = time.perf_counter()
+    for _ in range(args.loop_sample):
+        loop_business(days, params, rng)
+    loop = (time.perf_counter() - start) / args.loop_sample * args.businesses
+
+    start = time.perf_counter()
+    result = business_simulation.simulate_portfolio(args.businesses, days, params, seed=1)
+    batched = time.perf_counter() - start
+
+    median = result.summary()['total_revenue']['p50']
+    print(f"loop     {args.businesses:>6} businesses x {days} days  {loop:8.2f}s (extrapolated)")
+    print(f"batched  {args.businesses:>6} businesses x {days} days  {batched:8.2f}s  "
+          f"{loop / batched:,.0f}x faster  (median revenue ${median:,.0f})")
+
+
+if __name__ == "__main__":
+    main()
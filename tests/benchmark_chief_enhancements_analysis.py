@@ -0,0 +1,90 @@
+"""
+Benchmark: Chief Enhancements code analysis of a project tree.
+
+"legacy" reproduces the previous behaviour: the metrics, security,
+performance and quality analyzers each rglob and re-read the tree, parse
+every file and run nested ast.walk scans. "cold" is the shared single-pass
+ProjectAnalysis with an empty cache, "warm" a repeat run with the persisted
+cache and no changed files.
+
+Usage:
+    python tests/benchmark_chief_enhancements_analysis.py --root src
+"""
+
+import argparse
+import ast
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from chief_enhancements_office.analysis import ProjectAnalysis, iter_python_files, scan_security
+from chief_enhancements_office.tasks.audit import CodeMetricsAnalyzer, SecurityScanner
+from chief_enhancements_office.tasks.optimisation import CodeQualityAnalyzer, PerformanceAnalyzer
+
+LOOPS = (ast.For, ast.While)
+DECISIONS = (ast.If, ast.While, ast.For, ast.And, ast.Or, ast.ExceptHandler)
+
+
+def legacy(root):
+    def trees():
+        for path in iter_python_files(root):
+            source = path.read_text(encoding="utf-8")
+            try:
+                yield source, ast.parse(source)
+            except SyntaxError:
+                continue
+
+    for _, tree in trees():  # Code metrics
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef):
+                sum(isinstance(c, DECISIONS) for c in ast.walk(node))
+    for path in iter_python_files(root):  # Security
+        scan_security(path.read_text(encoding="utf-8"), str(path))
+    for _, tree in trees():  # Performance
+        for node in ast.walk(tree):
+            for child in ast.iter_child_nodes(node):
+                child.parent = node
+            if isinstance(node, LOOPS):
+                sum(isinstance(c, LOOPS) for c in ast.walk(node))
+    for _, tree in trees():  # Code quality
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                [n for n in ast.walk(node) if isinstance(n, ast.FunctionDef)]
+
+
+def shared(root, cache_path):
+    analysis = ProjectAnalysis(root, cache_path=cache_path)
+    CodeMetricsAnalyzer(root, analysis).analyze_project()
+    SecurityScanner(root, analysis).scan_python_security()
+    PerformanceAnalyzer(root, analysis).analyze_python_performance()
+    CodeQualityAnalyzer(root, analysis).analyze_code_quality()
+    return analysis
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--root", type=Path, default=Path(__file__).parent.parent / "src")
+    args = parser.parse_args()
+    files = sum(1 for _ in iter_python_files(args.root))
+
+    start = time.perf_counter()
+    legacy(args.root)
+    legacy_time = time.perf_counter() - start
+    print(f"legacy  {files:>5} files  {legacy_time:7.2f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "analysis_cache.json"
+        for label in ("cold", "warm"):
+            start = time.perf_counter()
+            analysis = shared(args.root, cache_path)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<6}  {files:>5} files  {elapsed:7.2f}s  {legacy_time / elapsed:6.1f}x  "
+                  f"({analysis.stats['analyzed']} analyzed, {analysis.stats['reused']} reused)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark: dashboard serving cost for many open dashboards.
+
+"legacy" is the previous BaseHTTPRequestHandler on a single-threaded
+HTTPServer, serialising the state on every request over a fresh connection.
+The asyncio server is measured for full snapshot responses, 304
+revalidations on kept-alive connections, and one server-sent event
+published to every subscriber.
+
+Usage:
+    python tests/benchmark_dashboard_server.py --clients 50 --requests 20 --subscribers 500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts", "runners"))
+
+from dashboard_server import DashboardServer, initial_state
+
+STATE = initial_state()
+STATE["businesses"] = [{"name": f"Business {i}", "url": "", "category": "saas", "status": "active",
+                        "revenue": 0.0, "monthly_target": 5000.0} for i in range(50)]
+STATE["activity_log"] = [{"time": "12:00:00", "msg": f"[EMAIL] SENT: message {i}"} for i in range(50)]
+
+
+class LegacyHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = json.dumps(STATE, default=str).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", len(body))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class BenchDashboard(DashboardServer):
+    def probes(self):
+        return [lambda: {"businesses": STATE["businesses"]}]
+
+
+async def _read_response(reader):
+    headers = {}
+    await reader.readline()
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode().partition(":")
+        headers[name.lower()] = value.strip()
+    await reader.readexactly(int(headers.get("content-length", 0)))
+    return headers
+
+
+async def legacy_clients(port, clients, requests):
+    async def client():
+        for _ in range(requests):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET /api/state HTTP/1.0\r\n\r\n")
+            await _read_response(reader)
+            writer.close()
+    await asyncio.gather(*(client() for _ in range(clients)))
+
+
+async def keep_alive_clients(port, clients, requests, revalidate):
+    async def client():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        etag = None
+        for _ in range(requests):
+            extra = f"If-None-Match: {etag}\r\n" if revalidate and etag else ""
+            writer.write(f"GET /api/state HTTP/1.1\r\nHost: x\r\n{extra}\r\n".encode())
+            etag = (await _read_response(reader))["etag"]
+        writer.close()
+    await asyncio.gather(*(client() for _ in range(clients)))
+
+
+async def fan_out(server, subscribers):
+    streams = []
+    for _ in range(subscribers):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(b"GET /api/events HTTP/1.1\r\n\r\n")
+        await reader.readuntil(b"\r\n\r\n")
+        await reader.readuntil(b"\n\n")
+        streams.append((reader, writer))
+
+    start = time.perf_counter()
+    server.publish()
+    await asyncio.gather(*(reader.readuntil(b"\n\n") for reader, _ in streams))
+    elapsed = time.perf_counter() - start
+    for _, writer in streams:
+        writer.close()
+    return elapsed
+
+
+async def run_async(args, legacy_port, ech0_dir):
+    total = args.clients * args.requests
+    start = time.perf_counter()
+    await legacy_clients(legacy_port, args.clients, args.requests)
+    legacy = time.perf_counter() - start
+    print(f"legacy        {total:>6} requests  {total / legacy:9.0f} req/s")
+
+    server = BenchDashboard(host="127.0.0.1", port=0, refresh_interval=3600, ech0_dir=ech0_dir)
+    await server.start()
+    try:
+        for label, revalidate in (("asyncio 200", False), ("asyncio 304", True)):
+            start = time.perf_counter()
+            await keep_alive_clients(server.port, args.clients, args.requests, revalidate)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<12}  {total:>6} requests  {total / elapsed:9.0f} req/s  {legacy / elapsed:.1f}x")
+        elapsed = await fan_out(server, args.subscribers)
+        print(f"sse publish   {args.subscribers:>6} subscribers  {elapsed * 1e3:7.1f}ms")
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--subscribers", type=int, default=500)
+    args = parser.parse_args()
+
+    legacy = HTTPServer(("127.0.0.1", 0), LegacyHandler)
+    legacy.request_queue_size = 1024
+    threading.Thread(target=legacy.serve_forever, daemon=True).start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            asyncio.run(run_async(args, legacy.server_address[1], tmp))
+    finally:
+        legacy.shutdown()
+
+
+if __name__ == "__main__":
+    main()
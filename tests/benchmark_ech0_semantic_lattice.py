@@ -0,0 +1,88 @@
+"""
+Benchmark: placing and validating inventions in the ECH0 semantic lattice.
+
+The "pairwise" run reproduces the previous behaviour: a substring scan over
+every node key per sibling pair and one shortest-path query per node for the
+prior art check. The "indexed" run uses the combination index and a single
+breadth-first search per validated invention.
+
+Usage:
+    python tests/benchmark_ech0_semantic_lattice.py --inventions 1000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import networkx as nx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts", "ech0"))
+
+from ech0_semantic_lattice import ECH0SemanticLattice
+
+DOMAINS = ["Virtual Reality", "Haptics", "Brain-Computer Interface", "Quantum ML", "Quantum Sensing",
+           "Cognitive Enhancement", "Neural Prosthetics", "Invasive BCI"]
+
+
+class PairwiseLattice(ECH0SemanticLattice):
+    """The lattice with the previous quadratic lookups."""
+
+    def _find_unexplored_neighbors(self, node):
+        siblings = set()
+        for parent_id in node.parents:
+            siblings.update(self.nodes[parent_id].children)
+        siblings.discard(node.id)
+        unexplored = []
+        for sibling_id in siblings:
+            sibling = self.nodes[sibling_id]
+            combo_key = f"{node.name}_{sibling.name}"
+            reverse_combo = f"{sibling.name}_{node.name}"
+            if not any(combo_key in n or reverse_combo in n for n in self.nodes.keys()) and sibling.density > 0:
+                unexplored.append((node.name, sibling.name))
+        return unexplored
+
+    def find_similar_nodes(self, node_id, threshold=0.3):
+        similar = []
+        for other_id, other in self.nodes.items():
+            if other_id != node_id and other.density > 0:
+                try:
+                    distance = min(1.0, nx.shortest_path_length(self.graph, node_id, other_id) / self.MAX_DISTANCE)
+                except nx.NetworkXNoPath:
+                    continue
+                if distance < threshold:
+                    similar.append((other_id, distance))
+        return similar
+
+
+def run(lattice_class, inventions):
+    lattice = lattice_class()
+    similar = 0
+    start = time.perf_counter()
+    for invention in inventions:
+        node_id = lattice.add_invention(dict(invention))
+        similar += len(lattice.find_similar_nodes(node_id))
+    return time.perf_counter() - start, len(lattice.gap_opportunities), similar
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--inventions", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    inventions = [
+        {'invention_name': f"Invention {i}", 'categories': rng.sample(DOMAINS, rng.choice([1, 2, 3]))}
+        for i in range(args.inventions)
+    ]
+
+    pairwise, gaps, similar = run(PairwiseLattice, inventions)
+    print(f"pairwise  {args.inventions:>6} inventions  {pairwise:8.2f}s  ({gaps} gaps, {similar} prior-art hits)")
+    indexed, gaps, similar = run(ECH0SemanticLattice, inventions)
+    print(f"indexed   {args.inventions:>6} inventions  {indexed:8.2f}s  ({gaps} gaps, {similar} prior-art hits)  "
+          f"{pairwise / indexed:,.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
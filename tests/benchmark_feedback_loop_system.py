@@ -0,0 +1,62 @@
+"""
+Benchmark: FeedbackLoopSystem record and summary cost as agents and history grow.
+
+Usage:
+    python tests/benchmark_feedback_loop_system.py --events 100000
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts", "runners"))
+
+from blank_business_builder import hive_mind_coordinator
+
+sys.modules.setdefault("hive_mind_coordinator", hive_mind_coordinator)
+
+from feedback_loop_system import FeedbackEvent, FeedbackLoopSystem, FeedbackType
+
+
+def run(agents, events, config_path):
+    system = FeedbackLoopSystem(hive_mind_coordinator.HiveMindCoordinator(config_path=config_path))
+    system.hive.share_learning = lambda *args, **kwargs: None  # Measure the feedback loop only
+    rng = random.Random(1)
+    agent_ids = [f"agent_{i}" for i in range(agents)]
+    kinds = [FeedbackType.SUCCESS, FeedbackType.FAILURE, FeedbackType.PERFORMANCE_METRIC]
+
+    start = time.perf_counter()
+    for _ in range(events):
+        system.record_feedback(FeedbackEvent(
+            agent_id=rng.choice(agent_ids), feedback_type=rng.choice(kinds), timestamp=0.0,
+            metric_name="conversion_rate", metric_value=rng.uniform(0.01, 0.05), context={},
+        ))
+    record = (time.perf_counter() - start) / events
+
+    start = time.perf_counter()
+    for _ in range(100):
+        system.get_hive_performance_summary()
+    summary = (time.perf_counter() - start) / 100
+    return record, summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for agents in (10, 100, 1000, 10000):
+            record, summary = run(agents, args.events, os.path.join(tmp, "config.json"))
+            print(f"{agents:>6} agents  {args.events} events  record_feedback {record * 1e6:7.1f}us  "
+                  f"summary {summary * 1e6:9.1f}us")
+
+
+if __name__ == "__main__":
+    main()
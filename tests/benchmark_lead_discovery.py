@@ -0,0 +1,86 @@
+"""
+Benchmark: sequential enrich-and-flush discovery vs LeadDiscoveryPipeline.
+
+Both paths talk to an offline Apollo transport that sleeps --latency-ms per
+enrichment call, and write to an in-memory SQLite database.
+
+Usage:
+    python tests/benchmark_lead_discovery.py --people 1000 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from blank_business_builder.database import Base, LeadEnrichment, LeadRecord
+from blank_business_builder.integrations.apollo import ApolloService
+from blank_business_builder.lead_discovery import LeadDiscoveryPipeline, lead_fields
+from test_lead_discovery import FakeApolloTransport, _people
+
+
+def _session():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def sequential_discover(apollo, db, keywords):
+    """The previous endpoint body: enrich one person at a time, flush per lead."""
+    people = apollo.search_people(q_keywords=keywords, per_page=100).get("people") or []
+    for person in people:
+        try:
+            enrich = apollo.enrich_person(
+                email=person.get("email"),
+                first_name=person.get("first_name"),
+                last_name=person.get("last_name"),
+                company_name=(person.get("organization") or {}).get("name"),
+            )
+        except Exception:
+            enrich = {}
+        lead = LeadRecord(**lead_fields(person, enrich))
+        db.add(lead)
+        db.flush()
+        db.add(LeadEnrichment(lead_id=lead.id, provider="apollo", payload=enrich))
+    db.commit()
+    return len(people)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--people", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=1000.0, help="Enrichment calls per second")
+    args = parser.parse_args()
+
+    people = _people(args.people)
+    latency = args.latency_ms / 1000
+
+    apollo = ApolloService(api_key="bench", session=FakeApolloTransport(people, latency=latency))
+    start = time.perf_counter()
+    count = sequential_discover(apollo, _session(), "growth")
+    sequential = time.perf_counter() - start
+    print(f"sequential     {count:>6} people {sequential:8.2f}s")
+
+    apollo = ApolloService(api_key="bench", session=FakeApolloTransport(people, latency=latency))
+    pipeline = LeadDiscoveryPipeline(apollo, max_concurrency=args.concurrency, rate_limits={"apollo": args.rate})
+    db = _session()
+    start = time.perf_counter()
+    stored = asyncio.run(pipeline.discover(db, keywords="growth", per_page=100))
+    concurrent = time.perf_counter() - start
+    print(f"pipeline       {len(stored):>6} people {concurrent:8.2f}s  "
+          f"(concurrency={args.concurrency}, rate={args.rate:g}/s)")
+    print(f"speedup        {sequential / concurrent:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
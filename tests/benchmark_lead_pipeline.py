@@ -0,0 +1,101 @@
+"""
+Benchmark: per-lead qualify()/save() vs the batched SalesEngineer/DataBroker pipeline.
+
+Usage:
+    python tests/benchmark_lead_pipeline.py --leads 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from blank_business_builder.data_broker import DataBroker
+from blank_business_builder.sales_engineer import SalesEngineer
+from blank_business_builder.semantic_framework import Lead, Organization, Person, db
+
+INDUSTRIES = ["SaaS", "Retail", "B2B Services", "Healthcare", "AI / ML", "Logistics"]
+ROLES = ["CTO", "Developer", "Founder & CEO", "Analyst", "VP Sales", "Manager"]
+
+
+class _Core:
+    llm_engine = None
+
+
+def legacy_qualify(lead: Lead, out):
+    """The pre-batch SalesEngineer.qualify: keyword scans, a print and a save per lead."""
+    if not lead.organization or not lead.person:
+        lead.status = "Disqualified"
+        lead.score = 0
+        return
+    score = 50
+    if any(ind.lower() in lead.organization.industry.lower() for ind in ["SaaS", "AI", "B2B", "Technology"]):
+        score += 20
+    if any(role.lower() in lead.person.role.lower() for role in ["CTO", "CEO", "Founder", "VP", "Director"]):
+        score += 20
+    lead.score = score
+    lead.status = "Qualified" if score >= 70 else "Low Priority"
+    print(f"   [Qualify] {lead.person.name} @ {lead.organization.name}: Score {score} ({lead.status})", file=out)
+    db.save(lead)
+
+
+def _population(count: int):
+    rng = random.Random(11)
+    return [
+        Lead(
+            person=Person(
+                name=f"User {i}",
+                role=rng.choice(ROLES),
+                email=rng.choice([f"user{i}@acme.com", f"user{i}@localhost", None]),
+            ),
+            organization=Organization(name=f"Org {i % 500}", industry=rng.choice(INDUSTRIES)),
+        )
+        for i in range(count)
+    ]
+
+
+def _timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:8.3f}s")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--leads", type=int, default=100_000)
+    args = parser.parse_args()
+
+    leads = _population(args.leads)
+    print(f"Leads: {args.leads:,}")
+
+    db._store = {}
+    with open(os.devnull, "w") as out:
+        _, loop_time = _timed("legacy per-lead qualify", lambda: [legacy_qualify(lead, out) for lead in leads])
+    loop_scores = [lead.score for lead in leads]
+
+    db._store = {}
+    engineer = SalesEngineer(_Core())
+    qualified, batch_time = _timed("qualify_many()", lambda: engineer.qualify_many(leads))
+    assert [lead.score for lead in leads] == loop_scores
+    print(f"  qualified {len(qualified):,}, speedup {loop_time / batch_time:.2f}x")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        broker = DataBroker(_Core(), manifest_path=os.path.join(tmp, "manifest.jsonl"))
+        half = len(qualified) // 2
+        prospects, _ = _timed("verify_and_package() 1st half", lambda: broker.verify_and_package(qualified[:half]))
+        _timed("generate_manifest() 1st half", broker.generate_manifest)
+        more, _ = _timed("verify_and_package() 2nd half", lambda: broker.verify_and_package(qualified[half:]))
+        _timed("generate_manifest() 2nd half", broker.generate_manifest)
+        with open(broker.manifest_path) as f:
+            assert sum(1 for _ in f) == len(prospects) + len(more)
+        print(f"  verified {len(prospects) + len(more):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: SmartLeadScorer.score_lead in a loop vs score_batch.
+
+Usage:
+    python tests/benchmark_lead_scoring.py --leads 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from blank_business_builder.smart_lead_nurturing import Lead, SmartLeadScorer, TEMPERATURE_TIERS
+
+TYPES = ["email_open", "email_click", "page_view", "pricing_view", "demo_request",
+         "whitepaper_download", "case_study_view", "contact_sales", "trial_signup"]
+
+
+def _population(count: int):
+    rng = random.Random(7)
+    now = datetime.utcnow()
+    leads, interactions = [], {}
+    for i in range(count):
+        lead = Lead(
+            id=f"lead_{i}",
+            email=f"user{i}@{rng.choice(['gmail.com', 'acme.io', 'corp.com'])}",
+            name=f"User {i}",
+            company=rng.choice([None, "Acme"]),
+            source="website",
+            created_at=now,
+        )
+        leads.append(lead)
+        interactions[lead.id] = [
+            {"type": rng.choice(TYPES), "timestamp": now - timedelta(days=rng.randint(0, 30))}
+            for _ in range(rng.randint(0, 4))
+        ]
+    return leads, interactions
+
+
+def benchmark(count: int, loop_sample: int) -> dict:
+    print(f"Generating {count:,} leads...")
+    leads, interactions = _population(count)
+    scorer = SmartLeadScorer()
+
+    sample = leads[:loop_sample]
+    start = time.perf_counter()
+    for lead in sample:
+        scorer.score_lead(lead, interactions[lead.id])
+    loop_per_lead = (time.perf_counter() - start) / len(sample)
+    print(f"score_lead loop:         {loop_per_lead * count:7.2f}s for {count:,} leads (extrapolated)")
+
+    start = time.perf_counter()
+    scores, tiers = scorer.score_batch(leads, interactions)
+    cold = time.perf_counter() - start
+    print(f"score_batch (cold):      {cold:7.2f}s  (feature extraction + cache fill)")
+
+    start = time.perf_counter()
+    scores, tiers = scorer.score_batch(leads, interactions)
+    warm = time.perf_counter() - start
+    print(f"score_batch (cached):    {warm:7.2f}s")
+
+    features = scorer.build_feature_matrix(leads, interactions)
+    start = time.perf_counter()
+    scorer.score_features(features)
+    vectorised = time.perf_counter() - start
+    print(f"score_features (matrix): {vectorised:7.2f}s")
+
+    counts = {name: int((tiers == i).sum()) for i, name in enumerate(TEMPERATURE_TIERS)}
+    print(f"Tiers: {counts}")
+    return {"loop": loop_per_lead * count, "cold": cold, "warm": warm, "vectorised": vectorised}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--leads", type=int, default=1_000_000)
+    parser.add_argument("--loop-sample", type=int, default=20_000)
+    args = parser.parse_args()
+    benchmark(args.leads, args.loop_sample)
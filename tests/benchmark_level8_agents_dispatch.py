@@ -0,0 +1,105 @@
+"""
+Benchmark: Level-8-Agents deployment makespan with phase barriers versus
+dependency-driven dispatch.
+
+Each synthetic website has one task per phase and the executor sleeps for a
+random simulated duration. The "barrier" run waits for a whole phase before
+starting the next; the "dependency" run starts a task as soon as its own
+website's previous phase has finished. Both use the same concurrency limit.
+
+Usage:
+    python tests/benchmark_level8_agents_dispatch.py --websites 200 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts", "runners"))
+
+from blank_business_builder import hive_mind_coordinator
+
+sys.modules.setdefault("hive_mind_coordinator", hive_mind_coordinator)
+
+from feedback_loop_system import FeedbackLoopSystem
+from level8_agents_dispatch import Level8AgentsDispatchSystem, Level8Task, TaskPriority
+
+
+class SyntheticDispatch(Level8AgentsDispatchSystem):
+    """One task per phase for each of ``websites`` synthetic websites."""
+
+    websites = 0
+
+    def _load_tasks(self):
+        for site in range(self.websites):
+            for phase in TaskPriority:
+                self.add_task(Level8Task(
+                    task_id=f"site{site}_{phase.name.lower()}", title="", website=f"site{site}.example",
+                    description="", impact="", cost="", timeline="", priority=phase,
+                ))
+
+
+def build(websites, config_path):
+    hive = hive_mind_coordinator.HiveMindCoordinator(config_path=config_path)
+    SyntheticDispatch.websites = websites
+    return SyntheticDispatch(hive, FeedbackLoopSystem(hive))
+
+
+async def barrier(dispatch, executor, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(task):
+        async with semaphore:
+            dispatch._dispatch_agent(task)
+            task.result = await executor(task)
+
+    for phase in TaskPriority:
+        await asyncio.gather(*(run(task) for task in dispatch.tasks if task.priority == phase))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--websites", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    durations = {}
+    rng = random.Random(4)
+
+    async def executor(task):
+        duration = durations.setdefault(task.task_id, rng.lognormvariate(-4, 1))
+        await asyncio.sleep(duration)
+        return {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = os.path.join(tmp, "config.json")
+        dispatch = build(args.websites, config_path)
+        start = time.perf_counter()
+        asyncio.run(barrier(dispatch, executor, args.concurrency))
+        barrier_time = time.perf_counter() - start
+
+        dispatch = build(args.websites, config_path)
+        start = time.perf_counter()
+        dispatch.dispatch_all_agents(executor, max_concurrency=args.concurrency)
+        dependency_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            dispatch.get_deployment_status()
+        status_time = (time.perf_counter() - start) / 1000
+
+    tasks = len(dispatch.tasks)
+    print(f"barrier     {tasks:>6} tasks  {barrier_time:7.2f}s")
+    print(f"dependency  {tasks:>6} tasks  {dependency_time:7.2f}s  {barrier_time / dependency_time:.2f}x faster")
+    print(f"get_deployment_status  {status_time * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark: full-scan metric aggregation vs incremental MetricRollupEngine runs.
+
+Usage:
+    python tests/benchmark_metric_rollups.py --businesses 500 --rows 200000 --new-rows 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, func, insert, select
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from blank_business_builder.database import Base, Business, MetricsHistory, User
+from blank_business_builder.metric_rollups import MetricRollupEngine, bucket_start
+
+
+def write_history(engine, business_ids, count, start, span, ingested_at, seed):
+    rng = random.Random(seed)
+    table = MetricsHistory.__table__
+    for offset in range(0, count, 20000):
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "business_id": rng.choice(business_ids),
+                "timestamp": start + timedelta(seconds=rng.uniform(0, span.total_seconds())),
+                "revenue": rng.randrange(100000) / 100,
+                "customers": rng.randrange(500),
+                "leads": rng.randrange(2000),
+                "conversion_rate": rng.randrange(10000) / 100,
+                "tasks_completed": rng.randrange(100),
+                "tasks_pending": rng.randrange(20),
+                "tasks_failed": rng.randrange(5),
+                "ingested_at": ingested_at,
+            }
+            for _ in range(min(20000, count - offset))
+        ]
+        with engine.begin() as conn:
+            conn.execute(insert(table), rows)
+
+
+def full_scan(engine):
+    """Recompute hourly per-business aggregates from all of MetricsHistory."""
+    table = MetricsHistory.__table__
+    hour = func.strftime("%Y-%m-%d %H:00:00", table.c.timestamp)
+    with engine.connect() as conn:
+        return len(conn.execute(
+            select(table.c.business_id, hour, func.count(), func.sum(table.c.revenue))
+            .group_by(table.c.business_id, hour)
+        ).all())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--businesses", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--new-rows", type=int, default=2000)
+    parser.add_argument("--late-fraction", type=float, default=0.05,
+                        help="Share of new rows backdated into earlier days")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        user_id = uuid.uuid4()
+        business_ids = [uuid.uuid4() for _ in range(args.businesses)]
+        with engine.begin() as conn:
+            conn.execute(insert(User.__table__), [{"id": user_id, "email": "bench@bbb.test", "hashed_password": "x"}])
+            conn.execute(insert(Business.__table__), [
+                {"id": business_id, "user_id": user_id, "business_name": f"Business {i}"}
+                for i, business_id in enumerate(business_ids)
+            ])
+
+        now = bucket_start(datetime.utcnow(), "minute")
+        history = timedelta(days=args.days)
+        write_history(engine, business_ids, args.rows, now - history, history, now - timedelta(minutes=10), seed=1)
+        rollups = MetricRollupEngine(engine, overlap=timedelta(0))
+
+        start = time.perf_counter()
+        report = rollups.run()
+        buckets = report.buckets
+        print(f"initial rollup   {report.rows_consumed:>8} rows  {time.perf_counter() - start:8.2f}s "
+              f"({buckets['minute']} minute / {buckets['hour']} hour / {buckets['day']} day buckets)")
+
+        start = time.perf_counter()
+        groups = full_scan(engine)
+        scan = time.perf_counter() - start
+        print(f"full scan        {args.rows:>8} rows  {scan:8.2f}s ({groups} business-hours)")
+
+        late = int(args.new_rows * args.late_fraction)
+        write_history(engine, business_ids, args.new_rows - late, now, timedelta(minutes=1), now, seed=2)
+        write_history(engine, business_ids, late, now - history, history, now, seed=3)
+        start = time.perf_counter()
+        report = rollups.run()
+        incremental = time.perf_counter() - start
+        print(f"incremental      {report.rows_consumed:>8} rows  {incremental:8.2f}s "
+              f"({report.buckets['minute']} minute / {report.buckets['hour']} hour / {report.buckets['day']} day "
+              f"buckets, {late} late)  {scan / incremental:,.1f}x faster than the full scan")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: OpenAGI workflow execution and team workload balancing.
+
+"sequential" awaits each action in declaration order (the previous
+behaviour, and still the default when no dependencies are declared);
+"concurrent" declares the wide actions independent of each other.
+
+For balancing, "round-robin" is the previous assignment (it ignores
+capacity, so overbooked members are reported), "scan" is least-loaded
+assignment with a linear search of the team per task, and "heap" is
+TeamBalancerAgent.balance_workload.
+
+Usage:
+    python tests/benchmark_openagi_workflow.py --width 200 --team 1000 --tasks 8000
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import random
+import time
+
+_spec = importlib.util.spec_from_file_location(
+    "openagi_workflow", os.path.join(os.path.dirname(__file__), "..", "FlowState", "backend", "openagi_workflow.py")
+)
+openagi_workflow = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(openagi_workflow)
+
+ActionType = openagi_workflow.ActionType
+WorkflowAction = openagi_workflow.WorkflowAction
+TRIGGER = openagi_workflow.WorkflowTrigger(type=openagi_workflow.TriggerType.MANUAL, conditions={})
+
+
+class IOBoundEngine(openagi_workflow.OpenAGIWorkflowEngine):
+    """Every action waits ``latency`` seconds, like a call to an agent or API."""
+
+    def __init__(self, latency, **kwargs):
+        super().__init__(**kwargs)
+        self.latency = latency
+
+    async def _execute_action(self, action, context):
+        await asyncio.sleep(self.latency)
+        return {"action": action.id}
+
+
+async def run_workflow(width, latency, concurrency, independent):
+    engine = IOBoundEngine(latency, max_concurrency=concurrency)
+    deps = (lambda ids: ids) if independent else (lambda ids: None)
+    actions = [WorkflowAction(ActionType.CALL_API, {}, id="start", depends_on=[])]
+    actions += [WorkflowAction(ActionType.CALL_API, {}, id=f"a{i}", depends_on=deps(["start"]))
+                for i in range(width)]
+    actions.append(WorkflowAction(ActionType.CALL_API, {}, id="end",
+                                  depends_on=deps([f"a{i}" for i in range(width)])))
+    workflow_id = await engine.create_workflow("wide", "", TRIGGER, actions)
+    start = time.perf_counter()
+    result = await engine.execute_workflow(workflow_id, {})
+    assert result["actions_executed"] == width + 2
+    return time.perf_counter() - start
+
+
+def round_robin(team, tasks):
+    return {task["id"]: team[i % len(team)]["id"] for i, task in enumerate(tasks)}
+
+
+def linear_scan(team, tasks):
+    loads = [float(m.get("workload", 0)) for m in team]
+    assignments = {}
+    for task in sorted(tasks, key=lambda t: (-t.get("priority", 0), -t.get("estimated_hours", 1))):
+        hours = task.get("estimated_hours", 1)
+        best = None
+        for i, member in enumerate(team):
+            if loads[i] + hours <= member["capacity"] and (best is None or loads[i] < loads[best]):
+                best = i
+        if best is not None:
+            loads[best] += hours
+            assignments[task["id"]] = team[best]["id"]
+    return assignments
+
+
+def overbooked(team, tasks, assignments):
+    hours = {m["id"]: m.get("workload", 0) for m in team}
+    for task in tasks:
+        if task["id"] in assignments:
+            hours[assignments[task["id"]]] += task["estimated_hours"]
+    return sum(1 for m in team if hours[m["id"]] > m["capacity"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--team", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=8000)
+    args = parser.parse_args()
+
+    sequential = asyncio.run(run_workflow(args.width, args.latency, args.concurrency, False))
+    concurrent = asyncio.run(run_workflow(args.width, args.latency, args.concurrency, True))
+    print(f"workflow  width {args.width}  sequential {sequential:6.3f}s  concurrent {concurrent:6.3f}s  "
+          f"{sequential / concurrent:5.1f}x")
+
+    rng = random.Random(7)
+    team = [{"id": f"m{i}", "capacity": rng.choice([20, 32, 40]), "workload": rng.randint(0, 16)}
+            for i in range(args.team)]
+    tasks = [{"id": f"t{i}", "estimated_hours": rng.choice([1, 2, 3, 5, 8]), "priority": rng.randint(0, 3)}
+             for i in range(args.tasks)]
+
+    start = time.perf_counter()
+    rr = round_robin(team, tasks)
+    rr_time = time.perf_counter() - start
+    start = time.perf_counter()
+    linear_scan(team, tasks)
+    scan_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = asyncio.run(openagi_workflow.TeamBalancerAgent().balance_workload(team, tasks))
+    heap_time = time.perf_counter() - start
+
+    print(f"balance   {args.team} members x {args.tasks} tasks")
+    print(f"  round-robin {rr_time:7.3f}s  overbooked members {overbooked(team, tasks, rr)}")
+    print(f"  scan        {scan_time:7.3f}s")
+    print(f"  heap        {heap_time:7.3f}s  {scan_time / heap_time:5.1f}x vs scan  "
+          f"overbooked {overbooked(team, tasks, result['assignments'])}  "
+          f"unassigned {len(result['unassigned'])}  balance {result['balance_score']}")
+
+
+if __name__ == "__main__":
+    main()
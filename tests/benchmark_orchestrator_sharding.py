@@ -0,0 +1,95 @@
+"""
+Load test: run 10k simulated businesses on one machine through ShardSupervisor.
+
+Usage:
+    python tests/benchmark_orchestrator_sharding.py --businesses 10000 --workers 8
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from blank_business_builder.orchestrator_sharding import BusinessSpec, ShardSupervisor
+
+logging.disable(logging.CRITICAL)
+
+CONCEPTS = [
+    "AI Chatbot Integration Service",
+    "Crypto Mining Pool",
+    "Micro SaaS Builder",
+    "Content Creation Agency",
+]
+
+
+def _rss_mb(pid: int) -> float:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def benchmark(businesses: int, workers: int, cycles: int, cycle_interval: float) -> dict:
+    specs = [
+        BusinessSpec(f"biz-{i:06d}", CONCEPTS[i % len(CONCEPTS)], f"Founder {i}")
+        for i in range(businesses)
+    ]
+
+    with ShardSupervisor(num_workers=workers, cycle_interval=cycle_interval, simulate=True,
+                         rpc_timeout=600, worker_log_level=logging.CRITICAL) as supervisor:
+        print(f"Deploying {businesses} businesses across {workers} workers...")
+        start = time.perf_counter()
+        started = supervisor.add_businesses(specs)
+        deploy_seconds = time.perf_counter() - start
+        print(f"Deployed {started} businesses in {deploy_seconds:.2f}s "
+              f"({started / deploy_seconds:,.0f} businesses/s)")
+
+        time.sleep(cycles * cycle_interval)
+
+        start = time.perf_counter()
+        dashboard = supervisor.get_metrics_dashboard()
+        dashboard_seconds = time.perf_counter() - start
+
+        print(f"Aggregated dashboard over IPC in {dashboard_seconds * 1000:.1f} ms")
+        for shard in dashboard["shards"]:
+            print(f"  shard {shard['worker_index']}: {shard['businesses']:5d} businesses, "
+                  f"{shard['cycles']:3d} cycles, last cycle {shard['last_cycle_seconds']:.2f}s, "
+                  f"RSS {_rss_mb(shard['pid']):.0f} MB")
+        metrics = dashboard["metrics"]
+        print(f"Total revenue ${metrics['total_revenue']:,.2f}, "
+              f"tasks completed {metrics['tasks_completed']:,}, pending {metrics['tasks_pending']:,}")
+
+        # Kill one worker and measure rebalancing
+        victim = dashboard["shards"][0]["worker_index"]
+        supervisor.processes[victim].terminate()
+        supervisor.processes[victim].join()
+        start = time.perf_counter()
+        supervisor.check_workers()
+        rebalance_seconds = time.perf_counter() - start
+        print(f"Rebalanced {supervisor.rebalanced_businesses} businesses after worker death "
+              f"in {rebalance_seconds:.2f}s")
+
+        assert supervisor.get_metrics_dashboard()["businesses"] == businesses
+
+    return {
+        "deploy_seconds": deploy_seconds,
+        "dashboard_seconds": dashboard_seconds,
+        "rebalance_seconds": rebalance_seconds,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--businesses", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--cycle-interval", type=float, default=5.0)
+    args = parser.parse_args()
+    benchmark(args.businesses, args.workers, args.cycles, args.cycle_interval)
@@ -0,0 +1,96 @@
+"""
+Benchmark: ProfitabilityMonitor cycle and metric retention.
+
+Compares a sequential cycle (one Stripe charge list per business) with the
+concurrent cycle (one list per cycle), using a simulated Stripe latency, and
+list-rescan retention with the ring-buffer MetricTimeSeriesStore.
+
+Usage:
+    python tests/benchmark_profitability_monitor.py --businesses 200 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import stripe
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts", "runners"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts", "tools"))
+
+from bbb_real_business_library import get_real_business_library
+from profitability_monitor import ProfitabilityMonitor
+
+
+def make_monitor(models, latency, calls):
+    def charge_list(**params):
+        calls.append(params)
+        time.sleep(latency)
+        charges = [
+            SimpleNamespace(id=f"ch_{i}", amount=4900, created=int(time.time()), metadata={"business": name})
+            for i, name in enumerate(models)
+        ]
+        return SimpleNamespace(data=charges, auto_paging_iter=lambda: iter(charges))
+
+    stripe.Charge.list = charge_list
+    monitor = ProfitabilityMonitor(stripe_api_key="sk_test_benchmark")
+    monitor._load_business_models = lambda: models
+    return monitor
+
+
+async def sequential_cycle(monitor, models):
+    """The previous cycle: businesses one after another, charges listed per business."""
+    for name, model in models.items():
+        metric = await monitor._gather_business_metrics(name, model)
+        monitor.metrics_store.append(metric)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--businesses", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--samples", type=int, default=2160, help="Retained samples per business (90 days hourly)")
+    args = parser.parse_args()
+
+    template = get_real_business_library().get_all_businesses()[0]
+    models = {f"Business {i}": replace(template, name=f"Business {i}") for i in range(args.businesses)}
+    latency = args.latency_ms / 1000
+
+    calls = []
+    monitor = make_monitor(models, latency, calls)
+    start = time.perf_counter()
+    asyncio.run(sequential_cycle(monitor, models))
+    sequential = time.perf_counter() - start
+    print(f"sequential cycle   {args.businesses:>5} businesses  {sequential:7.2f}s  ({len(calls)} charge lists)")
+
+    calls = []
+    monitor = make_monitor(models, latency, calls)
+    start = time.perf_counter()
+    asyncio.run(monitor._monitoring_cycle())
+    concurrent = time.perf_counter() - start
+    print(f"concurrent cycle   {args.businesses:>5} businesses  {concurrent:7.2f}s  ({len(calls)} charge lists)  "
+          f"{sequential / concurrent:,.1f}x faster")
+
+    # Retention once the window is full: rescanning a list vs overwriting a ring slot
+    metric = monitor.metrics_store.latest(next(iter(models)))
+    history = [replace(metric, timestamp=datetime.now() - timedelta(hours=i)) for i in range(args.samples)]
+    cutoff = datetime.now() - timedelta(days=90)
+    start = time.perf_counter()
+    for _ in range(1000):
+        history.append(metric)
+        history = [m for m in history if m.timestamp > cutoff][-args.samples:]
+    rescan = (time.perf_counter() - start) / 1000
+    start = time.perf_counter()
+    for _ in range(1000):
+        monitor.metrics_store.append(metric)
+    ring = (time.perf_counter() - start) / 1000
+    print(f"retention per sample  list rescan {rescan * 1e6:9.1f}us  ring buffer {ring * 1e6:6.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: per-event Stripe webhook handling vs the batched event inbox.
+
+Usage:
+    python tests/benchmark_stripe_inbox.py --events 5000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from blank_business_builder.database import Base, PaymentTransaction, Subscription, User
+from blank_business_builder.payments import handle_webhook_event
+from blank_business_builder.stripe_inbox import StripeInboxProcessor, record_stripe_event
+
+
+def make_events(count, customers):
+    events = []
+    for i in range(count):
+        customer = f"cus_{i % customers}"
+        if i % 2:
+            event_type, obj = "payment_intent.succeeded", {
+                "id": f"pi_{i}", "customer": customer, "amount": 4900, "currency": "usd", "metadata": {},
+            }
+        else:
+            event_type, obj = "customer.subscription.created", {
+                "id": f"sub_{i}", "customer": customer, "status": "active",
+                "current_period_start": 1760000000, "current_period_end": 1762600000,
+                "items": {"data": [{"price": {"lookup_key": "pro"}}]},
+            }
+        events.append({"id": f"evt_{i}", "type": event_type, "created": 1760000000 + i, "data": {"object": obj}})
+    return events
+
+
+def fresh_session(path, customers):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User.__table__), [
+            {"id": uuid.uuid4(), "email": f"cus_{i}@example.com", "hashed_password": "x",
+             "stripe_customer_id": f"cus_{i}"}
+            for i in range(customers)
+        ])
+    return engine, sessionmaker(bind=engine)()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--customers", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    events = make_events(args.events, args.customers)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+
+        engine, db = fresh_session(path, args.customers)
+        start = time.perf_counter()
+        for event in events:
+            handle_webhook_event(event, db)
+        legacy = time.perf_counter() - start
+        rows = db.query(Subscription).count() + db.query(PaymentTransaction).count()
+        print(f"per-event handlers   {args.events:>6} events  {legacy:7.2f}s  ({rows} rows written)")
+        db.close()
+        engine.dispose()
+
+        engine, db = fresh_session(path, args.customers)
+        start = time.perf_counter()
+        for event in events:
+            record_stripe_event(db, event)
+        ingest = time.perf_counter() - start
+        report = StripeInboxProcessor(db, batch_size=args.batch_size).drain()
+        rows = db.query(Subscription).count() + db.query(PaymentTransaction).count()
+        print(f"inbox ingest         {args.events:>6} events  {ingest:7.2f}s  "
+              f"({ingest / args.events * 1000:.2f} ms per webhook ack)")
+        print(f"inbox drain          {report.events:>6} events  {report.elapsed_seconds:7.2f}s  "
+              f"({report.batches} batches, {rows} rows written)  "
+              f"processing {legacy / report.elapsed_seconds:,.1f}x faster")
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: temporal memory housekeeping, one JSON file per memory versus
+the segmented store.
+
+"legacy" is the previous cleaner: should_clean globs the directory to
+count, clean_old_memories globs, stats and sorts every file and unlinks the
+surplus. "store" opens the segmented store (index plus the active segment),
+checks its in-memory count and drops whole segments. The one-shot migration
+of the legacy layout is timed as well.
+
+Usage:
+    python tests/benchmark_temporal_memory_store.py --memories 20000 --keep 100
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+TOOLS = os.path.join(os.path.dirname(__file__), "..", "scripts", "tools")
+_spec = importlib.util.spec_from_file_location("temporal_memory_store", os.path.join(TOOLS, "temporal_memory_store.py"))
+temporal_memory_store = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(temporal_memory_store)
+
+
+def write_legacy(root, memories):
+    for i in range(memories):
+        (root / f"memory_{i:07d}.json").write_text(json.dumps({"thought": f"memory {i}", "weight": i % 7}))
+
+
+def legacy_check_and_clean(root, threshold, keep):
+    if len(list(root.glob("*.json"))) < threshold:
+        return 0
+    files = sorted(((f, f.stat().st_mtime) for f in root.glob("*.json")), key=lambda x: x[1], reverse=True)
+    for path, _ in files[keep:]:
+        path.unlink()
+    return len(files) - keep
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--memories", type=int, default=20000)
+    parser.add_argument("--keep", type=int, default=100)
+    parser.add_argument("--segment-records", type=int, default=25)
+    args = parser.parse_args()
+    threshold = args.memories
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = Path(tmp) / "legacy"
+        legacy.mkdir()
+        write_legacy(legacy, args.memories)
+
+        start = time.perf_counter()
+        len(list(legacy.glob("*.json"))) >= threshold
+        check = time.perf_counter() - start
+        start = time.perf_counter()
+        dropped = legacy_check_and_clean(legacy, threshold, args.keep)
+        clean = time.perf_counter() - start
+        print(f"legacy  {args.memories} memories  check {check * 1000:8.2f}ms  "
+              f"check+clean {clean * 1000:8.1f}ms  ({dropped} dropped)")
+
+        migrated_dir = Path(tmp) / "migrate"
+        migrated_dir.mkdir()
+        write_legacy(migrated_dir, args.memories)
+        start = time.perf_counter()
+        with temporal_memory_store.TemporalMemoryStore(migrated_dir / "segments",
+                                                       segment_records=args.segment_records) as store:
+            temporal_memory_store.migrate_directory(migrated_dir, store)
+        migrate = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store = temporal_memory_store.TemporalMemoryStore(migrated_dir / "segments",
+                                                          segment_records=args.segment_records)
+        len(store) >= threshold
+        check = time.perf_counter() - start
+        start = time.perf_counter()
+        dropped = store.enforce_retention(args.keep) if len(store) >= threshold else 0
+        clean = time.perf_counter() - start
+        print(f"store   {args.memories} memories  check {check * 1000:8.2f}ms  "
+              f"clean       {clean * 1000:8.1f}ms  ({dropped} dropped, {len(store)} kept)  "
+              f"one-shot migration {migrate:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
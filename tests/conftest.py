@@ -0,0 +1,48 @@
+"""
+Shared pytest fixtures.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+# conftest is imported before any test module, i.e. before several of them
+# replace sys.modules['numpy'] / sys.modules['httpx'] with a MagicMock at import time.
+import httpx as _real_httpx
+import numpy as _real_numpy
+# numpy loads these submodules lazily, which fails once sys.modules['numpy'] is stubbed
+import numpy.ma  # noqa: F401
+import numpy.random  # noqa: F401
+import pytest
+
+
+@pytest.fixture
+def real_numpy():
+    """The real numpy module, even if a test module has stubbed sys.modules['numpy']."""
+    return _real_numpy
+
+
+@pytest.fixture(autouse=True)
+def _real_numpy_marker(request, monkeypatch):
+    """Bind the real numpy as ``np`` in each module named by a ``real_numpy`` marker.
+
+    A module imported while sys.modules['numpy'] was stubbed keeps the stub;
+    ``pytestmark = pytest.mark.real_numpy(module)`` undoes that for a test.
+    """
+    for marker in request.node.iter_markers("real_numpy"):
+        for module in marker.args:
+            monkeypatch.setattr(module, "np", _real_numpy)
+
+
+@pytest.fixture
+def real_httpx():
+    """The real httpx module, even if a test module has stubbed sys.modules['httpx']."""
+    return _real_httpx
+
+
+@pytest.fixture
+def backup_sandbox(tmp_path, monkeypatch):
+    """Run in tmp_path with a backup key in the environment.
+
+    Disaster recovery engines default to ./backups and refuse to encrypt
+    without a key kept outside the backup tree.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BBB_BACKUP_KEY", "00" * 32)
@@ -0,0 +1,99 @@
+"""
+Tests for adaptive task generation (dedup, coalescing, rate caps, IDs).
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder.autonomous_business import (
+    AgentRole,
+    AutonomousBusinessOrchestrator,
+    TaskStatus,
+)
+from blank_business_builder.orchestrator_sharding import SimulatedServices
+
+LOW_CONVERSION = "Analyze low conversion and recommend improvements"
+
+
+def _orchestrator(**kwargs):
+    services = SimulatedServices()
+    return AutonomousBusinessOrchestrator(
+        "AI Chatbot Integration Service", "Founder",
+        market_research=services, email_service=services,
+        payment_processor=services, social_media=services,
+        **kwargs,
+    )
+
+
+def _research_tasks(orch):
+    return [t for t in orch.task_queue if t.description == LOW_CONVERSION]
+
+
+@pytest.mark.asyncio
+async def test_low_conversion_keeps_one_open_research_task():
+    orch = _orchestrator()
+    for _ in range(100):
+        await orch._generate_adaptive_tasks([])
+
+    assert len(orch.task_queue) == 1
+    assert orch.task_generator.stats["generated"] == 1
+    assert orch.task_generator.stats["coalesced"] == 99
+
+    task = _research_tasks(orch)[0]
+    orch._set_task_status(task, TaskStatus.IN_PROGRESS)
+    await orch._generate_adaptive_tasks([])
+    assert orch.task_generator.stats["deduplicated"] == 1
+
+    orch._set_task_status(task, TaskStatus.COMPLETED, result={"success": True})
+    await orch._generate_adaptive_tasks([])
+    assert len(_research_tasks(orch)) == 2
+
+
+@pytest.mark.asyncio
+async def test_mining_results_coalesce_into_one_pending_task():
+    orch = _orchestrator()
+    miner = orch._create_agent("miner_1", AgentRole.CRYPTO_MINER)
+    results = [{"agent_id": miner.agent_id, "success": True}] * 5
+
+    await orch._generate_adaptive_tasks(results)
+
+    mining = [t for t in orch.task_queue if t.role == AgentRole.CRYPTO_MINER]
+    assert len(mining) == 1
+    assert orch.task_generator.stats["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_rate_cap_limits_generated_tasks_per_role():
+    orch = _orchestrator()
+    orch.task_generator.rate_caps[AgentRole.RESEARCHER] = 2
+    for _ in range(5):
+        await orch._generate_adaptive_tasks([])
+        for task in _research_tasks(orch):
+            if task.status == TaskStatus.PENDING:
+                orch._set_task_status(task, TaskStatus.COMPLETED, result={"success": True})
+
+    assert len(_research_tasks(orch)) == 2
+    assert orch.task_generator.stats["rate_limited"] == 3
+
+
+@pytest.mark.asyncio
+async def test_generated_ids_stay_unique_after_archiving():
+    orch = _orchestrator(task_retention_seconds=0)
+    orch.task_generator.rate_cap = 1000
+    seen = set()
+    for _ in range(20):
+        await orch._generate_adaptive_tasks([])
+        task = _research_tasks(orch)[-1]
+        assert task.task_id not in seen
+        seen.add(task.task_id)
+        orch._set_task_status(task, TaskStatus.COMPLETED, result={"success": True})
+        orch.archive_finished_tasks(force=True)
+
+    assert len(seen) == 20
+    assert orch.task_queue == []
+    assert len(orch.task_archive) == 20
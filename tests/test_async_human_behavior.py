@@ -0,0 +1,195 @@
+"""
+Tests for the asyncio human-behaviour timing model.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import asyncio
+import math
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../scripts/runners')))
+
+import async_human_behavior
+from async_human_behavior import (
+    BACKSPACE, AsyncHumanBehaviorSimulator, RealClock, Schedule, VirtualClock, bezier_path, keystroke_schedule,
+)
+
+
+pytestmark = pytest.mark.real_numpy(async_human_behavior)
+
+
+class FakeElement:
+    location = {'x': 400, 'y': 300}
+    size = {'width': 80, 'height': 20}
+
+    def __init__(self, log):
+        self.log = log
+
+    def click(self):
+        self.log.append(("click",))
+
+    def send_keys(self, keys):
+        self.log.append(("keys", keys))
+
+
+class FakeDriver:
+    def __init__(self):
+        self.log = []
+
+    def execute_script(self, script):
+        self.log.append(("script", script))
+        return 1200 if "Width" in script else 800
+
+
+class FakeChains:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def move_to_element(self, element):
+        self.driver.log.append(("move",))
+        return self
+
+    def move_to_element_with_offset(self, element, x, y):
+        self.driver.log.append(("misclick", x, y))
+        return self
+
+    def click(self):
+        return self
+
+    def perform(self):
+        pass
+
+
+def _session(seed, clock=None):
+    driver = FakeDriver()
+    human = AsyncHumanBehaviorSimulator(driver, seed=seed, clock=clock or VirtualClock(),
+                                        offload_driver_calls=False, action_chains=FakeChains)
+    return human, driver
+
+
+def _typed(log):
+    text = []
+    for entry in log:
+        if entry[0] == "keys":
+            for key in entry[1]:
+                text.pop() if key == BACKSPACE else text.append(key)
+    return "".join(text)
+
+
+async def _browse(human, driver, text):
+    element = FakeElement(driver.log)
+    await human.natural_page_arrival_behavior()
+    for _ in range(16):
+        await human.human_click(element)
+    await human.human_type(element, text)
+    return human.clock.time()
+
+
+def test_seeded_sessions_are_deterministic_in_virtual_time():
+    text = "The quick brown fox jumps over the lazy dog " * 3
+
+    async def scenario(seed):
+        human, driver = _session(seed)
+        elapsed = await _browse(human, driver, text)
+        return elapsed, driver.log, human.clock.sleeps
+
+    start = time.perf_counter()
+    first, again, other = (asyncio.run(scenario(seed)) for seed in (7, 7, 8))
+    assert time.perf_counter() - start < 5  # Minutes of simulated browsing, no real waiting
+
+    assert first == again
+    assert first[0] != other[0]
+    assert first[0] > 16 * 0.4  # At least the click hesitations and post-click pauses
+    log = first[1]
+    assert _typed(log) == text
+    assert any(entry[0] == "misclick" for entry in log)  # Misclicks come every 7-15 clicks
+
+
+def test_keystrokes_sleep_in_batches_no_shorter_than_min_sleep():
+    rng = async_human_behavior.np.random.default_rng(3)
+    schedule = keystroke_schedule("hello world, typing quickly", rng, typo_rate=0.3)
+    assert BACKSPACE in schedule.events
+    assert ((schedule.delays >= 0.08 * 0.7) & (schedule.delays <= 0.15 + 0.5)).all()
+
+    coarse = schedule.batches(min_sleep=0.2)
+    assert [key for _, keys in coarse for key in keys] == list(schedule.events)
+    offsets = [offset for offset, _ in coarse]
+    assert offsets[0] == 0.0
+    assert all(b - a >= 0.2 for a, b in zip(offsets, offsets[1:]))
+    assert len(coarse) < len(schedule.events)
+
+    # Delays of at least min_sleep are never merged
+    assert len(schedule.batches()) == len(schedule.events)
+    tiny = Schedule(tuple("abcd"), async_human_behavior.np.array([0.004, 0.004, 0.004, 0.004]))
+    assert [keys for _, keys in tiny.batches()] == [tuple("abc"), ("d",)]
+
+
+def test_bezier_path_runs_from_start_to_end():
+    rng = async_human_behavior.np.random.default_rng(0)
+    path = bezier_path((600, 400), (440, 310), 20, rng)
+    assert path.shape == (21, 2)
+    assert tuple(path[0]) == (600, 400)
+    assert tuple(path[-1]) == (440, 310)
+
+
+def test_many_sessions_share_one_event_loop():
+    async def scenario():
+        sessions = [_session(seed, RealClock()) for seed in range(50)]
+        for human, _ in sessions:
+            human.min_sleep = 0.02
+        start = time.perf_counter()
+        elements = [FakeElement(driver.log) for _, driver in sessions]
+        await asyncio.gather(*(human.human_type(element, "abcdefgh")
+                               for (human, _), element in zip(sessions, elements)))
+        return time.perf_counter() - start, sessions
+
+    elapsed, sessions = asyncio.run(scenario())
+
+    # Each session types for ~1 s; run one after another they would take ~50 s
+    assert elapsed < 5
+    assert all(_typed(driver.log) == "abcdefgh" for _, driver in sessions)
+
+
+def test_replay_tracks_absolute_deadlines():
+    async def scenario():
+        human, _ = _session(1, RealClock())
+        schedule = Schedule(tuple(range(20)), async_human_behavior.np.full(20, 0.01))
+
+        async def slow_fire(events):
+            time.sleep(0.003)  # Work done per event must not push later deadlines back
+
+        start = time.perf_counter()
+        await human.replay(schedule, slow_fire)
+        return time.perf_counter() - start
+
+    assert math.isclose(asyncio.run(scenario()), 0.2, abs_tol=0.08)
+
+
+def test_element_geometry_is_read_off_the_event_loop():
+    class RemoteElement(FakeElement):
+        """Geometry reads are WebDriver round trips; record the thread they run on."""
+
+        @property
+        def location(self):
+            self.log.append(("location", threading.current_thread()))
+            return {'x': 400, 'y': 300}
+
+        @property
+        def size(self):
+            self.log.append(("size", threading.current_thread()))
+            return {'width': 80, 'height': 20}
+
+    async def scenario():
+        driver = FakeDriver()
+        human = AsyncHumanBehaviorSimulator(driver, seed=2, clock=VirtualClock(), action_chains=FakeChains)
+        await human.human_move_to_element(RemoteElement(driver.log))
+        return driver.log
+
+    reads = [entry for entry in asyncio.run(scenario()) if entry[0] in ("location", "size")]
+    assert [name for name, _ in reads] == ["location", "size"]
+    assert all(thread is not threading.main_thread() for _, thread in reads)
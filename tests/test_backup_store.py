@@ -0,0 +1,259 @@
+"""
+Tests for the chunked, deduplicated backup store behind BackupEngine.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import hashlib
+import os
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder.backup_store import BackupKeyError, ChunkCodec, ChunkIntegrityError, load_backup_key
+from blank_business_builder.disaster_recovery import (
+    BackupEngine,
+    BackupType,
+    DisasterRecoveryOrchestrator,
+    run_restore_drill,
+)
+
+CHUNK = 64 * 1024
+KEY = bytes(range(32))
+
+
+def _dataset(root: Path) -> Path:
+    data = root / "data"
+    (data / "nested").mkdir(parents=True)
+    (data / "big.bin").write_bytes(os.urandom(10 * CHUNK + 123))
+    (data / "nested" / "notes.txt").write_text("hello backup\n" * 5000)
+    (data / "empty.txt").write_bytes(b"")
+    return data
+
+
+def _engine(root: Path, **kwargs) -> BackupEngine:
+    return BackupEngine(base_path=str(root / "store"), chunk_size=CHUNK, encryption_key=KEY, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_directory_round_trip_restores_identical_bytes(tmp_path):
+    data = _dataset(tmp_path)
+    engine = _engine(tmp_path)
+
+    backup = await engine.create_backup([str(data), "database"])
+    result = await engine.restore_backup(backup.backup_id, target=str(tmp_path / "restore"))
+
+    assert result["success"] is True
+    assert result["restored_sources"] == [str(data), "database"]
+    for name in ("big.bin", "nested/notes.txt", "empty.txt"):
+        assert (tmp_path / "restore" / "data" / name).read_bytes() == (data / name).read_bytes()
+    # The repetitive text file compresses well
+    assert backup.compression_ratio > 1.0
+    assert backup.chunk_count >= 12
+
+
+@pytest.mark.asyncio
+async def test_incremental_backup_writes_only_changed_chunks(tmp_path):
+    data = _dataset(tmp_path)
+    engine = _engine(tmp_path)
+    full = await engine.create_backup([str(data)])
+
+    with open(data / "big.bin", "r+b") as f:
+        f.seek(3 * CHUNK + 10)
+        f.write(b"changed")
+
+    incremental = await engine.create_backup([str(data)], backup_type=BackupType.INCREMENTAL)
+
+    # One changed 64 KiB chunk (random data, so ~incompressible) plus the tiny export document
+    assert CHUNK < incremental.bytes_written < 2 * CHUNK
+    assert incremental.bytes_written < full.bytes_written / 5
+    restored = await engine.restore_backup(incremental.backup_id, target=str(tmp_path / "restore"))
+    assert restored["success"] is True
+    assert (tmp_path / "restore" / "data" / "big.bin").read_bytes() == (data / "big.bin").read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_encrypted_and_tampering_is_detected(tmp_path):
+    data = _dataset(tmp_path)
+    engine = _engine(tmp_path)
+    backup = await engine.create_backup([str(data)], encrypt=True)
+
+    chunk_files = [p for p in (tmp_path / "store" / "chunks").rglob("*") if p.is_file()]
+    assert chunk_files and all(p.name.endswith(".e") for p in chunk_files)
+    assert not any(b"hello backup" in p.read_bytes() for p in chunk_files)
+
+    victim = max(chunk_files, key=lambda p: p.stat().st_size)
+    blob = bytearray(victim.read_bytes())
+    blob[-1] ^= 0xFF
+    victim.write_bytes(bytes(blob))
+
+    result = await engine.restore_backup(backup.backup_id, target=str(tmp_path / "restore"))
+    assert result["success"] is False
+    assert "authentication" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_failed_restore_leaves_existing_files_untouched(tmp_path):
+    data = _dataset(tmp_path)
+    engine = _engine(tmp_path)
+    backup = await engine.create_backup([str(data)], encrypt=False)
+
+    target = tmp_path / "restore"
+    (target / "data").mkdir(parents=True)
+    (target / "data" / "big.bin").write_bytes(b"previous contents")
+    # Corrupt the last chunk of big.bin; all earlier chunks decode fine
+    big = next(e for e in engine.manifest.files(backup.backup_id) if e.relpath == "big.bin")
+    engine.chunk_store.write(big.chunks[-1], False, b"\x00\x00" + b"garbage")
+
+    result = await engine.restore_backup(backup.backup_id, target=str(target), verify=False)
+
+    assert result["success"] is False
+    assert (target / "data" / "big.bin").read_bytes() == b"previous contents"
+    assert not [p for p in target.rglob("*.restore")]
+    measurement = engine.restore_history()[-1]
+    assert measurement.success is False and "digest" in measurement.error
+
+
+@pytest.mark.asyncio
+async def test_restore_measures_rto_and_rpo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # The orchestrator's default engine uses ./backups
+    data = _dataset(tmp_path)
+    dr = DisasterRecoveryOrchestrator()
+    dr.backup_engine = _engine(tmp_path)
+    backup = await dr.backup_engine.create_backup([str(data)])
+
+    result = await dr.backup_engine.restore_backup(backup.backup_id, target=str(tmp_path / "restore"))
+
+    assert result["success"] is True
+    assert result["rto_seconds"] > 0
+    assert result["rpo_seconds"] >= 0
+    assert result["bytes_restored"] >= (data / "big.bin").stat().st_size
+    restored = tmp_path / "restore" / "data" / "big.bin"
+    assert restored.stat().st_mtime_ns == (data / "big.bin").stat().st_mtime_ns
+
+    objectives = (await dr.get_recovery_metrics())["recovery_objectives"]
+    assert objectives["total_restores"] == 1
+    assert objectives["last_rto_seconds"] == result["rto_seconds"]
+    assert objectives["last_rpo_seconds"] == result["rpo_seconds"]
+    assert objectives["current_rpo_seconds"] >= result["rpo_seconds"]
+
+
+@pytest.mark.asyncio
+async def test_restore_drill_checks_bytes_and_budgets(tmp_path):
+    report = await run_restore_drill(size_mb=4, rto_budget_seconds=60, work_dir=str(tmp_path), chunk_size=CHUNK)
+    assert report.passed, report.failures
+    assert report.bytes_equal and report.files == 1
+
+    report = await run_restore_drill(size_mb=2, rto_budget_seconds=0.0, work_dir=str(tmp_path), chunk_size=CHUNK)
+    assert not report.passed
+    assert "RTO" in report.failures[0]
+    assert not list(tmp_path.iterdir())
+
+
+def test_codec_rejects_wrong_digest():
+    codec = ChunkCodec("lzma", key=KEY)
+    raw = b"x" * 1000
+    digest = hashlib.sha256(raw).digest()
+    blob = codec.encode(digest, raw, encrypt=False)
+    assert codec.decode(digest, blob) == raw
+    with pytest.raises(ChunkIntegrityError):
+        codec.decode(hashlib.sha256(b"other").digest(), blob)
+
+
+@pytest.mark.asyncio
+async def test_manifest_survives_reopen_and_cleanup_collects_chunks(tmp_path):
+    data = _dataset(tmp_path)
+    engine = _engine(tmp_path)
+    backup = await engine.create_backup([str(data)], retention_days=0)
+    engine.manifest.close()
+
+    reopened = _engine(tmp_path)
+    assert [b.backup_id for b in reopened.backup_history] == [backup.backup_id]
+    assert reopened.backup_history.get(backup.backup_id).checksum == backup.checksum
+
+    # Age the backup past its retention and collect it
+    aged = reopened.backup_history.get(backup.backup_id)
+    aged.timestamp = aged.timestamp.replace(year=aged.timestamp.year - 1)
+    reopened.backup_history.append(aged)
+    assert reopened.cleanup_old_backups() == [backup.backup_id]
+    assert len(reopened.backup_history) == 0
+    assert not [p for p in (tmp_path / "store" / "chunks").rglob("*") if p.is_file()]
+
+
+@pytest.mark.asyncio
+async def test_memory_stays_bounded_for_large_files(tmp_path):
+    source = tmp_path / "large.bin"
+    with open(source, "wb") as f:
+        for _ in range(48):
+            f.write(os.urandom(1024 * 1024))
+    engine = BackupEngine(base_path=str(tmp_path / "store"), chunk_size=1024 * 1024,
+                          workers=2, encryption_key=KEY)
+
+    tracemalloc.start()
+    try:
+        await engine.create_backup([str(source)])
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # 48 MiB file, 1 MiB chunks, at most 4 chunks in flight
+    assert peak < 16 * 1024 * 1024
+
+
+def test_backup_key_is_never_kept_in_the_backup_tree(tmp_path, monkeypatch):
+    monkeypatch.delenv("BBB_BACKUP_KEY", raising=False)
+    monkeypatch.delenv("BBB_BACKUP_KEY_FILE", raising=False)
+    store = tmp_path / "store"
+    store.mkdir()
+
+    assert load_backup_key(store) is None
+    assert not list(store.iterdir())
+    with pytest.raises(BackupKeyError):
+        load_backup_key(store, key_path=store / "keys" / "backup.key")
+
+    key_file = tmp_path / "secrets" / "backup.key"
+    key = load_backup_key(store, key_path=key_file)
+    assert len(key) == 32 and key_file.stat().st_mode & 0o777 == 0o600
+    monkeypatch.setenv("BBB_BACKUP_KEY_FILE", str(key_file))
+    assert load_backup_key(store) == key
+    monkeypatch.setenv("BBB_BACKUP_KEY", KEY.hex())
+    assert load_backup_key(store) == KEY
+
+    # A key file left inside the tree by older versions is refused, not used
+    (store / "backup.key").write_bytes(KEY)
+    with pytest.raises(BackupKeyError, match="inside the backup tree"):
+        load_backup_key(store)
+
+
+@pytest.mark.asyncio
+async def test_encrypted_backup_without_a_key_fails_loudly(tmp_path, monkeypatch):
+    monkeypatch.delenv("BBB_BACKUP_KEY", raising=False)
+    monkeypatch.delenv("BBB_BACKUP_KEY_FILE", raising=False)
+    data = _dataset(tmp_path)
+    engine = BackupEngine(base_path=str(tmp_path / "store"), chunk_size=CHUNK)
+
+    with pytest.raises(BackupKeyError, match="BBB_BACKUP_KEY"):
+        await engine.create_backup([str(data)])
+    plain = await engine.create_backup([str(data)], encrypt=False)
+    assert plain.encryption_enabled is False
+
+
+@pytest.mark.asyncio
+async def test_scheduled_backups_check_the_key_up_front(tmp_path, monkeypatch):
+    monkeypatch.delenv("BBB_BACKUP_KEY", raising=False)
+    monkeypatch.delenv("BBB_BACKUP_KEY_FILE", raising=False)
+    monkeypatch.chdir(tmp_path)
+    dr = DisasterRecoveryOrchestrator()
+
+    with pytest.raises(BackupKeyError):
+        dr.schedule_backup("daily", ["database"])
+    with pytest.raises(BackupKeyError):
+        await dr.test_disaster_recovery("full_system_failure")
+    assert len(dr.backup_engine.backup_history) == 0
+
+    dr.schedule_backup("daily", ["database"], encrypt=False)
+    backups = await dr.run_scheduled_backups()
+    assert [b.encryption_enabled for b in backups] == [False]
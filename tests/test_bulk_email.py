@@ -0,0 +1,209 @@
+"""
+Tests for the batched async bulk email sender against a local fake SendGrid server.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder import bulk_email
+from blank_business_builder.bulk_email import BulkEmailSender, EmailRecipient, OutreachAttemptRecorder
+from blank_business_builder.database import Base, LeadRecord, OutreachAttempt
+
+
+class FakeSendGrid(ThreadingHTTPServer):
+    """Local HTTP server answering POST /v3/mail/send.
+
+    ``script`` holds status codes returned to successive requests before
+    falling back to 202; ``latency`` delays every response.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, script=(), latency=0.0):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.script = list(script)
+        self.latency = latency
+        self.batches = []
+        self.auth = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.auth.add(self.headers.get("Authorization"))
+            status = server.script.pop(0) if server.script else 202
+            if status == 202:
+                server.batches.append([p["to"][0]["email"] for p in body["personalizations"]])
+        time.sleep(server.latency)
+        with server.lock:
+            server.in_flight -= 1
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        if status == 202:
+            self.send_header("X-Message-Id", f"msg-{len(server.batches)}")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _httpx(monkeypatch, real_httpx):
+    monkeypatch.setattr(bulk_email, "httpx", real_httpx)
+
+
+@pytest.fixture
+def fake_sendgrid(request):
+    params = getattr(request, "param", {})
+    server = FakeSendGrid(**params)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _sender(server, **kwargs):
+    options = dict(requests_per_second=1000.0, backoff_base=0.01)
+    options.update(kwargs)
+    return BulkEmailSender("SG.test", "team@bbb.test", base_url=server.url, **options)
+
+
+@pytest.mark.asyncio
+async def test_recipients_are_batched_and_outcomes_recorded(fake_sendgrid, db):
+    leads = [LeadRecord(id=uuid.uuid4(), email=f"lead{i}@example.com", status="new") for i in range(2500)]
+    db.add_all(leads)
+    db.commit()
+    recipients = [EmailRecipient(lead.email, lead.id) for lead in leads]
+    recipients.append(EmailRecipient("no-lead@example.com"))
+    recorder = OutreachAttemptRecorder(db, task="Spring launch", flush_size=1000)
+
+    report = await _sender(fake_sendgrid).send(recipients, "Spring launch", "<p>Hi</p>", on_outcomes=recorder)
+    recorder.flush()
+
+    assert sorted(len(batch) for batch in fake_sendgrid.batches) == [501, 1000, 1000]
+    assert fake_sendgrid.auth == {"Bearer SG.test"}
+    assert (report.recipients, report.sent, report.failed, report.requests) == (2501, 2501, 0, 3)
+    assert recorder.recorded == 2500
+    attempts = db.query(OutreachAttempt).all()
+    assert len(attempts) == 2500
+    assert {(a.channel, a.provider, a.status, a.task) for a in attempts} == {
+        ("email", "sendgrid", "sent", "Spring launch")
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fake_sendgrid", [{"script": [429, 503]}], indirect=True)
+async def test_transient_errors_are_retried(fake_sendgrid):
+    outcomes = []
+    report = await _sender(fake_sendgrid).send(
+        [EmailRecipient(f"u{i}@example.com") for i in range(10)], "Hi", "<p>Hi</p>", on_outcomes=outcomes.extend
+    )
+
+    assert report.sent == 10 and report.retries == 2
+    assert all(o.sent and o.attempts == 3 and o.message_id == "msg-1" for o in outcomes)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fake_sendgrid", [{"script": [400, 500, 500, 500]}], indirect=True)
+async def test_permanent_and_exhausted_failures(fake_sendgrid, db):
+    lead = LeadRecord(id=uuid.uuid4(), email="lead@example.com", status="new")
+    db.add(lead)
+    db.commit()
+    recorder = OutreachAttemptRecorder(db, task="Hi")
+    sender = _sender(fake_sendgrid, batch_size=1, max_concurrency=1, max_retries=2)
+    outcomes = []
+
+    def on_outcomes(batch):
+        outcomes.extend(batch)
+        recorder(batch)
+
+    report = await sender.send(
+        [EmailRecipient(lead.email, lead.id), EmailRecipient("b@example.com")], "Hi", "<p>Hi</p>",
+        on_outcomes=on_outcomes,
+    )
+    recorder.flush()
+
+    # 400 is not retried; the second batch gives up after 1 + max_retries 500s
+    assert [(o.sent, o.status_code, o.attempts) for o in outcomes] == [(False, 400, 1), (False, 500, 3)]
+    assert report.failed == 2 and report.requests == 4
+    attempt = db.query(OutreachAttempt).one()
+    assert attempt.status == "failed" and attempt.next_action.startswith("HTTP 400")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fake_sendgrid", [{"latency": 0.05}], indirect=True)
+async def test_concurrency_is_bounded(fake_sendgrid):
+    sender = _sender(fake_sendgrid, batch_size=10, max_concurrency=3)
+
+    start = time.perf_counter()
+    report = await sender.send((EmailRecipient(f"u{i}@example.com") for i in range(120)), "Hi", "<p>Hi</p>")
+    elapsed = time.perf_counter() - start
+
+    assert report.sent == 120 and report.requests == 12
+    assert 2 <= fake_sendgrid.max_in_flight <= 3
+    # 12 requests of 50 ms, three at a time
+    assert elapsed < 12 * 0.05
+
+
+class _FlakyClient:
+    """Injected client that drops the first connection."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def post(self, path, json):
+        self.calls += 1
+        if self.calls == 1:
+            raise ConnectionResetError("connection reset by peer")
+        return type("Response", (), {"status_code": 202, "headers": {"X-Message-Id": "msg-2"}, "text": ""})()
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_are_retried_without_httpx(monkeypatch):
+    # What the module defines when the httpx import fails
+    monkeypatch.setattr(bulk_email, "httpx", None)
+    monkeypatch.setattr(bulk_email, "TRANSPORT_ERRORS", (OSError, asyncio.TimeoutError))
+    client = _FlakyClient()
+    sender = BulkEmailSender("SG.test", "team@bbb.test", client=client,
+                             requests_per_second=1000.0, backoff_base=0.01)
+
+    report = await sender.send([EmailRecipient("u@example.com")], "Hi", "<p>Hi</p>")
+
+    assert (report.sent, report.retries, client.calls) == (1, 1, 2)
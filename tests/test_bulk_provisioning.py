@@ -0,0 +1,76 @@
+"""
+Tests for bulk business provisioning.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import csv
+import sys
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder.bulk_provisioning import BulkProvisioningEngine, copy_payload
+from blank_business_builder.database import AgentTask, Base, Business, BusinessPlan, MetricsHistory, User
+
+
+def _engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    Base.metadata.create_all(engine)
+    user_id = uuid.uuid4()
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), {
+            "id": user_id, "email": "owner@example.com", "hashed_password": "x",
+        })
+    return engine, user_id
+
+
+def _count(conn, table):
+    return conn.execute(select(func.count()).select_from(table)).scalar()
+
+
+def test_provision_writes_businesses_with_dependents(tmp_path):
+    engine, user_id = _engine(tmp_path)
+    provisioner = BulkProvisioningEngine(engine, batch_size=100, initial_tasks=(
+        ("researcher", "market_research", "Research"),
+        ("marketer", "launch_campaign", "Launch"),
+    ))
+    committed = []
+
+    report = provisioner.provision(user_id, 250, template_name="starter", on_batch=committed.append)
+
+    assert committed == [100, 100, 50]
+    assert report.businesses == 250
+    assert report.batches == 3
+    assert report.rows == 250 * 5
+    assert report.rows_per_second > 0
+
+    with engine.connect() as conn:
+        assert _count(conn, Business.__table__) == 250
+        assert _count(conn, BusinessPlan.__table__) == 250
+        assert _count(conn, AgentTask.__table__) == 500
+        assert _count(conn, MetricsHistory.__table__) == 250
+        orphans = conn.execute(
+            select(func.count()).select_from(AgentTask.__table__)
+            .where(AgentTask.__table__.c.business_id.not_in(select(Business.__table__.c.id)))
+        ).scalar()
+        assert orphans == 0
+        statuses = conn.execute(select(Business.__table__.c.status).distinct()).scalars().all()
+        assert statuses == ["active"]
+        plan_names = conn.execute(select(BusinessPlan.__table__.c.plan_name).distinct()).scalars().all()
+        assert plan_names == ["starter plan"]
+
+
+def test_copy_payload_renders_nulls_json_and_timestamps():
+    when = datetime(2025, 1, 2, 3, 4, 5)
+    rows = [{"id": uuid.UUID(int=1), "result": {"ok": True}, "started_at": when, "error": None}]
+
+    payload = copy_payload(["id", "result", "started_at", "error"], rows).getvalue()
+
+    assert payload.endswith(",\n")
+    assert next(csv.reader([payload.strip()])) == [
+        str(uuid.UUID(int=1)), '{"ok": true}', "2025-01-02 03:04:05", "",
+    ]
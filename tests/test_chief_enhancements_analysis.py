@@ -0,0 +1,168 @@
+"""
+Tests for the shared single-pass analysis service used by the
+Chief Enhancements audit and optimisation tasks.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import ast
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chief_enhancements_office import analysis
+from chief_enhancements_office.analysis import ProjectAnalysis, analyze_source
+from chief_enhancements_office.tasks.optimisation import CodeQualityAnalyzer, PerformanceAnalyzer
+
+SAMPLE = '''
+import os
+from collections import defaultdict
+
+
+class Big:
+    """Many methods."""
+''' + "".join(f"    def m{i}(self):\n        return {i}\n" for i in range(21)) + '''
+
+def nested(a, b, c, d, e, f):
+    total = ""
+    for x in a:
+        for y in b:
+            while y:
+                if x and y or c:
+                    total += str(x)
+                y -= 1
+    try:
+        sorted([v for v in d.keys()])
+    except ValueError:
+        pass
+
+    def inner(z):
+        for q in z:
+            if q:
+                return q
+    return inner
+''' + "def long_one():\n    '''Documented.'''\n" + "    x = 1\n" * 55
+
+
+def _legacy(source, path="sample.py"):
+    """The previous per-analyzer nested walks, for comparison."""
+    tree = ast.parse(source)
+    for node in ast.walk(tree):
+        for child in ast.iter_child_nodes(node):
+            child.parent = node
+    metrics = Counter()
+    issues, opportunities, suggestions = [], [], []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            metrics['functions'] += 1
+            complexity = 1 + sum(isinstance(c, analysis.DECISION_NODES) for c in ast.walk(node))
+            metrics['complexity'] += complexity
+            metrics['max_function_complexity'] = max(metrics['max_function_complexity'], complexity)
+            func_lines = node.end_lineno - node.lineno
+            if func_lines > 50:
+                suggestions.append(('maintainability', node.name, f'Function is {func_lines} lines long'))
+            params = len(node.args.args) + len(node.args.kwonlyargs)
+            if params > 5:
+                suggestions.append(('maintainability', node.name, f'Function has {params} parameters'))
+            if not ast.get_docstring(node) and not node.name.startswith('_'):
+                suggestions.append(('documentation', node.name, 'Missing docstring'))
+        elif isinstance(node, ast.ClassDef):
+            metrics['classes'] += 1
+            methods = [n for n in ast.walk(node) if isinstance(n, ast.FunctionDef)]
+            if len(methods) > 20:
+                suggestions.append(('design', node.name, f'Class has {len(methods)} methods'))
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            metrics['imports'] += 1
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and ast.get_docstring(node):
+            metrics['docstrings'] += 1
+        if isinstance(node, (ast.For, ast.While)):
+            nested = sum(isinstance(c, (ast.For, ast.While)) for c in ast.walk(node))
+            if nested > 2:
+                issues.append((node.lineno, nested))
+        if isinstance(node, ast.ListComp) and isinstance(getattr(node, 'parent', None), (ast.For, ast.Call)):
+            opportunities.append((node.lineno, 'List comprehension could be generator expression'))
+        if isinstance(node, ast.AugAssign) and isinstance(node.op, ast.Add) and isinstance(node.target, ast.Name):
+            opportunities.append((node.lineno, 'String concatenation in loop detected'))
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr == 'keys' and isinstance(node.func.value, ast.Name)):
+            opportunities.append((node.lineno, 'Unnecessary .keys() call'))
+    return metrics, issues, opportunities, suggestions
+
+
+def _assert_matches_legacy(source):
+    metrics, issues, opportunities, suggestions = _legacy(source)
+    result = analyze_source(source, "sample.py")
+
+    for key in ('functions', 'classes', 'complexity', 'max_function_complexity', 'imports', 'docstrings'):
+        assert result['metrics'][key] == metrics[key], key
+    assert sorted((i['line'], int(i['issue'].split('(')[1].split()[0])) for i in result['performance_issues']) \
+        == sorted(issues)
+    assert sorted((o['line'], o['opportunity']) for o in result['opportunities']) == sorted(opportunities)
+    assert Counter((s['category'], s.get('function', s.get('class')), s['issue'])
+                   for s in result['suggestions']) == Counter(suggestions)
+
+
+def test_single_pass_matches_the_previous_analyzers():
+    _assert_matches_legacy(SAMPLE)
+    result = analyze_source(SAMPLE, "sample.py")
+    assert result['performance_issues'][0]['issue'] == 'Deeply nested loops detected (3 levels)'
+    assert any(s['issue'] == 'Class has 21 methods' for s in result['suggestions'])
+
+    # And on real modules from the package itself
+    for path in (Path(__file__).parent.parent / "chief_enhancements_office").rglob("*.py"):
+        _assert_matches_legacy(path.read_text(encoding="utf-8"))
+
+
+def test_unparseable_file_still_gets_security_scan(tmp_path):
+    (tmp_path / "broken.py").write_text("eval('1'\n")
+    (tmp_path / "ok.py").write_text("def f():\n    return 1\n")
+
+    project = ProjectAnalysis(tmp_path)
+    files = project.python_files()
+
+    assert files["broken.py"]['metrics'] is None
+    assert files["broken.py"]['security'][0]['line'] == 1
+    assert files["ok.py"]['metrics']['functions'] == 1
+    assert CodeQualityAnalyzer(tmp_path, project).analyze_code_quality()['total_suggestions'] == 1
+
+
+def test_persisted_cache_only_reanalyzes_changed_files(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    for i in range(5):
+        (root / f"mod{i}.py").write_text(f"def f{i}(x):\n    for a in x:\n        x += a\n    return x\n")
+    cache = tmp_path / "cache.json"
+
+    first = ProjectAnalysis(root, cache_path=cache)
+    baseline = first.python_files()
+    assert first.stats == {'analyzed': 5, 'reused': 0}
+
+    second = ProjectAnalysis(root, cache_path=cache)
+    assert second.python_files() == baseline
+    assert second.stats == {'analyzed': 0, 'reused': 5}
+
+    (root / "mod1.py").write_text("def changed():\n    '''Doc.'''\n")
+    st = (root / "mod2.py").stat()
+    os.utime(root / "mod2.py", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))  # Touched, same content
+    (root / "mod4.py").unlink()
+
+    third = ProjectAnalysis(root, cache_path=cache)
+    files = third.python_files()
+    assert third.stats == {'analyzed': 1, 'reused': 3}
+    assert sorted(files) == ["mod0.py", "mod1.py", "mod2.py", "mod3.py"]
+    assert files["mod1.py"]['metrics']['docstrings'] == 1
+    assert files["mod2.py"] == baseline["mod2.py"]
+
+
+def test_process_pool_gives_the_same_results(tmp_path, monkeypatch):
+    for i in range(8):
+        (tmp_path / f"mod{i}.py").write_text(SAMPLE)
+    serial = PerformanceAnalyzer(tmp_path, ProjectAnalysis(tmp_path, max_workers=1)).analyze_python_performance()
+
+    monkeypatch.setattr(analysis, "PARALLEL_THRESHOLD", 2)
+    pooled = PerformanceAnalyzer(tmp_path, ProjectAnalysis(tmp_path, max_workers=2)).analyze_python_performance()
+
+    assert pooled == serial
+    assert serial['total_issues'] == 8
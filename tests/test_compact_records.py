@@ -0,0 +1,104 @@
+"""
+Tests for slotted task records and the columnar task archive.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import pickle
+from datetime import datetime
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder.autonomous_business import (
+    AgentRole,
+    AutonomousBusinessOrchestrator,
+    AutonomousTask,
+    BusinessMetrics,
+    TaskStatus,
+)
+from blank_business_builder.compact_records import ARCHIVE_COLUMNS, TaskArchive
+from blank_business_builder.orchestrator_sharding import SimulatedServices
+
+
+def _row(i, status="completed"):
+    return (i, f"t{i}", "researcher", "Research", status, "researcher_1",
+            1000.0 + i, 2000.0 + i, {"success": True, "n": i}, [], 5, 1)
+
+
+def test_records_are_slotted_and_keep_datetime_views():
+    task = AutonomousTask(task_id="t1", role=AgentRole.RESEARCHER, description="Research")
+
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(AttributeError):
+        task.unexpected = 1
+    assert abs(task.created_at.timestamp() - task.created_ts) < 1e-3
+    assert task.completed_at is None
+    assert task.dependencies == ()
+    assert pickle.loads(pickle.dumps(task)) == task
+
+    # Legacy callers still assign datetimes
+    finished = datetime(2025, 3, 1, 12, 30)
+    task.completed_at = finished
+    assert task.completed_ts == finished.timestamp()
+    assert task.completed_at == finished
+    task.completed_at = None
+    assert task.completed_ts is None
+
+    metrics = BusinessMetrics(total_revenue=10.0)
+    assert not hasattr(metrics, "__dict__")
+    assert abs(metrics.last_updated.timestamp() - metrics.last_updated_ts) < 1e-3
+
+
+def test_archive_round_trips_rows_in_memory():
+    archive = TaskArchive(block_size=3)
+    for i in range(7):
+        archive.append(_row(i, "failed" if i % 2 else "completed"))
+
+    assert len(archive) == 7
+    assert len(archive._blocks) == 2
+    assert list(archive.iter_rows()) == [_row(i, "failed" if i % 2 else "completed") for i in range(7)]
+    assert archive.column("task_id") == [f"t{i}" for i in range(7)]
+    with pytest.raises(KeyError):
+        archive.column("missing")
+
+
+def test_archive_blocks_survive_reopen(tmp_path):
+    archive = TaskArchive(str(tmp_path), block_size=2)
+    for i in range(5):
+        archive.append(_row(i))
+    archive.flush()
+
+    reopened = TaskArchive(str(tmp_path))
+    assert len(reopened) == 5
+    rows = list(reopened.iter_rows())
+    assert [row[ARCHIVE_COLUMNS.index("result")]["n"] for row in rows] == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_finished_tasks_move_to_archive_after_retention():
+    services = SimulatedServices()
+    orch = AutonomousBusinessOrchestrator(
+        "AI Chatbot Integration Service", "Founder",
+        market_research=services, email_service=services,
+        payment_processor=services, social_media=services,
+        task_retention_seconds=0,
+    )
+    first = AutonomousTask(task_id="t1", role=AgentRole.RESEARCHER, description="Research")
+    second = AutonomousTask(task_id="t2", role=AgentRole.MARKETER, description="Market", dependencies=["t1"])
+    orch.add_task(first)
+    orch.add_task(second)
+    orch._set_task_status(first, TaskStatus.COMPLETED, result={"success": True})
+
+    # Below the batch size nothing moves unless forced
+    assert orch.archive_finished_tasks() == 0
+    assert orch.archive_finished_tasks(force=True) == 1
+
+    assert [t.task_id for t in orch.task_queue] == ["t2"]
+    assert "t1" not in orch.task_index
+    assert orch.task_archive.column("task_id") == ["t1"]
+    # Counters and dependency tracking still see the archived task
+    assert orch.task_status_counts[TaskStatus.COMPLETED] == 1
+    assert "t1" in orch.completed_task_ids
@@ -0,0 +1,160 @@
+"""
+Tests for the asyncio dashboard server and its incremental activity log.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../scripts/runners')))
+
+from dashboard_server import ActivityLogTail, DashboardServer
+
+
+class StaticDashboard(DashboardServer):
+    """Dashboard with local probes instead of Ollama, settings and Stripe."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.revenue = 0.0
+
+    def probes(self):
+        return [lambda: {"revenue": {"total": self.revenue}}]
+
+
+def serve(tmp_path, scenario):
+    """Run ``scenario(server)`` against a started dashboard on a free port."""
+    async def run():
+        server = StaticDashboard(host="127.0.0.1", port=0, refresh_interval=3600, ech0_dir=tmp_path)
+        await server.start()
+        try:
+            await scenario(server)
+        finally:
+            await server.close()
+    asyncio.run(run())
+
+
+async def _get(reader, writer, path, headers=()):
+    request = f"GET {path} HTTP/1.1\r\nHost: localhost\r\n" + "".join(f"{h}\r\n" for h in headers) + "\r\n"
+    writer.write(request.encode())
+    status = int((await reader.readline()).split()[1])
+    response_headers = {}
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode().partition(":")
+        response_headers[name.lower()] = value.strip()
+    body = await reader.readexactly(int(response_headers["content-length"]))
+    return status, response_headers, body
+
+
+def test_etag_revalidation_on_a_kept_alive_connection(tmp_path):
+    serve(tmp_path, _etag_revalidation)
+
+
+async def _etag_revalidation(server):
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    try:
+        status, headers, body = await _get(reader, writer, "/api/state")
+        assert status == 200
+        assert json.loads(body)["system"]["status"] == "running"
+
+        status, _, body = await _get(reader, writer, "/api/state", [f"If-None-Match: {headers['etag']}"])
+        assert (status, body) == (304, b"")
+
+        server.revenue = 42.5
+        await server.refresh()
+        status, new_headers, body = await _get(reader, writer, "/api/state", [f"If-None-Match: {headers['etag']}"])
+        assert status == 200
+        assert new_headers["etag"] != headers["etag"]
+        assert json.loads(body)["revenue"]["total"] == 42.5
+
+        status, _, _ = await _get(reader, writer, "/missing")
+        assert status == 404
+    finally:
+        writer.close()
+
+
+def test_event_stream_pushes_each_snapshot(tmp_path):
+    serve(tmp_path, _event_stream)
+
+
+async def _event_stream(server):
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    try:
+        writer.write(b"GET /api/events HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        assert b"text/event-stream" in await reader.readuntil(b"\r\n\r\n")
+
+        first = await reader.readuntil(b"\n\n")
+        assert first == server.snapshot.event
+
+        server.revenue = 7.0
+        await server.refresh()
+        frame = await asyncio.wait_for(reader.readuntil(b"\n\n"), 5)
+        data = json.loads(frame.split(b"data: ", 1)[1])
+        assert data["revenue"]["total"] == 7.0
+    finally:
+        writer.close()
+
+
+def test_refresh_times_out_a_hung_probe(tmp_path):
+    server = StaticDashboard(port=0, probe_timeout=0.2, ech0_dir=tmp_path)
+    server.probes = lambda: [lambda: time.sleep(2) or {"revenue": {"total": 99.0}},
+                             lambda: {"social": {"twitter_connected": True}}]
+
+    async def timed_refresh():
+        start = time.perf_counter()
+        await server.refresh()
+        return time.perf_counter() - start
+
+    assert asyncio.run(timed_refresh()) < 1.5
+    assert server.state["social"]["twitter_connected"] is True
+    assert server.state["revenue"]["total"] == 0.0
+
+
+def test_activity_log_tail_reads_only_appended_lines(tmp_path):
+    jsonl = tmp_path / "activity_log.jsonl"
+    tail = ActivityLogTail(jsonl, tmp_path / "activity_log.json", limit=3)
+
+    with open(jsonl, "w") as f:
+        f.write(json.dumps({"msg": "one"}) + "\n" + json.dumps({"msg": "two"}) + "\n" + '{"msg": "thr')
+    assert tail.poll() is True
+    assert [e["msg"] for e in tail.entries] == ["two", "one"]
+    assert tail.poll() is False
+
+    with open(jsonl, "a") as f:
+        f.write('ee"}\n' + json.dumps({"msg": "four"}) + "\n")
+    assert tail.poll() is True
+    assert [e["msg"] for e in tail.entries] == ["four", "three", "two"]
+
+    jsonl.write_text(json.dumps({"msg": "rotated"}) + "\n")
+    assert tail.poll() is True
+    assert tail.entries[0]["msg"] == "rotated"
+
+
+def test_activity_log_first_poll_reads_only_the_tail(tmp_path):
+    jsonl = tmp_path / "activity_log.jsonl"
+    lines = [json.dumps({"msg": f"entry-{i:04d}"}) + "\n" for i in range(1000)]
+    jsonl.write_text("".join(lines))
+    tail = ActivityLogTail(jsonl, tmp_path / "activity_log.json", limit=50, tail_bytes=len(lines[0]) * 10)
+
+    assert tail.poll() is True
+    assert [e["msg"] for e in tail.entries] == [f"entry-{i:04d}" for i in range(999, 989, -1)]
+
+    with open(jsonl, "a") as f:
+        f.write(json.dumps({"msg": "new"}) + "\n")
+    assert tail.poll() is True
+    assert tail.entries[0]["msg"] == "new"
+    assert len(tail.entries) == 11
+
+
+def test_activity_log_falls_back_to_legacy_array(tmp_path):
+    legacy = tmp_path / "activity_log.json"
+    tail = ActivityLogTail(tmp_path / "activity_log.jsonl", legacy)
+    assert tail.poll() is False
+
+    legacy.write_text(json.dumps([{"msg": "newest"}, {"msg": "older"}]))
+    assert tail.poll() is True
+    assert [e["msg"] for e in tail.entries] == ["newest", "older"]
+    assert tail.poll() is False
@@ -0,0 +1,63 @@
+"""
+Tests for DataBroker verification and the incremental manifest.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder.data_broker import DataBroker
+from blank_business_builder.semantic_framework import Lead, Organization, Person, db
+
+
+def _lead(name, email):
+    return Lead(
+        person=Person(name=name, role="CTO", email=email),
+        organization=Organization(name="Acme", industry="SaaS"),
+    )
+
+
+def _broker(tmp_path):
+    db._store = {}
+    return DataBroker(core_system=None, manifest_path=str(tmp_path / "manifest.jsonl"))
+
+
+def test_verify_email_heuristics(tmp_path):
+    broker = _broker(tmp_path)
+    assert broker._verify_email("a@b.com")
+    assert broker._verify_email("first.last@mail.example.org")
+    assert not broker._verify_email("")
+    assert not broker._verify_email(None)
+    assert not broker._verify_email("no-at-sign.com")
+    assert not broker._verify_email("a@localhost")
+    assert not broker._verify_email("a@b@c.com")
+
+
+def test_verify_and_package_bulk_saves_verified_prospects(tmp_path):
+    broker = _broker(tmp_path)
+    leads = [_lead("A", "a@acme.com"), _lead("B", "bad"), _lead("C", "c@acme.io")]
+
+    prospects = broker.verify_and_package(leads)
+
+    assert [p.lead.person.name for p in prospects] == ["A", "C"]
+    assert set(db._store) == {p.id for p in prospects}
+    assert all(p.status == "Available" and p.resale_price == 5.0 for p in prospects)
+
+
+def test_manifest_appends_only_new_available_prospects(tmp_path):
+    broker = _broker(tmp_path)
+    first = broker.verify_and_package([_lead("A", "a@acme.com"), _lead("B", "b@acme.com")])
+    path = broker.generate_manifest()
+
+    second = broker.verify_and_package([_lead("C", "c@acme.com"), _lead("D", "d@acme.com")])
+    second[1].status = "Sold"
+    assert broker.generate_manifest() == path
+    # Nothing new since the last call: the file is left alone
+    broker.generate_manifest()
+
+    lines = [json.loads(line) for line in Path(path).read_text().splitlines()]
+    assert [entry["id"] for entry in lines] == [first[0].id, first[1].id, second[0].id]
+    assert lines[0] == {"industry": "SaaS", "role": "CTO", "price": 5.0, "id": first[0].id}
@@ -25,19 +25,23 @@ from blank_business_builder.disaster_recovery import (
 )
 
 
+pytestmark = pytest.mark.usefixtures("backup_sandbox")
+
+
 class TestBackupEngine:
     """Test suite for BackupEngine."""
 
-    def test_engine_initialization(self):
+    def test_engine_initialization(self, tmp_path):
         """Test backup engine initializes correctly."""
-        engine = BackupEngine(base_path="./test_backups")
+        # History lives in the on-disk manifest, so start from an empty directory
+        engine = BackupEngine(base_path=str(tmp_path / "backups"))
         assert engine.base_path.exists()
         assert len(engine.backup_history) == 0
 
     @pytest.mark.asyncio
-    async def test_create_full_backup(self):
+    async def test_create_full_backup(self, tmp_path):
         """Test creating a full backup."""
-        engine = BackupEngine(base_path="./test_backups")
+        engine = BackupEngine(base_path=str(tmp_path / "test_backups"))
 
         backup = await engine.create_backup(
             data_sources=["database", "files"],
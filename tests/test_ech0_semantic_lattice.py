@@ -0,0 +1,90 @@
+"""
+Tests for the ECH0 semantic lattice combination index and batched distances.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import importlib.util
+import random
+from pathlib import Path
+
+import networkx as nx
+
+# Loaded by path: putting scripts/ech0 on sys.path would also expose its other ech0_* scripts to later tests
+_spec = importlib.util.spec_from_file_location(
+    "ech0_semantic_lattice", Path(__file__).parent.parent / "scripts" / "ech0" / "ech0_semantic_lattice.py"
+)
+ech0_semantic_lattice = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ech0_semantic_lattice)
+ECH0SemanticLattice = ech0_semantic_lattice.ECH0SemanticLattice
+
+DOMAINS = ["Virtual Reality", "Haptics", "Brain-Computer Interface", "Quantum ML", "Quantum Sensing",
+           "Cognitive Enhancement", "Neural Prosthetics", "Invasive BCI"]
+
+
+def _lattice(count, seed=0):
+    rng = random.Random(seed)
+    lattice = ECH0SemanticLattice()
+    for i in range(count):
+        lattice.add_invention({
+            'invention_name': DOMAINS[i % len(DOMAINS)] if i % 5 == 0 else f"Invention {i}",
+            'categories': rng.sample(DOMAINS, rng.choice([1, 2, 3])),
+        })
+    return lattice
+
+
+def test_combination_index_is_unordered_and_maintained_on_add():
+    lattice = ECH0SemanticLattice()
+    assert not lattice.is_combination_explored("Haptics", "Virtual Reality")
+
+    lattice.add_invention({'invention_name': 'Haptic VR Glove', 'categories': ['Virtual Reality', 'Haptics']})
+
+    assert lattice.is_combination_explored("Haptics", "Virtual Reality")
+    assert lattice.is_combination_explored("Virtual Reality", "Haptics")
+    assert not lattice.is_combination_explored("Haptics", "Quantum ML")
+
+
+def test_unexplored_neighbors_skip_explored_pairs():
+    lattice = ECH0SemanticLattice()
+    lattice.add_invention({'invention_name': 'Haptics', 'categories': ['Haptics']})
+    lattice.add_invention({'invention_name': 'Virtual Reality', 'categories': ['Haptics']})
+    node = lattice.nodes['combo_Haptics_2']
+    assert lattice._find_unexplored_neighbors(node) == [('Virtual Reality', 'Haptics')]
+
+    lattice.add_invention({'invention_name': 'Glove', 'categories': ['Haptics', 'Virtual Reality']})
+
+    # Haptics x Virtual Reality is now explored; the new Glove sibling is not
+    assert lattice._find_unexplored_neighbors(node) == [('Virtual Reality', 'Glove')]
+
+
+def test_batched_distances_match_pairwise_shortest_paths():
+    lattice = _lattice(120)
+    node_id = lattice.add_invention({'invention_name': 'Probe', 'categories': ['Haptics', 'Quantum ML']})
+
+    expected = {}
+    for other_id in lattice.nodes:
+        if other_id == node_id:
+            continue
+        try:
+            expected[other_id] = min(1.0, nx.shortest_path_length(lattice.graph, node_id, other_id) / 10)
+        except nx.NetworkXNoPath:
+            assert lattice.calculate_semantic_distance(node_id, other_id) >= 0.7
+    assert lattice.semantic_distances(node_id) == expected
+    assert all(lattice.calculate_semantic_distance(node_id, other) == d for other, d in expected.items())
+    assert lattice.find_similar_nodes(node_id) == [
+        (other, d) for other, d in expected.items() if d < 0.3 and lattice.nodes[other].density > 0
+    ]
+
+
+def test_distance_cache_is_refreshed_when_the_lattice_grows():
+    lattice = ECH0SemanticLattice()
+    first = lattice.add_invention({'invention_name': 'A', 'categories': ['Haptics', 'Virtual Reality']})
+    assert 'bridge_Haptics_Virtual Reality' in lattice.semantic_distances(first)
+
+    second = lattice.add_invention({'invention_name': 'B', 'categories': ['Haptics', 'Quantum ML']})
+
+    assert 'bridge_Haptics_Quantum ML' in lattice.semantic_distances(second)
+    assert lattice.semantic_distances(first) == {
+        other: min(1.0, length / 10)
+        for other, length in nx.single_source_shortest_path_length(lattice.graph, first).items()
+        if other != first
+    }
@@ -0,0 +1,114 @@
+"""
+Tests for the ring-buffer metric trackers in the feedback loop system.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import math
+import os
+import random
+import statistics
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../scripts/runners')))
+
+from blank_business_builder import hive_mind_coordinator
+
+# The runner imports the coordinator as a top-level module
+sys.modules.setdefault("hive_mind_coordinator", hive_mind_coordinator)
+
+import feedback_loop_system
+from feedback_loop_system import FeedbackEvent, FeedbackLoopSystem, FeedbackType, MetricSeries
+
+
+pytestmark = pytest.mark.real_numpy(feedback_loop_system)
+
+
+def _list_trend(values, window=10):
+    """The previous list-based AgentPerformanceTracker.get_metric_trend."""
+    if len(values) < 2:
+        return "unknown"
+    recent = values[-window:]
+    if len(recent) < 2:
+        return "insufficient_data"
+    first_half = sum(recent[:len(recent)//2]) / (len(recent)//2)
+    second_half = sum(recent[len(recent)//2:]) / (len(recent) - len(recent)//2)
+    change_pct = ((second_half - first_half) / first_half * 100) if first_half > 0 else 0
+    return "improving" if change_pct > 5 else "declining" if change_pct < -5 else "stable"
+
+
+def test_metric_series_matches_full_history_statistics():
+    rng = random.Random(3)
+    series = MetricSeries(capacity=32)
+    values = []
+    for i in range(3000):
+        value = rng.uniform(0.5, 1.5) * (1 + (i // 50) % 3)
+        series.append(value)
+        values.append(value)
+        assert series.trend == _list_trend(values)
+        assert series.get_trend(7) == _list_trend(values, 7)
+
+    assert len(series) == 32
+    assert series.values().tolist() == values[-32:]
+    assert series.latest == values[-1]
+    # math.isclose, not pytest.approx: approx breaks once another test module has stubbed numpy
+    assert math.isclose(series.mean, statistics.fmean(values))
+    assert math.isclose(series.variance, statistics.variance(values))
+
+
+def _feedback(agent_id, feedback_type, value, metric="conversion_rate"):
+    return FeedbackEvent(agent_id=agent_id, feedback_type=feedback_type, timestamp=0.0,
+                         metric_name=metric, metric_value=value,
+                         context={'action_type': 'acquisition', 'strategy': 'strategy_a'})
+
+
+def test_hive_summary_matches_a_full_walk_of_the_trackers(tmp_path):
+    hive = hive_mind_coordinator.HiveMindCoordinator(config_path=str(tmp_path / "config.json"))
+    system = FeedbackLoopSystem(hive, history_limit=100)
+    rng = random.Random(5)
+    agents = [f"agent_{i}" for i in range(12)]
+    for step in range(3000):
+        agent_id = rng.choice(agents)
+        roll = rng.random()
+        if roll < 0.4:
+            system.record_feedback(_feedback(agent_id, FeedbackType.SUCCESS, 1.0))
+        elif roll < 0.7:
+            system.record_feedback(_feedback(agent_id, FeedbackType.FAILURE, 0.0))
+        else:
+            system.record_feedback(_feedback(agent_id, FeedbackType.PERFORMANCE_METRIC, rng.uniform(0.01, 0.05)))
+
+    summary = system.get_hive_performance_summary()
+    trackers = system.performance_trackers
+
+    assert summary['total_feedback_events'] == 3000
+    assert len(system.feedback_history) == 100
+    assert summary['total_successes'] == sum(t.successes for t in trackers.values())
+    assert summary['total_failures'] == sum(t.failures for t in trackers.values())
+    assert math.isclose(summary['average_success_rate'],
+                        sum(t.success_rate() for t in trackers.values()) / len(trackers))
+    assert [p['agent_id'] for p in summary['top_performers']] == [
+        agent_id for agent_id, _ in sorted(trackers.items(), key=lambda x: x[1].success_rate(), reverse=True)[:3]
+    ]
+    assert set(summary['agents_needing_help']) == {
+        agent_id for agent_id, tracker in trackers.items()
+        if any(tracker.get_metric_trend(name) == "declining" for name in tracker.metrics)
+    }
+
+
+def test_report_uses_streaming_statistics(tmp_path):
+    hive = hive_mind_coordinator.HiveMindCoordinator(config_path=str(tmp_path / "config.json"))
+    system = FeedbackLoopSystem(hive)
+    for value in [0.05, 0.05, 0.05, 0.04, 0.03, 0.02]:
+        system.record_feedback(_feedback("agent_1", FeedbackType.PERFORMANCE_METRIC, value))
+
+    report = system.get_agent_performance_report("agent_1")
+
+    metric = report['metrics']['conversion_rate']
+    assert metric['current'] == 0.02
+    assert math.isclose(metric['average'], 0.04)
+    assert metric['trend'] == "declining"
+    assert report['feedback_events'] == 6
+    assert system.get_hive_performance_summary()['agents_needing_help'] == ["agent_1"]
@@ -0,0 +1,131 @@
+"""
+Tests for the segmented hive knowledge store.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder.hive_knowledge_store import HiveKnowledgeStore, SNAPSHOT_FILE
+from blank_business_builder.hive_mind_coordinator import HiveMindCoordinator, AgentType
+
+
+def _learning(i, agent_id="agent_1"):
+    return {'agent_id': agent_id, 'agent_type': 'acquisition', 'timestamp': float(i), 'data': {'n': i}}
+
+
+def _segments(directory):
+    return sorted(p.name for p in Path(directory).glob("segment-*.jsonl"))
+
+
+def test_in_memory_store_caps_working_set_but_counts_everything():
+    store = HiveKnowledgeStore(recent_limit=5)
+    for i in range(20):
+        store.append('customer_insights', _learning(i))
+
+    assert store.count('customer_insights') == 20
+    assert len(store.working_sets['customer_insights']) == 5
+    assert [learning['data']['n'] for learning in store.recent('customer_insights', 2)] == [18, 19]
+    assert store.learnings_by_agent['agent_1'] == 20
+
+
+def test_segments_rotate_and_compact_into_snapshot(tmp_path):
+    store = HiveKnowledgeStore(
+        str(tmp_path), recent_limit=10, segment_max_records=5,
+        compact_after_segments=100, background_compaction=False,
+    )
+    for i in range(23):
+        store.append('successful_strategies', _learning(i))
+
+    assert len(_segments(tmp_path)) == 5
+
+    assert store.compact() == 4
+    assert _segments(tmp_path) == ["segment-00000005.jsonl"]
+
+    snapshot = json.loads((tmp_path / SNAPSHOT_FILE).read_text())
+    assert snapshot['last_segment'] == 4
+    assert snapshot['counters']['successful_strategies'] == 20
+    store.close()
+
+
+def test_background_compaction_is_triggered_by_rotation(tmp_path):
+    store = HiveKnowledgeStore(str(tmp_path), segment_max_records=3, compact_after_segments=2)
+    for i in range(6):
+        store.append('optimization_learnings', _learning(i))
+
+    store.wait_for_compaction(timeout=5)
+    assert (tmp_path / SNAPSHOT_FILE).exists()
+    assert _segments(tmp_path) == ["segment-00000003.jsonl"]
+    store.close()
+
+
+def test_warm_start_from_snapshot_plus_tail(tmp_path):
+    store = HiveKnowledgeStore(
+        str(tmp_path), recent_limit=4, segment_max_records=5,
+        compact_after_segments=100, background_compaction=False,
+    )
+    for i in range(12):
+        store.append('market_intelligence', _learning(i))
+    store.compact()
+    for i in range(12, 15):
+        store.append('market_intelligence', _learning(i))
+    store.close()
+
+    restored = HiveKnowledgeStore(str(tmp_path), recent_limit=4, segment_max_records=5)
+    assert restored.count('market_intelligence') == 15
+    assert [learning['data']['n'] for learning in restored.recent('market_intelligence')] == [11, 12, 13, 14]
+
+    # New appends continue in the active segment rather than starting a new one
+    assert _segments(tmp_path) == ["segment-00000003.jsonl", "segment-00000004.jsonl"]
+    restored.append('market_intelligence', _learning(15))
+    restored.close()
+    assert _segments(tmp_path) == ["segment-00000003.jsonl", "segment-00000004.jsonl"]
+    assert len((tmp_path / "segment-00000004.jsonl").read_text().splitlines()) == 1
+
+
+def test_interrupted_compaction_does_not_double_count(tmp_path):
+    store = HiveKnowledgeStore(
+        str(tmp_path), segment_max_records=2,
+        compact_after_segments=100, background_compaction=False,
+    )
+    for i in range(5):
+        store.append('failed_strategies', _learning(i))
+    store.close()
+
+    # Simulate a crash after the snapshot was written but before cleanup
+    leftover = (tmp_path / "segment-00000001.jsonl").read_text()
+    store = HiveKnowledgeStore(str(tmp_path), segment_max_records=2, background_compaction=False)
+    store.compact()
+    (tmp_path / "segment-00000001.jsonl").write_text(leftover)
+    store.close()
+
+    restored = HiveKnowledgeStore(str(tmp_path), segment_max_records=2, background_compaction=False)
+    assert restored.count('failed_strategies') == 5
+    restored.compact()
+    assert "segment-00000001.jsonl" not in _segments(tmp_path)
+    assert restored.count('failed_strategies') == 5
+    restored.close()
+
+
+def test_coordinator_persists_and_warm_starts_learnings(tmp_path):
+    hive = HiveMindCoordinator(config_path=str(tmp_path / "missing.json"), knowledge_dir=str(tmp_path / "kb"))
+    hive.register_agent("acq_1", AgentType.ACQUISITION)
+    for i in range(3):
+        hive.share_learning("acq_1", "successful_strategy", {'name': f's{i}', 'type': 'seo'})
+    hive.share_learning("acq_1", "customer_insight", {'insight': 'dark mode'})
+    hive.knowledge_store.close()
+
+    status = hive.get_hive_status()
+    assert status['shared_knowledge']['successful_strategies'] == 3
+    assert status['shared_knowledge']['customer_insights'] == 1
+
+    warm = HiveMindCoordinator(config_path=str(tmp_path / "missing.json"), knowledge_dir=str(tmp_path / "kb"))
+    assert warm.get_hive_status()['shared_knowledge']['successful_strategies'] == 3
+    assert warm.shared_knowledge['successful_strategies'][-1]['data']['name'] == 's2'
+
+    export = warm.export_hive_knowledge(str(tmp_path / "export.json"))
+    assert export['shared_knowledge']['counters']['customer_insights'] == 1
+    warm.knowledge_store.close()
@@ -32,6 +32,10 @@ from blank_business_builder.multi_channel_marketing import (
     MultiChannelCampaignOrchestrator,
     MarketingAutomationEngine
 )
+from blank_business_builder import smart_lead_nurturing
+
+
+pytestmark = [pytest.mark.real_numpy(smart_lead_nurturing), pytest.mark.usefixtures("backup_sandbox")]
 
 
 class TestEndToEndBusinessWorkflow:
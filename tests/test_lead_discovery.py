@@ -0,0 +1,138 @@
+"""
+Tests for concurrent Apollo lead discovery with an offline transport.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder.database import Base, LeadEnrichment, LeadRecord
+from blank_business_builder.integrations.apollo import ApolloService
+from blank_business_builder.lead_discovery import AsyncRateLimiter, LeadDiscoveryPipeline
+
+
+class _Response:
+    def __init__(self, payload):
+        self._payload = payload
+        self.content = b"{}"
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class FakeApolloTransport:
+    """Stands in for requests.Session; answers Apollo search and match calls."""
+
+    def __init__(self, people, latency=0.0, fail_ids=()):
+        self.people = people
+        self.latency = latency
+        self.fail_ids = set(fail_ids)
+        self.enrich_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def post(self, url, json, headers, timeout):
+        if url.endswith("/v1/mixed_people/search"):
+            return _Response({"people": self.people})
+        with self._lock:
+            self.enrich_calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            person = next(p for p in self.people if p.get("first_name") == json.get("first_name"))
+            if person["id"] in self.fail_ids:
+                raise RuntimeError("provider error")
+            enriched = dict(person, email=person.get("email") or f"{person['first_name'].lower()}@found.io",
+                            title="VP Growth")
+            return _Response({"person": enriched})
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _people(count):
+    return [
+        {"id": f"p{i}", "first_name": f"Person{i}", "last_name": "Test",
+         "email": f"person{i}@acme.com", "organization": {"name": "Acme"}}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _pipeline(transport, **kwargs):
+    return LeadDiscoveryPipeline(ApolloService(api_key="test", session=transport), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_discovery_enriches_concurrently_and_bulk_stores(db):
+    transport = FakeApolloTransport(_people(20), latency=0.02, fail_ids={"p3"})
+    pipeline = _pipeline(transport, max_concurrency=5, rate_limits={"apollo": 1000.0})
+
+    stored = await pipeline.discover(db, keywords="growth")
+
+    assert len(stored) == 20
+    assert transport.enrich_calls == 20
+    assert 1 < transport.max_in_flight <= 5
+    assert db.query(LeadRecord).count() == 20
+    assert db.query(LeadEnrichment).count() == 20
+    lead = db.query(LeadRecord).filter(LeadRecord.external_id == "p0").one()
+    assert (lead.full_name, lead.company, lead.title, lead.status) == ("Person0 Test", "Acme", "VP Growth", "new")
+    # A failed enrichment still stores the search result with an empty payload
+    failed = db.query(LeadRecord).filter(LeadRecord.external_id == "p3").one()
+    assert failed.title is None
+    assert pipeline.stats["enrich_failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_known_emails_are_skipped_before_enrichment(db):
+    people = _people(4) + [{"id": "p9", "first_name": "Dup", "email": "person1@acme.com"},
+                           {"id": "p10", "first_name": "Noemail"}]
+    db.add(LeadRecord(full_name="Existing", email="person0@acme.com"))
+    db.commit()
+    transport = FakeApolloTransport(people)
+    pipeline = _pipeline(transport, rate_limits={"apollo": 1000.0})
+
+    stored = await pipeline.discover(db, keywords="growth")
+
+    # person0 is already stored and p9 repeats person1's email within the batch
+    assert transport.enrich_calls == 4
+    assert {s["name"] for s in stored} == {"Person1 Test", "Person2 Test", "Person3 Test", "Noemail"}
+    assert pipeline.stats["duplicates"] == 2
+    assert db.query(LeadRecord).filter(LeadRecord.email == "noemail@found.io").count() == 1
+
+    # Running the same discovery again stores nothing new
+    again = await _pipeline(transport, rate_limits={"apollo": 1000.0}).discover(db, keywords="growth")
+    assert again == []
+    assert db.query(LeadRecord).count() == 5
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_paces_acquisitions():
+    limiter = AsyncRateLimiter(rate=50.0, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        await limiter.acquire()
+    # First call uses the burst token, the remaining five wait ~20ms each
+    assert time.monotonic() - start >= 0.09
@@ -0,0 +1,123 @@
+"""
+Tests for the dependency-driven Level-8-Agents dispatcher.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../scripts/runners')))
+
+from blank_business_builder import hive_mind_coordinator
+
+# The runners import the coordinator as a top-level module
+sys.modules.setdefault("hive_mind_coordinator", hive_mind_coordinator)
+
+import feedback_loop_system
+from level8_agents_dispatch import Level8AgentsDispatchSystem, Level8Task, TaskPriority
+
+
+pytestmark = pytest.mark.real_numpy(feedback_loop_system)
+
+
+@pytest.fixture
+def dispatch(tmp_path):
+    hive = hive_mind_coordinator.HiveMindCoordinator(config_path=str(tmp_path / "config.json"))
+    return Level8AgentsDispatchSystem(hive, feedback_loop_system.FeedbackLoopSystem(hive))
+
+
+def _counted_status(dispatch):
+    """The status counts from a full walk of the tasks."""
+    counts = {}
+    for task in dispatch.tasks:
+        phase = counts.setdefault(task.priority, {'total': 0})
+        phase['total'] += 1
+        phase[task.status] = phase.get(task.status, 0) + 1
+    return counts
+
+
+def _assert_counters_match(dispatch):
+    status = dispatch.get_deployment_status()
+    for key, phase in (('phase_1', TaskPriority.PHASE_1), ('phase_2', TaskPriority.PHASE_2),
+                       ('phase_3', TaskPriority.PHASE_3)):
+        expected = _counted_status(dispatch)[phase]
+        assert {k: v for k, v in status[key].items() if v} == expected
+
+
+def test_tasks_start_when_their_own_prerequisites_finish(dispatch, tmp_path):
+    prerequisites = dispatch.prerequisites()
+    finished = set()
+    started = []
+    running = 0
+    peak = 0
+
+    async def executor(task):
+        nonlocal running, peak
+        assert set(prerequisites[task.task_id]) <= finished
+        started.append(task.task_id)
+        running += 1
+        peak = max(peak, running)
+        # Phase 1 work on one website is slow; other websites should not wait for it
+        await asyncio.sleep(0.05 if task.task_id == "chattertech_live_demo" else 0)
+        running -= 1
+        finished.add(task.task_id)
+        return {'implemented': task.task_id}
+
+    journal = tmp_path / "journal.jsonl"
+    dispatch.dispatch_all_agents(executor, max_concurrency=3, journal_path=str(journal))
+
+    assert all(task.status == "completed" for task in dispatch.tasks)
+    assert all(task.result == {'implemented': task.task_id} for task in dispatch.tasks)
+    assert peak == 3
+    # A phase 3 task on another website ran before this website's phase 2 could start
+    assert started.index("aios_status_dashboard") < started.index("chattertech_voice_showcase")
+    _assert_counters_match(dispatch)
+
+    events = [json.loads(line) for line in journal.read_text().splitlines()]
+    assert [e['event'] for e in events].count("completed") == len(dispatch.tasks)
+
+
+def test_failed_task_blocks_its_dependents(dispatch):
+    dispatch.add_task(Level8Task(
+        task_id="aios_followup", title="Follow-up", website="elsewhere.example", description="",
+        impact="", cost="", timeline="", priority=TaskPriority.PHASE_1,
+        depends_on=["chattertech_live_demo"],
+    ))
+
+    async def executor(task):
+        if task.task_id == "chattertech_live_demo":
+            raise RuntimeError("demo backend unavailable")
+        return {}
+
+    dispatch.dispatch_all_agents(executor)
+
+    tasks = dispatch.tasks_by_id
+    assert tasks["chattertech_live_demo"].status == "failed"
+    assert "demo backend unavailable" in tasks["chattertech_live_demo"].result['error']
+    assert tasks["aios_followup"].status == "blocked"
+    later = [t for t in dispatch.tasks if t.website == "chattertechai.com" and t.priority != TaskPriority.PHASE_1]
+    assert later and all(t.status == "blocked" for t in later)
+    assert all(t.status == "completed" for t in dispatch.tasks
+               if t.website not in ("chattertechai.com", "elsewhere.example"))
+    _assert_counters_match(dispatch)
+
+
+def test_dispatch_without_executor_and_streamed_plan(dispatch, tmp_path):
+    dispatch.dispatch_all_agents()
+
+    assert all(task.status == "in_progress" for task in dispatch.tasks)
+    assert len(dispatch.agents) == len(dispatch.tasks)
+    _assert_counters_match(dispatch)
+
+    plan_path = tmp_path / "plan.json"
+    dispatch.export_deployment_plan(str(plan_path))
+    plan = json.loads(plan_path.read_text())
+    assert plan['total_tasks'] == len(dispatch.tasks)
+    assert plan['status'] == dispatch.get_deployment_status()
+    assert plan['tasks'] == [task.to_dict() for task in dispatch.tasks]
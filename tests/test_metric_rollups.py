@@ -0,0 +1,202 @@
+"""
+Tests for incremental MetricsHistory rollups.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import random
+import sys
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder.database import (
+    Base, Business, BusinessMetricRollup, GlobalMetricRollup, MetricsHistory, User,
+)
+from blank_business_builder.metric_rollups import (
+    GRANULARITIES, MetricRollupEngine, bucket_start, business_series, global_series,
+)
+
+START = datetime(2026, 3, 1, 22, 50)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    user_id = uuid.uuid4()
+    with engine.begin() as conn:
+        conn.execute(insert(User.__table__), [{"id": user_id, "email": "owner@bbb.test", "hashed_password": "x"}])
+        conn.execute(insert(Business.__table__), [
+            {"id": uuid.uuid4(), "user_id": user_id, "business_name": f"Business {i}"} for i in range(3)
+        ])
+    yield engine
+    engine.dispose()
+
+
+def _business_ids(engine):
+    with engine.connect() as conn:
+        return sorted(conn.execute(select(Business.__table__.c.id)).scalars(), key=str)
+
+
+def _write(engine, samples, ingested_at):
+    rows = [
+        {
+            "id": uuid.uuid4(), "business_id": business_id, "timestamp": timestamp,
+            "revenue": Decimal(revenue), "customers": customers, "leads": 2 * customers,
+            "conversion_rate": Decimal("1.50"), "tasks_completed": 1, "tasks_pending": 0,
+            "tasks_failed": 0, "ingested_at": ingested_at,
+        }
+        for business_id, timestamp, revenue, customers in samples
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(MetricsHistory.__table__), rows)
+
+
+def _random_samples(business_ids, count, seed=7):
+    rng = random.Random(seed)
+    return [
+        (rng.choice(business_ids), START + timedelta(seconds=rng.randrange(3 * 3600)),
+         f"{rng.randrange(10000)}.{rng.randrange(100):02d}", rng.randrange(50))
+        for _ in range(count)
+    ]
+
+
+def _expected(engine):
+    """Brute-force business and global rollups straight from MetricsHistory."""
+    with engine.connect() as conn:
+        raw = conn.execute(select(MetricsHistory.__table__)).all()
+    business = defaultdict(lambda: {"samples": 0, "revenue_sum": 0, "last": None})
+    for row in raw:
+        for granularity in GRANULARITIES:
+            bucket = business[(row.business_id, granularity, bucket_start(row.timestamp, granularity))]
+            bucket["samples"] += 1
+            bucket["revenue_sum"] += row.revenue
+            if bucket["last"] is None or row.timestamp >= bucket["last"][0]:
+                bucket["last"] = (row.timestamp, row.revenue, row.customers)
+    overall = defaultdict(lambda: {"businesses": 0, "samples": 0, "revenue_sum": 0, "customers_last": 0})
+    for (business_id, granularity, start), bucket in business.items():
+        total = overall[(granularity, start)]
+        total["businesses"] += 1
+        total["samples"] += bucket["samples"]
+        total["revenue_sum"] += bucket["revenue_sum"]
+        total["customers_last"] += bucket["last"][2]
+    return business, overall
+
+
+def _assert_matches(engine):
+    business, overall = _expected(engine)
+    with engine.connect() as conn:
+        stored = conn.execute(select(BusinessMetricRollup.__table__)).all()
+        stored_global = conn.execute(select(GlobalMetricRollup.__table__)).all()
+    assert len(stored) == len(business)
+    for row in stored:
+        bucket = business[(row.business_id, row.granularity, row.bucket_start)]
+        assert row.samples == bucket["samples"]
+        assert row.revenue_sum == bucket["revenue_sum"]
+        assert (row.last_timestamp, row.revenue_last, row.customers_last) == bucket["last"]
+    assert len(stored_global) == len(overall)
+    for row in stored_global:
+        total = overall[(row.granularity, row.bucket_start)]
+        assert (row.businesses, row.samples, row.revenue_sum, row.customers_last) == (
+            total["businesses"], total["samples"], total["revenue_sum"], total["customers_last"]
+        )
+
+
+@pytest.mark.parametrize("scan_threshold", [2000, 0], ids=["range-lookups", "single-scan"])
+def test_rollups_match_a_full_recomputation(engine, scan_threshold):
+    _write(engine, _random_samples(_business_ids(engine), 600), ingested_at=START + timedelta(hours=3))
+
+    report = MetricRollupEngine(engine, scan_threshold=scan_threshold).run()
+
+    assert report.rows_consumed == 600
+    assert report.watermark == START + timedelta(hours=3)
+    # Three hours starting at 22:50 cross midnight: 4 hours and 2 days per business
+    assert report.buckets["hour"] == 12 and report.buckets["day"] == 6
+    assert report.global_buckets["day"] == 2
+    _assert_matches(engine)
+
+
+def test_runs_only_consume_rows_past_the_watermark(engine):
+    business_ids = _business_ids(engine)
+    _write(engine, _random_samples(business_ids, 300), ingested_at=START + timedelta(hours=3))
+    rollups = MetricRollupEngine(engine, overlap=timedelta(0))
+    rollups.run()
+
+    assert rollups.run().rows_consumed == 0
+
+    later = START + timedelta(hours=3, minutes=10)
+    _write(engine, [(business_ids[0], later, "5.00", 1)], ingested_at=later)
+    report = rollups.run()
+
+    assert report.rows_consumed == 1
+    assert report.watermark == later
+    assert report.buckets == {"minute": 1, "hour": 1, "day": 1}
+    assert report.global_buckets == {"minute": 1, "hour": 1, "day": 1}
+    _assert_matches(engine)
+
+    # Rows inside the overlap are read again; rebuilding their buckets changes nothing
+    assert MetricRollupEngine(engine, overlap=timedelta(minutes=15)).run().rows_consumed == 301
+    _assert_matches(engine)
+
+
+def test_late_data_re_rolls_only_its_buckets(engine):
+    business_ids = _business_ids(engine)
+    _write(engine, _random_samples(business_ids, 300), ingested_at=START + timedelta(hours=3))
+    rollups = MetricRollupEngine(engine, overlap=timedelta(0))
+    rollups.run()
+    with engine.connect() as conn:
+        before = {
+            (row.business_id, row.granularity, row.bucket_start): row.updated_at
+            for row in conn.execute(select(BusinessMetricRollup.__table__))
+        }
+
+    # A sample measured at the start of the window arrives a day late
+    late = START + timedelta(seconds=30)
+    _write(engine, [(business_ids[1], late, "9999.99", 42)], ingested_at=START + timedelta(days=1))
+    report = rollups.run()
+
+    assert report.rows_consumed == 1
+    assert report.buckets == {"minute": 1, "hour": 1, "day": 1}
+    _assert_matches(engine)
+    with engine.connect() as conn:
+        rewritten = {
+            (row.business_id, row.granularity, row.bucket_start)
+            for row in conn.execute(select(BusinessMetricRollup.__table__))
+            if row.updated_at != before.get((row.business_id, row.granularity, row.bucket_start))
+        }
+    assert rewritten == {
+        (business_ids[1], granularity, bucket_start(late, granularity)) for granularity in GRANULARITIES
+    }
+
+
+def test_series_read_from_rollups(engine):
+    business_ids = _business_ids(engine)
+    _write(engine, [
+        (business_ids[0], START + timedelta(minutes=minute), f"{100 + minute}.00", minute)
+        for minute in range(0, 120, 10)
+    ], ingested_at=START + timedelta(hours=2))
+    MetricRollupEngine(engine).run()
+    db = sessionmaker(bind=engine)()
+
+    points = business_series(db, business_ids[0], granularity="hour", end=START + timedelta(hours=2))
+    overall = global_series(db, granularity="day", end=START + timedelta(days=1))
+    db.close()
+
+    assert [point["bucket_start"] for point in points] == [
+        "2026-03-01T22:00:00", "2026-03-01T23:00:00", "2026-03-02T00:00:00",
+    ]
+    assert [point["samples"] for point in points] == [1, 6, 5]
+    assert points[1]["last"]["revenue"] == 160.0
+    assert points[1]["average"]["customers"] == 35.0
+    assert [(point["businesses"], point["samples"]) for point in overall] == [(1, 7), (1, 5)]
+    with pytest.raises(ValueError):
+        business_series(db, business_ids[0], granularity="week")
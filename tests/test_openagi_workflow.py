@@ -0,0 +1,167 @@
+"""
+Tests for dependency-aware execution and workload balancing in the
+FlowState OpenAGI workflow engine.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_spec = importlib.util.spec_from_file_location(
+    "openagi_workflow", Path(__file__).parent.parent / "FlowState" / "backend" / "openagi_workflow.py"
+)
+openagi_workflow = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(openagi_workflow)
+
+ActionType = openagi_workflow.ActionType
+OpenAGIWorkflowEngine = openagi_workflow.OpenAGIWorkflowEngine
+TeamBalancerAgent = openagi_workflow.TeamBalancerAgent
+TriggerType = openagi_workflow.TriggerType
+WorkflowAction = openagi_workflow.WorkflowAction
+WorkflowTrigger = openagi_workflow.WorkflowTrigger
+
+TRIGGER = WorkflowTrigger(type=TriggerType.MANUAL, conditions={})
+
+
+class RecordingEngine(OpenAGIWorkflowEngine):
+    """Actions sleep for ``parameters['delay']`` and record overlap."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.active = 0
+        self.peak = 0
+        self.started = []
+
+    async def _execute_action(self, action, context):
+        self.started.append(action.id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(action.parameters.get("delay", 0.01))
+            if action.parameters.get("fail"):
+                raise RuntimeError(f"{action.id} failed")
+            return {"id": action.id, "inputs": sorted(context.get("dependency_results", {}))}
+        finally:
+            self.active -= 1
+
+
+def _action(action_id, depends_on=None, **parameters):
+    return WorkflowAction(type=ActionType.EXECUTE_SCRIPT, parameters=parameters,
+                          id=action_id, depends_on=depends_on)
+
+
+def test_default_workflows_still_run_sequentially():
+    async def scenario():
+        engine = OpenAGIWorkflowEngine()
+        workflow_id = await engine.create_workflow("legacy", "", TRIGGER, [
+            WorkflowAction(type=ActionType.UPDATE_STATUS, parameters={"status": "review"}),
+            WorkflowAction(type=ActionType.AI_ANALYSIS, parameters={}),
+            WorkflowAction(type=ActionType.CALL_API, parameters={}),
+        ])
+        context = {"task": {"status": "todo"}}
+        return await engine.execute_workflow(workflow_id, context), context, engine
+
+    result, context, engine = asyncio.run(scenario())
+
+    assert result["actions_executed"] == 3
+    assert [r.get("action", r.get("status")) for r in result["results"]] == [
+        "status_updated", "ai_analysis_complete", "unsupported"]
+    assert result["results"][0]["previous_status"] == "todo"
+    assert context["previous_action_result"] == result["results"][-1]
+    assert engine.get_plan("wf_1").parents == ((), (0,), (1,))
+
+
+def test_independent_actions_run_concurrently_after_their_dependencies():
+    async def scenario():
+        engine = RecordingEngine(max_concurrency=4)
+        actions = [_action("fetch", [])]
+        actions += [_action(f"step{i}", ["fetch"], delay=0.05) for i in range(8)]
+        actions.append(_action("report", [f"step{i}" for i in range(8)]))
+        workflow_id = await engine.create_workflow("wide", "", TRIGGER, actions)
+        return await engine.execute_workflow(workflow_id, {}), engine
+
+    result, engine = asyncio.run(scenario())
+
+    assert result["actions_executed"] == 10
+    assert engine.peak == 4
+    assert engine.started[0] == "fetch" and engine.started[-1] == "report"
+    assert [r["id"] for r in result["results"]] == ["fetch"] + [f"step{i}" for i in range(8)] + ["report"]
+    assert result["results"][-1]["inputs"] == sorted(f"step{i}" for i in range(8))
+
+
+def test_failure_stops_remaining_actions_unless_configured_to_continue():
+    actions = [
+        _action("a", []),
+        _action("b", [], fail=True),
+        _action("slow", [], delay=0.5),
+        _action("after_b", ["b"]),
+    ]
+
+    async def scenario(stop_on_error):
+        engine = RecordingEngine()
+        workflow_id = await engine.create_workflow("errors", "", TRIGGER, actions)
+        engine.workflows[workflow_id]["stop_on_error"] = stop_on_error
+        return await engine.execute_workflow(workflow_id, {})
+
+    stopped = asyncio.run(scenario(True))
+    assert stopped["results"] == [{"id": "a", "inputs": []}, {"error": "b failed"}]
+
+    continued = asyncio.run(scenario(False))
+    assert continued["actions_executed"] == 4
+    assert continued["results"][3] == {"id": "after_b", "inputs": ["b"]}
+
+
+def test_plans_are_validated_once_and_shared_by_templates():
+    async def scenario():
+        engine = OpenAGIWorkflowEngine()
+        with pytest.raises(ValueError, match="unknown"):
+            await engine.create_workflow("bad", "", TRIGGER, [_action("a", ["missing"])])
+        with pytest.raises(ValueError, match="cycle"):
+            await engine.create_workflow("bad", "", TRIGGER, [_action("a", ["b"]), _action("b", ["a"])])
+
+        template = await engine.create_workflow("tmpl", "shared", TRIGGER, [_action("a", []), _action("b")])
+        copy = await engine.create_workflow_from_template(template, "copy")
+        return engine, template, copy
+
+    engine, template, copy = asyncio.run(scenario())
+
+    assert engine.get_plan(copy) is engine.get_plan(template)
+    assert engine.workflows[copy]["description"] == "shared"
+    assert engine.get_plan(template).action_ids == ("a", "b")
+
+
+def test_balance_workload_defaults_to_round_robin():
+    team = [{"id": f"m{i}"} for i in range(3)]
+    tasks = [{"id": f"t{i}"} for i in range(7)]
+
+    result = asyncio.run(TeamBalancerAgent().balance_workload(team, tasks))
+
+    assert result["assignments"] == {f"t{i}": f"m{i % 3}" for i in range(7)}
+    assert result["unassigned"] == []
+    assert asyncio.run(TeamBalancerAgent().balance_workload([], tasks))["assignments"] == {}
+
+
+def test_balance_workload_respects_capacity_and_existing_load():
+    team = [
+        {"id": "busy", "capacity": 40, "workload": 36},
+        {"id": "free", "capacity": 40},
+        {"id": "part_time", "capacity": 20},
+    ]
+    tasks = [
+        {"id": "big", "estimated_hours": 30},
+        {"id": "medium", "estimated_hours": 12},
+        {"id": "urgent", "estimated_hours": 8, "priority": 5},
+        {"id": "small", "estimated_hours": 3},
+        {"id": "huge", "estimated_hours": 50},
+    ]
+
+    result = asyncio.run(TeamBalancerAgent().balance_workload(team, tasks))
+
+    assert result["assignments"] == {"urgent": "free", "big": "free", "medium": "part_time", "small": "part_time"}
+    assert result["unassigned"] == ["huge"]
+    assert result["member_hours"] == {"busy": 36.0, "free": 38.0, "part_time": 15.0}
+    for member in team:
+        assert result["member_hours"][member["id"]] <= member["capacity"]
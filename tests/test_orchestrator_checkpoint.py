@@ -0,0 +1,119 @@
+"""
+Tests for orchestrator checkpoint / resume.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder.autonomous_business import (
+    AgentRole,
+    AutonomousBusinessOrchestrator,
+    AutonomousTask,
+    TaskStatus,
+)
+from blank_business_builder.orchestrator_sharding import SimulatedServices
+
+
+def _orchestrator(db_path):
+    services = SimulatedServices()
+    orch = AutonomousBusinessOrchestrator(
+        "AI Chatbot Integration Service",
+        "Founder",
+        market_research=services,
+        email_service=services,
+        payment_processor=services,
+        social_media=services,
+    )
+    orch.enable_checkpointing(str(db_path), interval_seconds=0)
+    return orch
+
+
+def _task_rows(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return dict(conn.execute("SELECT task_id, status FROM tasks").fetchall())
+
+
+@pytest.mark.asyncio
+async def test_first_checkpoint_is_full_then_only_dirty_tasks(tmp_path):
+    db_path = tmp_path / "orch.db"
+    orch = _orchestrator(db_path)
+    await orch.deploy_agents()
+
+    written = await orch.save_checkpoint()
+    assert written == len(orch.task_queue)
+    assert await orch.save_checkpoint() == 0
+
+    task = orch.task_queue[0]
+    orch._set_task_status(task, TaskStatus.COMPLETED, result={"success": True})
+    orch.add_task(AutonomousTask(task_id="extra_1", role=AgentRole.RESEARCHER, description="Extra"))
+
+    assert await orch.save_checkpoint() == 2
+    rows = _task_rows(db_path)
+    assert rows[task.task_id] == "completed"
+    assert rows["extra_1"] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_resume_rebuilds_state_without_regenerating_tasks(tmp_path):
+    db_path = tmp_path / "orch.db"
+    orch = _orchestrator(db_path)
+    await orch.deploy_agents()
+    for _ in range(3):
+        await orch.run_cycle(report=False)
+        if orch._checkpoint_task:
+            await orch._checkpoint_task
+    await orch.save_checkpoint()
+
+    resumed = _orchestrator(db_path)
+    assert await resumed.resume_from_checkpoint() is True
+
+    assert [t.task_id for t in resumed.task_queue] == [t.task_id for t in orch.task_queue]
+    assert resumed.completed_task_ids == orch.completed_task_ids
+    assert resumed.metrics.total_revenue == orch.metrics.total_revenue
+    assert resumed.metrics.tasks_completed == orch.metrics.tasks_completed
+    assert resumed.task_transition_counts == orch.task_transition_counts
+    assert set(resumed.agents) == set(orch.agents)
+
+    counts = resumed.get_task_status_counts()
+    assert sum(counts.values()) == len(resumed.task_queue)
+    assert counts["in_progress"] == 0
+    assert {t.task_id for t in resumed.pending_tasks} == {
+        t.task_id for t in resumed.task_queue
+        if t.status in (TaskStatus.PENDING, TaskStatus.BLOCKED)
+    }
+
+    some_agent = next(iter(orch.agents.values()))
+    restored_agent = resumed.agents[some_agent.agent_id]
+    assert restored_agent.performance.tasks_completed == some_agent.performance.tasks_completed
+    assert restored_agent.knowledge_graph == some_agent.knowledge_graph
+
+    # The resumed orchestrator keeps running where the old one stopped
+    await resumed.run_cycle(report=False)
+    assert resumed.metrics.tasks_completed > orch.metrics.tasks_completed
+
+
+@pytest.mark.asyncio
+async def test_in_flight_tasks_are_requeued_on_resume(tmp_path):
+    db_path = tmp_path / "orch.db"
+    orch = _orchestrator(db_path)
+    await orch.deploy_agents()
+    await orch._assign_tasks()
+    assert orch.task_status_counts[TaskStatus.IN_PROGRESS] > 0
+    await orch.save_checkpoint()
+
+    resumed = _orchestrator(db_path)
+    await resumed.resume_from_checkpoint()
+    assert all(t.status != TaskStatus.IN_PROGRESS for t in resumed.task_queue)
+    assert all(t.assigned_to is None for t in resumed.pending_tasks)
+
+
+@pytest.mark.asyncio
+async def test_resume_without_checkpoint_returns_false(tmp_path):
+    orch = _orchestrator(tmp_path / "empty.db")
+    assert await orch.resume_from_checkpoint() is False
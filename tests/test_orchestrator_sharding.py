@@ -0,0 +1,150 @@
+"""
+Tests for multi-process orchestrator sharding.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder.orchestrator_sharding import (
+    BusinessSpec,
+    ShardSupervisor,
+    ShardWorker,
+    shard_for,
+)
+
+
+def _specs(count):
+    return [BusinessSpec(f"biz-{i}", "AI Chatbot Integration Service", f"Founder {i}") for i in range(count)]
+
+
+def test_shard_for_is_stable_and_balanced():
+    workers = [0, 1, 2, 3]
+    placements = [shard_for(f"biz-{i}", workers) for i in range(4000)]
+
+    assert placements == [shard_for(f"biz-{i}", workers) for i in range(4000)]
+    for worker_index in workers:
+        assert 800 < placements.count(worker_index) < 1200
+
+
+def test_removing_a_worker_only_moves_its_businesses():
+    before = {f"biz-{i}": shard_for(f"biz-{i}", [0, 1, 2, 3]) for i in range(2000)}
+    after = {business_id: shard_for(business_id, [0, 1, 3]) for business_id in before}
+
+    for business_id, worker_index in before.items():
+        if worker_index != 2:
+            assert after[business_id] == worker_index
+        else:
+            assert after[business_id] in (0, 1, 3)
+
+
+def test_shard_for_requires_workers():
+    with pytest.raises(ValueError):
+        shard_for("biz-1", [])
+
+
+@pytest.mark.asyncio
+async def test_worker_shares_one_hive_between_orchestrators():
+    worker = ShardWorker(0, conn=None, cycle_interval=0, simulate=True)
+    started = await worker._add([spec.__dict__ for spec in _specs(3)])
+
+    assert started == 3
+    hives = {id(orch.hive_mind) for orch in worker.orchestrators.values()}
+    assert hives == {id(worker.hive_mind)}
+    transports = {id(orch.email_service) for orch in worker.orchestrators.values()}
+    assert transports == {id(worker.services["email_service"])}
+    # Agent IDs are namespaced per business, so nothing collides in the shared hive
+    agents_per_business = len(next(iter(worker.orchestrators.values())).agents)
+    assert len(worker.hive_mind.agents) == 1 + 3 * agents_per_business
+
+    dashboard = worker.get_metrics_dashboard()
+    assert dashboard["businesses"] == 3
+    assert dashboard["totals"]["tasks_pending"] > 0
+
+
+def test_worker_remove_unregisters_business_agents_from_hive():
+    async def scenario():
+        worker = ShardWorker(0, conn=None, cycle_interval=0, simulate=True)
+        await worker._add([spec.__dict__ for spec in _specs(2)])
+        assert await worker._handle("remove", ["biz-0"]) == 1
+        return worker
+
+    worker = asyncio.run(scenario())
+    remaining = next(iter(worker.orchestrators.values()))
+    assert set(worker.hive_mind.agents) == {worker.hive_mind.ech0_overseer_id, *remaining.agents}
+
+
+def test_stale_replies_after_a_timeout_are_discarded():
+    supervisor = ShardSupervisor(num_workers=1, rpc_timeout=0.05)
+    parent, child = multiprocessing.Pipe()
+    supervisor.connections[0] = parent
+
+    first = supervisor._send(0, "metrics", False)
+    with pytest.raises(TimeoutError):
+        supervisor._recv(0, first)
+
+    second = supervisor._send(0, "metrics", False)
+    child.send((first, "late answer to the first request"))
+    child.send((second, "answer"))
+    assert supervisor._recv(0, second) == "answer"
+    assert not parent.poll()
+
+
+class _DeadProcess:
+    pid = 1234
+
+    def is_alive(self):
+        return False
+
+    def join(self, timeout=None):
+        pass
+
+
+def test_businesses_of_dead_workers_stay_pending_without_survivors():
+    supervisor = ShardSupervisor(num_workers=1)
+    parent, _ = multiprocessing.Pipe()
+    supervisor.processes[0] = _DeadProcess()
+    supervisor.connections[0] = parent
+    for spec in _specs(3):
+        supervisor.specs[spec.business_id] = spec
+        supervisor.assignments[spec.business_id] = 0
+
+    assert supervisor.check_workers() == [0]
+    assert supervisor.assignments == {}
+    assert sorted(supervisor.unplaced) == ["biz-0", "biz-1", "biz-2"]
+    assert supervisor.get_metrics_dashboard()["unplaced_businesses"] == 3
+
+
+@pytest.mark.slow
+def test_supervisor_aggregates_metrics_and_rebalances_on_worker_death():
+    with ShardSupervisor(num_workers=2, cycle_interval=0.2, simulate=True,
+                         worker_log_level=logging.ERROR) as supervisor:
+        assert supervisor.add_businesses(_specs(20)) == 20
+
+        dashboard = supervisor.get_metrics_dashboard()
+        assert dashboard["businesses"] == 20
+        assert sum(shard["businesses"] for shard in dashboard["shards"]) == 20
+
+        victim = supervisor.assignments["biz-0"]
+        moved = [b for b, w in supervisor.assignments.items() if w == victim]
+        supervisor.processes[victim].terminate()
+        supervisor.processes[victim].join(5)
+
+        assert supervisor.check_workers() == [victim]
+        assert supervisor.rebalanced_businesses == len(moved)
+        assert all(supervisor.assignments[b] != victim for b in moved)
+
+        dashboard = supervisor.get_metrics_dashboard()
+        assert dashboard["workers"] == 1
+        assert dashboard["shards"][0]["businesses"] == 20
+
+        time.sleep(0.5)
+        assert supervisor.get_metrics_dashboard()["metrics"]["tasks_completed"] > 0
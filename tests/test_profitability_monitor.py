@@ -0,0 +1,107 @@
+"""
+Tests for the concurrent ProfitabilityMonitor and its metric time-series store.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import asyncio
+import os
+import random
+import sys
+from dataclasses import replace
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+import stripe
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../scripts/runners')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../scripts/tools')))
+
+import profitability_monitor
+from bbb_real_business_library import get_real_business_library
+from profitability_monitor import (
+    BusinessMetrics, MetricTimeSeriesStore, ProfitabilityMonitor, health_scores, health_statuses, METRIC_FIELDS,
+)
+
+
+pytestmark = pytest.mark.real_numpy(profitability_monitor)
+
+
+def _metric(business_id, timestamp, rng):
+    return BusinessMetrics(
+        business_id=business_id, timestamp=timestamp,
+        **{name: rng.randrange(500) if name in profitability_monitor.INT_FIELDS else rng.uniform(-0.3, 0.4)
+           for name in METRIC_FIELDS},
+    )
+
+
+def test_store_keeps_the_newest_samples_within_retention():
+    rng = random.Random(1)
+    store = MetricTimeSeriesStore(capacity=3, retention=timedelta(days=1))
+    now = datetime.now()
+    samples = [_metric("b", now - timedelta(hours=5 - i), rng) for i in range(5)]
+    for sample in samples:
+        store.append(sample)
+
+    assert [m.mrr for m in store.history("b")] == [m.mrr for m in samples[2:]]
+    assert store.series("b", "total_customers", last=2).tolist() == [m.total_customers for m in samples[3:]]
+    assert store.latest("b") == replace(samples[-1], timestamp=store.latest("b").timestamp)
+
+    # Samples older than the retention window are not returned
+    store.append(_metric("old", now - timedelta(days=2), rng))
+    assert store.history("old") == [] and "old" in store
+
+
+def test_vectorised_health_matches_business_metrics(real_numpy):
+    rng = random.Random(2)
+    metrics = [_metric(str(i), datetime.now(), rng) for i in range(500)]
+    values = real_numpy.array([[getattr(m, name) for name in METRIC_FIELDS] for m in metrics])
+
+    scores = health_scores(values)
+
+    assert scores.tolist() == [m.health_score for m in metrics]
+    assert health_statuses(scores).tolist() == [m.health_status.value for m in metrics]
+
+
+def test_cycle_gathers_every_business_concurrently_with_one_charge_fetch(monkeypatch):
+    template = get_real_business_library().get_all_businesses()[0]
+    models = {f"Business {i}": replace(template, name=f"Business {i}", website=f"b{i}.test") for i in range(25)}
+    charges = [
+        SimpleNamespace(id="ch_1", amount=10000, created=int(datetime.now().timestamp()),
+                        metadata={"business": "Business 3", "website": "b3.test"}),
+        SimpleNamespace(id="ch_2", amount=5000, created=int(datetime.now().timestamp()),
+                        metadata={"website": "b3.test"}),
+    ]
+    list_calls = []
+
+    def charge_list(**params):
+        list_calls.append(params)
+        return SimpleNamespace(auto_paging_iter=lambda: iter(charges))
+
+    monkeypatch.setattr(stripe, "api_key", None)
+    monkeypatch.setattr(stripe.Charge, "list", charge_list)
+    monitor = ProfitabilityMonitor(stripe_api_key="sk_test", max_concurrency=4)
+    monkeypatch.setattr(monitor, "_load_business_models", lambda: models)
+
+    in_flight, peak = 0, 0
+    operational = monitor._get_operational_metrics
+
+    async def slow_operational(business_id, business_model=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await operational(business_id, business_model)
+
+    monkeypatch.setattr(monitor, "_get_operational_metrics", slow_operational)
+
+    asyncio.run(monitor._monitoring_cycle())
+
+    assert len(list_calls) == 1
+    assert peak == 4
+    assert sorted(monitor.metrics_store.business_ids()) == sorted(models)
+    assert monitor.metrics_store.latest("Business 3").total_revenue == 150.0
+    summary = monitor.get_portfolio_summary()
+    assert summary["total_businesses"] == 25
+    assert sum(summary["health_distribution"].values()) == 25
@@ -80,3 +80,33 @@ class TestSalesEngineerQualify:
         self.se.qualify(lead)
         assert lead.score == 90
         assert lead.status == "Qualified"
+
+
+class TestSalesEngineerQualifyMany:
+    def setup_method(self):
+        db._store = {}
+        self.se = SalesEngineer(MockCoreSystem())
+
+    def test_batch_matches_single_lead_scoring(self):
+        leads = [
+            Lead(person=Person(name="A", role="CTO"), organization=Organization(name="X", industry="SaaS")),
+            Lead(person=Person(name="B", role="Developer"), organization=Organization(name="Y", industry="E-commerce")),
+            Lead(person=Person(name="C", role="Founder"), organization=Organization(name="Z", industry="E-commerce")),
+            Lead(person=Person(name="D", role="CEO")),
+        ]
+        qualified = self.se.qualify_many(leads)
+
+        assert [lead.person.name for lead in qualified] == ["A", "C"]
+        assert [lead.score for lead in leads] == [90, 50, 70, 0]
+        # Disqualified leads are not stored, same as qualify()
+        assert set(db._store) == {lead.id for lead in leads[:3]}
+
+    def test_process_leads_engages_only_qualified(self, monkeypatch):
+        engaged = []
+        monkeypatch.setattr(self.se, "engage", engaged.append)
+        leads = [
+            Lead(person=Person(name="A", role="CTO"), organization=Organization(name="X", industry="AI")),
+            Lead(person=Person(name="B", role="Developer"), organization=Organization(name="Y", industry="E-commerce")),
+        ]
+        self.se.process_leads(leads)
+        assert engaged == [leads[0]]
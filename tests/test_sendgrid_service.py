@@ -127,7 +127,8 @@ class TestSendGridService:
 
             assert result["success"] == 2
             assert result["failed"] == 0
-            assert service.client.send.call_count == 2
+            # One request carries both recipients as personalizations
+            assert service.client.send.call_count == 1
 
     def test_send_transactional_email(self):
         """Test sending transactional email."""
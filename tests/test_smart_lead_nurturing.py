@@ -16,8 +16,13 @@ from blank_business_builder.smart_lead_nurturing import (
     NurturingAction,
     SmartLeadScorer,
     LeadNurturingEngine,
-    AutomatedFollowUpSystem
+    AutomatedFollowUpSystem,
+    TEMPERATURE_TIERS,
 )
+from blank_business_builder import smart_lead_nurturing
+
+
+pytestmark = pytest.mark.real_numpy(smart_lead_nurturing)
 
 
 class TestSmartLeadScorer:
@@ -535,5 +540,81 @@ class TestLeadNurturingIntegration:
         assert stage3 == "hot"
 
 
+class TestBatchScoring:
+    """Test suite for SmartLeadScorer.score_batch."""
+
+    @staticmethod
+    def _population():
+        now = datetime.utcnow()
+        leads, interactions = [], {}
+        types = ["email_open", "email_click", "page_view", "pricing_view",
+                 "whitepaper_download", "contact_sales", "demo_request", "trial_signup"]
+        for i in range(60):
+            lead = Lead(
+                id=f"lead_{i}",
+                email=f"user{i}@{'gmail.com' if i % 3 == 0 else 'corp.com'}",
+                name=f"User {i}",
+                company="Corp" if i % 2 else None,
+                source="website",
+                created_at=now,
+            )
+            leads.append(lead)
+            events = []
+            for j in range(i % 7):
+                events.append({
+                    "type": types[(i + j) % (len(types) - (0 if i % 5 == 0 else 2))],
+                    "timestamp": (now - timedelta(days=(i * j) % 40, hours=j)).isoformat(),
+                })
+            if i % 11 == 0:
+                events.append({"type": "page_view"})  # no timestamp
+            interactions[lead.id] = events
+        return leads, interactions
+
+    def test_batch_matches_per_lead_scores_and_stages(self):
+        scorer = SmartLeadScorer()
+        engine = LeadNurturingEngine()
+        leads, interactions = self._population()
+
+        scores, tiers = scorer.score_batch(leads, interactions)
+
+        for lead, score, tier in zip(leads, scores, tiers):
+            expected = scorer.score_lead(lead, interactions[lead.id])
+            assert abs(score - expected) < 1e-9
+            assert TEMPERATURE_TIERS[tier] == engine._determine_stage(expected, interactions[lead.id])
+
+    def test_feature_rows_are_cached_until_lead_changes(self):
+        scorer = SmartLeadScorer()
+        leads, interactions = self._population()
+
+        scorer.score_batch(leads, interactions)
+        assert scorer.cache_misses == len(leads)
+
+        scorer.score_batch(leads, interactions)
+        assert scorer.cache_hits == len(leads)
+
+        lead = leads[4]
+        interactions[lead.id] = interactions[lead.id] + [
+            {"type": "trial_signup", "timestamp": datetime.utcnow().isoformat()}
+        ]
+        scores, tiers = scorer.score_batch(leads, interactions)
+        assert scorer.cache_misses == len(leads) + 1
+        assert abs(scores[4] - scorer.score_lead(lead, interactions[lead.id])) < 1e-9
+        assert TEMPERATURE_TIERS[tiers[4]] == "hot"
+
+    def test_empty_batch(self):
+        scores, tiers = SmartLeadScorer().score_batch([], {})
+        assert len(scores) == 0 and len(tiers) == 0
+
+    def test_schedule_follow_ups_uses_batch_plans(self):
+        system = AutomatedFollowUpSystem()
+        leads, interactions = self._population()
+
+        scheduled = system.schedule_follow_ups(leads, interactions)
+
+        for lead in leads:
+            expected = system.nurturing_engine.generate_nurturing_plan(lead, interactions[lead.id])
+            assert [a.content for a in scheduled[lead.id]] == [a.content for a in expected]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
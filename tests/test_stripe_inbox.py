@@ -0,0 +1,162 @@
+"""
+Tests for the Stripe webhook inbox and its batch processor.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder.database import Base, PaymentTransaction, StripeEventInbox, Subscription, User
+from blank_business_builder.stripe_inbox import StripeInboxProcessor, record_stripe_event
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _user(db, customer_id):
+    user = User(id=uuid.uuid4(), email=f"{customer_id}@example.com", hashed_password="x",
+                stripe_customer_id=customer_id, subscription_tier="free")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _event(event_id, event_type, created, obj):
+    return {"id": event_id, "type": event_type, "created": created, "data": {"object": obj}}
+
+
+def _subscription(sub_id, customer_id, status="active", plan="pro"):
+    return {
+        "id": sub_id,
+        "customer": customer_id,
+        "status": status,
+        "current_period_start": 1760000000,
+        "current_period_end": 1762600000,
+        "items": {"data": [{"price": {"lookup_key": plan}}]},
+    }
+
+
+def _payment(intent_id, customer_id, amount=4900):
+    return {"id": intent_id, "customer": customer_id, "amount": amount, "currency": "usd", "metadata": {}}
+
+
+def test_retried_deliveries_are_stored_once(db):
+    delivery = _event("evt_1", "payment_intent.succeeded", 1760000000, _payment("pi_1", "cus_1"))
+
+    assert record_stripe_event(db, delivery) is True
+    assert record_stripe_event(db, delivery) is False
+    assert db.query(StripeEventInbox).count() == 1
+
+
+def test_batches_use_one_query_per_table_and_one_commit(engine, db):
+    for i in range(200):
+        _user(db, f"cus_{i}")
+    for i in range(200):
+        record_stripe_event(db, _event(f"evt_sub_{i}", "customer.subscription.created", 1760000000 + i,
+                                       _subscription(f"sub_{i}", f"cus_{i}")))
+        record_stripe_event(db, _event(f"evt_pay_{i}", "payment_intent.succeeded", 1760000000 + i,
+                                       _payment(f"pi_{i}", f"cus_{i}")))
+    record_stripe_event(db, _event("evt_x", "invoice.created", 1760000000, {"id": "in_1"}))
+    record_stripe_event(db, _event("evt_y", "payment_intent.succeeded", 1760000000, _payment("pi_y", "cus_unknown")))
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2].split()[0]))
+    report = StripeInboxProcessor(db, batch_size=500).drain()
+
+    assert (report.events, report.applied, report.ignored, report.failed, report.batches) == (402, 400, 2, 0, 1)
+    # claim, subscriptions, users, payment_transactions, then the writes, then the empty claim
+    assert statements.count("SELECT") == 5
+    assert db.query(Subscription).count() == 200
+    assert db.query(PaymentTransaction).count() == 200
+    assert {user.subscription_tier for user in db.query(User)} == {"pro"}
+    assert db.query(StripeEventInbox).filter(StripeEventInbox.processed_at.is_(None)).count() == 0
+
+
+def test_out_of_order_subscription_events_settle_on_the_newest(db):
+    user = _user(db, "cus_1")
+    # updated (t=200) is processed before the older created (t=100) arrives
+    record_stripe_event(db, _event("evt_2", "customer.subscription.updated", 200,
+                                   _subscription("sub_1", "cus_1", status="past_due")))
+    StripeInboxProcessor(db).drain()
+    record_stripe_event(db, _event("evt_1", "customer.subscription.created", 100, _subscription("sub_1", "cus_1")))
+    # and deleted (t=400) is delivered before updated (t=300)
+    record_stripe_event(db, _event("evt_4", "customer.subscription.deleted", 400, _subscription("sub_1", "cus_1")))
+    record_stripe_event(db, _event("evt_3", "customer.subscription.updated", 300, _subscription("sub_1", "cus_1")))
+
+    report = StripeInboxProcessor(db).drain()
+
+    assert (report.applied, report.stale) == (2, 1)
+    assert db.get(StripeEventInbox, "evt_1").outcome == "stale"
+    subscription = db.query(Subscription).one()
+    assert subscription.status == "canceled"
+    db.refresh(user)
+    assert (user.subscription_tier, user.license_status) == ("free", "trial")
+
+
+def test_deleting_an_unknown_subscription_is_skipped(db):
+    user = _user(db, "cus_1")
+    user.subscription_tier = "pro"
+    db.commit()
+    record_stripe_event(db, _event("evt_1", "customer.subscription.deleted", 100, _subscription("sub_gone", "cus_1")))
+
+    report = StripeInboxProcessor(db).drain()
+
+    assert (report.applied, report.ignored) == (0, 1)
+    assert db.query(Subscription).count() == 0
+    db.refresh(user)
+    assert user.subscription_tier == "pro"
+
+
+def test_payment_failure_after_success_does_not_downgrade(db):
+    _user(db, "cus_1")
+    record_stripe_event(db, _event("evt_1", "payment_intent.payment_failed", 50, _payment("pi_1", "cus_1")))
+    record_stripe_event(db, _event("evt_2", "payment_intent.succeeded", 100, _payment("pi_1", "cus_1")))
+    assert StripeInboxProcessor(db).drain().applied == 2
+    # a retry of the earlier failure shows up after the success was applied
+    record_stripe_event(db, _event("evt_3", "payment_intent.payment_failed", 60, _payment("pi_1", "cus_1")))
+
+    report = StripeInboxProcessor(db).drain()
+
+    assert report.stale == 1
+    assert db.query(PaymentTransaction).one().status == "succeeded"
+
+
+def test_a_bad_event_does_not_block_its_batch(db):
+    _user(db, "cus_1")
+    record_stripe_event(db, _event("evt_ok", "payment_intent.succeeded", 100, _payment("pi_1", "cus_1")))
+    broken = _payment("pi_2", "cus_1")
+    del broken["amount"]
+    record_stripe_event(db, _event("evt_bad", "payment_intent.succeeded", 101, broken))
+    processor = StripeInboxProcessor(db, max_attempts=2)
+
+    report = processor.drain()
+
+    assert (report.applied, report.failed, report.batches) == (1, 1, 1)
+    bad = db.get(StripeEventInbox, "evt_bad")
+    assert (bad.processed_at, bad.attempts, bad.outcome) == (None, 1, "failed")
+    assert bad.last_error.startswith("KeyError")
+    assert db.query(PaymentTransaction).one().stripe_payment_intent_id == "pi_1"
+
+    # retried by the next drain until max_attempts
+    assert processor.drain().failed == 1
+    assert processor.drain().events == 0
@@ -0,0 +1,180 @@
+"""
+Tests for the segmented temporal memory store and the cleaner built on it.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+TOOLS = Path(__file__).parent.parent / "scripts" / "tools"
+
+
+def _load(name):
+    # Loaded by path: scripts/tools holds modules named test_*.py that must not shadow the suite's
+    spec = importlib.util.spec_from_file_location(name, TOOLS / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+temporal_memory_store = _load("temporal_memory_store")
+temporal_memory_cleaner = _load("temporal_memory_cleaner")  # Imports the store as a sibling module
+TemporalMemoryStore = temporal_memory_store.TemporalMemoryStore
+
+
+def test_segments_rotate_and_reopen_with_the_same_count(tmp_path):
+    with TemporalMemoryStore(tmp_path, segment_bytes=400) as store:
+        for i in range(50):
+            store.append({"n": i}, timestamp=1000.0 + i)
+        assert len(store) == 50
+        sealed = len(store.sealed)
+        assert sealed > 3
+
+    reopened = TemporalMemoryStore(tmp_path, segment_bytes=400)
+    assert len(reopened) == 50
+    assert len(reopened.sealed) == sealed
+    assert [r["memory"]["n"] for r in reopened] == list(range(50))
+    assert [r["memory"]["n"] for r in reopened.recent(3)] == [49, 48, 47]
+    assert all(s.bytes <= 400 for s in reopened.segments())
+
+    # The index is only rewritten on rotation, so appends after reopening are recounted
+    reopened.append({"n": 50}, timestamp=2000.0)
+    reopened.close()
+    assert len(TemporalMemoryStore(tmp_path, segment_bytes=400)) == 51
+
+
+def test_torn_final_write_is_discarded_on_open(tmp_path):
+    with TemporalMemoryStore(tmp_path) as store:
+        store.extend({"n": i} for i in range(3))
+        active = tmp_path / store.active.name
+    with open(active, "ab") as f:
+        f.write(b'{"ts": 1, "memo')
+
+    store = TemporalMemoryStore(tmp_path)
+    assert len(store) == 3
+    store.append({"n": 3})
+    assert [r["memory"]["n"] for r in store] == [0, 1, 2, 3]
+
+
+def test_retention_drops_whole_segments(tmp_path):
+    store = TemporalMemoryStore(tmp_path, segment_records=10)
+    store.extend({"n": i} for i in range(95))
+    files = sorted(p.name for p in tmp_path.glob("seg-*.jsonl"))
+    assert len(files) == 10
+
+    assert store.enforce_retention(30) == 60
+    assert len(store) == 35  # At least 30 kept, in whole segments of 10
+    assert sorted(p.name for p in tmp_path.glob("seg-*.jsonl")) == files[6:]
+    assert next(iter(store))["memory"]["n"] == 60
+    assert store.enforce_retention(30) == 0
+    assert len(TemporalMemoryStore(tmp_path, segment_records=10)) == 35
+
+
+def test_cleaner_migrates_legacy_files_once_then_cleans_the_store(tmp_path, monkeypatch):
+    for i in range(800):
+        path = tmp_path / f"memory_{i:04d}.json"
+        path.write_text(json.dumps({"thought": i}))
+        os.utime(path, (1000 + i, 1000 + i))
+    (tmp_path / "broken.json").write_text("{not json")
+    monkeypatch.setattr(temporal_memory_cleaner, "MEMORY_PATH", tmp_path)
+
+    store = temporal_memory_cleaner.open_store()
+    assert len(store) == 800
+    assert sorted(p.name for p in tmp_path.glob("*.json")) == ["broken.json"]
+    assert store.recent(1)[0] == {"ts": 1799.0, "memory": {"thought": 799}, "id": "memory_0799"}
+    assert temporal_memory_cleaner.should_clean(store)
+
+    assert temporal_memory_cleaner.auto_clean(store) == 700
+    assert len(store) == temporal_memory_cleaner.KEEP_RECENT
+    assert not temporal_memory_cleaner.should_clean(store)
+    store.close()
+
+    # Second open: no re-migration, count from the index
+    assert temporal_memory_cleaner.count_memory_files() == 100
+    assert [r["memory"]["thought"] for r in temporal_memory_cleaner.open_store()][:1] == [700]
+
+
+def test_missing_or_stale_index_is_rebuilt_from_segments(tmp_path):
+    with TemporalMemoryStore(tmp_path, segment_records=10) as store:
+        store.extend({"n": i} for i in range(35))
+    (tmp_path / "index.json").unlink()
+
+    rebuilt = TemporalMemoryStore(tmp_path, segment_records=10)
+    assert (len(rebuilt), len(rebuilt.sealed), rebuilt.active.count) == (35, 3, 5)
+    assert (tmp_path / "index.json").exists()
+
+    # Rotations made while the index write was deferred, then a crash
+    with rebuilt.deferred_index():
+        rebuilt.extend({"n": i} for i in range(35, 60))
+        stale = json.loads((tmp_path / "index.json").read_text())
+    (tmp_path / "index.json").write_text(json.dumps(stale))
+
+    reopened = TemporalMemoryStore(tmp_path, segment_records=10)
+    assert [r["memory"]["n"] for r in reopened] == list(range(60))
+    assert reopened.active.id == 6
+
+
+def test_interrupted_migration_resumes_where_it_stopped(tmp_path, monkeypatch):
+    for i in range(40):
+        (tmp_path / f"memory_{i:02d}.json").write_text(json.dumps({"n": i}))
+    store = TemporalMemoryStore(tmp_path / "segments", segment_records=10)
+    appended = []
+
+    def failing_append(memory, **kwargs):
+        if len(appended) == 25:
+            raise OSError("disk full")
+        appended.append(memory)
+        TemporalMemoryStore.append(store, memory, **kwargs)
+
+    monkeypatch.setattr(store, "append", failing_append)
+    try:
+        temporal_memory_store.migrate_directory(tmp_path, store)
+    except OSError:
+        pass
+    assert len(list(tmp_path.glob("memory_*.json"))) == 15  # Stored files were removed
+
+    retry = TemporalMemoryStore(tmp_path / "segments", segment_records=10)
+    assert len(retry) == 25
+    # A crash between storing a memory and removing its file
+    (tmp_path / "memory_24.json").write_text(json.dumps({"n": 24}))
+    assert temporal_memory_store.migrate_directory(tmp_path, retry) == 16
+    assert sorted(r["memory"]["n"] for r in retry) == list(range(40))
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_cleaner_sweeps_new_legacy_files_on_every_open(tmp_path, monkeypatch):
+    monkeypatch.setattr(temporal_memory_cleaner, "MEMORY_PATH", tmp_path)
+    (tmp_path / "memory_a.json").write_text(json.dumps({"thought": "a"}))
+    with temporal_memory_cleaner.open_store() as store:
+        assert len(store) == 1
+
+    (tmp_path / "memory_b.json").write_text(json.dumps({"thought": "b"}))
+    with temporal_memory_cleaner.open_store() as store:
+        assert [r["id"] for r in store] == ["memory_a", "memory_b"]
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_cleaner_closes_the_stores_it_opens(tmp_path, monkeypatch):
+    monkeypatch.setattr(temporal_memory_cleaner, "MEMORY_PATH", tmp_path)
+    monkeypatch.setattr(temporal_memory_cleaner, "THRESHOLD", 1)
+    (tmp_path / "memory_a.json").write_text(json.dumps({"thought": "a"}))
+    opened, closed = [], []
+    open_store = temporal_memory_cleaner.open_store
+
+    def tracking_open_store():
+        store = open_store()
+        opened.append(store)
+        monkeypatch.setattr(store, "close", lambda: closed.append(store))
+        return store
+
+    monkeypatch.setattr(temporal_memory_cleaner, "open_store", tracking_open_store)
+    assert temporal_memory_cleaner.count_memory_files() == 1
+    assert temporal_memory_cleaner.clean_old_memories() == 0
+    assert temporal_memory_cleaner.auto_clean() == 0
+
+    assert len(opened) == 3
+    assert closed == opened
@@ -0,0 +1,149 @@
+"""
+Tests for workflow DAG compilation and concurrent execution in the AI workflow builder.
+Copyright (c) 2025 Joshua Hendricks Cole (DBA: Corporation of Light). All Rights Reserved. PATENT PENDING.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blank_business_builder.features.ai_workflow_builder import AIWorkflowBuilder, Workflow, WorkflowStep
+from blank_business_builder.features.workflow_dag import WorkflowCycleError, WorkflowDAG
+
+
+def _step(step_id, step_type="action", config=None, error_handling=None):
+    return WorkflowStep(step_id, step_type, "webhook", "post", config or {}, [], error_handling or {})
+
+
+def _workflow(builder, steps, trigger=None):
+    trigger = trigger or _step("t", "trigger")
+    steps = builder._identify_parallel_steps(steps, trigger)
+    return Workflow("wf", "Test", "", trigger, steps, "active", "test", 0, 1.0, 0.0, None)
+
+
+@pytest.fixture
+def builder():
+    return AIWorkflowBuilder()
+
+
+def test_dependencies_become_levels_and_critical_path(builder):
+    steps = [
+        _step("join", config={"text": "{{a.id}} / {{b.id}}"}),
+        _step("a", config={"to": "{{trigger.email}}"}),
+        _step("b"),
+        _step("c"),
+        _step("wait", "delay"),
+        _step("after", config={"to": "{{trigger.email}}"}),
+    ]
+    workflow = _workflow(builder, steps)
+    dag = builder.compile_workflow(workflow)
+
+    assert [set(level) for level in dag.levels] == [{"t"}, {"a", "b", "c"}, {"join"}, {"wait"}, {"after"}]
+    assert dag.width == 3
+    assert [s.step_id for s in workflow.steps][:3] == ["a", "b", "c"]
+    path, length = dag.critical_path()
+    assert path[0] == "t" and path[-3:] == ["join", "wait", "after"] and length == 5
+    assert dag.critical_path({"c": 10})[0] == ["t", "c", "wait", "after"]
+
+
+def test_cycles_are_rejected(builder):
+    a, b = _step("a"), _step("b")
+    a.next_steps, b.next_steps = ["b"], ["a"]
+    trigger = _step("t", "trigger")
+    trigger.next_steps = ["a"]
+    with pytest.raises(WorkflowCycleError) as excinfo:
+        WorkflowDAG([trigger, a, b])
+    assert excinfo.value.step_ids == ["a", "b"]
+    # Mutual template references
+    workflow = _workflow(builder, [_step("x", config={"v": "{{y.v}}"}), _step("y", config={"v": "{{x.v}}"})])
+    with pytest.raises(WorkflowCycleError):
+        builder.compile_workflow(workflow)
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_run_concurrently_and_share_outputs(builder):
+    steps = [_step(f"s{i}") for i in range(8)]
+    steps.append(_step("sink", config={"depends_on": [f"s{i}" for i in range(8)]}))
+    workflow = _workflow(builder, steps)
+    payload = {"email": "a@b.co"}
+    in_flight, peak, seen = 0, 0, {}
+
+    async def runner(step, inputs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        seen[step.step_id] = inputs
+        return {"step": step.step_id}
+
+    start = time.perf_counter()
+    run = await builder.execute_workflow(workflow, payload, runner=runner, max_concurrency=4)
+
+    assert run.success and time.perf_counter() - start < 8 * 0.05
+    assert peak == 4
+    assert seen["s0"]["t"] is payload
+    assert set(seen["sink"]) == {f"s{i}" for i in range(8)}
+    assert seen["sink"]["s3"] is run.outputs["s3"]
+    assert workflow.executions_count == 1 and workflow.success_rate == 1.0
+
+
+@pytest.mark.asyncio
+async def test_pure_step_results_are_cached_by_input(builder):
+    calls = []
+
+    def runner(step, inputs):  # blocking runners go to the thread pool
+        calls.append(step.step_id)
+        return {"summary": f"summary of {inputs['t']['body']}"}
+
+    workflow = _workflow(builder, [_step("summarise", "ai", config={"task": "Summarise"})])
+    first = await builder.execute_workflow(workflow, {"body": "hello"}, runner=runner)
+    second = await builder.execute_workflow(workflow, {"body": "hello"}, runner=runner)
+    third = await builder.execute_workflow(workflow, {"body": "other"}, runner=runner)
+
+    assert calls == ["summarise", "summarise"]
+    assert (first.cache_hits, second.cache_hits, third.cache_hits) == (0, 1, 0)
+    assert second.outputs["summarise"] is first.outputs["summarise"]
+
+
+@pytest.mark.asyncio
+async def test_failures_retry_then_abort_or_continue(builder):
+    attempts = {}
+
+    async def runner(step, inputs):
+        attempts[step.step_id] = attempts.get(step.step_id, 0) + 1
+        if step.step_id.startswith("bad"):
+            raise RuntimeError("boom")
+        return step.step_id
+
+    steps = [
+        _step("bad", error_handling={"retry": 2}),
+        _step("child", config={"x": "{{bad.x}}"}),
+    ]
+    run = await builder.execute_workflow(_workflow(builder, steps), runner=runner)
+    assert attempts["bad"] == 3
+    assert run.failed == {"bad": "RuntimeError: boom"} and run.skipped == ["child"]
+
+    steps = [
+        _step("bad2", error_handling={"on_error": "continue"}),
+        _step("child2", config={"x": "{{bad2.x}}"}),
+    ]
+    run = await builder.execute_workflow(_workflow(builder, steps), runner=runner)
+    assert run.outputs["bad2"] is None and run.outputs["child2"] == "child2"
+    assert not run.success
+
+
+@pytest.mark.asyncio
+async def test_generated_workflows_compile_and_execute(builder):
+    workflow = await builder.create_workflow_from_description("When I get an email, save it to Google Sheets", "u1")
+    canvas = builder.get_workflow_canvas_data(workflow)
+    assert canvas["critical_path"] == [workflow.trigger.step_id, workflow.steps[0].step_id]
+    assert len(canvas["edges"]) == 1
+
+    run = await builder.execute_workflow(workflow, {"from": "a@b.co"})
+    assert run.success and run.outputs[workflow.steps[0].step_id]["status"] == "completed"